@@ -1,12 +1,23 @@
 """Add application service."""
 
+from collections.abc import Sequence
+from dataclasses import dataclass
 from datetime import date
 
 from src.domain.aggregates.product import Product
 from src.domain.entities.batch import Batch
+from src.domain.exceptions.persistence import PersistenceError
 from src.domain.interfaces.uow.allocation import AllocationUOW
 
 
+@dataclass(frozen=True, slots=True)
+class AddBatchResult:
+    """Outcome of adding one batch of a bulk insert."""
+
+    reference: str
+    error: str | None = None
+
+
 class AddAppService:
     """Add application service."""
 
@@ -25,25 +36,69 @@ class AddAppService:
 
         """
         with unit_of_work:
-            product: Product | None = unit_of_work.products.get(
+            self._add_batch(batch, unit_of_work)
+            unit_of_work.commit()
+
+    def add_batches(
+        self,
+        batches: Sequence[tuple[str, str, int, date | None]],
+        unit_of_work: AllocationUOW,
+    ) -> list[AddBatchResult]:
+        """Add several batches in a single transaction.
+
+        Each batch is added in its own savepoint, so a batch the database
+        rejects is rolled back alone and the rest is committed.
+
+        Args:
+            batches (Sequence[tuple[str, str, int, date | None]]): reference,
+                stock keeping unit, quantity and estimated arrival time of
+                every batch.
+            unit_of_work (AllocationUOW): AllocationUOW.
+
+        Returns:
+            list[AddBatchResult]: results in batches order.
+
+        """
+        results: list[AddBatchResult] = []
+
+        with unit_of_work:
+            for batch in batches:
+                try:
+                    with unit_of_work.savepoint(batch[1]):
+                        self._add_batch(batch, unit_of_work)
+                except PersistenceError as error:
+                    results.append(
+                        AddBatchResult(reference=batch[0], error=str(error)),
+                    )
+                else:
+                    results.append(AddBatchResult(reference=batch[0]))
+
+            unit_of_work.commit()
+
+        return results
+
+    def _add_batch(
+        self,
+        batch: tuple[str, str, int, date | None],
+        unit_of_work: AllocationUOW,
+    ) -> None:
+        product: Product | None = unit_of_work.products.get(
+            stock_keeping_unit=batch[1],
+        )
+
+        if product is None:
+            product = Product(
                 stock_keeping_unit=batch[1],
+                batches=[],
             )
 
-            if product is None:
-                product = Product(
-                    stock_keeping_unit=batch[1],
-                    batches=[],
-                )
-
-                unit_of_work.products.add(product)
-
-            product.batches.append(
-                Batch(
-                    reference=batch[0],
-                    stock_keeping_unit=batch[1],
-                    quantity=batch[2],
-                    estimated_arrival_time=batch[3],
-                )
-            )
+            unit_of_work.products.add(product)
 
-            unit_of_work.commit()
+        product.add_batch(
+            Batch(
+                reference=batch[0],
+                stock_keeping_unit=batch[1],
+                quantity=batch[2],
+                estimated_arrival_time=batch[3],
+            )
+        )
@@ -1,30 +1,50 @@
 """Allocation application service."""
 
-from typing import TYPE_CHECKING
+from collections.abc import Sequence
+from dataclasses import dataclass
 
+from src.application.utils.striped_lock import StripedLock
+from src.domain.aggregates.product import Product
 from src.domain.entities.batch import Batch
+from src.domain.exceptions.out_of_stock import OutOfStockError
+from src.domain.exceptions.persistence import PersistenceError
+from src.domain.interfaces.uow.allocation import AllocationUOW
 from src.domain.value_objects.order_line import OrderLine
-from src.infrastructure.uow.allocation.postgresql_allocation import (
-    PostgresqlAllocationUOW,
-)
-
-if TYPE_CHECKING:
-    from src.domain.aggregates.product import Product
 
 
 class InvalidSKUError(Exception):
     """Invalid stock keeping unit exception."""
 
 
+@dataclass(frozen=True, slots=True)
+class LineResult:
+    """Outcome of allocating one order line of a batch."""
+
+    order_line: OrderLine
+    batch_reference: str | None = None
+    error: str | None = None
+
+
 class AllocationAppService:
     """Allocation application service."""
 
+    def __init__(self, locks: StripedLock | None = None) -> None:
+        """Create new instance.
+
+        Args:
+            locks (StripedLock | None, optional): per stock keeping unit
+                locks held around load, allocate and commit. Defaults to
+                None, which creates a new striped lock.
+
+        """
+        self.locks: StripedLock = locks or StripedLock()
+
     def allocate(
         self,
         order_id: str,
         stock_keeping_unit: str,
         quantity: int,
-        unit_of_work: PostgresqlAllocationUOW,
+        unit_of_work: AllocationUOW,
     ) -> str:
         """Process allocation."""
         order_line: OrderLine = OrderLine(
@@ -33,7 +53,7 @@ class AllocationAppService:
             quantity=quantity,
         )
 
-        with unit_of_work:
+        with self.locks.hold(stock_keeping_unit), unit_of_work:
             product: Product | None = unit_of_work.products.get(
                 stock_keeping_unit=stock_keeping_unit,
             )
@@ -48,6 +68,128 @@ class AllocationAppService:
 
         return batch_reference
 
+    def allocate_lines(
+        self,
+        order_lines: Sequence[OrderLine],
+        unit_of_work: AllocationUOW,
+    ) -> list[LineResult]:
+        """Process allocation of several order lines.
+
+        Lines are grouped by product, and every product is loaded once,
+        allocated and committed in its own transaction, holding only its
+        own lock, so a large batch doesn't block allocations of the other
+        products. Each line runs in its own savepoint, so a line that can't
+        be allocated or persisted is rolled back alone.
+
+        Args:
+            order_lines (Sequence[OrderLine]): order lines.
+            unit_of_work (AllocationUOW): unit of work, entered once per
+                product.
+
+        Returns:
+            list[LineResult]: results in order lines order.
+
+        """
+        indexes: dict[str, list[int]] = {}
+
+        for index, order_line in enumerate(order_lines):
+            indexes.setdefault(order_line.stock_keeping_unit, []).append(
+                index,
+            )
+
+        results: dict[int, LineResult] = {}
+
+        for stock_keeping_unit, product_indexes in indexes.items():
+            with self.locks.hold(stock_keeping_unit), unit_of_work:
+                product: Product | None = unit_of_work.products.get(
+                    stock_keeping_unit=stock_keeping_unit,
+                )
+
+                for index in product_indexes:
+                    results[index] = self._allocate_line(
+                        product,
+                        order_lines[index],
+                        unit_of_work,
+                    )
+
+                if any(
+                    results[index].batch_reference for index in product_indexes
+                ):
+                    unit_of_work.commit()
+
+        return [results[index] for index in range(len(order_lines))]
+
+    def allocate_order(
+        self,
+        order_lines: Sequence[OrderLine],
+        unit_of_work: AllocationUOW,
+    ) -> list[str]:
+        """Process allocation of a whole order, all or nothing.
+
+        Every product the order touches is loaded and locked in one query,
+        in stock keeping unit order, and the order is committed once. Locks
+        are always taken in the same order, so concurrent orders touching
+        overlapping products can't deadlock.
+
+        Args:
+            order_lines (Sequence[OrderLine]): order lines.
+            unit_of_work (AllocationUOW): unit of work.
+
+        Raises:
+            InvalidSKUError: if any stock keeping unit is unknown.
+
+        Returns:
+            list[str]: batch references in order lines order.
+
+        """
+        stock_keeping_units: set[str] = {
+            order_line.stock_keeping_unit for order_line in order_lines
+        }
+
+        with self.locks.hold_many(stock_keeping_units), unit_of_work:
+            products: dict[str, Product] = {
+                product.stock_keeping_unit: product
+                for product in unit_of_work.products.get_many(
+                    stock_keeping_units,
+                )
+            }
+
+            if unknown := sorted(stock_keeping_units - products.keys()):
+                msg: str = f"Invalid SKU: {', '.join(unknown)}"
+                raise InvalidSKUError(msg)
+
+            batch_references: list[str] = [
+                products[order_line.stock_keeping_unit].allocate(order_line)
+                for order_line in order_lines
+            ]
+
+            unit_of_work.commit()
+
+        return batch_references
+
+    def _allocate_line(
+        self,
+        product: Product | None,
+        order_line: OrderLine,
+        unit_of_work: AllocationUOW,
+    ) -> LineResult:
+        if product is None:
+            return LineResult(
+                order_line=order_line,
+                error=f"Invalid SKU: {order_line.stock_keeping_unit}",
+            )
+
+        try:
+            with unit_of_work.savepoint(order_line.stock_keeping_unit):
+                batch_reference: str = product.allocate(order_line)
+        except (OutOfStockError, PersistenceError) as error:
+            return LineResult(order_line=order_line, error=str(error))
+
+        return LineResult(
+            order_line=order_line,
+            batch_reference=batch_reference,
+        )
+
     def _is_valid_sku(
         self,
         stock_keeping_unit: str,
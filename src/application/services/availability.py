@@ -0,0 +1,104 @@
+"""Availability application service."""
+
+from dataclasses import dataclass
+from datetime import date
+from typing import TYPE_CHECKING
+
+from src.application.services.allocation import InvalidSKUError
+from src.domain.interfaces.uow.allocation import AllocationUOW
+
+if TYPE_CHECKING:
+    from src.domain.aggregates.product import Product
+
+
+@dataclass(frozen=True, slots=True)
+class BatchAvailability:
+    """Available quantity of one batch."""
+
+    reference: str
+    available_quantity: int
+    estimated_arrival_time: date | None
+
+
+@dataclass(frozen=True, slots=True)
+class ProductAvailability:
+    """Available quantity of a product, per batch and in total."""
+
+    stock_keeping_unit: str
+    version_number: int
+    batches: tuple[BatchAvailability, ...]
+
+    @property
+    def available_quantity(self) -> int:
+        """Get total available quantity.
+
+        Returns:
+            int: available quantity of every batch.
+
+        """
+        return sum(batch.available_quantity for batch in self.batches)
+
+
+class AvailabilityAppService:
+    """Availability application service."""
+
+    def version(
+        self,
+        stock_keeping_unit: str,
+        unit_of_work: AllocationUOW,
+    ) -> int | None:
+        """Get product version number with a single column lookup.
+
+        Every change of availability bumps the version number, so callers
+        holding availability of the same version can reuse it.
+
+        Args:
+            stock_keeping_unit (str): stock keeping unit.
+            unit_of_work (AllocationUOW): unit of work.
+
+        Returns:
+            int | None: version number, None for unknown products.
+
+        """
+        with unit_of_work:
+            return unit_of_work.products.get_version(stock_keeping_unit)
+
+    def availability(
+        self,
+        stock_keeping_unit: str,
+        unit_of_work: AllocationUOW,
+    ) -> ProductAvailability:
+        """Get product availability.
+
+        Args:
+            stock_keeping_unit (str): stock keeping unit.
+            unit_of_work (AllocationUOW): unit of work.
+
+        Raises:
+            InvalidSKUError: if the stock keeping unit is unknown.
+
+        Returns:
+            ProductAvailability: availability as of its version number.
+
+        """
+        with unit_of_work:
+            product: Product | None = unit_of_work.products.get(
+                stock_keeping_unit=stock_keeping_unit,
+            )
+
+            if product is None:
+                msg: str = f"Invalid SKU: {stock_keeping_unit}"
+                raise InvalidSKUError(msg)
+
+            return ProductAvailability(
+                stock_keeping_unit=product.stock_keeping_unit,
+                version_number=product.version_number,
+                batches=tuple(
+                    BatchAvailability(
+                        reference=batch.reference,
+                        available_quantity=batch.available_quantity,
+                        estimated_arrival_time=batch.estimated_arrival_time,
+                    )
+                    for batch in sorted(product.batches)
+                ),
+            )
@@ -0,0 +1,42 @@
+"""Export application service."""
+
+from collections.abc import Generator
+
+from src.application.services.allocation import InvalidSKUError
+from src.domain.interfaces.uow.allocation import AllocationUOW
+from src.domain.value_objects.allocation import Allocation
+
+
+class ExportAppService:
+    """Export application service."""
+
+    def allocations(
+        self,
+        stock_keeping_unit: str,
+        unit_of_work: AllocationUOW,
+    ) -> Generator[Allocation, None, None]:
+        """Stream allocations of a product.
+
+        The unit of work stays open until the iterator is exhausted or
+        closed, and the product is never loaded as a whole.
+
+        Args:
+            stock_keeping_unit (str): stock keeping unit.
+            unit_of_work (AllocationUOW): unit of work.
+
+        Yields:
+            Generator[Allocation, None, None]: allocations.
+
+        Raises:
+            InvalidSKUError: on the first iteration, if the stock keeping
+                unit is unknown.
+
+        """
+        with unit_of_work:
+            if unit_of_work.products.get_version(stock_keeping_unit) is None:
+                msg: str = f"Invalid SKU: {stock_keeping_unit}"
+                raise InvalidSKUError(msg)
+
+            yield from unit_of_work.products.iter_allocations(
+                stock_keeping_unit,
+            )
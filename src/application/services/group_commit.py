@@ -0,0 +1,256 @@
+"""Group commit allocation application service."""
+
+from collections.abc import Callable
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from queue import Empty, SimpleQueue
+from threading import Lock, Thread
+from time import monotonic
+from types import TracebackType
+from typing import TYPE_CHECKING, Self
+
+from src.application.services.allocation import InvalidSKUError
+from src.domain.exceptions.out_of_stock import OutOfStockError
+from src.domain.interfaces.uow.allocation import AllocationUOW
+from src.domain.value_objects.order_line import OrderLine
+from src.infrastructure.settings import settings
+
+if TYPE_CHECKING:
+    from src.domain.aggregates.product import Product
+
+
+@dataclass(frozen=True, slots=True)
+class _PendingAllocation:
+    order_line: OrderLine
+    future: Future[str] = field(default_factory=Future)
+
+
+class GroupCommitAllocationExecutor:
+    """Group commit allocation executor.
+
+    Allocations submitted within the same window are grouped by stock
+    keeping unit, applied to each loaded product in arrival order and
+    committed in a single transaction. The worker thread starts with the
+    first submitted allocation, unless started before.
+    """
+
+    def __init__(
+        self,
+        unit_of_work_factory: Callable[[], AllocationUOW],
+        window: float = settings.group_commit_window,
+        max_batch_size: int = settings.group_commit_max_batch_size,
+    ) -> None:
+        """Create new instance.
+
+        Args:
+            unit_of_work_factory (Callable[[], AllocationUOW]): unit of work
+                factory, called once per group.
+            window (float, optional): seconds to wait for more allocations
+                after the first one of a group arrives. Defaults to
+                settings.group_commit_window.
+            max_batch_size (int, optional): maximum number of allocations
+                per transaction. Defaults to
+                settings.group_commit_max_batch_size.
+
+        """
+        self._unit_of_work_factory: Callable[[], AllocationUOW] = (
+            unit_of_work_factory
+        )
+        self._window: float = window
+        self._max_batch_size: int = max_batch_size
+        self._queue: SimpleQueue[_PendingAllocation | None] = SimpleQueue()
+        self._worker: Thread | None = None
+        self._worker_lock: Lock = Lock()
+
+    def submit(
+        self,
+        order_id: str,
+        stock_keeping_unit: str,
+        quantity: int,
+    ) -> Future[str]:
+        """Submit allocation.
+
+        Args:
+            order_id (str): order id.
+            stock_keeping_unit (str): stock keeping unit.
+            quantity (int): quantity.
+
+        Returns:
+            Future[str]: future resolved with the batch reference once the
+                group is committed, or with the allocation error.
+
+        """
+        pending: _PendingAllocation = _PendingAllocation(
+            order_line=OrderLine(
+                order_id=order_id,
+                stock_keeping_unit=stock_keeping_unit,
+                quantity=quantity,
+            ),
+        )
+
+        self.start()
+        self._queue.put(pending)
+
+        return pending.future
+
+    def allocate(
+        self,
+        order_id: str,
+        stock_keeping_unit: str,
+        quantity: int,
+    ) -> str:
+        """Process allocation and wait for its group to be committed.
+
+        Args:
+            order_id (str): order id.
+            stock_keeping_unit (str): stock keeping unit.
+            quantity (int): quantity.
+
+        Returns:
+            str: batch reference.
+
+        """
+        return self.submit(order_id, stock_keeping_unit, quantity).result()
+
+    def start(self) -> None:
+        """Start worker thread, if not running."""
+        with self._worker_lock:
+            if self._worker is None:
+                self._worker = Thread(
+                    target=self._run,
+                    name="group-commit-allocation",
+                    daemon=True,
+                )
+                self._worker.start()
+
+    def stop(self) -> None:
+        """Process queued allocations and stop worker thread."""
+        with self._worker_lock:
+            if self._worker is not None:
+                self._queue.put(None)
+                self._worker.join()
+                self._worker = None
+
+    def __enter__(self) -> Self:
+        """Enter dunder method."""
+        self.start()
+
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        """Exit dunder method.
+
+        Args:
+            exc_type (type[BaseException] | None): exception type.
+            exc_val (BaseException | None): exception value.
+            exc_tb (TracebackType | None): exception traceback.
+
+        """
+        self.stop()
+
+    def _run(self) -> None:
+        stopping: bool = False
+
+        while not stopping:
+            first: _PendingAllocation | None = self._queue.get()
+
+            if first is None:
+                return
+
+            group, stopping = self._collect(first)
+            self._process(group)
+
+    def _collect(
+        self,
+        first: _PendingAllocation,
+    ) -> tuple[list[_PendingAllocation], bool]:
+        group: list[_PendingAllocation] = [first]
+        deadline: float = monotonic() + self._window
+
+        while len(group) < self._max_batch_size:
+            timeout: float = deadline - monotonic()
+
+            try:
+                pending: _PendingAllocation | None = self._queue.get(
+                    timeout=max(timeout, 0),
+                )
+            except Empty:
+                break
+
+            if pending is None:
+                return group, True
+
+            group.append(pending)
+
+        return group, False
+
+    def _process(self, group: list[_PendingAllocation]) -> None:
+        groups: dict[str, list[_PendingAllocation]] = {}
+
+        for pending in group:
+            if pending.future.set_running_or_notify_cancel():
+                groups.setdefault(
+                    pending.order_line.stock_keeping_unit,
+                    [],
+                ).append(pending)
+
+        allocated: list[tuple[_PendingAllocation, str]] = []
+
+        try:
+            with self._unit_of_work_factory() as unit_of_work:
+                for stock_keeping_unit, pendings in groups.items():
+                    allocated.extend(
+                        self._allocate_group(
+                            stock_keeping_unit=stock_keeping_unit,
+                            pendings=pendings,
+                            unit_of_work=unit_of_work,
+                        )
+                    )
+
+                unit_of_work.commit()
+
+        except Exception as error:  # noqa: BLE001
+            for pendings in groups.values():
+                for pending in pendings:
+                    if not pending.future.done():
+                        pending.future.set_exception(error)
+
+            return
+
+        for pending, batch_reference in allocated:
+            pending.future.set_result(batch_reference)
+
+    def _allocate_group(
+        self,
+        stock_keeping_unit: str,
+        pendings: list[_PendingAllocation],
+        unit_of_work: AllocationUOW,
+    ) -> list[tuple[_PendingAllocation, str]]:
+        product: Product | None = unit_of_work.products.get(
+            stock_keeping_unit=stock_keeping_unit,
+        )
+
+        if product is None:
+            msg: str = f"Invalid SKU: {stock_keeping_unit}"
+
+            for pending in pendings:
+                pending.future.set_exception(InvalidSKUError(msg))
+
+            return []
+
+        allocated: list[tuple[_PendingAllocation, str]] = []
+
+        for pending in pendings:
+            try:
+                batch_reference: str = product.allocate(pending.order_line)
+            except OutOfStockError as error:
+                pending.future.set_exception(error)
+            else:
+                allocated.append((pending, batch_reference))
+
+        return allocated
@@ -0,0 +1,225 @@
+"""Streaming sync application service."""
+
+import secrets
+from collections.abc import Iterable, Iterator
+from contextlib import ExitStack
+from pathlib import Path
+
+from src.application.utils.external_sort import ExternalSort, Record
+from src.domain.interfaces.repositories.file_system import IFileSystem
+from src.domain.interfaces.repositories.reader import IReader
+from src.domain.services.sync import execute_command
+from src.domain.value_objects.file_system_command import FileSystemCommand
+from src.domain.value_objects.file_system_command_action import (
+    FileSystemCommandAction,
+)
+from src.infrastructure.settings import settings
+
+_END: str = "\U0010ffff"
+
+
+def _unique(records: Iterator[Record]) -> Iterator[Record]:
+    # Records are sorted, the first name of a hash is the smallest one.
+    previous: str | None = None
+
+    for hash_value, file_name in records:
+        if hash_value != previous:
+            previous = hash_value
+            yield hash_value, file_name
+
+
+def _join(
+    source: Iterator[Record],
+    destination: Iterator[Record],
+) -> Iterator[tuple[str | None, str | None]]:
+    source_hash, source_name = next(source, (_END, ""))
+    destination_hash, destination_name = next(destination, (_END, ""))
+
+    while source_hash != _END or destination_hash != _END:
+        if source_hash == destination_hash:
+            yield source_name, destination_name
+            source_hash, source_name = next(source, (_END, ""))
+            destination_hash, destination_name = next(destination, (_END, ""))
+
+        elif source_hash < destination_hash:
+            yield source_name, None
+            source_hash, source_name = next(source, (_END, ""))
+
+        else:
+            yield None, destination_name
+            destination_hash, destination_name = next(destination, (_END, ""))
+
+
+class StreamingSyncAppService:
+    """Streaming sync application service.
+
+    Plans the same commands as the sync domain service without holding
+    either folder's hashes in memory. Hash and name records of both folders
+    are sorted by hash with an external sort and merge joined, and moves and
+    copies are spilled the same way until they can be issued, so memory is
+    bounded by the sort buffers.
+
+    Commands come in an order they can run one by one: deletes first, then
+    moves, where a move whose target is the source of another move goes
+    through a temporary name, then moves from temporary names, then copies.
+    """
+
+    def __init__(
+        self,
+        buffer_size: int = settings.sync_sort_buffer_size,
+        directory: str | None = None,
+    ) -> None:
+        """Create new instance.
+
+        Args:
+            buffer_size (int, optional): records kept in memory per sort.
+                Defaults to settings.sync_sort_buffer_size.
+            directory (str | None, optional): folder of sort run files.
+                Defaults to None, the system temporary folder.
+
+        """
+        self._buffer_size: int = buffer_size
+        self._directory: str | None = directory
+
+    def sync(
+        self,
+        reader: IReader,
+        file_system: IFileSystem,
+        source: str,
+        destination: str,
+    ) -> None:
+        """Sync two folders.
+
+        Args:
+            reader (IReader): reader.
+            file_system (IFileSystem): file system repository.
+            source (str): source folder.
+            destination (str): destination folder.
+
+        """
+        for command in self.plan(
+            source_records=reader.iter_hashes(source),
+            destination_records=reader.iter_hashes(destination),
+            source=source,
+            destination=destination,
+        ):
+            execute_command(command, file_system)
+
+    def plan(
+        self,
+        source_records: Iterable[Record],
+        destination_records: Iterable[Record],
+        source: str,
+        destination: str,
+    ) -> Iterator[FileSystemCommand]:
+        """Plan commands making destination folder match the source one.
+
+        Args:
+            source_records (Iterable[Record]): source hash and file name
+                records, in any order.
+            destination_records (Iterable[Record]): destination hash and
+                file name records, in any order.
+            source (str): source folder.
+            destination (str): destination folder.
+
+        Yields:
+            Iterator[FileSystemCommand]: commands, in the order to run them.
+
+        """
+        with ExitStack() as stack:
+
+            def sort() -> ExternalSort:
+                return stack.enter_context(
+                    ExternalSort(self._buffer_size, self._directory),
+                )
+
+            source_sort: ExternalSort = sort()
+            source_sort.extend(source_records)
+            destination_sort: ExternalSort = sort()
+            destination_sort.extend(destination_records)
+            # Moves by source name and by target name, and copies.
+            moves: ExternalSort = sort()
+            targets: ExternalSort = sort()
+            copies: ExternalSort = sort()
+
+            for source_name, destination_name in _join(
+                _unique(source_sort.sorted()),
+                _unique(destination_sort.sorted()),
+            ):
+                if source_name is None:
+                    yield self._command(
+                        FileSystemCommandAction.delete,
+                        Path(destination) / str(destination_name),
+                    )
+
+                elif destination_name is None:
+                    copies.add((source_name, ""))
+
+                elif source_name != destination_name:
+                    moves.add((destination_name, source_name))
+                    targets.add((source_name, destination_name))
+
+            source_sort.close()
+            destination_sort.close()
+            yield from self._moves(
+                targets.sorted(),
+                moves.sorted(),
+                Path(destination),
+                sort(),
+            )
+            yield from (
+                self._command(
+                    FileSystemCommandAction.copy,
+                    Path(source) / file_name,
+                    Path(destination) / file_name,
+                )
+                for file_name, _ in copies.sorted()
+            )
+
+    def _moves(
+        self,
+        targets: Iterator[Record],
+        moves: Iterator[Record],
+        destination: Path,
+        pending: ExternalSort,
+    ) -> Iterator[FileSystemCommand]:
+        # Targets and move sources are both sorted by name, a target that
+        # is also a source is taken.
+        token: str = secrets.token_hex(4)
+        moved_name, _ = next(moves, (_END, ""))
+
+        for target, file_name in targets:
+            while moved_name < target:
+                moved_name, _ = next(moves, (_END, ""))
+
+            if moved_name == target:
+                temporary: str = f"{target}.{token}.sync"
+                pending.add((temporary, target))
+                target = temporary  # noqa: PLW2901
+
+            yield self._command(
+                FileSystemCommandAction.move,
+                destination / file_name,
+                destination / target,
+            )
+
+        yield from (
+            self._command(
+                FileSystemCommandAction.move,
+                destination / temporary,
+                destination / target,
+            )
+            for temporary, target in pending.sorted()
+        )
+
+    def _command(
+        self,
+        action: FileSystemCommandAction,
+        source: Path,
+        destination: Path | None = None,
+    ) -> FileSystemCommand:
+        return FileSystemCommand(
+            command=action,
+            source=source,
+            destination=destination,
+        )
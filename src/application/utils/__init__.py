@@ -0,0 +1 @@
+"""Application utils."""
@@ -0,0 +1,214 @@
+"""Admission control util."""
+
+from collections import Counter
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from threading import Condition
+from time import monotonic
+
+from src.infrastructure.settings import settings
+
+
+class AdmissionRejectedError(Exception):
+    """Request can't be admitted now exception."""
+
+    def __init__(self, message: str, retry_after: int) -> None:
+        """Create new instance.
+
+        Args:
+            message (str): message.
+            retry_after (int): seconds the caller should wait before
+                retrying.
+
+        """
+        super().__init__(message)
+        self.retry_after: int = retry_after
+
+
+@dataclass(frozen=True, slots=True)
+class AdmissionStatistics:
+    """Admission statistics snapshot."""
+
+    admitted: int
+    rejected: int
+    timed_out: int
+    in_flight: int
+    queue_depth: int
+    max_queue_depth: int
+
+
+class AdmissionController:
+    """Admission controller.
+
+    Caps requests in flight globally and per key. A request over a cap
+    waits in a bounded queue, and is rejected right away if the queue is
+    full or after the queue timeout, so a hot key can't take every worker
+    thread while requests for other keys wait behind it.
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        max_in_flight: int = settings.admission_max_in_flight,
+        max_in_flight_per_key: int = settings.admission_max_in_flight_per_key,
+        max_queue: int = settings.admission_max_queue,
+        max_queue_per_key: int = settings.admission_max_queue_per_key,
+        queue_timeout: float = settings.admission_queue_timeout,
+        retry_after: int = settings.admission_retry_after,
+    ) -> None:
+        """Create new instance.
+
+        Args:
+            max_in_flight (int, optional): requests in flight. Defaults to
+                settings.admission_max_in_flight.
+            max_in_flight_per_key (int, optional): requests in flight per
+                key. Defaults to settings.admission_max_in_flight_per_key.
+            max_queue (int, optional): waiting requests. Defaults to
+                settings.admission_max_queue.
+            max_queue_per_key (int, optional): waiting requests per key.
+                Defaults to settings.admission_max_queue_per_key.
+            queue_timeout (float, optional): seconds a request waits before
+                it is rejected. Defaults to settings.admission_queue_timeout.
+            retry_after (int, optional): seconds rejected callers are told
+                to wait. Defaults to settings.admission_retry_after.
+
+        Raises:
+            ValueError: if an in flight cap is less than one or a queue
+                bound is negative.
+
+        """
+        if min(max_in_flight, max_in_flight_per_key) < 1:
+            msg: str = (
+                "In flight caps must be positive, got "
+                f"{max_in_flight} and {max_in_flight_per_key}."
+            )
+            raise ValueError(msg)
+
+        if min(max_queue, max_queue_per_key) < 0:
+            msg = (
+                "Queue bounds must not be negative, got "
+                f"{max_queue} and {max_queue_per_key}."
+            )
+            raise ValueError(msg)
+
+        self._max_in_flight: int = max_in_flight
+        self._max_in_flight_per_key: int = max_in_flight_per_key
+        self._max_queue: int = max_queue
+        self._max_queue_per_key: int = max_queue_per_key
+        self._queue_timeout: float = queue_timeout
+        self._retry_after: int = retry_after
+        self._condition: Condition = Condition()
+        self._in_flight: Counter[str] = Counter()
+        self._waiting: Counter[str] = Counter()
+        self._in_flight_total: int = 0
+        self._waiting_total: int = 0
+        self._admitted: int = 0
+        self._rejected: int = 0
+        self._timed_out: int = 0
+        self._max_queue_depth: int = 0
+
+    @contextmanager
+    def admit(self, key: str) -> Iterator[None]:
+        """Hold an in flight slot of a key.
+
+        Args:
+            key (str): key, e.g. a stock keeping unit.
+
+        Yields:
+            Iterator[None]: nothing, the slot is held inside the block.
+
+        Raises:
+            AdmissionRejectedError: if the queue is full or the wait timed
+                out.
+
+        """
+        self._acquire(key)
+
+        try:
+            yield
+        finally:
+            with self._condition:
+                self._in_flight_total -= 1
+                self._in_flight[key] -= 1
+
+                if not self._in_flight[key]:
+                    del self._in_flight[key]
+
+                self._condition.notify_all()
+
+    def queue_depth(self, key: str | None = None) -> int:
+        """Get number of waiting requests.
+
+        Args:
+            key (str | None, optional): key. Defaults to None, every key.
+
+        Returns:
+            int: waiting requests.
+
+        """
+        with self._condition:
+            return self._waiting_total if key is None else self._waiting[key]
+
+    def statistics(self) -> AdmissionStatistics:
+        """Get statistics.
+
+        Returns:
+            AdmissionStatistics: statistics snapshot.
+
+        """
+        with self._condition:
+            return AdmissionStatistics(
+                admitted=self._admitted,
+                rejected=self._rejected,
+                timed_out=self._timed_out,
+                in_flight=self._in_flight_total,
+                queue_depth=self._waiting_total,
+                max_queue_depth=self._max_queue_depth,
+            )
+
+    def _acquire(self, key: str) -> None:
+        with self._condition:
+            if not self._has_slot(key):
+                if (
+                    self._waiting_total >= self._max_queue
+                    or self._waiting[key] >= self._max_queue_per_key
+                ):
+                    self._rejected += 1
+                    msg: str = f"Too many requests for {key}, queue is full."
+                    raise AdmissionRejectedError(msg, self._retry_after)
+
+                self._wait(key)
+
+            self._admitted += 1
+            self._in_flight_total += 1
+            self._in_flight[key] += 1
+
+    def _wait(self, key: str) -> None:
+        self._waiting_total += 1
+        self._waiting[key] += 1
+        self._max_queue_depth = max(self._max_queue_depth, self._waiting_total)
+        deadline: float = monotonic() + self._queue_timeout
+
+        try:
+            while not self._has_slot(key):
+                remaining: float = deadline - monotonic()
+
+                if remaining <= 0:
+                    self._rejected += 1
+                    self._timed_out += 1
+                    msg: str = f"Too many requests for {key}, wait timed out."
+                    raise AdmissionRejectedError(msg, self._retry_after)
+
+                self._condition.wait(remaining)
+        finally:
+            self._waiting_total -= 1
+            self._waiting[key] -= 1
+
+            if not self._waiting[key]:
+                del self._waiting[key]
+
+    def _has_slot(self, key: str) -> bool:
+        return (
+            self._in_flight_total < self._max_in_flight
+            and self._in_flight[key] < self._max_in_flight_per_key
+        )
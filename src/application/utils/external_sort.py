@@ -0,0 +1,194 @@
+"""External sort util."""
+
+import heapq
+import re
+import shutil
+from collections.abc import Iterable, Iterator
+from contextlib import ExitStack
+from pathlib import Path
+from tempfile import mkdtemp
+from types import TracebackType
+from typing import IO, Self
+
+from src.infrastructure.settings import settings
+
+Record = tuple[str, str]
+
+_ESCAPED: re.Pattern[str] = re.compile(r"\\(.)")
+
+
+def _escape(value: str) -> str:
+    if "\\" in value or "\t" in value or "\n" in value:
+        return (
+            value.replace("\\", "\\\\")
+            .replace("\t", "\\t")
+            .replace("\n", "\\n")
+        )
+
+    return value
+
+
+def _unescape(value: str) -> str:
+    if "\\" not in value:
+        return value
+
+    return _ESCAPED.sub(
+        lambda match: {"t": "\t", "n": "\n"}.get(match[1], match[1]),
+        value,
+    )
+
+
+def _read_run(file: IO[str]) -> Iterator[Record]:
+    for line in file:
+        first, second = line[:-1].split("\t")
+        yield _unescape(first), _unescape(second)
+
+
+class ExternalSort:
+    """External sort of string pairs.
+
+    Records are kept in a buffer, and whenever it is full it is sorted and
+    spilled to a run file. Sorted records are then a merge of the runs and
+    of the buffer, so at most a buffer of records is in memory whatever
+    their number. Run files are removed on close.
+    """
+
+    def __init__(
+        self,
+        buffer_size: int = settings.sync_sort_buffer_size,
+        directory: str | None = None,
+    ) -> None:
+        """Create new instance.
+
+        Args:
+            buffer_size (int, optional): records kept in memory. Defaults
+                to settings.sync_sort_buffer_size.
+            directory (str | None, optional): folder of run files. Defaults
+                to None, the system temporary folder.
+
+        Raises:
+            ValueError: if buffer size is less than one.
+
+        """
+        if buffer_size < 1:
+            msg: str = f"Buffer size must be positive, got {buffer_size}."
+            raise ValueError(msg)
+
+        self._buffer_size: int = buffer_size
+        self._directory: str | None = directory
+        self._folder: Path | None = None
+        self._buffer: list[Record] = []
+        self._runs: list[Path] = []
+
+    def __enter__(self) -> Self:
+        """Enter context.
+
+        Returns:
+            Self: sort.
+
+        """
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Exit context, removing run files.
+
+        Args:
+            exc_type (type[BaseException] | None): exception type.
+            exc_value (BaseException | None): exception.
+            traceback (TracebackType | None): traceback.
+
+        """
+        self.close()
+
+    @property
+    def spilled_runs(self) -> int:
+        """Get number of run files.
+
+        Returns:
+            int: run files written so far.
+
+        """
+        return len(self._runs)
+
+    def add(self, record: Record) -> None:
+        """Add record.
+
+        Args:
+            record (Record): record.
+
+        """
+        self._buffer.append(record)
+
+        if len(self._buffer) >= self._buffer_size:
+            self._spill()
+
+    def extend(self, records: Iterable[Record]) -> None:
+        """Add records.
+
+        Args:
+            records (Iterable[Record]): records.
+
+        """
+        for record in records:
+            self.add(record)
+
+    def sorted(self) -> Iterator[Record]:
+        """Get records in order.
+
+        Yields:
+            Iterator[Record]: records, sorted.
+
+        """
+        self._buffer.sort()
+
+        with ExitStack() as stack:
+            yield from heapq.merge(
+                *(
+                    _read_run(
+                        stack.enter_context(
+                            run.open(
+                                encoding="utf-8",
+                                errors="surrogateescape",
+                                newline="\n",
+                            )
+                        )
+                    )
+                    for run in self._runs
+                ),
+                self._buffer,
+            )
+
+    def close(self) -> None:
+        """Drop records and remove run files."""
+        self._buffer = []
+        self._runs = []
+
+        if self._folder is not None:
+            shutil.rmtree(self._folder, ignore_errors=True)
+            self._folder = None
+
+    def _spill(self) -> None:
+        if self._folder is None:
+            self._folder = Path(mkdtemp(prefix="sort-", dir=self._directory))
+
+        self._buffer.sort()
+        run: Path = self._folder / f"{len(self._runs)}.run"
+
+        with run.open(
+            "w",
+            encoding="utf-8",
+            errors="surrogateescape",
+            newline="\n",
+        ) as file:
+            file.writelines(
+                f"{_escape(first)}\t{_escape(second)}\n"
+                for first, second in self._buffer
+            )
+
+        self._runs.append(run)
+        self._buffer = []
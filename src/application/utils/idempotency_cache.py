@@ -0,0 +1,291 @@
+"""Idempotency cache util."""
+
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass
+from threading import Lock
+from time import time
+from typing import TYPE_CHECKING
+
+from src.application.utils.striped_lock import StripedLock
+from src.domain.interfaces.repositories.idempotency_store import (
+    IdempotencyStore,
+)
+from src.domain.value_objects.stored_response import StoredResponse
+from src.infrastructure.settings import settings
+
+if TYPE_CHECKING:
+    from src.domain.value_objects.idempotency_record import (
+        IdempotencyRecord,
+    )
+
+
+class IdempotencyConflictError(Exception):
+    """Request with the same idempotency key is in flight exception."""
+
+
+class IdempotencyKeyReusedError(Exception):
+    """Idempotency key reused for another request exception."""
+
+
+@dataclass(slots=True)
+class IdempotencyStatistics:
+    """Idempotency cache statistics."""
+
+    memory_hits: int = 0
+    store_hits: int = 0
+    misses: int = 0
+
+    @property
+    def hits(self) -> int:
+        """Get number of replayed requests.
+
+        Returns:
+            int: hits in memory and in the store.
+
+        """
+        return self.memory_hits + self.store_hits
+
+    @property
+    def hit_rate(self) -> float:
+        """Get share of replayed requests.
+
+        Returns:
+            float: hits over lookups, 0 without lookups.
+
+        """
+        lookups: int = self.hits + self.misses
+
+        return self.hits / lookups if lookups else 0
+
+
+class IdempotencyCache:
+    """Idempotency cache.
+
+    Responses are kept in a bounded least recently used map in memory and,
+    if a store is given, persisted so other processes and restarts replay
+    them too. Requests with the same key are serialized within a process,
+    and across processes the store reserves the key before the request
+    runs, so a storm of concurrent retries runs the request once.
+
+    Every key is bound to the fingerprint of its first request: reusing it
+    for another request is rejected instead of replaying the response of
+    the first one.
+
+    Only successful responses are kept: a failed request changed nothing
+    and may succeed when retried.
+    """
+
+    def __init__(
+        self,
+        store: IdempotencyStore | None = None,
+        capacity: int = settings.idempotency_cache_capacity,
+        ttl: float = settings.idempotency_cache_ttl,
+        reservation_timeout: float = settings.idempotency_reservation_timeout,
+        clock: Callable[[], float] = time,
+    ) -> None:
+        """Create new instance.
+
+        Args:
+            store (IdempotencyStore | None, optional): persistent store.
+                Defaults to None, responses are only kept in memory.
+            capacity (int, optional): maximum number of responses kept in
+                memory. Defaults to settings.idempotency_cache_capacity.
+            ttl (float, optional): seconds a response is replayed for.
+                Defaults to settings.idempotency_cache_ttl.
+            reservation_timeout (float, optional): seconds a key stays
+                reserved in the store if its request never completes.
+                Defaults to settings.idempotency_reservation_timeout.
+            clock (Callable[[], float], optional): wall clock, shared with
+                the store. Defaults to time.
+
+        Raises:
+            ValueError: if capacity is less than one.
+
+        """
+        if capacity < 1:
+            msg: str = f"Capacity must be positive, got {capacity}."
+            raise ValueError(msg)
+
+        self._store: IdempotencyStore | None = store
+        self._capacity: int = capacity
+        self._ttl: float = ttl
+        self._reservation_timeout: float = reservation_timeout
+        self._clock: Callable[[], float] = clock
+        self._responses: OrderedDict[
+            str,
+            tuple[StoredResponse, str, float],
+        ] = OrderedDict()
+        self._lock: Lock = Lock()
+        self._locks: StripedLock = StripedLock()
+        self._statistics: IdempotencyStatistics = IdempotencyStatistics()
+
+    def get_or_run(
+        self,
+        key: str,
+        run: Callable[[], StoredResponse],
+        fingerprint: str = "",
+    ) -> tuple[StoredResponse, bool]:
+        """Replay the response of a key or run the request.
+
+        Args:
+            key (str): idempotency key.
+            run (Callable[[], StoredResponse]): request, called on a miss.
+            fingerprint (str, optional): digest of the request, a key is
+                only replayed to the same request. Defaults to "".
+
+        Raises:
+            IdempotencyConflictError: if a request with the same key is in
+                flight in another process.
+            IdempotencyKeyReusedError: if the key was used for another
+                request.
+
+        Returns:
+            tuple[StoredResponse, bool]: response and whether it is a
+                replay.
+
+        """
+        if (cached := self._recall(key, fingerprint)) is not None:
+            return cached, True
+
+        with self._locks.hold(key):
+            # A concurrent retry may have stored it while we waited.
+            if (cached := self._recall(key, fingerprint)) is not None:
+                return cached, True
+
+            if (held := self._reserve(key, fingerprint)) is not None:
+                return held, True
+
+            try:
+                response: StoredResponse = run()
+            except BaseException:
+                self._release(key)
+                raise
+
+            with self._lock:
+                self._statistics.misses += 1
+
+            if 200 <= response.status_code < 300:  # noqa: PLR2004
+                self._put(key, fingerprint, response)
+            else:
+                self._release(key)
+
+        return response, False
+
+    def purge(self) -> int:
+        """Drop expired responses from memory and the store.
+
+        Returns:
+            int: number of records deleted from the store.
+
+        """
+        now: float = self._clock()
+
+        with self._lock:
+            for key in [
+                key
+                for key, (_, _, expires_at) in self._responses.items()
+                if expires_at <= now
+            ]:
+                del self._responses[key]
+
+        return 0 if self._store is None else self._store.purge(now)
+
+    def statistics(self) -> IdempotencyStatistics:
+        """Get statistics.
+
+        Returns:
+            IdempotencyStatistics: copy of the statistics.
+
+        """
+        with self._lock:
+            return IdempotencyStatistics(
+                memory_hits=self._statistics.memory_hits,
+                store_hits=self._statistics.store_hits,
+                misses=self._statistics.misses,
+            )
+
+    def _recall(self, key: str, fingerprint: str) -> StoredResponse | None:
+        now: float = self._clock()
+
+        with self._lock:
+            if (entry := self._responses.get(key)) is None:
+                return None
+
+            response, stored_fingerprint, expires_at = entry
+
+            if expires_at <= now:
+                del self._responses[key]
+
+                return None
+
+            _check_fingerprint(key, stored_fingerprint, fingerprint)
+            self._responses.move_to_end(key)
+            self._statistics.memory_hits += 1
+
+            return response
+
+    def _reserve(self, key: str, fingerprint: str) -> StoredResponse | None:
+        if self._store is None:
+            return None
+
+        now: float = self._clock()
+        record: IdempotencyRecord | None = self._store.reserve(
+            key,
+            fingerprint,
+            now,
+            now + self._reservation_timeout,
+        )
+
+        if record is None:
+            return None
+
+        _check_fingerprint(key, record.fingerprint, fingerprint)
+
+        if record.response is None:
+            msg: str = f"Request with idempotency key {key!r} is in flight."
+            raise IdempotencyConflictError(msg)
+
+        with self._lock:
+            self._statistics.store_hits += 1
+
+        # The store doesn't tell when it expires, keep it for a full ttl.
+        self._remember(key, fingerprint, record.response, now + self._ttl)
+
+        return record.response
+
+    def _release(self, key: str) -> None:
+        if self._store is not None:
+            self._store.release(key)
+
+    def _put(
+        self,
+        key: str,
+        fingerprint: str,
+        response: StoredResponse,
+    ) -> None:
+        now: float = self._clock()
+        self._remember(key, fingerprint, response, now + self._ttl)
+
+        if self._store is not None:
+            self._store.complete(key, response, now + self._ttl)
+
+    def _remember(
+        self,
+        key: str,
+        fingerprint: str,
+        response: StoredResponse,
+        expires_at: float,
+    ) -> None:
+        with self._lock:
+            self._responses[key] = (response, fingerprint, expires_at)
+            self._responses.move_to_end(key)
+
+            while len(self._responses) > self._capacity:
+                self._responses.popitem(last=False)
+
+
+def _check_fingerprint(key: str, stored: str, fingerprint: str) -> None:
+    if stored != fingerprint:
+        msg: str = f"Idempotency key {key!r} was used for another request."
+        raise IdempotencyKeyReusedError(msg)
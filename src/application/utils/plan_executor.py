@@ -0,0 +1,136 @@
+"""Sync plan executor util."""
+
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Future,
+    ThreadPoolExecutor,
+    wait,
+)
+from dataclasses import dataclass
+from time import perf_counter
+
+from src.domain.interfaces.repositories.file_system import IFileSystem
+from src.domain.services.sync import execute_command
+from src.domain.value_objects.file_system_command import FileSystemCommand
+from src.domain.value_objects.sync_plan import SyncPlan
+from src.infrastructure.settings import settings
+
+
+@dataclass(frozen=True, slots=True)
+class CommandTiming:
+    """Timing of a run command."""
+
+    command: FileSystemCommand
+    # Seconds from the start of the plan.
+    started: float
+    elapsed: float
+
+
+class PlanExecutor:
+    """Sync plan executor.
+
+    Commands run in a bounded thread pool as soon as the commands they wait
+    for are done, so copies and moves of unrelated names overlap. If a
+    command fails, no new command is started and the first error is raised
+    once the running ones are done.
+    """
+
+    def __init__(self, workers: int = settings.sync_workers) -> None:
+        """Create new instance.
+
+        Args:
+            workers (int, optional): commands run at once. Defaults to
+                settings.sync_workers.
+
+        Raises:
+            ValueError: if workers is less than one.
+
+        """
+        if workers < 1:
+            msg: str = f"Workers must be positive, got {workers}."
+            raise ValueError(msg)
+
+        self._workers: int = workers
+
+    def execute(
+        self,
+        plan: SyncPlan,
+        file_system: IFileSystem,
+    ) -> list[CommandTiming]:
+        """Run plan on a file system.
+
+        Args:
+            plan (SyncPlan): plan.
+            file_system (IFileSystem): file system repository.
+
+        Returns:
+            list[CommandTiming]: timing of every command, in plan order.
+
+        """
+        waiting: list[int] = [len(indices) for indices in plan.dependencies]
+        dependents: list[list[int]] = self._dependents(plan)
+        timings: list[CommandTiming | None] = [None] * len(plan.commands)
+        started: float = perf_counter()
+
+        def run(index: int) -> int:
+            command_started: float = perf_counter()
+            execute_command(plan.commands[index], file_system)
+            timings[index] = CommandTiming(
+                command=plan.commands[index],
+                started=command_started - started,
+                elapsed=perf_counter() - command_started,
+            )
+
+            return index
+
+        with ThreadPoolExecutor(max_workers=self._workers) as pool:
+            running: set[Future[int]] = {
+                pool.submit(run, index)
+                for index, count in enumerate(waiting)
+                if not count
+            }
+            error: BaseException | None = None
+
+            while running:
+                done, running = wait(running, return_when=FIRST_COMPLETED)
+
+                for future in done:
+                    if (exception := future.exception()) is not None:
+                        error = error or exception
+                        continue
+
+                    if error is not None:
+                        continue
+
+                    running.update(
+                        pool.submit(run, dependent)
+                        for dependent in self._release(
+                            dependents[future.result()],
+                            waiting,
+                        )
+                    )
+
+        if error is not None:
+            raise error
+
+        return [timing for timing in timings if timing is not None]
+
+    def _dependents(self, plan: SyncPlan) -> list[list[int]]:
+        dependents: list[list[int]] = [[] for _ in plan.commands]
+
+        for index, indices in enumerate(plan.dependencies):
+            for dependency in indices:
+                dependents[dependency].append(index)
+
+        return dependents
+
+    def _release(self, dependents: list[int], waiting: list[int]) -> list[int]:
+        ready: list[int] = []
+
+        for dependent in dependents:
+            waiting[dependent] -= 1
+
+            if not waiting[dependent]:
+                ready.append(dependent)
+
+        return ready
@@ -0,0 +1,161 @@
+"""Striped lock util."""
+
+from collections.abc import Iterable, Iterator
+from contextlib import ExitStack, contextmanager
+from dataclasses import dataclass
+from threading import Lock
+from time import perf_counter
+from zlib import crc32
+
+from src.infrastructure.settings import settings
+
+
+@dataclass(slots=True)
+class LockStatistics:
+    """Lock statistics, times are in seconds."""
+
+    acquisitions: int = 0
+    total_wait: float = 0
+    max_wait: float = 0
+    total_hold: float = 0
+    max_hold: float = 0
+
+    def record_wait(self, wait: float) -> None:
+        """Record time spent waiting for the lock.
+
+        Args:
+            wait (float): wait time.
+
+        """
+        self.acquisitions += 1
+        self.total_wait += wait
+        self.max_wait = max(self.max_wait, wait)
+
+    def record_hold(self, hold: float) -> None:
+        """Record time the lock was held.
+
+        Args:
+            hold (float): hold time.
+
+        """
+        self.total_hold += hold
+        self.max_hold = max(self.max_hold, hold)
+
+    def merge(self, other: "LockStatistics") -> None:
+        """Add other statistics to these ones.
+
+        Args:
+            other (LockStatistics): other statistics.
+
+        """
+        self.acquisitions += other.acquisitions
+        self.total_wait += other.total_wait
+        self.max_wait = max(self.max_wait, other.max_wait)
+        self.total_hold += other.total_hold
+        self.max_hold = max(self.max_hold, other.max_hold)
+
+
+class StripedLock:
+    """Striped lock.
+
+    Keys are hashed onto a fixed number of locks, so the same key is always
+    serialized while most different keys proceed in parallel.
+    """
+
+    def __init__(
+        self, stripes: int = settings.allocation_lock_stripes
+    ) -> None:
+        """Create new instance.
+
+        Args:
+            stripes (int, optional): number of locks. Defaults to
+                settings.allocation_lock_stripes.
+
+        Raises:
+            ValueError: if stripes is less than one.
+
+        """
+        if stripes < 1:
+            msg: str = f"Stripes must be positive, got {stripes}."
+            raise ValueError(msg)
+
+        self._locks: list[Lock] = [Lock() for _ in range(stripes)]
+        self._statistics: list[LockStatistics] = [
+            LockStatistics() for _ in range(stripes)
+        ]
+
+    def stripe(self, key: str) -> int:
+        """Get stripe index of a key.
+
+        Args:
+            key (str): key.
+
+        Returns:
+            int: stripe index.
+
+        """
+        return crc32(key.encode()) % len(self._locks)
+
+    @contextmanager
+    def hold(self, key: str) -> Iterator[None]:
+        """Hold the lock of a key.
+
+        Args:
+            key (str): key.
+
+        Yields:
+            Iterator[None]: nothing, the lock is held inside the block.
+
+        """
+        with self._hold_stripe(self.stripe(key)):
+            yield
+
+    @contextmanager
+    def hold_many(self, keys: Iterable[str]) -> Iterator[None]:
+        """Hold the locks of several keys.
+
+        Stripes are acquired in ascending index order and each one once, so
+        callers holding overlapping sets of keys can't deadlock.
+
+        Args:
+            keys (Iterable[str]): keys.
+
+        Yields:
+            Iterator[None]: nothing, the locks are held inside the block.
+
+        """
+        with ExitStack() as stack:
+            for index in sorted({self.stripe(key) for key in keys}):
+                stack.enter_context(self._hold_stripe(index))
+
+            yield
+
+    def statistics(self) -> LockStatistics:
+        """Get statistics summed over all stripes.
+
+        Returns:
+            LockStatistics: statistics.
+
+        """
+        total: LockStatistics = LockStatistics()
+
+        for statistics in self._statistics:
+            total.merge(statistics)
+
+        return total
+
+    @contextmanager
+    def _hold_stripe(self, index: int) -> Iterator[None]:
+        lock: Lock = self._locks[index]
+        statistics: LockStatistics = self._statistics[index]
+
+        waiting_since: float = perf_counter()
+
+        with lock:
+            holding_since: float = perf_counter()
+            statistics.record_wait(holding_since - waiting_since)
+
+            try:
+                yield
+            finally:
+                statistics.record_hold(perf_counter() - holding_since)
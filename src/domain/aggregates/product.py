@@ -26,6 +26,16 @@ class Product:
         self.batches: list[Batch] = batches
         self.version_number: int = version_number
 
+    def add_batch(self, batch: Batch) -> None:
+        """Add batch.
+
+        Args:
+            batch (Batch): batch entity.
+
+        """
+        self.batches.append(batch)
+        self.version_number += 1
+
     def allocate(
         self,
         line: OrderLine,
@@ -66,6 +66,26 @@ class Batch:
             and self.available_quantity >= line.quantity
         )
 
+    @property
+    def purchased_quantity(self) -> int:
+        """Get purchased quantity.
+
+        Returns:
+            int: purchased quantity.
+
+        """
+        return self._purchased_quantity
+
+    @property
+    def allocations(self) -> frozenset[OrderLine]:
+        """Get allocated order lines.
+
+        Returns:
+            frozenset[OrderLine]: allocated order lines.
+
+        """
+        return frozenset(self._allocations)
+
     @property
     def allocated_quantity(self) -> int:
         """Get allocated quantity.
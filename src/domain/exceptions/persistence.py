@@ -0,0 +1,5 @@
+"""Persistence exception."""
+
+
+class PersistenceError(Exception):
+    """Changes can't be persisted exception."""
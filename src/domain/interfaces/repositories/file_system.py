@@ -1,5 +1,6 @@
 """File system repository interface."""
 
+from collections.abc import Sequence
 from pathlib import Path
 from typing import Protocol
 
@@ -39,11 +40,11 @@ class IFileSystem(Protocol):
         """
         ...
 
-    def history(self) -> list[FileSystemCommand]:
+    def history(self) -> Sequence[FileSystemCommand]:
         """Get history.
 
         Returns:
-            list[FileSystemCommand]: history.
+            Sequence[FileSystemCommand]: history.
 
         """
         ...
@@ -0,0 +1,85 @@
+"""Idempotency store interface."""
+
+from typing import Protocol
+
+from src.domain.value_objects.idempotency_record import IdempotencyRecord
+from src.domain.value_objects.stored_response import StoredResponse
+
+
+class IdempotencyStore(Protocol):
+    """Idempotency store interface."""
+
+    def reserve(
+        self,
+        key: str,
+        fingerprint: str,
+        now: float,
+        expires_at: float,
+    ) -> IdempotencyRecord | None:
+        """Reserve an idempotency key for a request, unless it is held.
+
+        Args:
+            key (str): idempotency key.
+            fingerprint (str): digest of the request.
+            now (float): current time, a record of the same key expired by
+                then is replaced.
+            expires_at (float): time the reservation expires at, unless
+                completed before.
+
+        Returns:
+            IdempotencyRecord | None: None if the key is reserved for the
+                request, otherwise the record holding it.
+
+        """
+        ...
+
+    def complete(
+        self,
+        key: str,
+        response: StoredResponse,
+        expires_at: float,
+    ) -> None:
+        """Store response of a reserved idempotency key.
+
+        Args:
+            key (str): idempotency key.
+            response (StoredResponse): response.
+            expires_at (float): time the response expires at.
+
+        """
+        ...
+
+    def release(self, key: str) -> None:
+        """Drop reservation of an idempotency key without a response.
+
+        Args:
+            key (str): idempotency key.
+
+        """
+        ...
+
+    def get(self, key: str, now: float) -> IdempotencyRecord | None:
+        """Get record of an idempotency key.
+
+        Args:
+            key (str): idempotency key.
+            now (float): current time, records expired by then are
+                ignored.
+
+        Returns:
+            IdempotencyRecord | None: record.
+
+        """
+        ...
+
+    def purge(self, now: float) -> int:
+        """Delete expired records.
+
+        Args:
+            now (float): current time.
+
+        Returns:
+            int: number of deleted records.
+
+        """
+        ...
@@ -0,0 +1,45 @@
+"""Reader repository interface."""
+
+from collections.abc import Iterator
+from typing import Protocol
+
+
+class IReader(Protocol):
+    """Reader repository interface."""
+
+    def get_hashes(self, key: str) -> dict[str, str]:
+        """Get hashes.
+
+        Args:
+            key (str): key, e.g. a folder.
+
+        Returns:
+            dict[str, str]: file name by content hash.
+
+        """
+        ...
+
+    def get_names(self, key: str) -> list[str]:
+        """Get names of every file read, those of same content included.
+
+        Args:
+            key (str): key, e.g. a folder.
+
+        Returns:
+            list[str]: file names.
+
+        """
+        ...
+
+    def iter_hashes(self, key: str) -> Iterator[tuple[str, str]]:
+        """Get hashes one by one.
+
+        Args:
+            key (str): key, e.g. a folder.
+
+        Yields:
+            Iterator[tuple[str, str]]: content hash and file name records,
+                in no particular order.
+
+        """
+        ...
@@ -1,8 +1,10 @@
 """SQL repository interface."""
 
+from collections.abc import Iterable, Iterator
 from typing import Protocol
 
 from src.domain.aggregates.product import Product
+from src.domain.value_objects.allocation import Allocation
 
 
 class SQLRepository(Protocol):
@@ -20,6 +22,45 @@ class SQLRepository(Protocol):
         """
         ...
 
+    def get_version(self, stock_keeping_unit: str) -> int | None:
+        """Get version number of a product without loading its batches.
+
+        Args:
+            stock_keeping_unit (str): stock keeping unit.
+
+        Returns:
+            int | None: version number, None for unknown products.
+
+        """
+        ...
+
+    def get_many(self, stock_keeping_units: Iterable[str]) -> list[Product]:
+        """Get and lock product aggregates in stock keeping unit order.
+
+        Args:
+            stock_keeping_units (Iterable[str]): stock keeping units.
+
+        Returns:
+            list[Product]: found product aggregates, sorted by stock keeping
+                unit.
+
+        """
+        ...
+
+    def iter_allocations(
+        self, stock_keeping_unit: str
+    ) -> Iterator[Allocation]:
+        """Iterate over allocations of a product without loading it.
+
+        Args:
+            stock_keeping_unit (str): stock keeping unit.
+
+        Returns:
+            Iterator[Allocation]: allocations, in allocation order.
+
+        """
+        ...
+
     def add(self, product: Product) -> None:
         """Add product aggregate to repository.
 
@@ -1,5 +1,6 @@
 """Allocation unit of work interface."""
 
+from contextlib import AbstractContextManager
 from types import TracebackType
 from typing import Protocol, Self
 
@@ -27,6 +28,24 @@ class AllocationUOW(Protocol):
         """Rollback changes."""
         ...
 
+    def savepoint(
+        self,
+        stock_keeping_unit: str | None = None,
+    ) -> AbstractContextManager[None]:
+        """Open nested scope rolled back alone if its block raises.
+
+        Args:
+            stock_keeping_unit (str | None, optional): the only product the
+                block changes, so a unit of work copying products to roll
+                them back can copy just this one. Defaults to None, any.
+
+        Returns:
+            AbstractContextManager[None]: savepoint scope, the exception is
+                re-raised after the rollback.
+
+        """
+        ...
+
     def __enter__(self) -> Self:
         """Enter dunder method."""
         ...
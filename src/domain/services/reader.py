@@ -1,7 +1,11 @@
 """Reader domain service."""
 
+from collections.abc import Iterator
 
-class Reader:
+from src.domain.interfaces.repositories.reader import IReader
+
+
+class Reader(IReader):
     """Reader domain service."""
 
     def __init__(
@@ -32,3 +36,27 @@ class Reader:
 
         """
         return self._memory[key]
+
+    def get_names(self, key: str) -> list[str]:
+        """Get names.
+
+        Args:
+            key (str): key.
+
+        Returns:
+            list[str]: file names.
+
+        """
+        return list(self._memory[key].values())
+
+    def iter_hashes(self, key: str) -> Iterator[tuple[str, str]]:
+        """Get hashes one by one.
+
+        Args:
+            key (str): key.
+
+        Yields:
+            Iterator[tuple[str, str]]: hash and file name records.
+
+        """
+        yield from self._memory[key].items()
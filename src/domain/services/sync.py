@@ -1,9 +1,96 @@
 """Sync domain service."""
 
+from collections import Counter
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
 from pathlib import Path
 
 from src.domain.interfaces.repositories.file_system import IFileSystem
-from src.domain.services.reader import Reader
+from src.domain.interfaces.repositories.reader import IReader
+from src.domain.value_objects.file_system_command import FileSystemCommand
+from src.domain.value_objects.file_system_command_action import (
+    FileSystemCommandAction,
+)
+from src.domain.value_objects.sync_plan import SyncPlan
+
+
+@dataclass(slots=True)
+class _Operation:
+    action: FileSystemCommandAction
+    # Name the operation reads from, in the source folder for a copy.
+    source: str
+    # Destination name it writes, None for a delete.
+    target: str | None = None
+    # Index of the operation it waits for to free its target.
+    dependency: int | None = None
+
+
+def _folders(operation: _Operation) -> Iterator[tuple[str, str | None]]:
+    # Folders holding the operation's source, innermost first, with the
+    # folder the operation puts them at, as long as it keeps the path
+    # inside the folder.
+    end: int = operation.source.rfind("/")
+
+    while end > 0:
+        relative: str = operation.source[end:]
+
+        if operation.target is None:
+            yield operation.source[:end], None
+        elif operation.target.endswith(relative) and len(
+            operation.target
+        ) > len(relative):
+            yield operation.source[:end], operation.target[: -len(relative)]
+        else:
+            return
+
+        end = operation.source.rfind("/", 0, end)
+
+
+def _folder_sizes(names: Iterable[str]) -> Counter[str]:
+    # Number of files in each folder, subfolders included.
+    sizes: Counter[str] = Counter()
+
+    for name in names:
+        end: int = name.rfind("/")
+
+        while end > 0:
+            sizes[name[:end]] += 1
+            end = name.rfind("/", 0, end)
+
+    return sizes
+
+
+def _ancestors(name: str) -> Iterator[str]:
+    # The name itself, then the folders holding it.
+    end: int = len(name)
+
+    while end > 0:
+        yield name[:end]
+        end = name.rfind("/", 0, end)
+
+
+def execute_command(
+    command: FileSystemCommand,
+    file_system: IFileSystem,
+) -> None:
+    """Run command on a file system.
+
+    Args:
+        command (FileSystemCommand): command.
+        file_system (IFileSystem): file system repository.
+
+    """
+    if (
+        command.command == FileSystemCommandAction.delete
+        or command.destination is None
+    ):
+        file_system.delete(command.source)
+
+    elif command.command == FileSystemCommandAction.copy:
+        file_system.copy(command.source, command.destination)
+
+    else:
+        file_system.move(command.source, command.destination)
 
 
 class SyncService:
@@ -11,7 +98,7 @@ class SyncService:
 
     def sync(
         self,
-        reader: Reader,
+        reader: IReader,
         file_system: IFileSystem,
         source: str,
         destination: str,
@@ -19,60 +106,351 @@ class SyncService:
         """Sync two folders.
 
         Args:
-            reader (Reader): reader service.
+            reader (IReader): reader.
             file_system (IFileSystem): file system repository.
             source (Path): source folder.
             destination (Path): destination folder.
 
         """
-        source_hashes: dict[str, str] = reader.get_hashes(source)
-        destination_hashes: dict[str, str] = reader.get_hashes(destination)
+        plan: SyncPlan = self.plan(
+            source_hashes=reader.get_hashes(source),
+            destination_hashes=reader.get_hashes(destination),
+            source=source,
+            destination=destination,
+            source_names=reader.get_names(source),
+            destination_names=reader.get_names(destination),
+        )
+
+        for command in plan.commands:
+            execute_command(command, file_system)
+
+    def plan(  # noqa: PLR0913
+        self,
+        source_hashes: dict[str, str],
+        destination_hashes: dict[str, str],
+        source: str,
+        destination: str,
+        source_names: Iterable[str] | None = None,
+        destination_names: Iterable[str] | None = None,
+    ) -> SyncPlan:
+        """Plan commands making destination folder match the source one.
+
+        Files missing from the destination are copied, files with another
+        name are moved and files missing from the source are deleted. A
+        file changed in place is copied over its old version instead of
+        deleted first, so a file system can update it by delta. A command
+        writing a name waits for the move or delete freeing it, and moves
+        swapping names go through a temporary name.
+
+        Given the names of every file of both folders, when every file of
+        a folder is deleted, or moved or copied keeping its path inside the
+        folder to a folder missing from the destination, the folder is
+        deleted, moved or copied at once, and writes inside it wait for
+        that. Hashes keep one name per content, so they alone can't tell
+        a folder is covered whole.
+
+        Args:
+            source_hashes (dict[str, str]): source file names by hash.
+            destination_hashes (dict[str, str]): destination file names by
+                hash.
+            source (str): source folder.
+            destination (str): destination folder.
+            source_names (Iterable[str] | None, optional): names of every
+                source file, those of same content included. Defaults to
+                None, folders are not collapsed.
+            destination_names (Iterable[str] | None, optional): names of
+                every destination file. Defaults to None, folders are not
+                collapsed.
+
+        Returns:
+            SyncPlan: plan.
+
+        """
+        operations: list[_Operation] = self._operations(
+            source_hashes, destination_hashes
+        )
+
+        names: set[str] = set(source_hashes.values()) | set(
+            destination_hashes.values()
+        )
+
+        if source_names is not None and destination_names is not None:
+            listed_source: set[str] = set(source_names)
+            listed_destination: set[str] = set(destination_names)
+            operations = self._collapse(
+                operations, listed_source, listed_destination
+            )
+            names |= listed_source | listed_destination
+
+        self._break_cycles(operations, names)
+        order: list[int] = self._order(operations)
+        positions: dict[int, int] = {
+            index: position for position, index in enumerate(order)
+        }
+        dependencies: list[tuple[int, ...]] = []
+
+        for index in order:
+            dependency: int | None = operations[index].dependency
+            dependencies.append(
+                () if dependency is None else (positions[dependency],),
+            )
+
+        return SyncPlan(
+            commands=tuple(
+                self._command(operations[index], source, destination)
+                for index in order
+            ),
+            dependencies=tuple(dependencies),
+        )
+
+    def _operations(
+        self,
+        source_hashes: dict[str, str],
+        destination_hashes: dict[str, str],
+    ) -> list[_Operation]:
+        operations: list[_Operation] = []
 
         for hash_value, file_name in source_hashes.items():
             if hash_value not in destination_hashes:
-                self._copy(file_name, source, destination, file_system)
+                operations.append(
+                    _Operation(
+                        FileSystemCommandAction.copy, file_name, file_name
+                    )
+                )
 
             elif destination_hashes[hash_value] != file_name:
-                self._move(
-                    file_name=file_name,
-                    hash_value=hash_value,
-                    hashes=destination_hashes,
-                    destination=destination,
-                    file_system=file_system,
+                operations.append(
+                    _Operation(
+                        FileSystemCommandAction.move,
+                        destination_hashes[hash_value],
+                        file_name,
+                    )
                 )
 
-        for hash_value, file_name in destination_hashes.items():
-            if hash_value not in source_hashes:
-                self._delete(file_name, destination, file_system)
+        copied: set[str] = {
+            str(operation.target)
+            for operation in operations
+            if operation.action == FileSystemCommandAction.copy
+        }
+        operations.extend(
+            _Operation(FileSystemCommandAction.delete, file_name)
+            for hash_value, file_name in destination_hashes.items()
+            if hash_value not in source_hashes and file_name not in copied
+        )
+        vacating: dict[str, int] = {
+            operation.source: index
+            for index, operation in enumerate(operations)
+            if operation.action != FileSystemCommandAction.copy
+        }
 
-    def _copy(
+        for operation in operations:
+            if operation.target is not None:
+                operation.dependency = vacating.get(operation.target)
+
+        return operations
+
+    def _collapse(
         self,
-        file_name: str,
-        source: str,
-        destination: str,
-        file_system: IFileSystem,
-    ) -> None:
-        source_path: Path = Path(source) / file_name
-        destination_path: Path = Path(destination) / file_name
-        file_system.copy(source_path, destination_path)
+        operations: list[_Operation],
+        source_names: set[str],
+        destination_names: set[str],
+    ) -> list[_Operation]:
+        groups: dict[
+            tuple[FileSystemCommandAction, str, str | None], list[int]
+        ] = {}
+
+        listed: dict[FileSystemCommandAction, set[str]] = {
+            FileSystemCommandAction.copy: source_names,
+            FileSystemCommandAction.move: destination_names,
+            FileSystemCommandAction.delete: destination_names,
+        }
+
+        for index, operation in enumerate(operations):
+            # Operations on unlisted names can't vouch for a whole folder.
+            if operation.source not in listed[operation.action]:
+                continue
+
+            for folder, target in _folders(operation):
+                groups.setdefault(
+                    (operation.action, folder, target), []
+                ).append(index)
+
+        sizes: dict[FileSystemCommandAction, Counter[str]] = {
+            FileSystemCommandAction.copy: _folder_sizes(source_names),
+            FileSystemCommandAction.move: _folder_sizes(destination_names),
+        }
+        sizes[FileSystemCommandAction.delete] = sizes[
+            FileSystemCommandAction.move
+        ]
+        # Names and folders in the destination or written by a folder
+        # operation, and folders written by one.
+        taken: set[str] = set(sizes[FileSystemCommandAction.move])
+        taken.update(destination_names)
+        written: set[str] = set()
+        collapsed: dict[int, int] = {}
+        folders: list[_Operation] = []
 
-    def _move(
+        # Outer folders first, an inner one is collapsed with them.
+        for (action, folder, target), indexes in sorted(
+            groups.items(),
+            key=lambda group: group[0][1].count("/"),
+        ):
+            if (
+                len(indexes) == sizes[action][folder]
+                and not any(index in collapsed for index in indexes)
+                and self._is_free(folder, target, taken, written)
+            ):
+                collapsed.update(dict.fromkeys(indexes, len(folders)))
+                folders.append(_Operation(action, folder, target))
+
+                if target is not None:
+                    taken.update(_ancestors(target))
+                    written.add(target)
+
+        return (
+            self._wait_for_folders(operations, collapsed, folders)
+            if folders
+            else operations
+        )
+
+    def _is_free(
         self,
-        file_name: str,
-        hash_value: str,
-        hashes: dict[str, str],
-        destination: str,
-        file_system: IFileSystem,
+        folder: str,
+        target: str | None,
+        taken: set[str],
+        written: set[str],
+    ) -> bool:
+        # A folder is only written where nothing is, nor will be, and not
+        # into itself; a copy writes the folder it reads.
+        return target is None or (
+            target not in taken
+            and not any(name in written for name in _ancestors(target))
+            and not target.startswith(f"{folder}/")
+            and not folder.startswith(f"{target}/")
+        )
+
+    def _wait_for_folders(
+        self,
+        operations: list[_Operation],
+        collapsed: dict[int, int],
+        folders: list[_Operation],
+    ) -> list[_Operation]:
+        kept: list[int] = [
+            index for index in range(len(operations)) if index not in collapsed
+        ]
+        positions: dict[int, int] = {
+            index: position for position, index in enumerate(kept)
+        }
+        positions.update(
+            (index, len(kept) + folder) for index, folder in collapsed.items()
+        )
+        # Folders a folder operation empties or fills, by the position of
+        # that operation.
+        areas: dict[str, int] = {}
+
+        for position, operation in enumerate(folders, len(kept)):
+            areas.setdefault(operation.source, position)
+
+            if operation.target is not None:
+                areas.setdefault(operation.target, position)
+
+        result: list[_Operation] = [operations[index] for index in kept]
+        result.extend(folders)
+
+        for position, operation in enumerate(result):
+            area: int | None = next(
+                (
+                    areas[name]
+                    for name in _ancestors(operation.target or "")
+                    if areas.get(name, position) != position
+                ),
+                None,
+            )
+            operation.dependency = (
+                area
+                if area is not None or operation.dependency is None
+                else positions[operation.dependency]
+            )
+
+        return result
+
+    def _break_cycles(
+        self,
+        operations: list[_Operation],
+        names: set[str],
     ) -> None:
-        old_destination_path: Path = Path(destination) / hashes[hash_value]
-        new_destination_path: Path = Path(destination) / file_name
-        file_system.move(old_destination_path, new_destination_path)
+        # Every operation waits for one other at most, so a cycle is a ring
+        # of moves. The first move of a ring goes to a free name instead,
+        # and a last move takes it from there to its target.
+        visited: set[int] = set()
+
+        for start in range(len(operations)):
+            path: list[int] = []
+            index: int | None = start
+
+            while index is not None and index not in visited:
+                visited.add(index)
+                path.append(index)
+                index = operations[index].dependency
+
+            if index is None or index not in path:
+                continue
+
+            move: _Operation = operations[index]
+            temporary: str = self._free_name(str(move.target), names)
+            names.add(temporary)
+            operations.append(
+                _Operation(
+                    FileSystemCommandAction.move,
+                    temporary,
+                    move.target,
+                    move.dependency,
+                )
+            )
+            move.target = temporary
+            move.dependency = None
+
+    def _free_name(self, name: str, names: set[str]) -> str:
+        suffix: int = 0
 
-    def _delete(
+        while f"{name}.sync-{suffix}" in names:
+            suffix += 1
+
+        return f"{name}.sync-{suffix}"
+
+    def _order(self, operations: list[_Operation]) -> list[int]:
+        order: list[int] = []
+        ordered: set[int] = set()
+
+        for start in range(len(operations)):
+            chain: list[int] = []
+            index: int | None = start
+
+            while index is not None and index not in ordered:
+                ordered.add(index)
+                chain.append(index)
+                index = operations[index].dependency
+
+            order.extend(reversed(chain))
+
+        return order
+
+    def _command(
         self,
-        file_name: str,
+        operation: _Operation,
+        source: str,
         destination: str,
-        file_system: IFileSystem,
-    ) -> None:
-        delete_path: Path = Path(destination) / file_name
-        file_system.delete(delete_path)
+    ) -> FileSystemCommand:
+        return FileSystemCommand(
+            command=operation.action,
+            source=(
+                Path(source) / operation.source
+                if operation.action == FileSystemCommandAction.copy
+                else Path(destination) / operation.source
+            ),
+            destination=(
+                None
+                if operation.target is None
+                else Path(destination) / operation.target
+            ),
+        )
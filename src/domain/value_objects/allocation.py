@@ -0,0 +1,13 @@
+"""Allocation value object."""
+
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True, slots=True)
+class Allocation:
+    """Order line allocated against a batch."""
+
+    order_id: str
+    stock_keeping_unit: str
+    quantity: int
+    batch_reference: str
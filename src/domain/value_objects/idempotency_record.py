@@ -0,0 +1,15 @@
+"""Idempotency record value object."""
+
+from dataclasses import dataclass
+
+from src.domain.value_objects.stored_response import StoredResponse
+
+
+@dataclass(frozen=True, slots=True)
+class IdempotencyRecord:
+    """Request holding an idempotency key, and its response once done."""
+
+    # Digest of the request, a key is only replayed to the same request.
+    fingerprint: str
+    # None while the request is running.
+    response: StoredResponse | None = None
@@ -0,0 +1,11 @@
+"""Stored response value object."""
+
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True, slots=True)
+class StoredResponse:
+    """Response kept to be replayed to retries of the same request."""
+
+    status_code: int
+    body: bytes
@@ -0,0 +1,18 @@
+"""Sync plan value object."""
+
+from dataclasses import dataclass
+
+from src.domain.value_objects.file_system_command import FileSystemCommand
+
+
+@dataclass(slots=True, frozen=True)
+class SyncPlan:
+    """Sync plan value object.
+
+    Commands are in an order they can run one by one. Each one also lists
+    the indices of the commands it must wait for, so the others can run
+    concurrently.
+    """
+
+    commands: tuple[FileSystemCommand, ...] = ()
+    dependencies: tuple[tuple[int, ...], ...] = ()
@@ -0,0 +1,214 @@
+"""Block delta of files.
+
+The rsync algorithm, done on one machine. The old file is cut into blocks,
+each signed with a weak Adler-32 checksum and a strong SHA-256 digest. The
+new file is scanned with a window of one block: where the weak checksum of
+the window is known and the strong digest agrees, the block is taken from
+the old file, otherwise the window rolls one byte and the byte is literal
+data. Adler-32 rolls in constant time, so only bytes around changes are
+visited one by one.
+
+Deltas are applied in place, where only a block unchanged at its own
+offset costs no write, a block read from elsewhere costs as much as
+literal data. So when a window doesn't match, the scan jumps to the next
+unchanged block, and everything up to it is literal; rolling couldn't
+write less. It only rolls where no unchanged block is left.
+"""
+
+import hashlib
+import zlib
+from collections.abc import Iterator
+from dataclasses import dataclass
+from mmap import mmap
+
+# Modulus of Adler-32.
+_ADLER: int = 65521
+
+# Offsets and strong digests of old blocks by weak checksum.
+BlockSignatures = dict[int, list[tuple[int, bytes]]]
+
+# Whole file content, read or mapped; slices of either are bytes.
+FileContent = bytes | mmap
+
+
+@dataclass(frozen=True, slots=True)
+class DeltaOperation:
+    """Write making a range of the old file match the new one."""
+
+    # Offset of the range, in both files.
+    offset: int
+    length: int
+    # Offset of the old file the range is read from, None when it is read
+    # from the new file.
+    source: int | None = None
+
+
+def block_signatures(old: FileContent, block_size: int) -> BlockSignatures:
+    """Sign every whole block of a file.
+
+    Args:
+        old (FileContent): old file content, e.g. a memory map.
+        block_size (int): block size.
+
+    Returns:
+        BlockSignatures: offsets and strong digests by weak checksum.
+
+    """
+    signatures: BlockSignatures = {}
+
+    for offset in range(0, len(old) - block_size + 1, block_size):
+        block: bytes = old[offset : offset + block_size]
+        signatures.setdefault(zlib.adler32(block), []).append(
+            (offset, hashlib.sha256(block).digest()),
+        )
+
+    return signatures
+
+
+def block_delta(
+    new: FileContent,
+    signatures: BlockSignatures,
+    block_size: int,
+) -> Iterator[DeltaOperation]:
+    """Get writes turning an old file into a new one in place.
+
+    Blocks already at their offset need no write. Writes are in offset
+    order and only read old blocks at or after their own offset, so
+    applied in order they never read a range an earlier one overwrote.
+    Literal data is yielded as the scan passes it, so a caller can stop
+    early once a delta costs more than a plain copy.
+
+    Args:
+        new (FileContent): new file content, e.g. a memory map.
+        signatures (BlockSignatures): signatures of the old file.
+        block_size (int): block size the old file was signed with.
+
+    Yields:
+        Iterator[DeltaOperation]: writes, in offset order.
+
+    """
+    size: int = len(new)
+    position: int = 0
+    literal: int = 0
+    unchanged: Iterator[int] = _unchanged(new, signatures, block_size)
+    aligned: int | None = next(unchanged, None)
+
+    while position + block_size <= size:
+        while aligned is not None and aligned < position:
+            aligned = next(unchanged, None)
+
+        offset: int | None = (
+            position
+            if aligned == position
+            else _find(new, signatures, position, block_size)
+        )
+
+        if offset is None:
+            position, offset = (
+                _roll(new, signatures, position, block_size)
+                if aligned is None
+                else (aligned, aligned)
+            )
+
+        if offset is None:
+            # Bytes the window left behind are literal for sure.
+            yield DeltaOperation(literal, position - literal)
+        elif offset < position:
+            # The block moved forward and is overwritten before it could
+            # be read, it is literal data. Stepping over it keeps the scan
+            # aligned with the shifted data instead of rolling through it.
+            position += block_size
+            yield DeltaOperation(literal, position - literal)
+        else:
+            if literal < position:
+                yield DeltaOperation(literal, position - literal)
+
+            if offset != position:
+                yield DeltaOperation(position, block_size, offset)
+
+            position += block_size
+
+        literal = position
+
+    if literal < size:
+        yield DeltaOperation(literal, size - literal)
+
+
+def _find(
+    new: FileContent,
+    signatures: BlockSignatures,
+    position: int,
+    block_size: int,
+) -> int | None:
+    block: bytes = new[position : position + block_size]
+    candidates: list[tuple[int, bytes]] | None = signatures.get(
+        zlib.adler32(block)
+    )
+
+    return None if candidates is None else _match(block, candidates, position)
+
+
+def _match(
+    block: bytes,
+    candidates: list[tuple[int, bytes]],
+    position: int,
+) -> int | None:
+    # The same offset is best, a later one can still be read, an earlier
+    # one only tells the data shifted.
+    digest: bytes = hashlib.sha256(block).digest()
+    offsets: list[int] = [
+        offset for offset, strong in candidates if strong == digest
+    ]
+
+    if not offsets or position in offsets:
+        return position if offsets else None
+
+    return min(
+        offsets,
+        key=lambda offset: (offset < position, abs(offset - position)),
+    )
+
+
+def _unchanged(
+    new: FileContent,
+    signatures: BlockSignatures,
+    block_size: int,
+) -> Iterator[int]:
+    # Old blocks start at multiples of the block size, only there can a
+    # block be unchanged.
+    for offset in range(0, len(new) - block_size + 1, block_size):
+        if _find(new, signatures, offset, block_size) == offset:
+            yield offset
+
+
+def _roll(
+    new: FileContent,
+    signatures: BlockSignatures,
+    position: int,
+    block_size: int,
+) -> tuple[int, int | None]:
+    # Rolls the window up to a block further, and gets the first window
+    # matching an old block, or where the next window starts.
+    end: int = min(position + block_size, len(new) - block_size)
+    weak: int = zlib.adler32(new[position : position + block_size])
+
+    for window in range(position + 1, end + 1):
+        removed: int = new[window - 1]
+        low: int = (
+            (weak & 0xFFFF) - removed + new[window + block_size - 1]
+        ) % _ADLER
+        high: int = ((weak >> 16) - block_size * removed + low - 1) % _ADLER
+        weak = high << 16 | low
+
+        if (
+            weak in signatures
+            and (
+                offset := _match(
+                    new[window : window + block_size], signatures[weak], window
+                )
+            )
+            is not None
+        ):
+            return window, offset
+
+    return end + 1, None
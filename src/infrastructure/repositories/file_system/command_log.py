@@ -0,0 +1,346 @@
+"""File system command log."""
+
+import struct
+from array import array
+from collections.abc import Iterable, Iterator, Sequence
+from dataclasses import dataclass
+from mmap import ACCESS_READ, mmap
+from pathlib import Path
+from threading import Lock
+from typing import overload
+
+from src.domain.value_objects.file_system_command import FileSystemCommand
+from src.domain.value_objects.file_system_command_action import (
+    FileSystemCommandAction,
+)
+
+_ACTIONS: tuple[FileSystemCommandAction, ...] = tuple(FileSystemCommandAction)
+_CODES: dict[FileSystemCommandAction, int] = {
+    action: code for code, action in enumerate(_ACTIONS)
+}
+# Parent string index of a missing destination.
+_MISSING: int = 0xFFFFFFFF
+_MAGIC: bytes = b"FSCL"
+_VERSION: int = 1
+# Magic, version, number of commands and number of strings.
+_HEADER: struct.Struct = struct.Struct("=4sIQQ")
+# Columns of string indexes: source parent and name, destination parent
+# and name.
+_COLUMNS: int = 4
+
+
+def _padded(size: int) -> int:
+    # Sections start at multiples of 8 bytes.
+    return -(-size // 8) * 8
+
+
+@dataclass(slots=True)
+class _Sections:
+    # Views of a loaded log file, released before the map is closed.
+    map: mmap
+    views: list[memoryview]
+    actions: memoryview
+    columns: list[memoryview]
+    offsets: memoryview
+    blob: memoryview
+
+    def release(self) -> None:
+        for view in reversed(self.views):
+            view.release()
+
+        self.map.close()
+
+
+class CommandLog(Sequence[FileSystemCommand]):
+    """File system command log.
+
+    Commands are kept in columns: actions in a byte array, and paths split
+    into a parent folder and a name, each an index into one table of
+    interned strings, so a folder or a name shared by many commands is
+    kept once. A command costs 17 bytes plus its new strings, and is only
+    turned into a FileSystemCommand when read.
+
+    A log saves to a binary file with the same columns, in native byte
+    order, and a loaded log maps it into memory: strings are decoded when
+    read, and the first append copies the log back into memory.
+    """
+
+    def __init__(self, commands: Iterable[FileSystemCommand] = ()) -> None:
+        """Create new instance.
+
+        Args:
+            commands (Iterable[FileSystemCommand], optional): commands to
+                append. Defaults to ().
+
+        """
+        self._lock: Lock = Lock()
+        self._actions: bytearray = bytearray()
+        self._columns: list[array[int]] = [array("I") for _ in range(_COLUMNS)]
+        self._strings: list[str] = []
+        self._indexes: dict[str, int] = {}
+        self._sections: _Sections | None = None
+        # Parent folders read back, many commands share one.
+        self._folders: dict[int, Path] = {}
+
+        for command in commands:
+            self.append(command)
+
+    @classmethod
+    def load(cls, path: Path) -> "CommandLog":
+        """Map a saved log into memory.
+
+        Args:
+            path (Path): log file.
+
+        Raises:
+            ValueError: if the file isn't a command log of this version.
+
+        Returns:
+            CommandLog: log reading the file, close it when done.
+
+        """
+        with path.open("rb") as file:
+            mapped: mmap = mmap(file.fileno(), 0, access=ACCESS_READ)
+
+        view: memoryview = memoryview(mapped)
+        magic, version, commands, strings = _HEADER.unpack_from(view)
+
+        if magic != _MAGIC or version != _VERSION:
+            view.release()
+            mapped.close()
+            msg: str = f"{path} isn't a version {_VERSION} command log."
+            raise ValueError(msg)
+
+        offset: int = _HEADER.size + _padded(commands)
+        columns: list[memoryview] = []
+
+        for _ in range(_COLUMNS):
+            columns.append(view[offset : offset + 4 * commands].cast("I"))
+            offset += _padded(4 * commands)
+
+        actions: memoryview = view[_HEADER.size : _HEADER.size + commands]
+        offsets: memoryview = view[offset : offset + 8 * (strings + 1)].cast(
+            "Q"
+        )
+        blob: memoryview = view[offset + 8 * (strings + 1) :]
+        log: CommandLog = cls()
+        log._sections = _Sections(
+            map=mapped,
+            views=[view, actions, *columns, offsets, blob],
+            actions=actions,
+            columns=columns,
+            offsets=offsets,
+            blob=blob,
+        )
+
+        return log
+
+    def save(self, path: Path) -> None:
+        """Save log to a binary file.
+
+        Args:
+            path (Path): log file, overwritten.
+
+        """
+        with self._lock:
+            actions: bytearray | memoryview = self._actions
+            columns: list[array[int]] | list[memoryview] = self._columns
+
+            if self._sections is not None:
+                actions = self._sections.actions
+                columns = self._sections.columns
+
+            commands: int = len(actions)
+            encoded: list[bytes] = [
+                self._string(index).encode(errors="surrogateescape")
+                for index in range(self._string_count())
+            ]
+            offsets: array[int] = array("Q", [0])
+
+            for string in encoded:
+                offsets.append(offsets[-1] + len(string))
+
+            with path.open("wb") as file:
+                file.write(
+                    _HEADER.pack(_MAGIC, _VERSION, commands, len(encoded))
+                )
+                file.write(actions)
+                file.write(bytes(_padded(commands) - commands))
+
+                for column in columns:
+                    file.write(column)
+                    file.write(bytes(_padded(4 * commands) - 4 * commands))
+
+                file.write(offsets)
+                file.writelines(encoded)
+
+    def append(self, command: FileSystemCommand) -> None:
+        """Append command.
+
+        Args:
+            command (FileSystemCommand): command.
+
+        """
+        with self._lock:
+            if self._sections is not None:
+                self._thaw(self._sections)
+
+            indexes: tuple[int, ...] = (
+                *self._intern(command.source),
+                *(
+                    (_MISSING, _MISSING)
+                    if command.destination is None
+                    else self._intern(command.destination)
+                ),
+            )
+
+            for column, index in zip(self._columns, indexes, strict=True):
+                column.append(index)
+
+            self._actions.append(_CODES[command.command])
+
+    def close(self) -> None:
+        """Release the file of a loaded log, it can't be read after."""
+        with self._lock:
+            if self._sections is not None:
+                self._sections.release()
+                self._sections = None
+
+    def __len__(self) -> int:
+        """Get number of commands.
+
+        Returns:
+            int: number of commands.
+
+        """
+        return len(self._read_columns()[0])
+
+    @overload
+    def __getitem__(self, index: int) -> FileSystemCommand: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[FileSystemCommand]: ...
+
+    def __getitem__(
+        self,
+        index: int | slice,
+    ) -> FileSystemCommand | list[FileSystemCommand]:
+        """Get command, or a list of commands of a slice.
+
+        Args:
+            index (int | slice): command index or slice.
+
+        Raises:
+            IndexError: if the index is out of range.
+
+        Returns:
+            FileSystemCommand | list[FileSystemCommand]: command, or
+                commands.
+
+        """
+        if isinstance(index, slice):
+            return [self[item] for item in range(*index.indices(len(self)))]
+
+        if index < 0:
+            index += len(self)
+
+        if not 0 <= index < len(self):
+            msg: str = f"Command index out of range, got {index}."
+            raise IndexError(msg)
+
+        return self._command(index)
+
+    def __iter__(self) -> Iterator[FileSystemCommand]:
+        """Iterate over commands.
+
+        Yields:
+            Iterator[FileSystemCommand]: commands, in order.
+
+        """
+        for index in range(len(self)):
+            yield self._command(index)
+
+    def __eq__(self, other: object) -> bool:
+        """Compare with a sequence of commands.
+
+        Args:
+            other (object): other sequence.
+
+        Returns:
+            bool: whether both have equal commands in the same order.
+
+        """
+        if not isinstance(other, Sequence):
+            return NotImplemented
+
+        return len(self) == len(other) and all(
+            command == other_command
+            for command, other_command in zip(self, other, strict=True)
+        )
+
+    def _command(self, index: int) -> FileSystemCommand:
+        actions, columns = self._read_columns()
+        source_parent, source_name, destination_parent, destination_name = (
+            column[index] for column in columns
+        )
+
+        return FileSystemCommand(
+            command=_ACTIONS[actions[index]],
+            source=self._path(source_parent, source_name),
+            destination=(
+                None
+                if destination_parent == _MISSING
+                else self._path(destination_parent, destination_name)
+            ),
+        )
+
+    def _path(self, parent: int, name: int) -> Path:
+        if (folder := self._folders.get(parent)) is None:
+            folder = self._folders[parent] = Path(self._string(parent))
+
+        return folder / self._string(name)
+
+    def _read_columns(self) -> tuple[Sequence[int], Sequence[Sequence[int]]]:
+        if self._sections is None:
+            return self._actions, self._columns
+
+        return self._sections.actions, self._sections.columns
+
+    def _intern(self, path: Path) -> tuple[int, int]:
+        return self._index(str(path.parent)), self._index(path.name)
+
+    def _index(self, string: str) -> int:
+        if (index := self._indexes.get(string)) is None:
+            index = self._indexes[string] = len(self._strings)
+            self._strings.append(string)
+
+        return index
+
+    def _string(self, index: int) -> str:
+        if self._sections is None:
+            return self._strings[index]
+
+        offsets: memoryview = self._sections.offsets
+
+        return bytes(
+            self._sections.blob[offsets[index] : offsets[index + 1]],
+        ).decode(errors="surrogateescape")
+
+    def _string_count(self) -> int:
+        return (
+            len(self._strings)
+            if self._sections is None
+            else len(self._sections.offsets) - 1
+        )
+
+    def _thaw(self, sections: _Sections) -> None:
+        self._strings = [
+            self._string(index) for index in range(self._string_count())
+        ]
+        self._indexes = {
+            string: index for index, string in enumerate(self._strings)
+        }
+        self._actions = bytearray(sections.actions)
+        self._columns = [array("I", column) for column in sections.columns]
+        sections.release()
+        self._sections = None
@@ -7,6 +7,9 @@ from src.domain.value_objects.file_system_command import FileSystemCommand
 from src.domain.value_objects.file_system_command_action import (
     FileSystemCommandAction,
 )
+from src.infrastructure.repositories.file_system.command_log import (
+    CommandLog,
+)
 
 
 class FakeFileSystem(IFileSystem):
@@ -14,7 +17,7 @@ class FakeFileSystem(IFileSystem):
 
     def __init__(self) -> None:
         """Create new instance."""
-        self._memory: list[FileSystemCommand] = []
+        self._memory: CommandLog = CommandLog()
 
     def copy(self, src: Path, dest: Path) -> None:
         """Copy file.
@@ -64,11 +67,11 @@ class FakeFileSystem(IFileSystem):
             )
         )
 
-    def history(self) -> list[FileSystemCommand]:
+    def history(self) -> CommandLog:
         """Get history.
 
         Returns:
-            list[FileSystemCommand]: history.
+            CommandLog: history.
 
         """
         return self._memory
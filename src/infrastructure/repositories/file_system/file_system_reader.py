@@ -0,0 +1,338 @@
+"""File system reader repository."""
+
+import hashlib
+import mmap
+import os
+from collections import deque
+from collections.abc import Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import closing
+from dataclasses import dataclass
+from itertools import islice
+from time import time_ns
+
+from src.domain.interfaces.repositories.reader import IReader
+from src.infrastructure.repositories.file_system.hash_cache import (
+    FileDigest,
+    FileKey,
+    HashCache,
+)
+from src.infrastructure.settings import settings
+
+
+@dataclass(frozen=True, slots=True)
+class ScannedFile:
+    """Regular file found by a scan."""
+
+    name: str
+    path: str
+    device: int
+    inode: int
+    size: int
+    mtime_ns: int
+
+
+class FileSystemReader(IReader):
+    """File system reader.
+
+    A folder is walked with os.scandir, which reads the file types along
+    with the names, and its regular files are hashed in a thread pool:
+    hashlib releases the GIL while hashing, so reads and hashes of several
+    files overlap. Small files are read in chunks into a reused buffer,
+    large ones are mapped into memory and hashed in one call.
+
+    Symbolic links are not followed. If files have the same content, the
+    first name in sorted order is kept.
+
+    With a cache folder, digests of every tree are kept in a hash cache
+    there, and only files whose device, inode, size or modification time
+    changed are read again. Files modified within the racy window before
+    the scan are not cached, as they may change again within the
+    timestamp granularity without their time changing.
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        workers: int = settings.reader_workers,
+        batch_size: int = settings.reader_batch_size,
+        chunk_size: int = settings.reader_chunk_size,
+        mmap_threshold: int = settings.reader_mmap_threshold,
+        algorithm: str = settings.reader_hash_algorithm,
+        cache_folder: str | None = settings.reader_cache_folder,
+        racy_window: float = settings.reader_cache_racy_window,
+    ) -> None:
+        """Create new instance.
+
+        Args:
+            workers (int, optional): hashing threads. Defaults to
+                settings.reader_workers.
+            batch_size (int, optional): files hashed per task. Defaults to
+                settings.reader_batch_size.
+            chunk_size (int, optional): bytes read at once. Defaults to
+                settings.reader_chunk_size.
+            mmap_threshold (int, optional): size from which files are
+                mapped into memory. Defaults to
+                settings.reader_mmap_threshold.
+            algorithm (str, optional): hashlib algorithm. Defaults to
+                settings.reader_hash_algorithm.
+            cache_folder (str | None, optional): folder of hash caches.
+                Defaults to settings.reader_cache_folder.
+            racy_window (float, optional): seconds before the scan within
+                which modified files are not cached. Defaults to
+                settings.reader_cache_racy_window.
+
+        Raises:
+            ValueError: if a count or size is less than one or the
+                algorithm is unknown.
+
+        """
+        if min(workers, batch_size, chunk_size, mmap_threshold) < 1:
+            msg: str = (
+                "Workers, batch size, chunk size and mmap threshold must be "
+                f"positive, got {workers}, {batch_size}, {chunk_size} and "
+                f"{mmap_threshold}."
+            )
+            raise ValueError(msg)
+
+        if algorithm not in hashlib.algorithms_available:
+            msg = f"Unknown hash algorithm {algorithm}."
+            raise ValueError(msg)
+
+        self._workers: int = workers
+        self._batch_size: int = batch_size
+        self._chunk_size: int = chunk_size
+        self._mmap_threshold: int = mmap_threshold
+        self._algorithm: str = algorithm
+        self._cache_folder: str | None = cache_folder
+        self._racy_window_ns: int = int(racy_window * 1_000_000_000)
+
+    def get_hashes(self, key: str) -> dict[str, str]:
+        """Get hashes of the files of a folder.
+
+        Args:
+            key (str): folder.
+
+        Returns:
+            dict[str, str]: file name, relative to the folder with "/"
+                separators, by content hash. Files deleted while reading
+                are left out.
+
+        """
+        started_ns: int = time_ns()
+        files: list[ScannedFile] = self.scan(key)
+        digests: dict[str, str] = (
+            self.hash_files(files)
+            if self._cache_folder is None
+            else self._hash_cached(
+                os.path.join(  # noqa: PTH118
+                    self._cache_folder,
+                    self._cache_name(key),
+                ),
+                files,
+                started_ns,
+            )
+        )
+        hashes: dict[str, str] = {}
+
+        for file in files:
+            if (digest := digests.get(file.name)) is not None:
+                hashes.setdefault(digest, file.name)
+
+        return hashes
+
+    def get_names(self, key: str) -> list[str]:
+        """Get names of the regular files of a folder.
+
+        Args:
+            key (str): folder.
+
+        Returns:
+            list[str]: file names, relative to the folder with "/"
+                separators, those of same content included.
+
+        """
+        return [file.name for file in self.walk(key)]
+
+    def scan(self, key: str) -> list[ScannedFile]:
+        """Find regular files of a folder and its subfolders.
+
+        Args:
+            key (str): folder.
+
+        Returns:
+            list[ScannedFile]: files, sorted by name.
+
+        """
+        return sorted(self.walk(key), key=lambda file: file.name)
+
+    def walk(self, key: str) -> Iterator[ScannedFile]:
+        """Find regular files of a folder and its subfolders, one by one.
+
+        Args:
+            key (str): folder.
+
+        Yields:
+            Iterator[ScannedFile]: files, in no particular order.
+
+        """
+        folders: list[tuple[str, str]] = [(key, "")]
+
+        while folders:
+            folder, prefix = folders.pop()
+
+            with os.scandir(folder) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        folders.append((entry.path, f"{prefix}{entry.name}/"))
+
+                    elif entry.is_file(follow_symlinks=False):
+                        status: os.stat_result = entry.stat(
+                            follow_symlinks=False
+                        )
+                        yield ScannedFile(
+                            name=prefix + entry.name,
+                            path=entry.path,
+                            device=status.st_dev,
+                            inode=status.st_ino,
+                            size=status.st_size,
+                            mtime_ns=status.st_mtime_ns,
+                        )
+
+    def iter_hashes(self, key: str) -> Iterator[tuple[str, str]]:
+        """Get hashes of the files of a folder, one by one.
+
+        Files are hashed as they are found, with a bounded number of
+        batches in flight, so memory doesn't grow with the folder. The
+        hash cache is not used, as it is loaded whole.
+
+        Args:
+            key (str): folder.
+
+        Yields:
+            Iterator[tuple[str, str]]: content hash and file name records,
+                in no particular order, with every file of a same content.
+
+        """
+        files: Iterator[ScannedFile] = self.walk(key)
+        pending: deque[Future[list[tuple[str, str]]]] = deque()
+
+        with ThreadPoolExecutor(max_workers=self._workers) as pool:
+            while batch := list(islice(files, self._batch_size)):
+                pending.append(pool.submit(self._hash_batch, batch))
+
+                if len(pending) > 2 * self._workers:
+                    for name, digest in pending.popleft().result():
+                        yield digest, name
+
+            while pending:
+                for name, digest in pending.popleft().result():
+                    yield digest, name
+
+    def hash_files(self, files: list[ScannedFile]) -> dict[str, str]:
+        """Hash files in the thread pool, without the hash cache.
+
+        Args:
+            files (list[ScannedFile]): files of a folder.
+
+        Returns:
+            dict[str, str]: content hash by file name. Files deleted while
+                reading are left out.
+
+        """
+        batches: list[list[ScannedFile]] = [
+            files[index : index + self._batch_size]
+            for index in range(0, len(files), self._batch_size)
+        ]
+        digests: dict[str, str] = {}
+
+        with ThreadPoolExecutor(max_workers=self._workers) as pool:
+            for batch in pool.map(self._hash_batch, batches):
+                digests.update(batch)
+
+        return digests
+
+    def _cache_name(self, key: str) -> str:
+        tree: str = hashlib.sha256(os.path.realpath(key).encode()).hexdigest()
+
+        return f"{tree[:32]}.{self._algorithm}.sqlite"
+
+    def _hash_cached(
+        self,
+        path: str,
+        files: list[ScannedFile],
+        started_ns: int,
+    ) -> dict[str, str]:
+        os.makedirs(os.path.dirname(path), exist_ok=True)  # noqa: PTH103, PTH120
+
+        with closing(HashCache(path)) as cache:
+            cached: dict[FileKey, FileDigest] = cache.digests()
+            digests: dict[str, str] = {}
+            changed: list[ScannedFile] = []
+
+            for file in files:
+                entry: FileDigest | None = cached.get(
+                    (file.device, file.inode)
+                )
+
+                if (
+                    entry is not None
+                    and entry[0] == file.size
+                    and entry[1] == file.mtime_ns
+                ):
+                    digests[file.name] = entry[2]
+                else:
+                    changed.append(file)
+
+            hashed: dict[str, str] = self.hash_files(changed)
+            digests.update(hashed)
+            racy_ns: int = started_ns - self._racy_window_ns
+            cache.update(
+                digests={
+                    (file.device, file.inode): (
+                        file.size,
+                        file.mtime_ns,
+                        hashed[file.name],
+                    )
+                    for file in changed
+                    if file.name in hashed and file.mtime_ns < racy_ns
+                },
+                removed=cached.keys()
+                - {(file.device, file.inode) for file in files},
+            )
+
+        return digests
+
+    def _hash_batch(self, batch: list[ScannedFile]) -> list[tuple[str, str]]:
+        buffer: memoryview = memoryview(
+            bytearray(
+                min(
+                    self._chunk_size,
+                    max((file.size for file in batch), default=0) or 1,
+                )
+            )
+        )
+        digests: list[tuple[str, str]] = []
+
+        for file in batch:
+            try:
+                digests.append((file.name, self._hash_file(file, buffer)))
+            except FileNotFoundError:
+                continue
+
+        return digests
+
+    def _hash_file(self, file: ScannedFile, buffer: memoryview) -> str:
+        digest = hashlib.new(self._algorithm)
+
+        with open(file.path, "rb", buffering=0) as reader:  # noqa: PTH123
+            if file.size >= self._mmap_threshold:
+                with mmap.mmap(
+                    reader.fileno(), 0, access=mmap.ACCESS_READ
+                ) as mapped:
+                    digest.update(mapped)
+
+            else:
+                while read := reader.readinto(buffer):
+                    digest.update(buffer[:read])
+
+        return digest.hexdigest()
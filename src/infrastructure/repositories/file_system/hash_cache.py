@@ -0,0 +1,93 @@
+"""File hash cache."""
+
+import sqlite3
+from collections.abc import Iterable, Mapping
+
+# Device and inode of a file.
+FileKey = tuple[int, int]
+# Size, modification time in nanoseconds and digest of a file.
+FileDigest = tuple[int, int, str]
+
+
+class HashCache:
+    """File hash cache.
+
+    Digests of a tree's files are kept in a SQLite file, keyed by device
+    and inode, along with the size and modification time they were
+    computed at. A file whose size and time are unchanged doesn't need to
+    be read again, and a renamed file keeps its digest.
+    """
+
+    def __init__(self, path: str) -> None:
+        """Create new instance.
+
+        Args:
+            path (str): SQLite file, created if missing.
+
+        """
+        self._connection: sqlite3.Connection = sqlite3.connect(path)
+        self._connection.executescript(
+            """
+            PRAGMA journal_mode = WAL;
+            PRAGMA synchronous = NORMAL;
+            CREATE TABLE IF NOT EXISTS digests (
+                device INTEGER NOT NULL,
+                inode INTEGER NOT NULL,
+                size INTEGER NOT NULL,
+                mtime_ns INTEGER NOT NULL,
+                digest BLOB NOT NULL,
+                PRIMARY KEY (device, inode)
+            ) WITHOUT ROWID;
+            """,
+        )
+
+    def digests(self) -> dict[FileKey, FileDigest]:
+        """Get every cached digest.
+
+        Returns:
+            dict[FileKey, FileDigest]: size, modification time and digest
+                by device and inode.
+
+        """
+        return {
+            (device, inode): (size, mtime_ns, digest.hex())
+            for device, inode, size, mtime_ns, digest in (
+                self._connection.execute(
+                    "SELECT device, inode, size, mtime_ns, digest "
+                    "FROM digests",
+                )
+            )
+        }
+
+    def update(
+        self,
+        digests: Mapping[FileKey, FileDigest],
+        removed: Iterable[FileKey],
+    ) -> None:
+        """Store new digests and forget removed files, in one transaction.
+
+        Args:
+            digests (Mapping[FileKey, FileDigest]): size, modification time
+                and digest by device and inode.
+            removed (Iterable[FileKey]): devices and inodes of files that
+                are gone.
+
+        """
+        with self._connection:
+            self._connection.executemany(
+                "DELETE FROM digests WHERE device = ? AND inode = ?",
+                removed,
+            )
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO digests VALUES (?, ?, ?, ?, ?)",
+                (
+                    (device, inode, size, mtime_ns, bytes.fromhex(digest))
+                    for (device, inode), (size, mtime_ns, digest) in (
+                        digests.items()
+                    )
+                ),
+            )
+
+    def close(self) -> None:
+        """Close SQLite file."""
+        self._connection.close()
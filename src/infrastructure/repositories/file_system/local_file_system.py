@@ -0,0 +1,526 @@
+"""Local file system repository."""
+
+import errno
+import hashlib
+import os
+import shutil
+import stat
+from collections.abc import Iterator
+from dataclasses import dataclass
+from mmap import ACCESS_READ, mmap
+from pathlib import Path
+from tempfile import mkstemp
+from threading import Lock
+
+from src.domain.interfaces.repositories.file_system import IFileSystem
+from src.domain.value_objects.file_system_command import FileSystemCommand
+from src.domain.value_objects.file_system_command_action import (
+    FileSystemCommandAction,
+)
+from src.infrastructure.repositories.file_system.block_delta import (
+    DeltaOperation,
+    block_delta,
+    block_signatures,
+)
+from src.infrastructure.repositories.file_system.command_log import (
+    CommandLog,
+)
+from src.infrastructure.settings import settings
+
+# Errors of a transfer the file systems or the kernel don't support, the
+# next, slower, way is tried instead.
+_UNSUPPORTED: frozenset[int] = frozenset(
+    {
+        errno.EBADF,
+        errno.EINVAL,
+        errno.ENOSYS,
+        errno.EOPNOTSUPP,
+        errno.EPERM,
+        errno.EXDEV,
+    },
+)
+
+
+def _data_regions(
+    descriptor: int,
+    status: os.stat_result,
+) -> Iterator[tuple[int, int]]:
+    size: int = status.st_size
+
+    # A file with a block for every byte has no holes to look for.
+    if status.st_blocks * 512 >= size or not hasattr(os, "SEEK_DATA"):
+        yield 0, size
+        return
+
+    offset: int = 0
+
+    while offset < size:
+        try:
+            start: int = os.lseek(descriptor, offset, os.SEEK_DATA)
+        except OSError as error:
+            if error.errno == errno.ENXIO:
+                # Only a hole is left up to the end.
+                return
+
+            if error.errno not in _UNSUPPORTED:
+                raise
+
+            yield offset, size
+            return
+
+        end: int = min(os.lseek(descriptor, start, os.SEEK_HOLE), size)
+        yield start, end
+        offset = end
+
+
+def _copy_file_range(
+    source: int, destination: int, offset: int, end: int
+) -> int:
+    if not hasattr(os, "copy_file_range"):
+        return offset
+
+    while offset < end:
+        try:
+            copied: int = os.copy_file_range(
+                source,
+                destination,
+                end - offset,
+                offset,
+                offset,
+            )
+        except OSError as error:
+            if error.errno not in _UNSUPPORTED:
+                raise
+
+            break
+
+        if not copied:
+            break
+
+        offset += copied
+
+    return offset
+
+
+def _sendfile(source: int, destination: int, offset: int, end: int) -> int:
+    if offset >= end or not hasattr(os, "sendfile"):
+        return offset
+
+    # sendfile writes at the destination position.
+    os.lseek(destination, offset, os.SEEK_SET)
+
+    while offset < end:
+        try:
+            sent: int = os.sendfile(destination, source, offset, end - offset)
+        except OSError as error:
+            if error.errno not in _UNSUPPORTED:
+                raise
+
+            break
+
+        if not sent:
+            break
+
+        offset += sent
+
+    return offset
+
+
+def _copy_buffered(
+    source: int,
+    destination: int,
+    offset: int,
+    end: int,
+    buffer_size: int,
+) -> int:
+    if offset >= end:
+        return offset
+
+    view: memoryview = memoryview(bytearray(min(buffer_size, end - offset)))
+
+    while offset < end:
+        read: int = os.preadv(source, [view[: end - offset]], offset)
+
+        if not read:
+            break
+
+        written: int = 0
+
+        while written < read:
+            written += os.pwrite(
+                destination,
+                view[written:read],
+                offset + written,
+            )
+
+        offset += read
+
+    return offset
+
+
+def _digest(path: Path) -> bytes:
+    with path.open("rb") as file:
+        return hashlib.file_digest(file, "sha256").digest()
+
+
+def _write(descriptor: int, data: bytes, offset: int) -> None:
+    view: memoryview = memoryview(data)
+
+    while view:
+        written: int = os.pwrite(descriptor, view, offset)
+        view = view[written:]
+        offset += written
+
+
+def _is_regular(path: Path) -> bool:
+    return stat.S_ISREG(path.lstat().st_mode)
+
+
+@dataclass(frozen=True, slots=True)
+class CopyStatistics:
+    """Local file system copy statistics snapshot."""
+
+    copies: int
+    delta_copies: int
+    bytes_written: int
+
+
+class LocalFileSystem(IFileSystem):
+    """Local file system.
+
+    Copies move data inside the kernel with copy_file_range, or sendfile
+    where it isn't supported, e.g. across file systems on older kernels,
+    and fall back to buffered reads and writes. Only data regions are
+    copied, so holes of sparse files stay holes. A copy is written next to
+    the destination and renamed over it, so nobody sees a partial file.
+    Moves on the same device are a single atomic rename. Folders are
+    renamed at once, and copied or deleted file by file: like readers,
+    only regular files are touched, so symbolic links and other entries
+    stay, along with the folders holding them.
+
+    In delta mode a large file copied over an older version of itself is
+    updated in place instead: only blocks that differ, per a block delta
+    of both versions, are written, and the result is checked against the
+    source digest, falling back to a full copy on a mismatch. Such an
+    update isn't atomic, a reader may see a file half updated, and files
+    with other hard links are always copied in full so the links keep the
+    old content.
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        buffer_size: int = settings.file_system_buffer_size,
+        *,
+        zero_copy: bool = True,
+        delta: bool = False,
+        delta_block_size: int = settings.file_system_delta_block_size,
+        delta_threshold: int = settings.file_system_delta_threshold,
+        delta_max_ratio: float = settings.file_system_delta_max_ratio,
+    ) -> None:
+        """Create new instance.
+
+        Args:
+            buffer_size (int, optional): buffer size of buffered copies.
+                Defaults to settings.file_system_buffer_size.
+            zero_copy (bool, optional): whether to copy inside the kernel.
+                Defaults to True.
+            delta (bool, optional): whether to update existing files by
+                block delta. Defaults to False.
+            delta_block_size (int, optional): block size of deltas.
+                Defaults to settings.file_system_delta_block_size.
+            delta_threshold (int, optional): size from which a file is
+                updated by delta. Defaults to
+                settings.file_system_delta_threshold.
+            delta_max_ratio (float, optional): share of a file a delta may
+                write, beyond which the file is copied in full. Defaults to
+                settings.file_system_delta_max_ratio.
+
+        Raises:
+            ValueError: if buffer size or delta block size is less than
+                one.
+
+        """
+        if min(buffer_size, delta_block_size) < 1:
+            msg: str = (
+                "Buffer and block sizes must be positive, got "
+                f"{buffer_size} and {delta_block_size}."
+            )
+            raise ValueError(msg)
+
+        self._buffer_size: int = buffer_size
+        self._zero_copy: bool = zero_copy
+        self._delta: bool = delta
+        self._delta_block_size: int = delta_block_size
+        self._delta_threshold: int = delta_threshold
+        self._delta_max_ratio: float = delta_max_ratio
+        self._memory: CommandLog = CommandLog()
+        self._lock: Lock = Lock()
+        self._copies: int = 0
+        self._delta_copies: int = 0
+        self._bytes_written: int = 0
+
+    def copy(self, src: Path, dest: Path) -> None:
+        """Copy file, with its permissions and times, or folder.
+
+        Args:
+            src (Path): source path, a folder is copied file by file.
+            dest (Path): destination path, parent folders are created.
+
+        """
+        if src.is_dir():
+            self._copy_folder(src, dest)
+        elif not (self._delta and self._delta_copy(src, dest)):
+            self._copy(src, dest)
+
+        self._memory.append(
+            FileSystemCommand(
+                command=FileSystemCommandAction.copy,
+                source=src,
+                destination=dest,
+            )
+        )
+
+    def move(self, src: Path, dest: Path) -> None:
+        """Move file or folder.
+
+        Args:
+            src (Path): source path.
+            dest (Path): destination path, parent folders are created.
+
+        Raises:
+            OSError: if the path can't be renamed for another reason than
+                being on another device.
+
+        """
+        dest.parent.mkdir(parents=True, exist_ok=True)
+
+        try:
+            src.replace(dest)
+        except OSError as error:
+            if error.errno != errno.EXDEV:
+                raise
+
+            if src.is_dir():
+                self._copy_folder(src, dest)
+                self._delete_folder(src)
+            else:
+                self._copy(src, dest)
+                src.unlink()
+
+        self._memory.append(
+            FileSystemCommand(
+                command=FileSystemCommandAction.move,
+                source=src,
+                destination=dest,
+            )
+        )
+
+    def delete(self, src: Path, dest: Path | None = None) -> None:
+        """Delete file, or regular files of a folder and emptied folders.
+
+        A missing path is already deleted.
+
+        Args:
+            src (Path): source path.
+            dest (Path | None, optional): destination path, ignored.
+                Defaults to None.
+
+        """
+        if src.is_dir() and not src.is_symlink():
+            self._delete_folder(src)
+        else:
+            src.unlink(missing_ok=True)
+        self._memory.append(
+            FileSystemCommand(
+                command=FileSystemCommandAction.delete,
+                source=src,
+                destination=dest,
+            )
+        )
+
+    def history(self) -> CommandLog:
+        """Get history of done commands.
+
+        Returns:
+            CommandLog: history.
+
+        """
+        return self._memory
+
+    def statistics(self) -> CopyStatistics:
+        """Get copy statistics, moves across devices count as copies.
+
+        Returns:
+            CopyStatistics: statistics snapshot.
+
+        """
+        with self._lock:
+            return CopyStatistics(
+                copies=self._copies,
+                delta_copies=self._delta_copies,
+                bytes_written=self._bytes_written,
+            )
+
+    def _copy(self, src: Path, dest: Path) -> None:
+        dest.parent.mkdir(parents=True, exist_ok=True)
+        descriptor, partial_name = mkstemp(
+            prefix=f".{dest.name}.",
+            suffix=".partial",
+            dir=dest.parent,
+        )
+        partial: Path = Path(partial_name)
+
+        try:
+            with (
+                os.fdopen(descriptor, "wb") as target,
+                src.open("rb") as source,
+            ):
+                status: os.stat_result = os.fstat(source.fileno())
+                written: int = 0
+
+                for start, end in _data_regions(source.fileno(), status):
+                    self._copy_range(
+                        source.fileno(), target.fileno(), start, end
+                    )
+                    written += end - start
+
+                # Extend the copy over a trailing hole.
+                os.ftruncate(target.fileno(), status.st_size)
+
+            shutil.copystat(src, partial)
+            partial.replace(dest)
+        except BaseException:
+            partial.unlink(missing_ok=True)
+            raise
+
+        self._count(written, delta=False)
+
+    def _copy_folder(self, src: Path, dest: Path) -> None:
+        # Only regular files, as readers skip everything else.
+        for folder, _, names in os.walk(src):
+            target: Path = dest / Path(folder).relative_to(src)
+            target.mkdir(parents=True, exist_ok=True)
+
+            for name in names:
+                if _is_regular(path := Path(folder, name)):
+                    self._copy(path, target / name)
+
+    def _delete_folder(self, src: Path) -> None:
+        # Only regular files, the plan never saw anything else. Subfolders
+        # come first, so a folder is removed once they are.
+        for folder, _, names in os.walk(src, topdown=False):
+            for name in names:
+                if _is_regular(path := Path(folder, name)):
+                    path.unlink(missing_ok=True)
+
+            if not any(Path(folder).iterdir()):
+                Path(folder).rmdir()
+
+    def _delta_copy(self, src: Path, dest: Path) -> bool:
+        try:
+            status: os.stat_result = dest.stat(follow_symlinks=False)
+        except FileNotFoundError:
+            return False
+
+        if (
+            not stat.S_ISREG(status.st_mode)
+            or status.st_nlink > 1
+            # Empty files can't be memory mapped, whatever the threshold.
+            or min(status.st_size, src.stat().st_size)
+            < max(self._delta_threshold, 1)
+        ):
+            return False
+
+        with src.open("rb") as source, dest.open("r+b") as target:
+            operations: list[DeltaOperation] | None = self._plan_delta(
+                source.fileno(), target.fileno()
+            )
+
+            if operations is None:
+                return False
+
+            size: int = os.fstat(source.fileno()).st_size
+            self._apply_delta(
+                source.fileno(), target.fileno(), operations, size
+            )
+
+        if _digest(src) != _digest(dest):
+            self._copy(src, dest)
+            return True
+
+        shutil.copystat(src, dest)
+        self._count(
+            sum(operation.length for operation in operations), delta=True
+        )
+
+        return True
+
+    def _plan_delta(
+        self, source: int, target: int
+    ) -> list[DeltaOperation] | None:
+        with (
+            mmap(source, 0, access=ACCESS_READ) as new,
+            mmap(target, 0, access=ACCESS_READ) as old,
+        ):
+            budget: float = len(new) * self._delta_max_ratio
+            operations: list[DeltaOperation] = []
+
+            for operation in block_delta(
+                new,
+                block_signatures(old, self._delta_block_size),
+                self._delta_block_size,
+            ):
+                operations.append(operation)
+                budget -= operation.length
+
+                if budget < 0:
+                    return None
+
+            return operations
+
+    def _apply_delta(
+        self,
+        source: int,
+        target: int,
+        operations: list[DeltaOperation],
+        size: int,
+    ) -> None:
+        for operation in operations:
+            read_from: int = source if operation.source is None else target
+            read_offset: int = (
+                operation.offset
+                if operation.source is None
+                else operation.source
+            )
+
+            for start in range(0, operation.length, self._buffer_size):
+                _write(
+                    target,
+                    os.pread(
+                        read_from,
+                        min(self._buffer_size, operation.length - start),
+                        read_offset + start,
+                    ),
+                    operation.offset + start,
+                )
+
+        os.ftruncate(target, size)
+
+    def _count(self, written: int, *, delta: bool) -> None:
+        with self._lock:
+            self._copies += 1
+            self._delta_copies += delta
+            self._bytes_written += written
+
+    def _copy_range(
+        self,
+        source: int,
+        destination: int,
+        offset: int,
+        end: int,
+    ) -> None:
+        if self._zero_copy:
+            offset = _copy_file_range(source, destination, offset, end)
+            offset = _sendfile(source, destination, offset, end)
+
+        _copy_buffered(source, destination, offset, end, self._buffer_size)
@@ -0,0 +1,276 @@
+"""Tiered file system reader repository."""
+
+import hashlib
+import os
+from collections import Counter
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, replace
+
+from src.domain.interfaces.repositories.reader import IReader
+from src.infrastructure.repositories.file_system.file_system_reader import (
+    FileSystemReader,
+    ScannedFile,
+)
+from src.infrastructure.settings import settings
+
+
+@dataclass(slots=True)
+class TieredStatistics:
+    """Tiered reader statistics."""
+
+    files: int = 0
+    by_size: int = 0
+    by_partial_hash: int = 0
+    by_full_hash: int = 0
+    bytes_read: int = 0
+
+
+class TieredFileSystemReader(IReader):
+    """Tiered file system reader.
+
+    Files are told apart by the cheapest fingerprint that sets them apart
+    from every file of the folders read together: their size if no other
+    file has it, else a hash of their first and last bytes if no other file
+    of that size has it, else a hash of their whole content, as the file
+    system reader computes it. Files small enough to be read whole by the
+    partial hash get their content hash right away.
+
+    A file with a unique fingerprint has no copy in any folder, so syncs
+    plan the same commands as with content hashes. Fingerprints can only be
+    compared between folders read together, so the folders are given up
+    front and read on the first call.
+    """
+
+    def __init__(
+        self,
+        folders: Iterable[str],
+        algorithm: str = settings.reader_hash_algorithm,
+        partial_size: int = settings.reader_partial_hash_size,
+        workers: int = settings.reader_workers,
+    ) -> None:
+        """Create new instance.
+
+        Args:
+            folders (Iterable[str]): folders read together.
+            algorithm (str, optional): hashlib algorithm, e.g. blake2b,
+                sha1 or sha256. Defaults to settings.reader_hash_algorithm.
+            partial_size (int, optional): bytes hashed at each end of a
+                file by the partial hash. Defaults to
+                settings.reader_partial_hash_size.
+            workers (int, optional): hashing threads. Defaults to
+                settings.reader_workers.
+
+        Raises:
+            ValueError: if partial size is less than one.
+
+        """
+        if partial_size < 1:
+            msg: str = f"Partial size must be positive, got {partial_size}."
+            raise ValueError(msg)
+
+        self._folders: tuple[str, ...] = tuple(folders)
+        self._reader: FileSystemReader = FileSystemReader(
+            workers=workers,
+            algorithm=algorithm,
+        )
+        self._algorithm: str = algorithm
+        self._partial_size: int = partial_size
+        self._workers: int = workers
+        self._hashes: dict[str, dict[str, str]] | None = None
+        self._statistics: TieredStatistics = TieredStatistics()
+
+    def get_hashes(self, key: str) -> dict[str, str]:
+        """Get fingerprints of the files of a folder.
+
+        Args:
+            key (str): folder, one of the folders read together.
+
+        Returns:
+            dict[str, str]: file name by fingerprint.
+
+        Raises:
+            ValueError: if the folder isn't read together with the others.
+
+        """
+        if key not in self._folders:
+            msg: str = f"Folder {key} isn't read by this reader."
+            raise ValueError(msg)
+
+        if self._hashes is None:
+            self._hashes = self._fingerprint()
+
+        return self._hashes[key]
+
+    def get_names(self, key: str) -> list[str]:
+        """Get names of the regular files of a folder.
+
+        Args:
+            key (str): folder.
+
+        Returns:
+            list[str]: file names, those of same fingerprint included.
+
+        """
+        return [file.name for file in self._reader.walk(key)]
+
+    def iter_hashes(self, key: str) -> Iterator[tuple[str, str]]:
+        """Get fingerprints of the files of a folder one by one.
+
+        Fingerprints need every folder's sizes, so they are computed as a
+        whole first.
+
+        Args:
+            key (str): folder, one of the folders read together.
+
+        Yields:
+            Iterator[tuple[str, str]]: fingerprint and file name records.
+
+        """
+        yield from self.get_hashes(key).items()
+
+    def statistics(self) -> TieredStatistics:
+        """Get statistics.
+
+        Returns:
+            TieredStatistics: copy of the statistics.
+
+        """
+        return replace(self._statistics)
+
+    def _fingerprint(self) -> dict[str, dict[str, str]]:
+        files: dict[str, list[ScannedFile]] = {
+            folder: self._reader.scan(folder) for folder in self._folders
+        }
+        sizes: Counter[int] = Counter(
+            file.size for scanned in files.values() for file in scanned
+        )
+        candidates: list[tuple[str, ScannedFile]] = [
+            (folder, file)
+            for folder, scanned in files.items()
+            for file in scanned
+            if sizes[file.size] > 1
+        ]
+        fingerprints: dict[tuple[str, str], str] = {
+            (folder, file.name): f"size:{file.size}"
+            for folder, scanned in files.items()
+            for file in scanned
+            if sizes[file.size] == 1
+        }
+        self._statistics.files += sum(sizes.values())
+        self._statistics.by_size += len(fingerprints)
+        fingerprints.update(self._partial_fingerprints(candidates))
+        fingerprints.update(self._full_fingerprints(candidates, fingerprints))
+
+        return {
+            folder: self._hashes_of(folder, scanned, fingerprints)
+            for folder, scanned in files.items()
+        }
+
+    def _partial_fingerprints(
+        self,
+        candidates: list[tuple[str, ScannedFile]],
+    ) -> dict[tuple[str, str], str]:
+        with ThreadPoolExecutor(max_workers=self._workers) as pool:
+            partials: list[str | None] = list(
+                pool.map(
+                    self._partial_digest, (file for _, file in candidates)
+                )
+            )
+
+        counts: Counter[tuple[int, str | None]] = Counter(
+            (file.size, partial)
+            for (_, file), partial in zip(candidates, partials, strict=True)
+        )
+        fingerprints: dict[tuple[str, str], str] = {}
+
+        for (folder, file), partial in zip(candidates, partials, strict=True):
+            if partial is None:
+                continue
+
+            self._statistics.bytes_read += min(
+                file.size,
+                2 * self._partial_size,
+            )
+
+            if file.size <= 2 * self._partial_size:
+                # The partial hash read the whole file.
+                fingerprints[folder, file.name] = partial
+
+            elif counts[file.size, partial] == 1:
+                fingerprints[folder, file.name] = (
+                    f"partial:{file.size}:{partial}"
+                )
+
+            else:
+                continue
+
+            self._statistics.by_partial_hash += 1
+
+        return fingerprints
+
+    def _full_fingerprints(
+        self,
+        candidates: list[tuple[str, ScannedFile]],
+        fingerprints: dict[tuple[str, str], str],
+    ) -> dict[tuple[str, str], str]:
+        remaining: dict[str, list[ScannedFile]] = {}
+
+        for folder, file in candidates:
+            if (folder, file.name) not in fingerprints:
+                remaining.setdefault(folder, []).append(file)
+
+        full: dict[tuple[str, str], str] = {}
+
+        for folder, folder_files in remaining.items():
+            digests: dict[str, str] = self._reader.hash_files(folder_files)
+            self._statistics.by_full_hash += len(digests)
+            self._statistics.bytes_read += sum(
+                file.size for file in folder_files if file.name in digests
+            )
+            full.update(
+                ((folder, name), digest) for name, digest in digests.items()
+            )
+
+        return full
+
+    def _hashes_of(
+        self,
+        folder: str,
+        files: list[ScannedFile],
+        fingerprints: dict[tuple[str, str], str],
+    ) -> dict[str, str]:
+        hashes: dict[str, str] = {}
+
+        for file in files:
+            if (
+                fingerprint := fingerprints.get((folder, file.name))
+            ) is not None:
+                hashes.setdefault(fingerprint, file.name)
+
+        return hashes
+
+    def _partial_digest(self, file: ScannedFile) -> str | None:
+        digest = hashlib.new(self._algorithm)
+
+        try:
+            descriptor: int = os.open(file.path, os.O_RDONLY)
+        except FileNotFoundError:
+            return None
+
+        try:
+            if file.size <= 2 * self._partial_size:
+                digest.update(os.pread(descriptor, file.size, 0))
+            else:
+                digest.update(os.pread(descriptor, self._partial_size, 0))
+                digest.update(
+                    os.pread(
+                        descriptor,
+                        self._partial_size,
+                        file.size - self._partial_size,
+                    ),
+                )
+        finally:
+            os.close(descriptor)
+
+        return digest.hexdigest()
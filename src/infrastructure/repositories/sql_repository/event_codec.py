@@ -0,0 +1,244 @@
+"""Product events binary codec.
+
+Events are packed back to back without padding. Every event starts with a
+one byte type followed by its fields; strings are prefixed with their UTF-8
+length as an unsigned short:
+
+* ``PRODUCT``: stock keeping unit, version number (int64).
+* ``BATCH_ADDED``: stock keeping unit, reference, quantity (int64),
+  estimated arrival time as a proleptic ordinal (uint32, 0 for none).
+* ``ALLOCATED`` and ``DEALLOCATED``: stock keeping unit, batch position
+  in the product (uint32), order id, quantity (int64).
+
+Batches are only ever appended to a product, so they are told apart by
+position, references may repeat. Deallocations of a batch are written
+before its allocations, so capacity freed and reused in one commit is
+there again on replay.
+"""
+
+import struct
+from datetime import date
+from enum import IntEnum
+from struct import Struct
+
+from src.domain.aggregates.product import Product
+from src.domain.entities.batch import Batch
+from src.domain.value_objects.order_line import OrderLine
+
+_TYPE: Struct = Struct("<B")
+_LENGTH: Struct = Struct("<H")
+_INTEGER: Struct = Struct("<q")
+_ORDINAL: Struct = Struct("<I")
+_POSITION: Struct = Struct("<I")
+
+
+class EventType(IntEnum):
+    """Product event type."""
+
+    product = 1
+    batch_added = 2
+    allocated = 3
+    deallocated = 4
+
+
+class EventDecodeError(Exception):
+    """Malformed or inconsistent events exception."""
+
+
+def encode_changes(old: Product | None, new: Product) -> bytes:
+    """Encode events turning one product state into another.
+
+    Args:
+        old (Product | None): previous state, None for a new product.
+        new (Product): new state.
+
+    Returns:
+        bytes: encoded events, empty if nothing changed.
+
+    """
+    events: bytearray = bytearray()
+
+    if old is None or old.version_number != new.version_number:
+        _pack_product(events, new)
+
+    old_batches: list[Batch] = [] if old is None else old.batches
+
+    for position, batch in enumerate(new.batches):
+        if position < len(old_batches):
+            old_allocations: frozenset[OrderLine] = old_batches[
+                position
+            ].allocations
+        else:
+            _pack_batch(events, batch)
+            old_allocations = frozenset()
+
+        allocations: frozenset[OrderLine] = batch.allocations
+
+        for line in old_allocations - allocations:
+            _pack_allocation(
+                events, EventType.deallocated, batch, position, line
+            )
+
+        for line in allocations - old_allocations:
+            _pack_allocation(
+                events, EventType.allocated, batch, position, line
+            )
+
+    return bytes(events)
+
+
+def encode_product(product: Product) -> bytes:
+    """Encode events recreating a product from scratch.
+
+    Args:
+        product (Product): product aggregate.
+
+    Returns:
+        bytes: encoded events.
+
+    """
+    return encode_changes(None, product)
+
+
+def apply_events(events: bytes, products: dict[str, Product]) -> None:
+    """Apply encoded events to products.
+
+    Args:
+        events (bytes): encoded events.
+        products (dict[str, Product]): products by stock keeping unit,
+            changed in place.
+
+    Raises:
+        EventDecodeError: if events are malformed, refer to an unknown
+            product or batch, or can't be applied, e.g. an allocation
+            exceeding the batch.
+
+    """
+    offset: int = 0
+
+    try:
+        while offset < len(events):
+            (event_type,) = _TYPE.unpack_from(events, offset)
+            offset = _apply_event(
+                EventType(event_type),
+                events,
+                offset + _TYPE.size,
+                products,
+            )
+    except (struct.error, ValueError, KeyError, IndexError) as error:
+        msg: str = f"Can't decode event at offset {offset}: {error}"
+        raise EventDecodeError(msg) from error
+
+
+def _apply_event(
+    event_type: EventType,
+    events: bytes,
+    offset: int,
+    products: dict[str, Product],
+) -> int:
+    stock_keeping_unit, offset = _unpack_string(events, offset)
+
+    if event_type is EventType.product:
+        (version_number,) = _INTEGER.unpack_from(events, offset)
+        product: Product | None = products.get(stock_keeping_unit)
+
+        if product is None:
+            products[stock_keeping_unit] = Product(
+                stock_keeping_unit=stock_keeping_unit,
+                batches=[],
+                version_number=version_number,
+            )
+        else:
+            product.version_number = version_number
+
+        return offset + _INTEGER.size
+
+    if event_type is EventType.batch_added:
+        reference, offset = _unpack_string(events, offset)
+        (quantity,) = _INTEGER.unpack_from(events, offset)
+        (ordinal,) = _ORDINAL.unpack_from(events, offset + _INTEGER.size)
+        products[stock_keeping_unit].batches.append(
+            Batch(
+                reference=reference,
+                stock_keeping_unit=stock_keeping_unit,
+                quantity=quantity,
+                estimated_arrival_time=(
+                    date.fromordinal(ordinal) if ordinal else None
+                ),
+            )
+        )
+
+        return offset + _INTEGER.size + _ORDINAL.size
+
+    (position,) = _POSITION.unpack_from(events, offset)
+    order_id, offset = _unpack_string(events, offset + _POSITION.size)
+    (quantity,) = _INTEGER.unpack_from(events, offset)
+    line: OrderLine = OrderLine(
+        order_id=order_id,
+        stock_keeping_unit=stock_keeping_unit,
+        quantity=quantity,
+    )
+    batch: Batch = products[stock_keeping_unit].batches[position]
+
+    if event_type is EventType.allocated and batch.can_allocate(line):
+        batch.allocate(line)
+    elif event_type is EventType.deallocated and line in batch.allocations:
+        batch.deallocate(line)
+    else:
+        msg: str = (
+            f"Can't apply {event_type.name} event of order {order_id} to "
+            f"batch {batch.reference}."
+        )
+        raise ValueError(msg)
+
+    return offset + _INTEGER.size
+
+
+def _pack_product(events: bytearray, product: Product) -> None:
+    events += _TYPE.pack(EventType.product)
+    _pack_string(events, product.stock_keeping_unit)
+    events += _INTEGER.pack(product.version_number)
+
+
+def _pack_batch(events: bytearray, batch: Batch) -> None:
+    events += _TYPE.pack(EventType.batch_added)
+    _pack_string(events, batch.stock_keeping_unit)
+    _pack_string(events, batch.reference)
+    events += _INTEGER.pack(batch.purchased_quantity)
+    events += _ORDINAL.pack(
+        batch.estimated_arrival_time.toordinal()
+        if batch.estimated_arrival_time
+        else 0
+    )
+
+
+def _pack_allocation(
+    events: bytearray,
+    event_type: EventType,
+    batch: Batch,
+    position: int,
+    line: OrderLine,
+) -> None:
+    events += _TYPE.pack(event_type)
+    _pack_string(events, batch.stock_keeping_unit)
+    events += _POSITION.pack(position)
+    _pack_string(events, line.order_id)
+    events += _INTEGER.pack(line.quantity)
+
+
+def _pack_string(events: bytearray, value: str) -> None:
+    encoded: bytes = value.encode()
+    events += _LENGTH.pack(len(encoded))
+    events += encoded
+
+
+def _unpack_string(events: bytes, offset: int) -> tuple[str, int]:
+    (length,) = _LENGTH.unpack_from(events, offset)
+    start: int = offset + _LENGTH.size
+    end: int = start + length
+
+    if end > len(events):
+        msg: str = "String runs past the end of events."
+        raise ValueError(msg)
+
+    return events[start:end].decode(), end
@@ -0,0 +1,173 @@
+"""Memory-mapped append-only event log.
+
+The log file starts with a magic string followed by frames. A frame is a
+header holding the payload length and its CRC-32, then the payload. The file
+is preallocated with zeroes, so a zero length header marks the end of the
+log. The payload is written before its header, and a frame whose header or
+checksum doesn't match is treated as the torn tail of an interrupted write.
+"""
+
+from collections.abc import Callable
+from mmap import ALLOCATIONGRANULARITY, mmap
+from pathlib import Path
+from struct import Struct
+from typing import BinaryIO
+from zlib import crc32
+
+MAGIC: bytes = b"ALLOCLOG"
+
+_HEADER: Struct = Struct("<II")
+_INITIAL_SIZE: int = 1 << 20
+
+
+class EventLogError(Exception):
+    """Event log file is not readable exception."""
+
+
+class EventLog:
+    """Memory-mapped append-only event log."""
+
+    def __init__(
+        self,
+        path: Path,
+        initial_size: int = _INITIAL_SIZE,
+        *,
+        sync: bool = True,
+    ) -> None:
+        """Open or create event log.
+
+        Args:
+            path (Path): log file path.
+            initial_size (int, optional): preallocated size of a new log
+                file in bytes. Defaults to 1 MiB.
+            sync (bool, optional): flush every appended frame to disk.
+                Defaults to True.
+
+        Raises:
+            EventLogError: if the file is not an event log.
+
+        """
+        exists: bool = path.exists() and path.stat().st_size > 0
+
+        self._file: BinaryIO = path.open("r+b" if exists else "w+b")
+
+        if not exists:
+            self._file.write(MAGIC)
+            self._file.truncate(max(initial_size, len(MAGIC) + _HEADER.size))
+
+        self._map: mmap = mmap(self._file.fileno(), 0)
+
+        if self._map[: len(MAGIC)] != MAGIC:
+            self.close()
+            msg: str = f"{path} is not an event log."
+            raise EventLogError(msg)
+
+        self._sync: bool = sync
+        self._offset: int = len(MAGIC)
+
+    @property
+    def offset(self) -> int:
+        """Get offset the next frame will be written at.
+
+        Returns:
+            int: offset in bytes.
+
+        """
+        return self._offset
+
+    def recover(
+        self,
+        apply: Callable[[bytes], None],
+        offset: int | None = None,
+    ) -> None:
+        """Replay intact frames and discard a torn tail.
+
+        Args:
+            apply (Callable[[bytes], None]): called with every intact frame
+                payload, in order.
+            offset (int | None, optional): offset to replay from, e.g. the
+                one stored with a snapshot. Defaults to None, the first
+                frame.
+
+        """
+        self._offset = len(MAGIC) if offset is None else offset
+
+        while (payload := self._read(self._offset)) is not None:
+            apply(payload)
+            self._offset += _HEADER.size + len(payload)
+
+        self._discard_tail()
+
+    def append(self, payload: bytes) -> None:
+        """Append frame.
+
+        Args:
+            payload (bytes): frame payload.
+
+        """
+        start: int = self._offset + _HEADER.size
+        end: int = start + len(payload)
+
+        self._reserve(end + _HEADER.size)
+
+        self._map[start:end] = payload
+        self._map[self._offset : start] = _HEADER.pack(
+            len(payload),
+            crc32(payload),
+        )
+
+        if self._sync:
+            self._flush(self._offset, end)
+
+        self._offset = end
+
+    def close(self) -> None:
+        """Close log file."""
+        if not self._map.closed:
+            self._map.close()
+
+        self._file.close()
+
+    def _read(self, offset: int) -> bytes | None:
+        if offset + _HEADER.size > len(self._map):
+            return None
+
+        length, checksum = _HEADER.unpack_from(self._map, offset)
+        start: int = offset + _HEADER.size
+
+        if length == 0 or start + length > len(self._map):
+            return None
+
+        payload: bytes = self._map[start : start + length]
+
+        if crc32(payload) != checksum:
+            return None
+
+        return payload
+
+    def _discard_tail(self) -> None:
+        if self._offset + _HEADER.size > len(self._map):
+            return
+
+        length, _ = _HEADER.unpack_from(self._map, self._offset)
+
+        if length == 0:
+            return
+
+        end: int = min(self._offset + _HEADER.size + length, len(self._map))
+        self._map[self._offset : end] = bytes(end - self._offset)
+        self._flush(self._offset, end)
+
+    def _reserve(self, size: int) -> None:
+        if size <= len(self._map):
+            return
+
+        new_size: int = max(size, len(self._map) * 2)
+
+        self._map.close()
+        self._file.truncate(new_size)
+        self._map = mmap(self._file.fileno(), 0)
+
+    def _flush(self, start: int, end: int) -> None:
+        aligned: int = start - start % ALLOCATIONGRANULARITY
+        self._map.flush(aligned, end - aligned)
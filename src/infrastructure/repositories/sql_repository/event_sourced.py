@@ -0,0 +1,194 @@
+"""Event-sourced repository storage."""
+
+import os
+from pathlib import Path
+from struct import Struct
+from threading import Event, Lock, Thread
+from zlib import crc32
+
+from src.domain.aggregates.product import Product
+from src.infrastructure.repositories.sql_repository.event_codec import (
+    EventDecodeError,
+    apply_events,
+    encode_changes,
+    encode_product,
+)
+from src.infrastructure.repositories.sql_repository.event_log import EventLog
+from src.infrastructure.repositories.sql_repository.in_memory import (
+    InMemoryStorage,
+)
+from src.infrastructure.settings import settings
+
+LOG_FILE_NAME: str = "events.log"
+SNAPSHOT_FILE_NAME: str = "products.snapshot"
+
+_SNAPSHOT_MAGIC: bytes = b"ALLOCSNP"
+_SNAPSHOT_HEADER: Struct = Struct("<QI")
+
+
+class EventSourcedStorage(InMemoryStorage):
+    """Event-sourced storage of committed product aggregates.
+
+    Committed changes are appended to a memory-mapped event log as compact
+    events instead of being written in place. Products live in memory and
+    are rebuilt on start from the latest snapshot plus the log tail written
+    after it. Periodic snapshots are written by a background thread, off
+    the path of the commit that is due one.
+    """
+
+    def __init__(
+        self,
+        directory: Path,
+        snapshot_every: int = settings.event_log_snapshot_every,
+        *,
+        sync: bool = True,
+    ) -> None:
+        """Open storage, recovering products from disk.
+
+        Args:
+            directory (Path): directory holding the log and snapshot files,
+                created if missing.
+            snapshot_every (int, optional): number of commits between
+                snapshots, 0 disables periodic snapshots. Defaults to
+                settings.event_log_snapshot_every.
+            sync (bool, optional): flush every commit to disk. Defaults to
+                True.
+
+        """
+        super().__init__()
+
+        directory.mkdir(parents=True, exist_ok=True)
+
+        self._snapshot_path: Path = directory / SNAPSHOT_FILE_NAME
+        self._snapshot_every: int = snapshot_every
+        self._snapshot_lock: Lock = Lock()
+        # Wakes the snapshot thread, for a due snapshot or to stop it.
+        self._wake_snapshotter: Event = Event()
+        self._snapshot_due: bool = False
+        self._closing: bool = False
+        self._commits: int = 0
+
+        products, offset = self._read_snapshot()
+
+        self._log: EventLog = EventLog(directory / LOG_FILE_NAME, sync=sync)
+        self._log.recover(
+            apply=lambda events: apply_events(events, products),
+            offset=offset,
+        )
+
+        self._products = products
+        self._revisions = dict.fromkeys(products, 1)
+        self._snapshotter: Thread | None = None
+
+        if snapshot_every:
+            self._snapshotter = Thread(
+                target=self._write_snapshots,
+                name="event-log-snapshot",
+                daemon=True,
+            )
+            self._snapshotter.start()
+
+    def commit(
+        self,
+        products: dict[str, Product],
+        revisions: dict[str, int],
+    ) -> None:
+        """Append changed products to the log and replace committed ones.
+
+        Args:
+            products (dict[str, Product]): changed products by stock keeping
+                unit.
+            revisions (dict[str, int]): revisions the changes are based on.
+
+        """
+        super().commit(products, revisions)
+
+        with self._lock:
+            self._commits += 1
+
+            if (
+                self._snapshot_every
+                and self._commits % self._snapshot_every == 0
+            ):
+                self._snapshot_due = True
+                self._wake_snapshotter.set()
+
+    def snapshot(self) -> None:
+        """Write snapshot of committed products."""
+        with self._lock:
+            products: list[Product] = list(self._products.values())
+            offset: int = self._log.offset
+
+        body: bytes = b"".join(encode_product(product) for product in products)
+        temporary_path: Path = self._snapshot_path.with_suffix(".tmp")
+
+        with self._snapshot_lock:
+            with temporary_path.open("wb") as snapshot:
+                snapshot.write(_SNAPSHOT_MAGIC)
+                snapshot.write(_SNAPSHOT_HEADER.pack(offset, crc32(body)))
+                snapshot.write(body)
+                snapshot.flush()
+                os.fsync(snapshot.fileno())
+
+            temporary_path.replace(self._snapshot_path)
+
+    def close(self) -> None:
+        """Write a due snapshot and close the event log."""
+        if self._snapshotter is not None:
+            self._closing = True
+            self._wake_snapshotter.set()
+            self._snapshotter.join()
+            self._snapshotter = None
+
+        self._log.close()
+
+    def _write_snapshots(self) -> None:
+        while not self._closing:
+            self._wake_snapshotter.wait()
+            self._wake_snapshotter.clear()
+
+            with self._lock:
+                due: bool = self._snapshot_due
+                self._snapshot_due = False
+
+            if due:
+                self.snapshot()
+
+    def _apply(self, products: dict[str, Product]) -> None:
+        events: bytes = b"".join(
+            encode_changes(self._products.get(stock_keeping_unit), product)
+            for stock_keeping_unit, product in products.items()
+        )
+
+        if events:
+            self._log.append(events)
+
+        super()._apply(products)
+
+    def _read_snapshot(self) -> tuple[dict[str, Product], int | None]:
+        products: dict[str, Product] = {}
+
+        if not self._snapshot_path.exists():
+            return products, None
+
+        data: bytes = self._snapshot_path.read_bytes()
+        start: int = len(_SNAPSHOT_MAGIC) + _SNAPSHOT_HEADER.size
+
+        if len(data) < start or not data.startswith(_SNAPSHOT_MAGIC):
+            return products, None
+
+        offset, checksum = _SNAPSHOT_HEADER.unpack_from(
+            data,
+            len(_SNAPSHOT_MAGIC),
+        )
+        body: bytes = data[start:]
+
+        if crc32(body) != checksum:
+            return products, None
+
+        try:
+            apply_events(body, products)
+        except EventDecodeError:
+            return {}, None
+
+        return products, offset
@@ -0,0 +1,202 @@
+"""SQL idempotency store."""
+
+from collections.abc import Callable
+from hashlib import sha256
+from typing import Any
+
+from sqlalchemy import CursorResult, delete, insert, select, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from src.domain.value_objects.idempotency_record import IdempotencyRecord
+from src.domain.value_objects.stored_response import StoredResponse
+from src.infrastructure.repositories.sql_repository.postgresql import (
+    idempotency_keys,
+)
+
+
+class SQLIdempotencyStore:
+    """SQL idempotency store.
+
+    Every call runs in its own short session, independent of any unit of
+    work. A key is reserved by inserting its row before the request runs,
+    so the primary key lets one process run it while the others, whatever
+    process they are in, find the row. Keys are stored as SHA-256 digests,
+    so they fit the column whatever their length.
+    """
+
+    def __init__(self, session_factory: Callable[[], Session]) -> None:
+        """Create new instance.
+
+        Args:
+            session_factory (Callable[[], Session]): SQLAlchemy's session
+                factory.
+
+        """
+        self._session_factory: Callable[[], Session] = session_factory
+
+    def reserve(
+        self,
+        key: str,
+        fingerprint: str,
+        now: float,
+        expires_at: float,
+    ) -> IdempotencyRecord | None:
+        """Reserve an idempotency key for a request, unless it is held.
+
+        Args:
+            key (str): idempotency key.
+            fingerprint (str): digest of the request.
+            now (float): current time, a record of the same key expired by
+                then is replaced.
+            expires_at (float): time the reservation expires at, unless
+                completed before.
+
+        Returns:
+            IdempotencyRecord | None: None if the key is reserved for the
+                request, otherwise the record holding it.
+
+        """
+        with self._session_factory() as session:
+            while True:
+                session.execute(
+                    delete(idempotency_keys).where(
+                        idempotency_keys.c.key == _digest(key),
+                        idempotency_keys.c.expires_at <= now,
+                    ),
+                )
+
+                try:
+                    session.execute(
+                        insert(idempotency_keys).values(
+                            key=_digest(key),
+                            fingerprint=fingerprint,
+                            expires_at=expires_at,
+                        ),
+                    )
+                    session.commit()
+                except IntegrityError:
+                    session.rollback()
+                else:
+                    return None
+
+                # The holder may have released the key in the meantime,
+                # then try again.
+                if (record := self._record(session, key, now)) is not None:
+                    return record
+
+    def complete(
+        self,
+        key: str,
+        response: StoredResponse,
+        expires_at: float,
+    ) -> None:
+        """Store response of a reserved idempotency key.
+
+        Args:
+            key (str): idempotency key.
+            response (StoredResponse): response.
+            expires_at (float): time the response expires at.
+
+        """
+        with self._session_factory() as session:
+            session.execute(
+                update(idempotency_keys)
+                .where(idempotency_keys.c.key == _digest(key))
+                .values(
+                    status_code=response.status_code,
+                    body=response.body,
+                    expires_at=expires_at,
+                ),
+            )
+            session.commit()
+
+    def release(self, key: str) -> None:
+        """Drop reservation of an idempotency key without a response.
+
+        Args:
+            key (str): idempotency key.
+
+        """
+        with self._session_factory() as session:
+            session.execute(
+                delete(idempotency_keys).where(
+                    idempotency_keys.c.key == _digest(key),
+                    idempotency_keys.c.status_code.is_(None),
+                ),
+            )
+            session.commit()
+
+    def get(self, key: str, now: float) -> IdempotencyRecord | None:
+        """Get record of an idempotency key.
+
+        Args:
+            key (str): idempotency key.
+            now (float): current time, records expired by then are
+                ignored.
+
+        Returns:
+            IdempotencyRecord | None: record.
+
+        """
+        with self._session_factory() as session:
+            return self._record(session, key, now)
+
+    def purge(self, now: float) -> int:
+        """Delete expired records.
+
+        Args:
+            now (float): current time.
+
+        Returns:
+            int: number of deleted records.
+
+        """
+        with self._session_factory() as session:
+            result: CursorResult[Any] = session.connection().execute(
+                delete(idempotency_keys).where(
+                    idempotency_keys.c.expires_at <= now,
+                ),
+            )
+            session.commit()
+
+        return result.rowcount
+
+    def _record(
+        self,
+        session: Session,
+        key: str,
+        now: float,
+    ) -> IdempotencyRecord | None:
+        row: tuple[str, int | None, bytes | None] | None = (
+            session.execute(
+                select(
+                    idempotency_keys.c.fingerprint,
+                    idempotency_keys.c.status_code,
+                    idempotency_keys.c.body,
+                ).where(
+                    idempotency_keys.c.key == _digest(key),
+                    idempotency_keys.c.expires_at > now,
+                ),
+            )
+            .tuples()
+            .first()
+        )
+
+        if row is None:
+            return None
+
+        fingerprint, status_code, body = row
+
+        return IdempotencyRecord(
+            fingerprint=fingerprint,
+            response=(
+                None
+                if status_code is None or body is None
+                else StoredResponse(status_code=status_code, body=body)
+            ),
+        )
+
+
+def _digest(key: str) -> str:
+    return sha256(key.encode()).hexdigest()
@@ -0,0 +1,330 @@
+"""In-memory repository."""
+
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+from copy import deepcopy
+from threading import Lock
+
+from src.domain.aggregates.product import Product
+from src.domain.value_objects.allocation import Allocation
+
+
+class StaleProductError(Exception):
+    """Product has been changed by another unit of work exception."""
+
+
+class InMemoryStorage:
+    """In-memory storage of committed product aggregates.
+
+    Committed products are never mutated in place: units of work change
+    private copies and commit replaces the stored ones, so a reader can't
+    observe a half-applied change and rollback only has to drop the copies.
+    A copy is committed only if its version number changed, so products
+    are changed through the aggregate.
+    """
+
+    def __init__(self, products: Iterable[Product] = ()) -> None:
+        """Create new instance.
+
+        Args:
+            products (Iterable[Product], optional): initial products.
+                Defaults to ().
+
+        """
+        self._products: dict[str, Product] = {
+            product.stock_keeping_unit: deepcopy(product)
+            for product in products
+        }
+        self._revisions: dict[str, int] = dict.fromkeys(self._products, 1)
+        self._lock: Lock = Lock()
+
+    def __len__(self) -> int:
+        """Get number of products.
+
+        Returns:
+            int: number of products.
+
+        """
+        return len(self._products)
+
+    def revision(self, stock_keeping_unit: str) -> int:
+        """Get revision of a committed product.
+
+        Args:
+            stock_keeping_unit (str): stock keeping unit.
+
+        Returns:
+            int: revision, 0 for unknown products.
+
+        """
+        with self._lock:
+            return self._revisions.get(stock_keeping_unit, 0)
+
+    def version(self, stock_keeping_unit: str) -> int | None:
+        """Get version number of a committed product without copying it.
+
+        Args:
+            stock_keeping_unit (str): stock keeping unit.
+
+        Returns:
+            int | None: version number, None for unknown products.
+
+        """
+        with self._lock:
+            product: Product | None = self._products.get(stock_keeping_unit)
+
+            return None if product is None else product.version_number
+
+    def checkout(self, stock_keeping_unit: str) -> tuple[Product | None, int]:
+        """Get private copy of a committed product.
+
+        Args:
+            stock_keeping_unit (str): stock keeping unit.
+
+        Returns:
+            tuple[Product | None, int]: product copy, if any, and its
+                revision, 0 for unknown products.
+
+        """
+        with self._lock:
+            product: Product | None = self._products.get(stock_keeping_unit)
+            revision: int = self._revisions.get(stock_keeping_unit, 0)
+
+        if product is None:
+            return None, revision
+
+        return deepcopy(product), revision
+
+    def commit(
+        self,
+        products: dict[str, Product],
+        revisions: dict[str, int],
+    ) -> None:
+        """Replace committed products with changed copies.
+
+        Args:
+            products (dict[str, Product]): changed products by stock keeping
+                unit.
+            revisions (dict[str, int]): revisions the changes are based on.
+
+        Raises:
+            StaleProductError: if any product has been committed by another
+                unit of work since it was checked out.
+
+        """
+        with self._lock:
+            for stock_keeping_unit in products:
+                if self._revisions.get(stock_keeping_unit, 0) != revisions.get(
+                    stock_keeping_unit,
+                    0,
+                ):
+                    msg: str = (
+                        f"Product {stock_keeping_unit} has been changed by "
+                        "another unit of work."
+                    )
+                    raise StaleProductError(msg)
+
+            self._apply(
+                {
+                    stock_keeping_unit: deepcopy(product)
+                    for stock_keeping_unit, product in products.items()
+                }
+            )
+
+            for stock_keeping_unit in products:
+                self._revisions[stock_keeping_unit] = (
+                    revisions.get(stock_keeping_unit, 0) + 1
+                )
+
+    def _apply(self, products: dict[str, Product]) -> None:
+        self._products.update(products)
+
+
+class InMemoryRepository:
+    """In-memory repository."""
+
+    def __init__(self, storage: InMemoryStorage) -> None:
+        """Create new instance.
+
+        Args:
+            storage (InMemoryStorage): storage of committed products.
+
+        """
+        self._storage: InMemoryStorage = storage
+        self._products: dict[str, Product] = {}
+        self._revisions: dict[str, int] = {}
+        # Version numbers of loaded products, a product is committed only
+        # once its version moves on, or when it has been added.
+        self._versions: dict[str, int] = {}
+        self._added: set[str] = set()
+
+    def get(self, stock_keeping_unit: str) -> Product | None:
+        """Get product aggregate from repository by stock keeping unit.
+
+        Args:
+            stock_keeping_unit (str): stock keeping unit.
+
+        Returns:
+            Product | None: product aggregate.
+
+        """
+        if stock_keeping_unit in self._products:
+            return self._products[stock_keeping_unit]
+
+        product, revision = self._storage.checkout(stock_keeping_unit)
+        self._revisions.setdefault(stock_keeping_unit, revision)
+
+        if product is not None:
+            self._products[stock_keeping_unit] = product
+            self._versions[stock_keeping_unit] = product.version_number
+
+        return product
+
+    def get_version(self, stock_keeping_unit: str) -> int | None:
+        """Get version number of a product without loading its batches.
+
+        Args:
+            stock_keeping_unit (str): stock keeping unit.
+
+        Returns:
+            int | None: version number, None for unknown products.
+
+        """
+        if stock_keeping_unit in self._products:
+            return self._products[stock_keeping_unit].version_number
+
+        return self._storage.version(stock_keeping_unit)
+
+    def get_many(self, stock_keeping_units: Iterable[str]) -> list[Product]:
+        """Get product aggregates in stock keeping unit order.
+
+        Args:
+            stock_keeping_units (Iterable[str]): stock keeping units.
+
+        Returns:
+            list[Product]: found product aggregates, sorted by stock keeping
+                unit.
+
+        """
+        return [
+            product
+            for stock_keeping_unit in sorted(set(stock_keeping_units))
+            if (product := self.get(stock_keeping_unit)) is not None
+        ]
+
+    def iter_allocations(
+        self, stock_keeping_unit: str
+    ) -> Iterator[Allocation]:
+        """Iterate over allocations of a product.
+
+        Args:
+            stock_keeping_unit (str): stock keeping unit.
+
+        Yields:
+            Iterator[Allocation]: allocations, batch by batch.
+
+        """
+        product: Product | None = self.get(stock_keeping_unit)
+
+        if product is None:
+            return
+
+        for batch in product.batches:
+            for order_line in batch.allocations:
+                yield Allocation(
+                    order_id=order_line.order_id,
+                    stock_keeping_unit=order_line.stock_keeping_unit,
+                    quantity=order_line.quantity,
+                    batch_reference=batch.reference,
+                )
+
+    def add(self, product: Product) -> None:
+        """Add product aggregate to repository.
+
+        Args:
+            product (Product): product aggregate.
+
+        """
+        if product.stock_keeping_unit not in self._revisions:
+            self._revisions[product.stock_keeping_unit] = (
+                self._storage.revision(product.stock_keeping_unit)
+            )
+
+        self._products[product.stock_keeping_unit] = product
+        self._added.add(product.stock_keeping_unit)
+
+    @contextmanager
+    def savepoint(
+        self,
+        stock_keeping_unit: str | None = None,
+    ) -> Iterator[None]:
+        """Restore products if the block raises.
+
+        Products are restored in place, so references taken before the
+        savepoint stay valid. Products loaded or added inside the block are
+        dropped.
+
+        Args:
+            stock_keeping_unit (str | None, optional): the only loaded
+                product the block changes, only it is copied. Defaults to
+                None, every loaded product.
+
+        Yields:
+            Iterator[None]: nothing, changes inside the block are undone if
+                it raises.
+
+        """
+        covered: dict[str, Product] = self._products
+
+        if stock_keeping_unit is not None:
+            covered = (
+                {stock_keeping_unit: self._products[stock_keeping_unit]}
+                if stock_keeping_unit in self._products
+                else {}
+            )
+
+        products: dict[str, Product] = deepcopy(covered)
+        loaded: set[str] = set(self._products)
+        revisions: dict[str, int] = dict(self._revisions)
+        versions: dict[str, int] = dict(self._versions)
+        added: set[str] = set(self._added)
+
+        try:
+            yield
+        except BaseException:
+            for name in self._products.keys() - loaded:
+                del self._products[name]
+
+            for name, product in products.items():
+                current: Product | None = self._products.get(name)
+
+                if current is None:
+                    self._products[name] = product
+                else:
+                    vars(current).update(vars(product))
+
+            self._revisions = revisions
+            self._versions = versions
+            self._added = added
+            raise
+
+    def commit(self) -> None:
+        """Commit changed and added products to the storage."""
+        self._storage.commit(
+            {
+                stock_keeping_unit: product
+                for stock_keeping_unit, product in self._products.items()
+                if stock_keeping_unit in self._added
+                or product.version_number
+                != self._versions.get(stock_keeping_unit)
+            },
+            self._revisions,
+        )
+        self.clear()
+
+    def clear(self) -> None:
+        """Drop loaded and added products."""
+        self._products.clear()
+        self._revisions.clear()
+        self._versions.clear()
+        self._added.clear()
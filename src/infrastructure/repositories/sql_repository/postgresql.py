@@ -1,23 +1,30 @@
 """PostgreSQL repository."""
 
+from collections.abc import Iterable, Iterator
 from typing import TYPE_CHECKING
 
 from sqlalchemy import (
     Column,
     Date,
+    Float,
     ForeignKey,
     Integer,
+    LargeBinary,
     MetaData,
     String,
     Table,
+    select,
 )
 from sqlalchemy.orm import Session, registry, relationship
 
 from src.domain.aggregates.product import Product
 from src.domain.entities.batch import Batch
+from src.domain.value_objects.allocation import Allocation
 from src.domain.value_objects.order_line import OrderLine
+from src.infrastructure.settings import settings
 
 if TYPE_CHECKING:
+    from sqlalchemy.engine import TupleResult
     from sqlalchemy.orm.mapper import Mapper
 
 
@@ -59,6 +66,16 @@ allocations: Table = Table(
     Column("batch_id", ForeignKey("batches.id")),
 )
 
+idempotency_keys: Table = Table(
+    "idempotency_keys",
+    metadata,
+    Column("key", String(STRING_MAX_LENGTH), primary_key=True),
+    Column("fingerprint", String(STRING_MAX_LENGTH), nullable=False),
+    Column("status_code", Integer, nullable=True),
+    Column("body", LargeBinary, nullable=True),
+    Column("expires_at", Float, nullable=False, index=True),
+)
+
 
 def create_mappers() -> None:
     """Do ORM mapping."""
@@ -114,6 +131,100 @@ class PostgreSQLRepository:
             .first()
         )
 
+    def get_version(self, stock_keeping_unit: str) -> int | None:
+        """Get version number of a product without loading its batches.
+
+        Only the ``products.version_number`` column is selected, batches and
+        allocations are left alone.
+
+        Args:
+            stock_keeping_unit (str): stock keeping unit.
+
+        Returns:
+            int | None: version number, None for unknown products.
+
+        """
+        return self._session.scalar(
+            select(products.c.version_number).where(
+                products.c.stock_keeping_unit == stock_keeping_unit,
+            ),
+        )
+
+    def get_many(self, stock_keeping_units: Iterable[str]) -> list[Product]:
+        """Get and lock product aggregates in stock keeping unit order.
+
+        Rows are locked with a single ``SELECT ... FOR UPDATE`` ordered by
+        stock keeping unit, so concurrent transactions touching overlapping
+        products lock them in the same order and can't deadlock.
+
+        Args:
+            stock_keeping_units (Iterable[str]): stock keeping units.
+
+        Returns:
+            list[Product]: found product aggregates, sorted by stock keeping
+                unit.
+
+        """
+        return list(
+            self._session.scalars(
+                select(Product)
+                .where(
+                    products.c.stock_keeping_unit.in_(
+                        set(stock_keeping_units),
+                    ),
+                )
+                .order_by(products.c.stock_keeping_unit)
+                .with_for_update(),
+            )
+        )
+
+    def iter_allocations(
+        self,
+        stock_keeping_unit: str,
+        chunk_size: int = settings.allocations_export_chunk_size,
+    ) -> Iterator[Allocation]:
+        """Iterate over allocations of a product without loading it.
+
+        Rows of the allocations, order lines and batches join are fetched
+        through a server-side cursor, chunk by chunk, so memory use doesn't
+        grow with the number of allocations and the first ones are returned
+        before the query completes.
+
+        Args:
+            stock_keeping_unit (str): stock keeping unit.
+            chunk_size (int, optional): rows fetched at once. Defaults to
+                settings.allocations_export_chunk_size.
+
+        Yields:
+            Iterator[Allocation]: allocations, in allocation order.
+
+        """
+        result: TupleResult[tuple[str, int, str]] = self._session.execute(
+            select(
+                order_lines.c.order_id,
+                order_lines.c.quantity,
+                batches.c.reference,
+            )
+            .select_from(
+                allocations.join(
+                    order_lines,
+                    allocations.c.order_line_id == order_lines.c.id,
+                ).join(batches, allocations.c.batch_id == batches.c.id),
+            )
+            .where(batches.c.stock_keeping_unit == stock_keeping_unit)
+            .order_by(allocations.c.id)
+            .execution_options(yield_per=chunk_size),
+        ).tuples()
+
+        with result:
+            for order_id, quantity, batch_reference in result:
+                yield Allocation(
+                    order_id=order_id,
+                    stock_keeping_unit=stock_keeping_unit,
+                    quantity=quantity,
+                    batch_reference=batch_reference,
+                )
+
     def add(self, product: Product) -> None:
         """Add product aggregate to repository.
 
@@ -0,0 +1,30 @@
+"""Event-sourced allocation unit of work."""
+
+from src.infrastructure.repositories.sql_repository.event_sourced import (
+    EventSourcedStorage,
+)
+from src.infrastructure.uow.allocation.in_memory_allocation import (
+    InMemoryAllocationUOW,
+)
+
+
+class EventSourcedAllocationUOW(InMemoryAllocationUOW):
+    """Event-sourced allocation unit of work.
+
+    Works like the in-memory unit of work, but every commit is appended to
+    the storage's event log before it becomes visible.
+    """
+
+    _msg: str = (
+        "First, you should enter the context. "
+        "E. g. with EventSourcedAllocationUOW(storage):```"
+    )
+
+    def __init__(self, storage: EventSourcedStorage) -> None:
+        """Create new instance.
+
+        Args:
+            storage (EventSourcedStorage): event-sourced storage.
+
+        """
+        super().__init__(storage=storage)
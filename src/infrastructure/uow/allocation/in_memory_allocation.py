@@ -0,0 +1,101 @@
+"""In-memory allocation unit of work."""
+
+from collections.abc import Iterator
+from contextlib import contextmanager
+from types import TracebackType
+from typing import Self
+
+from src.infrastructure.repositories.sql_repository.in_memory import (
+    InMemoryRepository,
+    InMemoryStorage,
+)
+
+default_storage: InMemoryStorage = InMemoryStorage()
+
+
+class InMemoryAllocationUOW:
+    """In-memory allocation unit of work."""
+
+    _msg: str = (
+        "First, you should enter the context. "
+        "E. g. with InMemoryAllocationUOW():```"
+    )
+
+    def __init__(self, storage: InMemoryStorage = default_storage) -> None:
+        """Create new instance.
+
+        Args:
+            storage (InMemoryStorage): storage of committed products.
+
+        """
+        self._storage: InMemoryStorage = storage
+        self._repository: InMemoryRepository | None = None
+
+    @property
+    def products(self) -> InMemoryRepository:
+        """Get products.
+
+        Returns:
+            InMemoryRepository: products as in-memory repository.
+
+        """
+        if self._repository:
+            return self._repository
+
+        raise ValueError(self._msg)
+
+    def commit(self) -> None:
+        """Commit changes.
+
+        Raises:
+            StaleProductError: if a changed product has been committed by
+                another unit of work in the meantime.
+
+        """
+        self.products.commit()
+
+    def rollback(self) -> None:
+        """Rollback changes."""
+        self.products.clear()
+
+    @contextmanager
+    def savepoint(
+        self,
+        stock_keeping_unit: str | None = None,
+    ) -> Iterator[None]:
+        """Open nested scope restoring loaded products if its block raises.
+
+        Args:
+            stock_keeping_unit (str | None, optional): the only loaded
+                product the block changes. Defaults to None, any.
+
+        Yields:
+            Iterator[None]: nothing, changes inside the block are undone if
+                it raises.
+
+        """
+        with self.products.savepoint(stock_keeping_unit):
+            yield
+
+    def __enter__(self) -> Self:
+        """Enter dunder method."""
+        self._repository = InMemoryRepository(storage=self._storage)
+
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        """Exit dunder method.
+
+        Args:
+            exc_type (type[BaseException] | None): exception type.
+            exc_val (BaseException | None): exception value.
+            exc_tb (TracebackType | None): exception traceback.
+
+        """
+        self.rollback()
+        self._repository = None
@@ -1,19 +1,27 @@
 """PostgreSQL allocation unit of work."""
 
-from collections.abc import Callable
+import os
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
 from types import TracebackType
 from typing import Self
 
-from sqlalchemy import create_engine
+from sqlalchemy import Engine, create_engine
+from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import Session, sessionmaker
 
+from src.domain.exceptions.persistence import PersistenceError
 from src.infrastructure.repositories.sql_repository.postgresql import (
     PostgreSQLRepository,
 )
 from src.infrastructure.settings import settings
 
-default_session_factory: sessionmaker = sessionmaker(
-    bind=create_engine(settings.postgres_uri),
+default_engine: Engine = create_engine(settings.postgres_uri)
+default_session_factory: sessionmaker = sessionmaker(bind=default_engine)
+
+# Connections inherited from a parent process must never be used by a child.
+os.register_at_fork(
+    after_in_child=lambda: default_engine.dispose(close=False),
 )
 
 
@@ -79,6 +87,36 @@ class PostgresqlAllocationUOW:
         else:
             raise ValueError(self._msg)
 
+    @contextmanager
+    def savepoint(
+        self,
+        stock_keeping_unit: str | None = None,  # noqa: ARG002
+    ) -> Iterator[None]:
+        """Open nested scope backed by a SAVEPOINT.
+
+        Pending changes are flushed before the savepoint is released, so
+        database errors are raised inside the scope too.
+
+        Args:
+            stock_keeping_unit (str | None, optional): product the block
+                changes, unused, a SAVEPOINT covers the whole session.
+                Defaults to None.
+
+        Yields:
+            Iterator[None]: nothing, changes inside the block are rolled back
+                to the savepoint if it raises.
+
+        Raises:
+            PersistenceError: if the database rejects the changes.
+
+        """
+        try:
+            with self.session.begin_nested():
+                yield
+        except SQLAlchemyError as error:
+            msg: str = f"Can't persist changes: {error}"
+            raise PersistenceError(msg) from error
+
     def __enter__(self) -> Self:
         """Enter dunder method."""
         self._session = self._session_factory()
@@ -0,0 +1,179 @@
+"""Replicated PostgreSQL allocation unit of work."""
+
+import os
+from collections.abc import Callable, Sequence
+from functools import partial
+from itertools import cycle
+from threading import Lock
+from time import monotonic
+from typing import TYPE_CHECKING, Self
+
+from sqlalchemy import Engine, create_engine
+from sqlalchemy.orm import Session, sessionmaker
+
+from src.infrastructure.settings import settings
+from src.infrastructure.uow.allocation.postgresql_allocation import (
+    PostgresqlAllocationUOW,
+    default_session_factory,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+
+class ReplicaRouter:
+    """Session factory router between a primary and its replicas.
+
+    Read-only units of work go to the replicas in round-robin order. A
+    caller, e.g. a client session, that committed within the read your
+    writes window reads from the primary instead, until the replicas are
+    likely to have its writes; other callers keep using the replicas.
+    """
+
+    def __init__(
+        self,
+        primary: Callable[[], Session],
+        replicas: Sequence[Callable[[], Session]] = (),
+        read_your_writes_window: float = settings.read_your_writes_window,
+    ) -> None:
+        """Create new instance.
+
+        Args:
+            primary (Callable[[], Session]): primary session factory.
+            replicas (Sequence[Callable[[], Session]], optional): replica
+                session factories. Defaults to (), every unit of work uses
+                the primary.
+            read_your_writes_window (float, optional): seconds after a
+                commit during which reads of the same caller are pinned to
+                the primary, 0 disables pinning. Defaults to
+                settings.read_your_writes_window.
+
+        """
+        self.primary: Callable[[], Session] = primary
+        self._replicas: Iterator[Callable[[], Session]] | None = (
+            cycle(replicas) if replicas else None
+        )
+        self._read_your_writes_window: float = read_your_writes_window
+        self._pinned_until: dict[str, float] = {}
+        # Size of pins at which expired ones are dropped, doubled after.
+        self._sweep_at: int = 1024
+        self._lock: Lock = Lock()
+
+    def route(
+        self,
+        *,
+        read_only: bool,
+        caller: str | None = None,
+    ) -> Callable[[], Session]:
+        """Choose session factory for a unit of work.
+
+        Args:
+            read_only (bool): whether the unit of work only reads.
+            caller (str | None, optional): caller the unit of work reads
+                for. Defaults to None, never pinned.
+
+        Returns:
+            Callable[[], Session]: session factory.
+
+        """
+        with self._lock:
+            if not read_only or self._replicas is None:
+                return self.primary
+
+            if caller is not None and caller in self._pinned_until:
+                if monotonic() < self._pinned_until[caller]:
+                    return self.primary
+
+                del self._pinned_until[caller]
+
+            return next(self._replicas)
+
+    def mark_write(self, caller: str | None = None) -> None:
+        """Pin reads of a caller to the primary for the window.
+
+        Args:
+            caller (str | None, optional): caller that committed. Defaults
+                to None, nothing is pinned.
+
+        """
+        if caller is None or self._read_your_writes_window <= 0:
+            return
+
+        now: float = monotonic()
+
+        with self._lock:
+            self._pinned_until[caller] = now + self._read_your_writes_window
+
+            if len(self._pinned_until) >= self._sweep_at:
+                self._pinned_until = {
+                    pinned: until
+                    for pinned, until in self._pinned_until.items()
+                    if until > now
+                }
+                self._sweep_at = max(1024, 2 * len(self._pinned_until))
+
+
+replica_engines: list[Engine] = [
+    create_engine(uri) for uri in settings.postgres_replica_uris
+]
+
+for replica_engine in replica_engines:
+    os.register_at_fork(
+        after_in_child=partial(replica_engine.dispose, close=False),
+    )
+
+default_replica_router: ReplicaRouter = ReplicaRouter(
+    primary=default_session_factory,
+    replicas=[sessionmaker(bind=engine) for engine in replica_engines],
+)
+
+
+class ReplicatedAllocationUOW(PostgresqlAllocationUOW):
+    """Replicated PostgreSQL allocation unit of work."""
+
+    _read_only_msg: str = "Read-only unit of work can't commit."
+
+    def __init__(
+        self,
+        router: ReplicaRouter = default_replica_router,
+        *,
+        read_only: bool = False,
+        caller: str | None = None,
+    ) -> None:
+        """Create new instance.
+
+        Args:
+            router (ReplicaRouter, optional): session factory router.
+                Defaults to default_replica_router.
+            read_only (bool, optional): route to a replica and forbid
+                commits. Defaults to False.
+            caller (str | None, optional): caller, e.g. a client session,
+                whose reads follow its own writes. Defaults to None.
+
+        """
+        super().__init__(session_factory=router.primary)
+        self._router: ReplicaRouter = router
+        self._read_only: bool = read_only
+        self._caller: str | None = caller
+
+    def commit(self) -> None:
+        """Commit changes.
+
+        Raises:
+            ValueError: if the unit of work is read-only.
+
+        """
+        if self._read_only:
+            raise ValueError(self._read_only_msg)
+
+        super().commit()
+        self._router.mark_write(self._caller)
+
+    def __enter__(self) -> Self:
+        """Enter dunder method."""
+        self._session_factory = self._router.route(
+            read_only=self._read_only,
+            caller=self._caller,
+        )
+
+        return super().__enter__()
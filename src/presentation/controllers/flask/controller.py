@@ -1,21 +1,34 @@
 """Flask controller."""
 
+import os
+
 from flask import Flask
 from sqlalchemy import Engine, create_engine
+from sqlalchemy.orm import configure_mappers
 
 from src.infrastructure.repositories.sql_repository.postgresql import (
     create_mappers,
     metadata,
 )
 from src.infrastructure.settings import settings
+from src.presentation.utils.encoder import FastJSONProvider
 from src.presentation.views.flask.add_batch import add_batch_blueprint
 from src.presentation.views.flask.allocate import allocate_blueprint
+from src.presentation.views.flask.availability import availability_blueprint
+from src.presentation.views.flask.export import export_blueprint
 
 app: Flask = Flask(__name__)
+app.json = FastJSONProvider(app)
 
 engine: Engine = create_engine(settings.postgres_uri)
 metadata.create_all(engine)
 create_mappers()
+# Built before a pre-fork server freezes the heap, not in every worker.
+configure_mappers()
+
+os.register_at_fork(after_in_child=lambda: engine.dispose(close=False))
 
 app.register_blueprint(add_batch_blueprint)
 app.register_blueprint(allocate_blueprint)
+app.register_blueprint(availability_blueprint)
+app.register_blueprint(export_blueprint)
@@ -0,0 +1,300 @@
+"""Pre-fork Flask server.
+
+The parent process imports the application, binds the listening socket,
+sends warm-up requests through the application so lazily built state
+exists, and freezes everything allocated so far out of the garbage
+collector, then forks workers that accept connections from the shared
+socket. Freezing keeps the collector from touching, and therefore copying,
+memory pages the workers share with the parent. Database engines drop
+inherited connections after fork, see ``os.register_at_fork`` calls next to
+their creation.
+
+Run with ``python -m src.presentation.controllers.flask.server``.
+"""
+
+import gc
+import logging
+import os
+import signal
+import socket
+from argparse import ArgumentParser, Namespace
+from collections.abc import Sequence
+from threading import Event
+from time import monotonic
+from types import FrameType
+from typing import TYPE_CHECKING
+
+from flask import Flask
+from werkzeug.exceptions import HTTPException
+from werkzeug.serving import BaseWSGIServer, make_server
+
+from src.infrastructure.settings import settings
+
+if TYPE_CHECKING:
+    from werkzeug.routing import MapAdapter
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+_POLL_INTERVAL: float = 0.5
+
+
+class PreForkServer:
+    """Pre-fork Flask server."""
+
+    def __init__(  # noqa: PLR0913
+        self,
+        app: Flask,
+        host: str = settings.server_host,
+        port: int = settings.server_port,
+        workers: int = settings.server_workers,
+        *,
+        threaded: bool = True,
+        rss_report_interval: float = settings.server_rss_report_interval,
+        warm_up_paths: Sequence[str] = settings.server_warm_up_paths,
+    ) -> None:
+        """Create new instance.
+
+        Args:
+            app (Flask): Flask application, imported before forking.
+            host (str, optional): host to listen on. Defaults to
+                settings.server_host.
+            port (int, optional): port to listen on, 0 picks a free one.
+                Defaults to settings.server_port.
+            workers (int, optional): number of worker processes. Defaults to
+                settings.server_workers.
+            threaded (bool, optional): handle requests of a worker in
+                threads. Defaults to True.
+            rss_report_interval (float, optional): seconds between worker
+                resident set size reports. Defaults to
+                settings.server_rss_report_interval.
+            warm_up_paths (Sequence[str], optional): paths requested with
+                GET before forking, read-only routes going through views
+                and the database. Paths matching no route are skipped with
+                a warning. Defaults to settings.server_warm_up_paths, the
+                availability and export of an unknown product.
+
+        """
+        self._app: Flask = app
+        self._host: str = host
+        self._port: int = port
+        self._workers: int = workers
+        self._threaded: bool = threaded
+        self._rss_report_interval: float = rss_report_interval
+        self._warm_up_paths: Sequence[str] = warm_up_paths
+        self._socket: socket.socket | None = None
+        self._pids: set[int] = set()
+        self._stopping: Event = Event()
+
+    @property
+    def address(self) -> tuple[str, int]:
+        """Get address the server listens on.
+
+        Returns:
+            tuple[str, int]: host and port.
+
+        """
+        if self._socket is None:
+            return self._host, self._port
+
+        host, port = self._socket.getsockname()[:2]
+
+        return host, port
+
+    @property
+    def workers(self) -> frozenset[int]:
+        """Get worker process ids.
+
+        Returns:
+            frozenset[int]: process ids.
+
+        """
+        return frozenset(self._pids)
+
+    def start(self) -> None:
+        """Bind socket, warm up and fork workers."""
+        self._stopping.clear()
+        self._socket = socket.create_server((self._host, self._port))
+
+        self._warm_up()
+        gc.collect()
+        gc.freeze()
+
+        for _ in range(self._workers):
+            self._spawn()
+
+    def serve_forever(self) -> None:
+        """Start, then supervise workers until SIGINT or SIGTERM."""
+        signal.signal(signal.SIGINT, self._handle_stop)
+        signal.signal(signal.SIGTERM, self._handle_stop)
+
+        self.start()
+        logger.info(
+            "Listening on %s:%s with %s workers",
+            *self.address,
+            self._workers,
+        )
+
+        next_report: float = monotonic()
+
+        while not self._stopping.wait(_POLL_INTERVAL):
+            self._reap()
+
+            if monotonic() >= next_report:
+                self._report()
+                next_report = monotonic() + self._rss_report_interval
+
+        self.stop()
+
+    def stop(self) -> None:
+        """Terminate workers and close socket."""
+        self._stopping.set()
+
+        for pid in self._pids:
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                continue
+
+        for pid in self._pids:
+            try:
+                os.waitpid(pid, 0)
+            except ChildProcessError:
+                continue
+
+        self._pids.clear()
+
+        if self._socket is not None:
+            self._socket.close()
+            self._socket = None
+
+    def rss(self) -> dict[int, int]:
+        """Get resident set size of every worker.
+
+        Returns:
+            dict[int, int]: resident set size in bytes by process id, empty
+                where /proc is not available.
+
+        """
+        sizes: dict[int, int] = {}
+
+        for pid in self._pids:
+            try:
+                with open(f"/proc/{pid}/statm", encoding="ascii") as statm:  # noqa: PTH123
+                    pages: int = int(statm.read().split()[1])
+            except OSError:
+                continue
+
+            sizes[pid] = pages * os.sysconf("SC_PAGE_SIZE")
+
+        return sizes
+
+    def _spawn(self) -> None:
+        pid: int = os.fork()
+
+        if pid:
+            self._pids.add(pid)
+            return
+
+        try:
+            self._work()
+        except BaseException:
+            logger.exception("Worker %s crashed", os.getpid())
+            os._exit(1)
+
+        os._exit(0)
+
+    def _warm_up(self) -> None:
+        routes: MapAdapter = self._app.url_map.bind("localhost")
+
+        with self._app.test_client() as client:
+            for path in self._warm_up_paths:
+                try:
+                    routes.match(path, method="GET")
+                except HTTPException:
+                    logger.warning("Warm-up path %s matches no route", path)
+                    continue
+
+                try:
+                    client.get(path)
+                except Exception:
+                    logger.exception("Warm-up request to %s failed", path)
+
+    def _work(self) -> None:
+        signal.signal(signal.SIGINT, signal.SIG_IGN)
+        signal.signal(signal.SIGTERM, signal.SIG_DFL)
+
+        if self._socket is None:
+            return
+
+        server: BaseWSGIServer = make_server(
+            host=self._host,
+            port=self._port,
+            app=self._app,
+            threaded=self._threaded,
+            fd=self._socket.fileno(),
+        )
+        server.serve_forever()
+
+    def _reap(self) -> None:
+        while self._pids:
+            pid, status = os.waitpid(-1, os.WNOHANG)
+
+            if pid == 0:
+                return
+
+            self._pids.discard(pid)
+            logger.warning(
+                "Worker %s exited with %s, restarting",
+                pid,
+                os.waitstatus_to_exitcode(status),
+            )
+
+            if not self._stopping.is_set():
+                self._spawn()
+
+    def _report(self) -> None:
+        for pid, size in sorted(self.rss().items()):
+            logger.info("Worker %s RSS %.1f MiB", pid, size / 2**20)
+
+    def _handle_stop(self, signum: int, frame: FrameType | None) -> None:  # noqa: ARG002
+        self._stopping.set()
+
+
+def parse_arguments() -> Namespace:
+    """Parse command line arguments.
+
+    Returns:
+        Namespace: parsed arguments.
+
+    """
+    parser: ArgumentParser = ArgumentParser(description=__doc__)
+    parser.add_argument("--host", default=settings.server_host)
+    parser.add_argument("--port", type=int, default=settings.server_port)
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=settings.server_workers,
+    )
+
+    return parser.parse_args()
+
+
+def main() -> None:
+    """Run the allocation API with pre-forked workers."""
+    from src.presentation.controllers.flask.controller import (
+        app,
+    )
+
+    arguments: Namespace = parse_arguments()
+    logging.basicConfig(level=logging.INFO)
+
+    PreForkServer(
+        app=app,
+        host=arguments.host,
+        port=arguments.port,
+        workers=arguments.workers,
+    ).serve_forever()
+
+
+if __name__ == "__main__":
+    main()
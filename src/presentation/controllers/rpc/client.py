@@ -0,0 +1,145 @@
+"""Allocation RPC client."""
+
+import socket
+from collections.abc import Sequence
+from itertools import count
+from types import TracebackType
+from typing import Self
+
+from src.domain.value_objects.order_line import OrderLine
+from src.infrastructure.settings import settings
+from src.presentation.dtos.rpc.allocate import (
+    LENGTH,
+    AllocateRequestFrame,
+    AllocateResponseFrame,
+)
+
+_RECEIVE_SIZE: int = 64 * 1024
+
+
+class AllocationRPCClient:
+    """Allocation RPC client, not thread safe."""
+
+    def __init__(
+        self,
+        path: str = settings.rpc_socket_path,
+        window: int = settings.rpc_pipeline_window,
+    ) -> None:
+        """Create new instance and connect.
+
+        Args:
+            path (str, optional): socket path. Defaults to
+                settings.rpc_socket_path.
+            window (int, optional): requests sent before reading their
+                responses when pipelining. Defaults to
+                settings.rpc_pipeline_window.
+
+        """
+        self._socket: socket.socket = socket.socket(socket.AF_UNIX)
+        self._socket.connect(path)
+        self._window: int = window
+        self._request_ids: count[int] = count(1)
+        self._buffer: bytearray = bytearray()
+
+    def allocate(
+        self,
+        order_id: str,
+        stock_keeping_unit: str,
+        quantity: int,
+    ) -> AllocateResponseFrame:
+        """Allocate order line.
+
+        Args:
+            order_id (str): order id.
+            stock_keeping_unit (str): stock keeping unit.
+            quantity (int): quantity.
+
+        Returns:
+            AllocateResponseFrame: response frame.
+
+        """
+        return self.allocate_many(
+            [OrderLine(order_id, stock_keeping_unit, quantity)],
+        )[0]
+
+    def allocate_many(
+        self,
+        order_lines: Sequence[OrderLine],
+    ) -> list[AllocateResponseFrame]:
+        """Allocate order lines, pipelined.
+
+        Requests are sent window by window, so neither side blocks writing
+        while the other one is writing too.
+
+        Args:
+            order_lines (Sequence[OrderLine]): order lines.
+
+        Returns:
+            list[AllocateResponseFrame]: response frames in order lines
+                order.
+
+        """
+        responses: list[AllocateResponseFrame] = []
+
+        for start in range(0, len(order_lines), self._window):
+            window: Sequence[OrderLine] = order_lines[
+                start : start + self._window
+            ]
+            self._socket.sendall(
+                b"".join(
+                    AllocateRequestFrame(
+                        request_id=next(self._request_ids),
+                        order_id=order_line.order_id,
+                        stock_keeping_unit=order_line.stock_keeping_unit,
+                        quantity=order_line.quantity,
+                    ).encode()
+                    for order_line in window
+                ),
+            )
+            responses.extend(self._receive() for _ in window)
+
+        return responses
+
+    def close(self) -> None:
+        """Close the connection."""
+        self._socket.close()
+
+    def __enter__(self) -> Self:
+        """Enter dunder method."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        """Exit dunder method.
+
+        Args:
+            exc_type (type[BaseException] | None): exception type.
+            exc_val (BaseException | None): exception value.
+            exc_tb (TracebackType | None): exception traceback.
+
+        """
+        self.close()
+
+    def _receive(self) -> AllocateResponseFrame:
+        while True:
+            if len(self._buffer) >= LENGTH.size:
+                (size,) = LENGTH.unpack_from(self._buffer)
+                end: int = LENGTH.size + size
+
+                if len(self._buffer) >= end:
+                    payload: bytes = bytes(self._buffer[LENGTH.size : end])
+                    del self._buffer[:end]
+
+                    return AllocateResponseFrame.decode(payload)
+
+            chunk: bytes = self._socket.recv(_RECEIVE_SIZE)
+
+            if not chunk:
+                msg: str = "Server closed the connection."
+                raise ConnectionError(msg)
+
+            self._buffer += chunk
@@ -0,0 +1,154 @@
+"""Allocation RPC server.
+
+Serves the binary allocation protocol of ``src.presentation.dtos.rpc``
+over a Unix domain socket, one thread per connection, for internal clients
+that don't need HTTP. Clients may pipeline requests: every complete frame
+received is processed in order and the responses are written back in a
+single call.
+
+Run with ``python -m src.presentation.controllers.rpc.server``.
+"""
+
+import logging
+import socket
+from argparse import ArgumentParser, Namespace
+from collections.abc import Callable
+from pathlib import Path
+from socketserver import BaseRequestHandler, ThreadingMixIn, UnixStreamServer
+
+from src.domain.interfaces.uow.allocation import AllocationUOW
+from src.infrastructure.settings import settings
+from src.infrastructure.uow.allocation.postgresql_allocation import (
+    PostgresqlAllocationUOW,
+)
+from src.presentation.dtos.rpc.allocate import LENGTH
+from src.presentation.views.rpc.allocate import allocate_frame
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+_RECEIVE_SIZE: int = 64 * 1024
+
+
+class _ConnectionHandler(BaseRequestHandler):
+    server: "AllocationRPCServer"
+    request: socket.socket
+
+    def handle(self) -> None:
+        self.server.serve_connection(self.request)
+
+
+class AllocationRPCServer(ThreadingMixIn, UnixStreamServer):
+    """Allocation RPC server."""
+
+    daemon_threads: bool = True
+
+    def __init__(
+        self,
+        path: str = settings.rpc_socket_path,
+        unit_of_work_factory: Callable[
+            [],
+            AllocationUOW,
+        ] = PostgresqlAllocationUOW,
+        max_frame_size: int = settings.rpc_max_frame_size,
+    ) -> None:
+        """Create new instance and bind the socket.
+
+        A stale socket file left at the path is removed first.
+
+        Args:
+            path (str, optional): socket path. Defaults to
+                settings.rpc_socket_path.
+            unit_of_work_factory (Callable[[], AllocationUOW], optional):
+                unit of work factory, called once per request. Defaults to
+                PostgresqlAllocationUOW.
+            max_frame_size (int, optional): largest accepted payload, a
+                connection announcing a larger one is closed. Defaults to
+                settings.rpc_max_frame_size.
+
+        """
+        self.path: Path = Path(path)
+        self._unit_of_work_factory: Callable[[], AllocationUOW] = (
+            unit_of_work_factory
+        )
+        self._max_frame_size: int = max_frame_size
+
+        self.path.unlink(missing_ok=True)
+        super().__init__(str(self.path), _ConnectionHandler)
+
+    def serve_connection(self, connection: socket.socket) -> None:
+        """Serve frames of a connection until it is closed.
+
+        Args:
+            connection (socket.socket): accepted connection.
+
+        """
+        buffer: bytearray = bytearray()
+
+        while chunk := connection.recv(_RECEIVE_SIZE):
+            buffer += chunk
+            responses: bytearray = bytearray()
+            offset: int = 0
+
+            while len(buffer) - offset >= LENGTH.size:
+                (size,) = LENGTH.unpack_from(buffer, offset)
+
+                if size > self._max_frame_size:
+                    logger.warning(
+                        "Closing connection announcing a %d bytes frame.",
+                        size,
+                    )
+
+                    return
+
+                end: int = offset + LENGTH.size + size
+
+                if len(buffer) < end:
+                    break
+
+                responses += allocate_frame(
+                    payload=bytes(buffer[offset + LENGTH.size : end]),
+                    unit_of_work_factory=self._unit_of_work_factory,
+                ).encode()
+                offset = end
+
+            del buffer[:offset]
+
+            if responses:
+                connection.sendall(responses)
+
+    def server_close(self) -> None:
+        """Close the socket and remove its file."""
+        super().server_close()
+        self.path.unlink(missing_ok=True)
+
+
+def parse_arguments() -> Namespace:
+    """Parse command line arguments.
+
+    Returns:
+        Namespace: parsed arguments.
+
+    """
+    parser: ArgumentParser = ArgumentParser(description=__doc__)
+    parser.add_argument("--path", default=settings.rpc_socket_path)
+
+    return parser.parse_args()
+
+
+def main() -> None:
+    """Run the allocation RPC server."""
+    from src.infrastructure.repositories.sql_repository.postgresql import (
+        create_mappers,
+    )
+
+    arguments: Namespace = parse_arguments()
+    logging.basicConfig(level=logging.INFO)
+    create_mappers()
+
+    with AllocationRPCServer(path=arguments.path) as server:
+        logger.info("Serving allocation RPC on %s.", server.path)
+        server.serve_forever()
+
+
+if __name__ == "__main__":
+    main()
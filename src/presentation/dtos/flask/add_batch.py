@@ -1,12 +1,19 @@
 """Add batch data transfer objects."""
 
+from collections.abc import Mapping
 from dataclasses import dataclass
 from datetime import date
 from typing import Any, Self
 
-from flask import Request, Response, jsonify
+from flask import Request, Response
 
 from src.domain.entities.batch import Batch
+from src.presentation.utils.decoder import Decoder
+from src.presentation.utils.encoder import (
+    ResponseCodec,
+    StaticCodec,
+    json_codec,
+)
 from src.presentation.utils.status_codes import StatusCode
 
 
@@ -20,31 +27,20 @@ class AddBatchRequestBody:
     estimated_arrival_time: date | None
 
     @classmethod
-    def from_flask_request(cls, request: Request) -> Self:
+    def from_flask_request(cls, request: Request) -> "AddBatchRequestBody":
         """Make new instance from a Flask request.
 
         Args:
             request (Request): Flask request
 
+        Raises:
+            DecodeError: if the body doesn't match the fields.
+
         Returns:
-            Self: allocation request body
+            AddBatchRequestBody: add batch request body
 
         """
-        if not isinstance(request.json, dict):
-            msg: str = "Can't parse request body since it's not a dict."
-            raise TypeError(msg)
-
-        for variable_name, expected_type in cls.__annotations__.items():
-            try:
-                variable_value: Any = request.json[variable_name]
-            except KeyError:
-                msg = f"Request must have {variable_name} field."
-                raise ValueError(msg) from KeyError
-
-            if not isinstance(variable_value, expected_type):
-                msg = f"{variable_name} must have {expected_type} type."
-
-        return cls(**request.json)
+        return _add_batch_decoder.decode(request.get_data(cache=False))
 
     def as_batch(self) -> Batch:
         """Get as order line.
@@ -61,12 +57,55 @@ class AddBatchRequestBody:
         )
 
 
+_add_batch_decoder: Decoder[AddBatchRequestBody] = Decoder(AddBatchRequestBody)
+
+
+@dataclass(frozen=True, slots=True)
+class AddBatchesRequestBody:
+    """Bulk add batch request body."""
+
+    batches: tuple[AddBatchRequestBody, ...]
+
+    @classmethod
+    def from_flask_request(cls, request: Request) -> Self:
+        """Make new instance from a Flask request.
+
+        Args:
+            request (Request): Flask request
+
+        Raises:
+            DecodeError: if the body isn't an array of add batch requests.
+
+        Returns:
+            Self: bulk add batch request body
+
+        """
+        return cls(
+            batches=_batches_decoder.decode(request.get_data(cache=False)),
+        )
+
+    def as_batches(self) -> list[Batch]:
+        """Get as batches.
+
+        Returns:
+            list[Batch]: batch entities, in request order.
+
+        """
+        return [batch.as_batch() for batch in self.batches]
+
+
+_batches_decoder: Decoder[tuple[AddBatchRequestBody, ...]] = Decoder(
+    tuple[AddBatchRequestBody, ...],
+)
+
+
 @dataclass(frozen=True, slots=True)
 class AddBatchResponseBody:
     """Add batch response body."""
 
-    body: dict[str, Any]
+    body: Mapping[str, Any]
     status_code: StatusCode
+    codec: ResponseCodec = json_codec
 
     def as_flask_response(self) -> tuple[Response, int]:
         """Get as flask response.
@@ -75,4 +114,13 @@ class AddBatchResponseBody:
             tuple[Response, int]: flask response and status code.
 
         """
-        return (jsonify(self.body), self.status_code.value)
+        return (
+            Response(
+                self.codec.encode(self.body),
+                mimetype="application/json",
+            ),
+            self.status_code.value,
+        )
+
+
+created_codec: StaticCodec = StaticCodec({"status": "ok"})
@@ -1,11 +1,19 @@
 """Allocation data transfer objects."""
 
+from collections.abc import Mapping
 from dataclasses import dataclass
 from typing import Any, Self
 
-from flask import Request, Response, jsonify
+from flask import Request, Response
 
 from src.domain.value_objects.order_line import OrderLine
+from src.domain.value_objects.stored_response import StoredResponse
+from src.presentation.utils.decoder import Decoder
+from src.presentation.utils.encoder import (
+    ResponseCodec,
+    TemplateCodec,
+    json_codec,
+)
 from src.presentation.utils.status_codes import StatusCode
 
 
@@ -18,31 +26,20 @@ class AllocateRequestBody:
     quantity: int
 
     @classmethod
-    def from_flask_request(cls, request: Request) -> Self:
+    def from_flask_request(cls, request: Request) -> "AllocateRequestBody":
         """Make new instance from a Flask request.
 
         Args:
             request (Request): Flask request
 
+        Raises:
+            DecodeError: if the body doesn't match the fields.
+
         Returns:
-            Self: allocation request body
+            AllocateRequestBody: allocation request body
 
         """
-        if not isinstance(request.json, dict):
-            msg: str = "Can't parse request body since it's not a dict."
-            raise TypeError(msg)
-
-        for variable_name, expected_type in cls.__annotations__.items():
-            try:
-                variable_value: Any = request.json[variable_name]
-            except KeyError:
-                msg = f"Request must have {variable_name} field."
-                raise ValueError(msg) from KeyError
-
-            if not isinstance(variable_value, expected_type):
-                msg = f"{variable_name} must have {expected_type} type."
-
-        return cls(**request.json)
+        return _allocate_decoder.decode(request.get_data(cache=False))
 
     def as_order_line(self) -> OrderLine:
         """Get as order line.
@@ -58,12 +55,54 @@ class AllocateRequestBody:
         )
 
 
+_allocate_decoder: Decoder[AllocateRequestBody] = Decoder(AllocateRequestBody)
+
+
+@dataclass(frozen=True, slots=True)
+class AllocateBatchRequestBody:
+    """Batch allocation request body."""
+
+    lines: tuple[AllocateRequestBody, ...]
+
+    @classmethod
+    def from_flask_request(cls, request: Request) -> Self:
+        """Make new instance from a Flask request.
+
+        Args:
+            request (Request): Flask request
+
+        Raises:
+            DecodeError: if the body isn't an array of allocation requests.
+
+        Returns:
+            Self: batch allocation request body
+
+        """
+        return cls(lines=_lines_decoder.decode(request.get_data(cache=False)))
+
+    def as_order_lines(self) -> list[OrderLine]:
+        """Get as order lines.
+
+        Returns:
+            list[OrderLine]: order line value objects, in request order.
+
+        """
+        return [line.as_order_line() for line in self.lines]
+
+
+_lines_decoder: Decoder[tuple[AllocateRequestBody, ...]] = Decoder(
+    tuple[AllocateRequestBody, ...],
+)
+
+
 @dataclass(frozen=True, slots=True)
 class AllocateResponseBody:
     """Allocation response body."""
 
-    body: dict[str, Any]
+    body: Mapping[str, Any]
     status_code: StatusCode
+    codec: ResponseCodec = json_codec
+    retry_after: int | None = None
 
     def as_flask_response(self) -> tuple[Response, int]:
         """Get as flask response.
@@ -72,4 +111,53 @@ class AllocateResponseBody:
             tuple[Response, int]: flask response and status code.
 
         """
-        return (jsonify(self.body), self.status_code.value)
+        response: Response = Response(
+            self.codec.encode(self.body),
+            mimetype="application/json",
+        )
+
+        if self.retry_after is not None:
+            response.headers["Retry-After"] = str(self.retry_after)
+
+        return response, self.status_code.value
+
+    def as_stored_response(self) -> StoredResponse:
+        """Get as response stored for replays.
+
+        Returns:
+            StoredResponse: encoded body and status code.
+
+        """
+        return StoredResponse(
+            status_code=self.status_code.value,
+            body=self.codec.encode(self.body),
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class StoredResponseBody:
+    """Stored, possibly replayed, response body."""
+
+    response: StoredResponse
+    replayed: bool
+
+    def as_flask_response(self) -> tuple[Response, int]:
+        """Get as flask response.
+
+        Returns:
+            tuple[Response, int]: flask response and status code, replays
+                are marked with an ``Idempotent-Replayed`` header.
+
+        """
+        flask_response: Response = Response(
+            self.response.body,
+            mimetype="application/json",
+        )
+
+        if self.replayed:
+            flask_response.headers["Idempotent-Replayed"] = "true"
+
+        return flask_response, self.response.status_code
+
+
+batch_reference_codec: TemplateCodec = TemplateCodec("batch_reference")
@@ -0,0 +1,42 @@
+"""Availability data transfer objects."""
+
+from collections.abc import Mapping
+from dataclasses import dataclass
+from typing import Any
+
+from flask import Response
+
+from src.presentation.utils.encoder import ResponseCodec, json_codec
+from src.presentation.utils.status_codes import StatusCode
+
+
+@dataclass(frozen=True, slots=True)
+class AvailabilityResponseBody:
+    """Availability response body."""
+
+    body: Mapping[str, Any] | None
+    status_code: StatusCode
+    etag: str | None = None
+    codec: ResponseCodec = json_codec
+
+    def as_flask_response(self) -> tuple[Response, int]:
+        """Get as flask response.
+
+        Responses carrying an entity tag must be revalidated by caches on
+        every use, so clients always poll with ``If-None-Match``.
+
+        Returns:
+            tuple[Response, int]: flask response and status code, without a
+                body if the body is None.
+
+        """
+        response: Response = Response(
+            b"" if self.body is None else self.codec.encode(self.body),
+            mimetype=None if self.body is None else "application/json",
+        )
+
+        if self.etag is not None:
+            response.set_etag(self.etag)
+            response.cache_control.no_cache = True
+
+        return response, self.status_code.value
@@ -0,0 +1,96 @@
+"""Export data transfer objects."""
+
+from collections.abc import Callable, Iterable, Iterator, Mapping
+from dataclasses import dataclass
+from typing import Any
+
+from flask import Response
+
+from src.domain.value_objects.allocation import Allocation
+from src.infrastructure.settings import settings
+from src.presentation.utils.encoder import (
+    ResponseCodec,
+    TemplateCodec,
+    json_codec,
+)
+from src.presentation.utils.status_codes import StatusCode
+
+
+@dataclass(frozen=True, slots=True)
+class AllocationsExportBody:
+    """Allocations export body, one JSON object per line."""
+
+    allocations: Iterable[Allocation]
+    on_close: Callable[[], None] | None = None
+    buffer_size: int = settings.allocations_export_buffer_size
+
+    def as_flask_response(self) -> tuple[Response, int]:
+        """Get as streamed flask response.
+
+        Lines are encoded as allocations arrive and sent in chunks of about
+        buffer_size bytes, so the response never holds the whole export.
+
+        Returns:
+            tuple[Response, int]: flask response and status code.
+
+        """
+        response: Response = Response(
+            self._stream(),
+            mimetype="application/x-ndjson",
+        )
+
+        if self.on_close is not None:
+            response.call_on_close(self.on_close)
+
+        return response, StatusCode.ok.value
+
+    def _stream(self) -> Iterator[bytes]:
+        buffer: bytearray = bytearray()
+
+        for allocation in self.allocations:
+            buffer += allocation_codec.encode(
+                {
+                    "order_id": allocation.order_id,
+                    "quantity": allocation.quantity,
+                    "batch_reference": allocation.batch_reference,
+                },
+            )
+            buffer += b"\n"
+
+            if len(buffer) >= self.buffer_size:
+                yield bytes(buffer)
+                buffer.clear()
+
+        if buffer:
+            yield bytes(buffer)
+
+
+@dataclass(frozen=True, slots=True)
+class ExportResponseBody:
+    """Export response body, sent instead of the export on errors."""
+
+    body: Mapping[str, Any]
+    status_code: StatusCode
+    codec: ResponseCodec = json_codec
+
+    def as_flask_response(self) -> tuple[Response, int]:
+        """Get as flask response.
+
+        Returns:
+            tuple[Response, int]: flask response and status code.
+
+        """
+        return (
+            Response(
+                self.codec.encode(self.body),
+                mimetype="application/json",
+            ),
+            self.status_code.value,
+        )
+
+
+allocation_codec: TemplateCodec = TemplateCodec(
+    "order_id",
+    "quantity",
+    "batch_reference",
+)
@@ -0,0 +1 @@
+"""RPC data transfer objects."""
@@ -0,0 +1,184 @@
+"""Allocation RPC data transfer objects.
+
+Frames are a big-endian unsigned 32-bit payload length followed by the
+payload. A request payload is a fixed header, request id, order id length,
+stock keeping unit length and quantity, followed by the UTF-8 order id and
+stock keeping unit. A response payload is a fixed header, request id,
+status code and text length, followed by the UTF-8 batch reference or
+error message.
+"""
+
+from dataclasses import dataclass
+from struct import Struct, error
+from typing import Self
+
+from src.domain.value_objects.order_line import OrderLine
+
+LENGTH: Struct = Struct("!I")
+
+_REQUEST_HEADER: Struct = Struct("!IHHi")
+# Texts echo stock keeping units, up to a request frame long, so their
+# length takes 32 bits.
+_RESPONSE_HEADER: Struct = Struct("!IHI")
+
+
+class FrameError(ValueError):
+    """Payload doesn't match the frame layout exception."""
+
+    def __init__(self, message: str, request_id: int = 0) -> None:
+        """Create new instance.
+
+        Args:
+            message (str): message.
+            request_id (int, optional): request id, if the header could be
+                read. Defaults to 0.
+
+        """
+        super().__init__(message)
+        self.request_id: int = request_id
+
+
+@dataclass(frozen=True, slots=True)
+class AllocateRequestFrame:
+    """Allocation request frame."""
+
+    request_id: int
+    order_id: str
+    stock_keeping_unit: str
+    quantity: int
+
+    @classmethod
+    def decode(cls, payload: bytes) -> Self:
+        """Make new instance from a request payload.
+
+        Args:
+            payload (bytes): request payload, without the length prefix.
+
+        Raises:
+            FrameError: if the payload doesn't match the layout.
+
+        Returns:
+            Self: allocation request frame.
+
+        """
+        try:
+            request_id, order_id_size, stock_keeping_unit_size, quantity = (
+                _REQUEST_HEADER.unpack_from(payload)
+            )
+        except error as exception:
+            msg: str = f"Malformed request header: {exception}."
+            raise FrameError(msg) from exception
+
+        offset: int = _REQUEST_HEADER.size
+
+        if len(payload) != offset + order_id_size + stock_keeping_unit_size:
+            msg = (
+                f"Request {request_id} payload is {len(payload)} bytes, "
+                f"header announces "
+                f"{offset + order_id_size + stock_keeping_unit_size}."
+            )
+            raise FrameError(msg, request_id)
+
+        try:
+            return cls(
+                request_id=request_id,
+                order_id=payload[offset : offset + order_id_size].decode(),
+                stock_keeping_unit=payload[offset + order_id_size :].decode(),
+                quantity=quantity,
+            )
+        except UnicodeDecodeError as exception:
+            msg = f"Request {request_id} strings are not UTF-8."
+            raise FrameError(msg, request_id) from exception
+
+    def encode(self) -> bytes:
+        """Get as length prefixed frame.
+
+        Returns:
+            bytes: frame.
+
+        """
+        order_id: bytes = self.order_id.encode()
+        stock_keeping_unit: bytes = self.stock_keeping_unit.encode()
+        payload: bytes = (
+            _REQUEST_HEADER.pack(
+                self.request_id,
+                len(order_id),
+                len(stock_keeping_unit),
+                self.quantity,
+            )
+            + order_id
+            + stock_keeping_unit
+        )
+
+        return LENGTH.pack(len(payload)) + payload
+
+    def as_order_line(self) -> OrderLine:
+        """Get as order line.
+
+        Returns:
+            OrderLine: order line value object.
+
+        """
+        return OrderLine(
+            order_id=self.order_id,
+            stock_keeping_unit=self.stock_keeping_unit,
+            quantity=self.quantity,
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class AllocateResponseFrame:
+    """Allocation response frame."""
+
+    request_id: int
+    status_code: int
+    text: str
+
+    @classmethod
+    def decode(cls, payload: bytes) -> Self:
+        """Make new instance from a response payload.
+
+        Args:
+            payload (bytes): response payload, without the length prefix.
+
+        Raises:
+            FrameError: if the payload doesn't match the layout.
+
+        Returns:
+            Self: allocation response frame.
+
+        """
+        try:
+            request_id, status_code, text_size = _RESPONSE_HEADER.unpack_from(
+                payload,
+            )
+        except error as exception:
+            msg: str = f"Malformed response header: {exception}."
+            raise FrameError(msg) from exception
+
+        if len(payload) != _RESPONSE_HEADER.size + text_size:
+            msg = f"Response {request_id} payload size mismatch."
+            raise FrameError(msg, request_id)
+
+        return cls(
+            request_id=request_id,
+            status_code=status_code,
+            text=payload[_RESPONSE_HEADER.size :].decode(),
+        )
+
+    def encode(self) -> bytes:
+        """Get as length prefixed frame.
+
+        Returns:
+            bytes: frame.
+
+        """
+        text: bytes = self.text.encode()
+
+        return (
+            LENGTH.pack(_RESPONSE_HEADER.size + len(text))
+            + _RESPONSE_HEADER.pack(
+                self.request_id, self.status_code, len(text)
+            )
+            + text
+        )
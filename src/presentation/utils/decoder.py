@@ -0,0 +1,213 @@
+"""Request body decoder util.
+
+A decoder is compiled once per target type into nested closures, one per
+field, so decoding a request only runs the checks that type needs instead of
+inspecting annotations again. Supported types are ``str``, ``int``, ``date``
+(ISO 8601 strings), ``X | None``, ``tuple[X, ...]``, ``list[X]`` and
+dataclasses built from them.
+"""
+
+import json
+from collections.abc import Callable
+from dataclasses import MISSING, fields, is_dataclass
+from datetime import date
+from types import NoneType, UnionType
+from typing import (
+    Any,
+    Generic,
+    TypeVar,
+    Union,
+    get_args,
+    get_origin,
+    get_type_hints,
+)
+
+T = TypeVar("T")
+
+_FieldDecoder = Callable[[Any, str], Any]
+
+_ROOT: str = "body"
+
+
+class DecodeError(ValueError):
+    """Request body doesn't match the expected type exception."""
+
+
+class Decoder(Generic[T]):
+    """Request body decoder compiled for a target type."""
+
+    def __init__(self, target: type[T]) -> None:
+        """Compile decoder.
+
+        Args:
+            target (type[T]): type to decode into.
+
+        Raises:
+            TypeError: if the target type, or a type it is built from, is
+                not supported.
+
+        """
+        self._decode: _FieldDecoder = _compile(target)
+
+    def decode(self, data: bytes | str) -> T:
+        """Decode raw JSON request body.
+
+        Args:
+            data (bytes | str): raw request body.
+
+        Raises:
+            DecodeError: if the body is not JSON or doesn't match the target
+                type.
+
+        Returns:
+            T: decoded value.
+
+        """
+        try:
+            value: Any = json.loads(data)
+        except (json.JSONDecodeError, UnicodeDecodeError) as error:
+            msg: str = f"{_ROOT} is not valid JSON: {error}."
+            raise DecodeError(msg) from error
+
+        return self._decode(value, _ROOT)
+
+
+def _compile(target: Any) -> _FieldDecoder:  # noqa: ANN401
+    origin: Any = get_origin(target)
+
+    if origin in {UnionType, Union}:
+        return _compile_optional(target)
+
+    if origin in {tuple, list}:
+        return _compile_sequence(target, origin)
+
+    if is_dataclass(target) and isinstance(target, type):
+        return _compile_dataclass(target)
+
+    if target in {int, str}:
+        return _compile_scalar(target)
+
+    if target is date:
+        return _decode_date
+
+    msg: str = f"Can't compile decoder for {target!r}."
+    raise TypeError(msg)
+
+
+def _compile_scalar(target: type) -> _FieldDecoder:
+    def decode(value: Any, path: str) -> Any:  # noqa: ANN401
+        # Exact type check, bool is a subclass of int.
+        if type(value) is not target:
+            msg: str = (
+                f"{path} must be {_json_name(target)}, "
+                f"got {_json_name(type(value))}."
+            )
+            raise DecodeError(msg)
+
+        return value
+
+    return decode
+
+
+def _decode_date(value: Any, path: str) -> date:  # noqa: ANN401
+    if not isinstance(value, str):
+        msg: str = (
+            f"{path} must be an ISO 8601 date string, "
+            f"got {_json_name(type(value))}."
+        )
+        raise DecodeError(msg)
+
+    try:
+        return date.fromisoformat(value)
+    except ValueError as error:
+        msg = f"{path} must be an ISO 8601 date, got {value!r}."
+        raise DecodeError(msg) from error
+
+
+def _compile_optional(target: Any) -> _FieldDecoder:  # noqa: ANN401
+    arguments: tuple[Any, ...] = tuple(
+        argument for argument in get_args(target) if argument is not NoneType
+    )
+
+    if len(arguments) != 1 or len(get_args(target)) != 2:  # noqa: PLR2004
+        msg: str = f"Only X | None unions are supported, got {target!r}."
+        raise TypeError(msg)
+
+    decode_value: _FieldDecoder = _compile(arguments[0])
+
+    def decode(value: Any, path: str) -> Any:  # noqa: ANN401
+        return None if value is None else decode_value(value, path)
+
+    return decode
+
+
+def _compile_sequence(target: Any, origin: type) -> _FieldDecoder:  # noqa: ANN401
+    arguments: tuple[Any, ...] = get_args(target)
+
+    if origin is tuple and (len(arguments) != 2 or arguments[1] is not ...):  # noqa: PLR2004
+        msg: str = f"Only tuple[X, ...] tuples are supported, got {target!r}."
+        raise TypeError(msg)
+
+    decode_item: _FieldDecoder = _compile(arguments[0])
+
+    def decode(value: Any, path: str) -> Any:  # noqa: ANN401
+        if not isinstance(value, list):
+            msg: str = f"{path} must be array, got {_json_name(type(value))}."
+            raise DecodeError(msg)
+
+        return origin(
+            decode_item(item, f"{path}[{index}]")
+            for index, item in enumerate(value)
+        )
+
+    return decode
+
+
+def _compile_dataclass(target: type) -> _FieldDecoder:
+    hints: dict[str, Any] = get_type_hints(target)
+    decoders: dict[str, _FieldDecoder] = {
+        field.name: _compile(hints[field.name])
+        for field in fields(target)
+        if field.init
+    }
+    required: frozenset[str] = frozenset(
+        field.name
+        for field in fields(target)
+        if field.init
+        and field.default is MISSING
+        and field.default_factory is MISSING
+    )
+
+    def decode(value: Any, path: str) -> Any:  # noqa: ANN401
+        if not isinstance(value, dict):
+            msg: str = f"{path} must be object, got {_json_name(type(value))}."
+            raise DecodeError(msg)
+
+        if missing := sorted(required - value.keys()):
+            msg = f"{path} must have {', '.join(missing)} field(s)."
+            raise DecodeError(msg)
+
+        if unexpected := sorted(value.keys() - decoders.keys()):
+            msg = f"{path} has unexpected {', '.join(unexpected)} field(s)."
+            raise DecodeError(msg)
+
+        return target(
+            **{
+                name: decoders[name](item, f"{path}.{name}")
+                for name, item in value.items()
+            }
+        )
+
+    return decode
+
+
+def _json_name(python_type: type) -> str:
+    return {
+        bool: "boolean",
+        dict: "object",
+        float: "number",
+        int: "integer",
+        list: "array",
+        NoneType: "null",
+        str: "string",
+    }.get(python_type, python_type.__name__)
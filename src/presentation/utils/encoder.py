@@ -0,0 +1,168 @@
+"""Response body encoder util.
+
+Response bodies are encoded by codecs picked per response: constant bodies
+are encoded once, bodies with a fixed shape are filled into pre-encoded byte
+templates, and everything else goes through the fastest available JSON
+library. orjson is used when installed, the standard library otherwise;
+note that orjson encodes dates as ISO 8601 strings.
+"""
+
+import json
+from collections.abc import Callable, Mapping
+from importlib import import_module
+from importlib.util import find_spec
+from typing import TYPE_CHECKING, Any, Protocol
+
+from flask.json.provider import DefaultJSONProvider
+
+if TYPE_CHECKING:
+    from types import ModuleType
+
+
+def _dumps_standard(value: Any) -> bytes:  # noqa: ANN401
+    return json.dumps(
+        value,
+        ensure_ascii=False,
+        separators=(",", ":"),
+        default=DefaultJSONProvider.default,
+    ).encode()
+
+
+def _fastest_dumps() -> Callable[[Any], bytes]:
+    if find_spec("orjson") is None:
+        return _dumps_standard
+
+    orjson: ModuleType = import_module("orjson")
+
+    def dumps(value: Any) -> bytes:  # noqa: ANN401
+        return orjson.dumps(value, default=DefaultJSONProvider.default)
+
+    return dumps
+
+
+dumps: Callable[[Any], bytes] = _fastest_dumps()
+
+
+class ResponseCodec(Protocol):
+    """Response body codec."""
+
+    def encode(self, body: Mapping[str, Any]) -> bytes:
+        """Encode response body.
+
+        Args:
+            body (Mapping[str, Any]): response body.
+
+        Returns:
+            bytes: encoded JSON body.
+
+        """
+        ...
+
+
+class JSONCodec:
+    """Codec encoding any body with the fast JSON library."""
+
+    def encode(self, body: Mapping[str, Any]) -> bytes:
+        """Encode response body.
+
+        Args:
+            body (Mapping[str, Any]): response body.
+
+        Returns:
+            bytes: encoded JSON body.
+
+        """
+        return dumps(body)
+
+
+class StaticCodec:
+    """Codec of a constant body, encoded once."""
+
+    def __init__(self, body: Mapping[str, Any]) -> None:
+        """Create new instance.
+
+        Args:
+            body (Mapping[str, Any]): constant response body.
+
+        """
+        self.body: Mapping[str, Any] = body
+        self._encoded: bytes = dumps(body)
+
+    def encode(self, body: Mapping[str, Any]) -> bytes:  # noqa: ARG002
+        """Get pre-encoded body.
+
+        Args:
+            body (Mapping[str, Any]): response body, ignored since it must
+                be the constant one.
+
+        Returns:
+            bytes: encoded JSON body.
+
+        """
+        return self._encoded
+
+
+class TemplateCodec:
+    """Codec of an object with fixed keys, filled into a byte template."""
+
+    def __init__(self, *keys: str) -> None:
+        """Create new instance.
+
+        Args:
+            *keys (str): object keys, in encoding order.
+
+        """
+        self._keys: tuple[str, ...] = keys
+        self._prefixes: tuple[bytes, ...] = tuple(
+            (b"{" if index == 0 else b",") + dumps(key) + b":"
+            for index, key in enumerate(keys)
+        )
+
+    def encode(self, body: Mapping[str, Any]) -> bytes:
+        """Fill template with body values.
+
+        Args:
+            body (Mapping[str, Any]): response body with the template keys.
+
+        Returns:
+            bytes: encoded JSON body.
+
+        """
+        return (
+            b"".join(
+                prefix + dumps(body[key])
+                for prefix, key in zip(self._prefixes, self._keys, strict=True)
+            )
+            + b"}"
+        )
+
+
+json_codec: JSONCodec = JSONCodec()
+message_codec: TemplateCodec = TemplateCodec("message")
+
+
+class FastJSONProvider(DefaultJSONProvider):
+    """Flask JSON provider backed by the fast JSON library.
+
+    Keys are not sorted. Pretty printing, used in debug mode, falls back to
+    the standard library.
+    """
+
+    sort_keys: bool = False
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:  # noqa: ANN401
+        """Serialize data as JSON string.
+
+        Args:
+            obj (Any): data to serialize.
+            **kwargs (Any): standard library encoder options, compact
+                separators are the fast library's default.
+
+        Returns:
+            str: JSON string.
+
+        """
+        if dumps is _dumps_standard or kwargs.keys() - {"separators"}:
+            return super().dumps(obj, **kwargs)
+
+        return dumps(obj).decode()
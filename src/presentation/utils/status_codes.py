@@ -6,5 +6,12 @@ from enum import IntEnum
 class StatusCode(IntEnum):
     """Status code choices."""
 
+    ok = 200
     created = 201
+    not_modified = 304
     bad_request = 400
+    not_found = 404
+    conflict = 409
+    unprocessable_entity = 422
+    internal_server_error = 500
+    service_unavailable = 503
@@ -4,14 +4,18 @@ from typing import TYPE_CHECKING
 
 from flask import Blueprint, Response, request
 
-from src.application.services.add import AddAppService
+from src.application.services.add import AddAppService, AddBatchResult
 from src.infrastructure.uow.allocation.postgresql_allocation import (
     PostgresqlAllocationUOW,
 )
 from src.presentation.dtos.flask.add_batch import (
+    AddBatchesRequestBody,
     AddBatchRequestBody,
     AddBatchResponseBody,
+    created_codec,
 )
+from src.presentation.utils.decoder import DecodeError
+from src.presentation.utils.encoder import message_codec
 from src.presentation.utils.status_codes import StatusCode
 
 if TYPE_CHECKING:
@@ -31,9 +35,18 @@ def add_batch_endpoint() -> tuple[Response, int]:
         tuple[Response, int]: Response body and status code.
 
     """
-    body: Batch = AddBatchRequestBody.from_flask_request(
-        request=request,
-    ).as_batch()
+    try:
+        body: Batch = AddBatchRequestBody.from_flask_request(
+            request=request,
+        ).as_batch()
+    except DecodeError as error:
+        return AddBatchResponseBody(
+            body={
+                "message": str(error),
+            },
+            status_code=StatusCode.bad_request,
+            codec=message_codec,
+        ).as_flask_response()
 
     add_app_service.add_batch(
         batch=(
@@ -45,9 +58,61 @@ def add_batch_endpoint() -> tuple[Response, int]:
         unit_of_work=PostgresqlAllocationUOW(),
     )
 
+    return AddBatchResponseBody(
+        body=created_codec.body,
+        status_code=StatusCode.created,
+        codec=created_codec,
+    ).as_flask_response()
+
+
+@add_batch_blueprint.route("/add_batch/batch", methods=["POST"])
+def add_batches_endpoint() -> tuple[Response, int]:
+    """Add several batches endpoint.
+
+    Returns:
+        tuple[Response, int]: Response body and status code.
+
+    """
+    try:
+        batches: list[Batch] = AddBatchesRequestBody.from_flask_request(
+            request=request,
+        ).as_batches()
+    except DecodeError as error:
+        return AddBatchResponseBody(
+            body={
+                "message": str(error),
+            },
+            status_code=StatusCode.bad_request,
+            codec=message_codec,
+        ).as_flask_response()
+
+    results: list[AddBatchResult] = add_app_service.add_batches(
+        batches=[
+            (
+                batch.reference,
+                batch.stock_keeping_unit,
+                batch.available_quantity,
+                batch.estimated_arrival_time,
+            )
+            for batch in batches
+        ],
+        unit_of_work=PostgresqlAllocationUOW(),
+    )
+
     return AddBatchResponseBody(
         body={
-            "status": "ok",
+            "results": [
+                {
+                    "reference": result.reference,
+                    "status_code": (
+                        StatusCode.bad_request
+                        if result.error
+                        else StatusCode.created
+                    ),
+                    "message": result.error,
+                }
+                for result in results
+            ],
         },
-        status_code=StatusCode.created,
+        status_code=StatusCode.ok,
     ).as_flask_response()
@@ -1,49 +1,142 @@
 """Flask allocate view."""
 
-from typing import TYPE_CHECKING
+from functools import partial
+from hashlib import sha256
 
 from flask import Blueprint, Response, request
 
-from src.application.services.allocation import (
-    AllocationAppService,
-    InvalidSKUError,
+from src.application.services.allocation import InvalidSKUError, LineResult
+from src.application.utils.admission_control import (
+    AdmissionController,
+    AdmissionRejectedError,
+)
+from src.application.utils.idempotency_cache import (
+    IdempotencyCache,
+    IdempotencyConflictError,
+    IdempotencyKeyReusedError,
 )
 from src.domain.exceptions.out_of_stock import OutOfStockError
+from src.domain.value_objects.order_line import OrderLine
+from src.domain.value_objects.stored_response import StoredResponse
+from src.infrastructure.repositories.sql_repository.idempotency import (
+    SQLIdempotencyStore,
+)
 from src.infrastructure.uow.allocation.postgresql_allocation import (
     PostgresqlAllocationUOW,
+    default_session_factory,
 )
 from src.presentation.dtos.flask.allocate import (
+    AllocateBatchRequestBody,
     AllocateRequestBody,
     AllocateResponseBody,
+    StoredResponseBody,
+    batch_reference_codec,
 )
+from src.presentation.utils.decoder import DecodeError
+from src.presentation.utils.encoder import message_codec
 from src.presentation.utils.status_codes import StatusCode
-
-if TYPE_CHECKING:
-    from src.domain.value_objects.order_line import OrderLine
-
+from src.presentation.views.services import allocation_app_service
 
 allocate_blueprint: Blueprint = Blueprint("allocate", __name__)
 
-allocation_app_service: AllocationAppService = AllocationAppService()
+admission_controller: AdmissionController = AdmissionController()
+
+idempotency_cache: IdempotencyCache = IdempotencyCache(
+    store=SQLIdempotencyStore(session_factory=default_session_factory),
+)
 
 
 @allocate_blueprint.route("/allocate", methods=["POST"])
 def allocate_endpoint() -> tuple[Response, int]:
     """Process allocate_endpoint.
 
+    A retry of a successful allocation with the same ``Idempotency-Key``
+    header gets the original response without allocating again. The key
+    defaults to the order id and stock keeping unit. Reusing a key for
+    another request gets a 422, and a retry while the original request is
+    still in flight in another worker gets a 409.
+
+    Requests in flight are capped globally and per stock keeping unit, and
+    a request that can't get a slot in time gets a 503 with Retry-After.
+
     Returns:
         tuple[Response, int]: Response body and status code.
 
     """
-    body: OrderLine = AllocateRequestBody.from_flask_request(
-        request=request,
-    ).as_order_line()
+    try:
+        body: OrderLine = AllocateRequestBody.from_flask_request(
+            request=request,
+        ).as_order_line()
+    except DecodeError as error:
+        return AllocateResponseBody(
+            body={
+                "message": str(error),
+            },
+            status_code=StatusCode.bad_request,
+            codec=message_codec,
+        ).as_flask_response()
+
+    # Header values can't hold control characters, so default keys never
+    # collide with explicit ones.
+    key: str = (
+        request.headers.get("Idempotency-Key")
+        or f"{body.order_id}\x1f{body.stock_keeping_unit}"
+    )
+
+    try:
+        with admission_controller.admit(body.stock_keeping_unit):
+            response, replayed = idempotency_cache.get_or_run(
+                key=key,
+                run=partial(allocate_order_line, body),
+                fingerprint=_fingerprint(body),
+            )
+    except AdmissionRejectedError as error:
+        return AllocateResponseBody(
+            body={
+                "message": str(error),
+            },
+            status_code=StatusCode.service_unavailable,
+            codec=message_codec,
+            retry_after=error.retry_after,
+        ).as_flask_response()
+    except IdempotencyKeyReusedError as error:
+        return AllocateResponseBody(
+            body={
+                "message": str(error),
+            },
+            status_code=StatusCode.unprocessable_entity,
+            codec=message_codec,
+        ).as_flask_response()
+    except IdempotencyConflictError as error:
+        return AllocateResponseBody(
+            body={
+                "message": str(error),
+            },
+            status_code=StatusCode.conflict,
+            codec=message_codec,
+        ).as_flask_response()
+
+    return StoredResponseBody(
+        response=response,
+        replayed=replayed,
+    ).as_flask_response()
+
+
+def allocate_order_line(order_line: OrderLine) -> StoredResponse:
+    """Allocate order line.
+
+    Args:
+        order_line (OrderLine): order line.
+
+    Returns:
+        StoredResponse: response to store for replays.
 
+    """
     try:
         batch_reference: str = allocation_app_service.allocate(
-            order_id=body.order_id,
-            stock_keeping_unit=body.stock_keeping_unit,
-            quantity=body.quantity,
+            order_id=order_line.order_id,
+            stock_keeping_unit=order_line.stock_keeping_unit,
+            quantity=order_line.quantity,
             unit_of_work=PostgresqlAllocationUOW(),
         )
 
@@ -53,11 +146,71 @@ def allocate_endpoint() -> tuple[Response, int]:
                 "message": str(error),
             },
             status_code=StatusCode.bad_request,
-        ).as_flask_response()
+            codec=message_codec,
+        ).as_stored_response()
 
     return AllocateResponseBody(
         body={
             "batch_reference": batch_reference,
         },
         status_code=StatusCode.created,
+        codec=batch_reference_codec,
+    ).as_stored_response()
+
+
+def _fingerprint(order_line: OrderLine) -> str:
+    return sha256(
+        f"{order_line.order_id}\x1f{order_line.stock_keeping_unit}"
+        f"\x1f{order_line.quantity}".encode(),
+    ).hexdigest()
+
+
+@allocate_blueprint.route("/allocate/batch", methods=["POST"])
+def allocate_batch_endpoint() -> tuple[Response, int]:
+    """Process allocate_batch_endpoint.
+
+    Returns:
+        tuple[Response, int]: Response body and status code.
+
+    """
+    try:
+        order_lines: list[OrderLine] = (
+            AllocateBatchRequestBody.from_flask_request(
+                request=request,
+            ).as_order_lines()
+        )
+    except DecodeError as error:
+        return AllocateResponseBody(
+            body={
+                "message": str(error),
+            },
+            status_code=StatusCode.bad_request,
+            codec=message_codec,
+        ).as_flask_response()
+
+    results: list[LineResult] = allocation_app_service.allocate_lines(
+        order_lines=order_lines,
+        unit_of_work=PostgresqlAllocationUOW(),
+    )
+
+    return AllocateResponseBody(
+        body={
+            "results": [
+                {
+                    "order_id": result.order_line.order_id,
+                    "stock_keeping_unit": (
+                        result.order_line.stock_keeping_unit
+                    ),
+                    "status_code": (
+                        StatusCode.created
+                        if result.batch_reference
+                        else StatusCode.bad_request
+                    ),
+                    "batch_reference": result.batch_reference,
+                    "message": result.error,
+                }
+                for result in results
+            ],
+        },
+        status_code=StatusCode.ok,
     ).as_flask_response()
@@ -0,0 +1,98 @@
+"""Flask availability view."""
+
+from flask import Blueprint, Response, request
+
+from src.application.services.allocation import InvalidSKUError
+from src.application.services.availability import (
+    AvailabilityAppService,
+    ProductAvailability,
+)
+from src.infrastructure.uow.allocation.postgresql_allocation import (
+    PostgresqlAllocationUOW,
+)
+from src.presentation.dtos.flask.availability import AvailabilityResponseBody
+from src.presentation.utils.encoder import message_codec
+from src.presentation.utils.status_codes import StatusCode
+
+availability_blueprint: Blueprint = Blueprint("availability", __name__)
+
+availability_app_service: AvailabilityAppService = AvailabilityAppService()
+
+
+def version_etag(version_number: int) -> str:
+    """Make strong entity tag of a product version.
+
+    Args:
+        version_number (int): product version number.
+
+    Returns:
+        str: unquoted entity tag.
+
+    """
+    return f"v{version_number}"
+
+
+@availability_blueprint.route(
+    "/products/<stock_keeping_unit>/availability",
+    methods=["GET"],
+)
+def availability_endpoint(stock_keeping_unit: str) -> tuple[Response, int]:
+    """Process availability_endpoint.
+
+    A request with ``If-None-Match`` is first answered from the product
+    version number alone, batches are only loaded if it has changed.
+
+    Args:
+        stock_keeping_unit (str): stock keeping unit.
+
+    Returns:
+        tuple[Response, int]: Response body and status code.
+
+    """
+    if request.if_none_match:
+        version_number: int | None = availability_app_service.version(
+            stock_keeping_unit=stock_keeping_unit,
+            unit_of_work=PostgresqlAllocationUOW(),
+        )
+
+        if version_number is not None and request.if_none_match.contains(
+            version_etag(version_number),
+        ):
+            return AvailabilityResponseBody(
+                body=None,
+                status_code=StatusCode.not_modified,
+                etag=version_etag(version_number),
+            ).as_flask_response()
+
+    try:
+        availability: ProductAvailability = (
+            availability_app_service.availability(
+                stock_keeping_unit=stock_keeping_unit,
+                unit_of_work=PostgresqlAllocationUOW(),
+            )
+        )
+    except InvalidSKUError as error:
+        return AvailabilityResponseBody(
+            body={
+                "message": str(error),
+            },
+            status_code=StatusCode.not_found,
+            codec=message_codec,
+        ).as_flask_response()
+
+    return AvailabilityResponseBody(
+        body={
+            "stock_keeping_unit": availability.stock_keeping_unit,
+            "available_quantity": availability.available_quantity,
+            "batches": [
+                {
+                    "reference": batch.reference,
+                    "available_quantity": batch.available_quantity,
+                    "estimated_arrival_time": batch.estimated_arrival_time,
+                }
+                for batch in availability.batches
+            ],
+        },
+        status_code=StatusCode.ok,
+        etag=version_etag(availability.version_number),
+    ).as_flask_response()
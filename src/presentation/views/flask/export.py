@@ -0,0 +1,71 @@
+"""Flask export view."""
+
+from itertools import chain, islice
+from typing import TYPE_CHECKING
+
+from flask import Blueprint, Response
+
+from src.application.services.allocation import InvalidSKUError
+from src.application.services.export import ExportAppService
+from src.infrastructure.uow.allocation.postgresql_allocation import (
+    PostgresqlAllocationUOW,
+)
+from src.presentation.dtos.flask.export import (
+    AllocationsExportBody,
+    ExportResponseBody,
+)
+from src.presentation.utils.encoder import message_codec
+from src.presentation.utils.status_codes import StatusCode
+
+if TYPE_CHECKING:
+    from collections.abc import Generator
+
+    from src.domain.value_objects.allocation import Allocation
+
+export_blueprint: Blueprint = Blueprint("export", __name__)
+
+export_app_service: ExportAppService = ExportAppService()
+
+
+@export_blueprint.route(
+    "/products/<stock_keeping_unit>/allocations",
+    methods=["GET"],
+)
+def allocations_export_endpoint(
+    stock_keeping_unit: str,
+) -> tuple[Response, int]:
+    """Process allocations_export_endpoint.
+
+    Allocations are streamed as newline delimited JSON straight from the
+    database cursor. The first one is fetched before the response starts,
+    so an unknown product still gets a 404.
+
+    Args:
+        stock_keeping_unit (str): stock keeping unit.
+
+    Returns:
+        tuple[Response, int]: Response body and status code.
+
+    """
+    allocations: Generator[Allocation, None, None] = (
+        export_app_service.allocations(
+            stock_keeping_unit=stock_keeping_unit,
+            unit_of_work=PostgresqlAllocationUOW(),
+        )
+    )
+
+    try:
+        head: list[Allocation] = list(islice(allocations, 1))
+    except InvalidSKUError as error:
+        return ExportResponseBody(
+            body={
+                "message": str(error),
+            },
+            status_code=StatusCode.not_found,
+            codec=message_codec,
+        ).as_flask_response()
+
+    return AllocationsExportBody(
+        allocations=chain(head, allocations),
+        on_close=allocations.close,
+    ).as_flask_response()
@@ -0,0 +1 @@
+"""RPC views."""
@@ -0,0 +1,74 @@
+"""RPC allocate view."""
+
+import logging
+from collections.abc import Callable
+
+from src.application.services.allocation import InvalidSKUError
+from src.domain.exceptions.out_of_stock import OutOfStockError
+from src.domain.interfaces.uow.allocation import AllocationUOW
+from src.presentation.dtos.rpc.allocate import (
+    AllocateRequestFrame,
+    AllocateResponseFrame,
+    FrameError,
+)
+from src.presentation.utils.status_codes import StatusCode
+from src.presentation.views.services import allocation_app_service
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+
+def allocate_frame(
+    payload: bytes,
+    unit_of_work_factory: Callable[[], AllocationUOW],
+) -> AllocateResponseFrame:
+    """Process allocation request frame.
+
+    An unexpected error is logged and answered with a 500 frame, so the
+    connection keeps serving the frames pipelined behind it.
+
+    Args:
+        payload (bytes): request payload.
+        unit_of_work_factory (Callable[[], AllocationUOW]): unit of work
+            factory.
+
+    Returns:
+        AllocateResponseFrame: response frame, with the batch reference or
+            the error message.
+
+    """
+    try:
+        request: AllocateRequestFrame = AllocateRequestFrame.decode(payload)
+    except FrameError as error:
+        return AllocateResponseFrame(
+            request_id=error.request_id,
+            status_code=StatusCode.bad_request,
+            text=str(error),
+        )
+
+    try:
+        batch_reference: str = allocation_app_service.allocate(
+            order_id=request.order_id,
+            stock_keeping_unit=request.stock_keeping_unit,
+            quantity=request.quantity,
+            unit_of_work=unit_of_work_factory(),
+        )
+    except (OutOfStockError, InvalidSKUError) as error:
+        return AllocateResponseFrame(
+            request_id=request.request_id,
+            status_code=StatusCode.bad_request,
+            text=str(error),
+        )
+    except Exception:
+        logger.exception("Allocation request %d failed", request.request_id)
+
+        return AllocateResponseFrame(
+            request_id=request.request_id,
+            status_code=StatusCode.internal_server_error,
+            text="Internal server error.",
+        )
+
+    return AllocateResponseFrame(
+        request_id=request.request_id,
+        status_code=StatusCode.created,
+        text=batch_reference,
+    )
@@ -0,0 +1,9 @@
+"""Application services shared by views.
+
+Views of every transport use the same instances, so their locks serialize
+allocations of a product whichever transport the request came in on.
+"""
+
+from src.application.services.allocation import AllocationAppService
+
+allocation_app_service: AllocationAppService = AllocationAppService()
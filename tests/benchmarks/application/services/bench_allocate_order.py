@@ -0,0 +1,271 @@
+"""Whole order allocation benchmark.
+
+Runs overlapping multi-SKU orders from a thread pool, either as one
+all-or-nothing transaction per order or as one transaction per line, and
+reports order throughput. Every mode gets its own freshly stocked products.
+A run that finishes shows no deadlocks.
+
+Run with
+``python -m tests.benchmarks.application.services.bench_allocate_order``
+and pass ``--database-uri`` to benchmark against a database instead of the
+in-memory unit of work.
+"""
+
+from argparse import ArgumentParser, Namespace
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from random import Random
+from time import perf_counter
+
+from sqlalchemy import Engine, create_engine
+from sqlalchemy.orm import sessionmaker
+
+from src.application.services.allocation import AllocationAppService
+from src.domain.aggregates.product import Product
+from src.domain.entities.batch import Batch
+from src.domain.interfaces.uow.allocation import AllocationUOW
+from src.domain.value_objects.order_line import OrderLine
+from src.infrastructure.repositories.sql_repository.in_memory import (
+    InMemoryStorage,
+)
+from src.infrastructure.repositories.sql_repository.postgresql import (
+    create_mappers,
+    metadata,
+)
+from src.infrastructure.uow.allocation.in_memory_allocation import (
+    InMemoryAllocationUOW,
+)
+from src.infrastructure.uow.allocation.postgresql_allocation import (
+    PostgresqlAllocationUOW,
+)
+from tests.utils.benchmark import report
+from tests.utils.generate_random import (
+    random_batch_reference,
+    random_order_id,
+    random_stock_keeping_unit,
+)
+
+
+def parse_arguments() -> Namespace:
+    """Parse command line arguments.
+
+    Returns:
+        Namespace: parsed arguments.
+
+    """
+    parser: ArgumentParser = ArgumentParser(description=__doc__)
+    parser.add_argument("--database-uri", default=None)
+    parser.add_argument("--threads", type=int, default=16)
+    parser.add_argument("--orders", type=int, default=2000)
+    parser.add_argument("--products", type=int, default=16)
+    parser.add_argument("--lines", type=int, default=4)
+
+    return parser.parse_args()
+
+
+def make_products(arguments: Namespace) -> list[Product]:
+    """Make products with enough stock for every order.
+
+    Args:
+        arguments (Namespace): parsed arguments.
+
+    Returns:
+        list[Product]: products.
+
+    """
+    products: list[Product] = []
+
+    for index in range(arguments.products):
+        stock_keeping_unit: str = random_stock_keeping_unit(str(index))
+        products.append(
+            Product(
+                stock_keeping_unit=stock_keeping_unit,
+                batches=[
+                    Batch(
+                        reference=random_batch_reference(),
+                        stock_keeping_unit=stock_keeping_unit,
+                        quantity=arguments.orders * arguments.lines,
+                        estimated_arrival_time=None,
+                    ),
+                ],
+            )
+        )
+
+    return products
+
+
+def make_orders(
+    stock_keeping_units: list[str],
+    arguments: Namespace,
+) -> list[list[OrderLine]]:
+    """Make orders touching random overlapping products.
+
+    Args:
+        stock_keeping_units (list[str]): stock keeping units.
+        arguments (Namespace): parsed arguments.
+
+    Returns:
+        list[list[OrderLine]]: orders.
+
+    """
+    random: Random = Random(0)  # noqa: S311
+    orders: list[list[OrderLine]] = []
+
+    for _ in range(arguments.orders):
+        order_id: str = random_order_id()
+        orders.append(
+            [
+                OrderLine(order_id, stock_keeping_unit, 1)
+                for stock_keeping_unit in random.sample(
+                    stock_keeping_units,
+                    k=min(arguments.lines, len(stock_keeping_units)),
+                )
+            ]
+        )
+
+    return orders
+
+
+def run(
+    name: str,
+    allocate: Callable[[list[OrderLine]], None],
+    orders: list[list[OrderLine]],
+    arguments: Namespace,
+) -> None:
+    """Run orders from a thread pool and report results.
+
+    Args:
+        name (str): benchmark name.
+        allocate (Callable[[list[OrderLine]], None]): order allocation
+            function.
+        orders (list[list[OrderLine]]): orders.
+        arguments (Namespace): parsed arguments.
+
+    """
+
+    def timed(order: list[OrderLine]) -> float:
+        started: float = perf_counter()
+        allocate(order)
+
+        return perf_counter() - started
+
+    started: float = perf_counter()
+
+    with ThreadPoolExecutor(max_workers=arguments.threads) as pool:
+        latencies: list[float] = list(pool.map(timed, orders))
+
+    report(name, latencies, perf_counter() - started)
+
+
+def allocate_lines(
+    allocation_app_service: AllocationAppService,
+    order: list[OrderLine],
+    unit_of_work_factory: Callable[[], AllocationUOW],
+) -> None:
+    """Allocate an order one line per transaction.
+
+    Args:
+        allocation_app_service (AllocationAppService): service.
+        order (list[OrderLine]): order lines.
+        unit_of_work_factory (Callable[[], AllocationUOW]): unit of work
+            factory.
+
+    """
+    for order_line in order:
+        allocation_app_service.allocate(
+            order_id=order_line.order_id,
+            stock_keeping_unit=order_line.stock_keeping_unit,
+            quantity=order_line.quantity,
+            unit_of_work=unit_of_work_factory(),
+        )
+
+
+def allocate_order(
+    allocation_app_service: AllocationAppService,
+    order: list[OrderLine],
+    unit_of_work_factory: Callable[[], AllocationUOW],
+) -> None:
+    """Allocate an order in one all-or-nothing transaction.
+
+    Args:
+        allocation_app_service (AllocationAppService): service.
+        order (list[OrderLine]): order lines.
+        unit_of_work_factory (Callable[[], AllocationUOW]): unit of work
+            factory.
+
+    """
+    allocation_app_service.allocate_order(
+        order_lines=order,
+        unit_of_work=unit_of_work_factory(),
+    )
+
+
+def make_unit_of_work_factory(
+    arguments: Namespace,
+) -> Callable[[], AllocationUOW]:
+    """Make unit of work factory for the benchmarked storage.
+
+    Args:
+        arguments (Namespace): parsed arguments.
+
+    Returns:
+        Callable[[], AllocationUOW]: unit of work factory.
+
+    """
+    if not arguments.database_uri:
+        storage: InMemoryStorage = InMemoryStorage()
+
+        return lambda: InMemoryAllocationUOW(storage)
+
+    engine: Engine = create_engine(
+        arguments.database_uri,
+        pool_size=arguments.threads,
+    )
+    metadata.create_all(engine)
+    create_mappers()
+
+    session_factory: sessionmaker = sessionmaker(bind=engine)
+
+    return lambda: PostgresqlAllocationUOW(session_factory=session_factory)
+
+
+def main() -> None:
+    """Run benchmark."""
+    arguments: Namespace = parse_arguments()
+    unit_of_work_factory: Callable[[], AllocationUOW] = (
+        make_unit_of_work_factory(arguments)
+    )
+    allocation_app_service: AllocationAppService = AllocationAppService()
+    modes: dict[str, Callable[..., None]] = {
+        "per-line": allocate_lines,
+        "whole-order": allocate_order,
+    }
+
+    for name, allocate in modes.items():
+        products: list[Product] = make_products(arguments)
+        orders: list[list[OrderLine]] = make_orders(
+            [product.stock_keeping_unit for product in products],
+            arguments,
+        )
+
+        with unit_of_work_factory() as unit_of_work:
+            for product in products:
+                unit_of_work.products.add(product)
+
+            unit_of_work.commit()
+
+        run(
+            name=name,
+            allocate=partial(
+                allocate,
+                allocation_app_service,
+                unit_of_work_factory=unit_of_work_factory,
+            ),
+            orders=orders,
+            arguments=arguments,
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+"""Product availability benchmark.
+
+Polls availability of a product with many allocated order lines, either by
+loading the whole aggregate every time or by checking the version number
+first, as a conditional GET with a matching ``If-None-Match`` does, and
+reports per-poll latency.
+
+Run with
+``python -m tests.benchmarks.application.services.bench_availability``
+and pass ``--database-uri`` to benchmark against a database instead of
+in-memory SQLite.
+"""
+
+from argparse import ArgumentParser, Namespace
+from collections.abc import Callable
+from time import perf_counter
+
+from sqlalchemy import Engine, create_engine
+from sqlalchemy.orm import sessionmaker
+
+from src.application.services.add import AddAppService
+from src.application.services.allocation import AllocationAppService
+from src.application.services.availability import AvailabilityAppService
+from src.domain.value_objects.order_line import OrderLine
+from src.infrastructure.repositories.sql_repository.postgresql import (
+    create_mappers,
+    metadata,
+)
+from src.infrastructure.uow.allocation.postgresql_allocation import (
+    PostgresqlAllocationUOW,
+)
+from tests.utils.benchmark import report
+from tests.utils.generate_random import (
+    random_batch_reference,
+    random_order_id,
+    random_stock_keeping_unit,
+)
+
+
+def parse_arguments() -> Namespace:
+    """Parse command line arguments.
+
+    Returns:
+        Namespace: parsed arguments.
+
+    """
+    parser: ArgumentParser = ArgumentParser(description=__doc__)
+    parser.add_argument("--database-uri", default="sqlite://")
+    parser.add_argument("--polls", type=int, default=2000)
+    parser.add_argument("--batches", type=int, default=10)
+    parser.add_argument("--lines", type=int, default=500)
+
+    return parser.parse_args()
+
+
+def run(name: str, poll: Callable[[], object], arguments: Namespace) -> None:
+    """Poll availability and report results.
+
+    Args:
+        name (str): benchmark name.
+        poll (Callable[[], object]): availability poll.
+        arguments (Namespace): parsed arguments.
+
+    """
+    latencies: list[float] = []
+    started: float = perf_counter()
+
+    for _ in range(arguments.polls):
+        poll_started: float = perf_counter()
+        poll()
+        latencies.append(perf_counter() - poll_started)
+
+    report(name, latencies, perf_counter() - started)
+
+
+def main() -> None:
+    """Run benchmark."""
+    arguments: Namespace = parse_arguments()
+    engine: Engine = create_engine(arguments.database_uri)
+    metadata.create_all(engine)
+    create_mappers()
+
+    session_factory: sessionmaker = sessionmaker(bind=engine)
+    stock_keeping_unit: str = random_stock_keeping_unit()
+
+    AddAppService().add_batches(
+        batches=[
+            (
+                random_batch_reference(),
+                stock_keeping_unit,
+                arguments.lines,
+                None,
+            )
+            for _ in range(arguments.batches)
+        ],
+        unit_of_work=PostgresqlAllocationUOW(session_factory),
+    )
+    AllocationAppService().allocate_lines(
+        order_lines=[
+            OrderLine(random_order_id(), stock_keeping_unit, 1)
+            for _ in range(arguments.lines)
+        ],
+        unit_of_work=PostgresqlAllocationUOW(session_factory),
+    )
+
+    availability_app_service: AvailabilityAppService = AvailabilityAppService()
+
+    run(
+        name="full load",
+        poll=lambda: availability_app_service.availability(
+            stock_keeping_unit=stock_keeping_unit,
+            unit_of_work=PostgresqlAllocationUOW(session_factory),
+        ),
+        arguments=arguments,
+    )
+    run(
+        name="version probe",
+        poll=lambda: availability_app_service.version(
+            stock_keeping_unit=stock_keeping_unit,
+            unit_of_work=PostgresqlAllocationUOW(session_factory),
+        ),
+        arguments=arguments,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,186 @@
+"""Allocations export benchmark.
+
+Reads every allocation of a product with many allocated order lines, either
+by loading the product aggregate or by streaming them through the export
+service, and reports time to the first allocation, total time and peak
+traced memory.
+
+Run with ``python -m tests.benchmarks.application.services.bench_export``
+and pass ``--database-uri`` to benchmark against a database instead of a
+temporary SQLite file.
+"""
+
+import sys
+import tracemalloc
+from argparse import ArgumentParser, Namespace
+from collections.abc import Callable, Iterator
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from time import perf_counter
+from typing import TYPE_CHECKING
+
+from sqlalchemy import Engine, create_engine, insert
+from sqlalchemy.orm import sessionmaker
+
+from src.application.services.export import ExportAppService
+from src.infrastructure.repositories.sql_repository.postgresql import (
+    allocations,
+    batches,
+    create_mappers,
+    metadata,
+    order_lines,
+    products,
+)
+from src.infrastructure.uow.allocation.postgresql_allocation import (
+    PostgresqlAllocationUOW,
+)
+from tests.utils.generate_random import random_stock_keeping_unit
+
+if TYPE_CHECKING:
+    from src.domain.aggregates.product import Product
+
+
+def parse_arguments() -> Namespace:
+    """Parse command line arguments.
+
+    Returns:
+        Namespace: parsed arguments.
+
+    """
+    parser: ArgumentParser = ArgumentParser(description=__doc__)
+    parser.add_argument("--database-uri", default=None)
+    parser.add_argument("--allocations", type=int, default=200000)
+
+    return parser.parse_args()
+
+
+def fill(
+    engine: Engine, stock_keeping_unit: str, arguments: Namespace
+) -> None:
+    """Insert a product with one batch and its allocated order lines.
+
+    Args:
+        engine (Engine): engine.
+        stock_keeping_unit (str): stock keeping unit.
+        arguments (Namespace): parsed arguments.
+
+    """
+    with engine.begin() as connection:
+        connection.execute(
+            insert(products).values(stock_keeping_unit=stock_keeping_unit),
+        )
+        batch_id: int = connection.execute(
+            insert(batches)
+            .values(
+                reference="batch-001",
+                stock_keeping_unit=stock_keeping_unit,
+                _purchased_quantity=arguments.allocations,
+            )
+            .returning(batches.c.id),
+        ).scalar_one()
+        connection.execute(
+            insert(order_lines),
+            [
+                {
+                    "id": index + 1,
+                    "order_id": f"order-{index}",
+                    "stock_keeping_unit": stock_keeping_unit,
+                    "quantity": 1,
+                }
+                for index in range(arguments.allocations)
+            ],
+        )
+        connection.execute(
+            insert(allocations),
+            [
+                {"order_line_id": index + 1, "batch_id": batch_id}
+                for index in range(arguments.allocations)
+            ],
+        )
+
+
+def run(name: str, read: Callable[[], Iterator[object]]) -> None:
+    """Read every allocation and report results.
+
+    Args:
+        name (str): benchmark name.
+        read (Callable[[], Iterator[object]]): allocations reader.
+
+    """
+    tracemalloc.start()
+    started: float = perf_counter()
+    first: float = 0
+    count: int = 0
+
+    for _ in read():
+        if not count:
+            first = perf_counter() - started
+
+        count += 1
+
+    elapsed: float = perf_counter() - started
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    sys.stdout.write(
+        f"{name:<32} rows={count:<8} first={first * 1000:.3f}ms "
+        f"total={elapsed * 1000:.3f}ms peak={peak / 2**20:.1f}MiB\n",
+    )
+
+
+def load_aggregate(
+    session_factory: sessionmaker,
+    stock_keeping_unit: str,
+) -> Iterator[object]:
+    """Read allocations by loading the product aggregate.
+
+    Args:
+        session_factory (sessionmaker): session factory.
+        stock_keeping_unit (str): stock keeping unit.
+
+    Yields:
+        Iterator[object]: allocated order lines.
+
+    """
+    with PostgresqlAllocationUOW(session_factory) as unit_of_work:
+        product: Product | None = unit_of_work.products.get(
+            stock_keeping_unit,
+        )
+
+        assert product is not None
+
+        for batch in product.batches:
+            yield from batch.allocations
+
+
+def main() -> None:
+    """Run benchmark."""
+    arguments: Namespace = parse_arguments()
+
+    with TemporaryDirectory() as directory:
+        engine: Engine = create_engine(
+            arguments.database_uri
+            or f"sqlite:///{Path(directory) / 'export.db'}",
+        )
+        metadata.create_all(engine)
+        create_mappers()
+
+        session_factory: sessionmaker = sessionmaker(bind=engine)
+        stock_keeping_unit: str = random_stock_keeping_unit()
+        fill(engine, stock_keeping_unit, arguments)
+
+        run(
+            "aggregate load",
+            lambda: load_aggregate(session_factory, stock_keeping_unit),
+        )
+        run(
+            "stream",
+            lambda: ExportAppService().allocations(
+                stock_keeping_unit=stock_keeping_unit,
+                unit_of_work=PostgresqlAllocationUOW(session_factory),
+            ),
+        )
+
+
+if __name__ == "__main__":
+    main()
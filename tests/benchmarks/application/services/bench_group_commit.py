@@ -0,0 +1,177 @@
+"""Group commit allocation benchmark.
+
+Compares per-request transactions with group commit on the same database.
+
+Run with ``python -m tests.benchmarks.application.services.bench_group_commit``
+and pass ``--database-uri`` to benchmark against PostgreSQL instead of a
+temporary SQLite file.
+"""
+
+from argparse import ArgumentParser, Namespace
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from time import perf_counter
+
+from sqlalchemy import Engine, create_engine
+from sqlalchemy.orm import sessionmaker
+
+from src.application.services.add import AddAppService
+from src.application.services.allocation import AllocationAppService
+from src.application.services.group_commit import (
+    GroupCommitAllocationExecutor,
+)
+from src.infrastructure.repositories.sql_repository.postgresql import (
+    create_mappers,
+    metadata,
+)
+from src.infrastructure.uow.allocation.postgresql_allocation import (
+    PostgresqlAllocationUOW,
+)
+from tests.utils.benchmark import report
+from tests.utils.generate_random import (
+    random_batch_reference,
+    random_order_id,
+    random_stock_keeping_unit,
+)
+
+
+def parse_arguments() -> Namespace:
+    """Parse command line arguments.
+
+    Returns:
+        Namespace: parsed arguments.
+
+    """
+    parser: ArgumentParser = ArgumentParser(description=__doc__)
+    parser.add_argument("--database-uri", default=None)
+    parser.add_argument("--threads", type=int, default=16)
+    parser.add_argument("--allocations", type=int, default=2000)
+    parser.add_argument("--products", type=int, default=8)
+    parser.add_argument("--window", type=float, default=0.002)
+    parser.add_argument("--max-batch-size", type=int, default=64)
+
+    return parser.parse_args()
+
+
+def run(
+    name: str,
+    allocate: Callable[[str, str], str],
+    stock_keeping_units: list[str],
+    arguments: Namespace,
+) -> None:
+    """Run allocations from a thread pool and report results.
+
+    Args:
+        name (str): benchmark name.
+        allocate (Callable[[str, str], str]): allocation function taking
+            order id and stock keeping unit.
+        stock_keeping_units (list[str]): stock keeping units to allocate.
+        arguments (Namespace): parsed arguments.
+
+    """
+
+    def timed(index: int) -> float:
+        started: float = perf_counter()
+        allocate(
+            random_order_id(),
+            stock_keeping_units[index % len(stock_keeping_units)],
+        )
+
+        return perf_counter() - started
+
+    started: float = perf_counter()
+
+    with ThreadPoolExecutor(max_workers=arguments.threads) as pool:
+        latencies: list[float] = list(
+            pool.map(timed, range(arguments.allocations))
+        )
+
+    report(name, latencies, perf_counter() - started)
+
+
+def benchmark(database_uri: str, arguments: Namespace) -> None:
+    """Benchmark both modes against a database.
+
+    Args:
+        database_uri (str): SQLAlchemy database URI.
+        arguments (Namespace): parsed arguments.
+
+    """
+    engine: Engine = create_engine(
+        database_uri,
+        pool_size=arguments.threads,
+    )
+    metadata.create_all(engine)
+    create_mappers()
+
+    session_factory: sessionmaker = sessionmaker(bind=engine)
+
+    def unit_of_work_factory() -> PostgresqlAllocationUOW:
+        return PostgresqlAllocationUOW(session_factory=session_factory)
+
+    stock_keeping_units: list[str] = [
+        random_stock_keeping_unit(str(index))
+        for index in range(arguments.products)
+    ]
+
+    for stock_keeping_unit in stock_keeping_units:
+        AddAppService().add_batch(
+            batch=(
+                random_batch_reference(),
+                stock_keeping_unit,
+                arguments.allocations * 2,
+                None,
+            ),
+            unit_of_work=unit_of_work_factory(),
+        )
+
+    allocation_app_service: AllocationAppService = AllocationAppService()
+
+    run(
+        name="per-request",
+        allocate=lambda order_id, stock_keeping_unit: (
+            allocation_app_service.allocate(
+                order_id=order_id,
+                stock_keeping_unit=stock_keeping_unit,
+                quantity=1,
+                unit_of_work=unit_of_work_factory(),
+            )
+        ),
+        stock_keeping_units=stock_keeping_units,
+        arguments=arguments,
+    )
+
+    with GroupCommitAllocationExecutor(
+        unit_of_work_factory=unit_of_work_factory,
+        window=arguments.window,
+        max_batch_size=arguments.max_batch_size,
+    ) as executor:
+        run(
+            name="group-commit",
+            allocate=lambda order_id, stock_keeping_unit: executor.allocate(
+                order_id=order_id,
+                stock_keeping_unit=stock_keeping_unit,
+                quantity=1,
+            ),
+            stock_keeping_units=stock_keeping_units,
+            arguments=arguments,
+        )
+
+
+def main() -> None:
+    """Run benchmark."""
+    arguments: Namespace = parse_arguments()
+
+    if arguments.database_uri:
+        benchmark(arguments.database_uri, arguments)
+        return
+
+    with TemporaryDirectory() as directory:
+        database_path: Path = Path(directory) / "benchmark.sqlite"
+        benchmark(f"sqlite:///{database_path}", arguments)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+"""Streaming sync benchmark.
+
+Plans the sync of two large synthetic folders, where a share of the files
+is new, renamed or stale, with the sync domain service, which holds both
+folders' hashes in dicts, and with the streaming sync service, which sorts
+them with a bounded buffer. Reports commands, time and peak memory traced
+by tracemalloc, which slows both down alike.
+
+Run with
+``python -m tests.benchmarks.application.services.bench_streaming_sync``
+and pass ``--files`` and ``--buffer-size`` to change the scale.
+"""
+
+import sys
+import tracemalloc
+from argparse import ArgumentParser, Namespace
+from collections.abc import Callable, Iterable, Iterator
+from tempfile import TemporaryDirectory
+from time import perf_counter
+
+from src.application.services.streaming_sync import StreamingSyncAppService
+from src.domain.services.sync import SyncService
+
+
+def parse_arguments() -> Namespace:
+    """Parse command line arguments.
+
+    Returns:
+        Namespace: parsed arguments.
+
+    """
+    parser: ArgumentParser = ArgumentParser(description=__doc__)
+    parser.add_argument("--files", type=int, default=1_000_000)
+    parser.add_argument("--buffer-size", type=int, default=50_000)
+
+    return parser.parse_args()
+
+
+def records(files: int, *, source: bool) -> Iterator[tuple[str, str]]:
+    """Make hash and file name records of a folder.
+
+    One file in ten is renamed in the source, one in ten is only in the
+    source and one in ten only in the destination.
+
+    Args:
+        files (int): number of files.
+        source (bool): whether to make the source folder.
+
+    Yields:
+        Iterator[tuple[str, str]]: records, in file name order.
+
+    """
+    for index in range(files):
+        hash_value: str = f"{index * 0x9E3779B97F4A7C15 % 2**64:016x}"
+
+        if index % 10 == 0:
+            yield (
+                hash_value,
+                f"folder/file-{index}" + ("-renamed" if source else ""),
+            )
+
+        elif index % 10 == 1:
+            if source:
+                yield hash_value, f"folder/file-{index}"
+
+        elif index % 10 == 2:  # noqa: PLR2004
+            if not source:
+                yield hash_value, f"folder/file-{index}"
+
+        else:
+            yield hash_value, f"folder/file-{index}"
+
+
+def run(name: str, plan: Callable[[], Iterable[object]]) -> None:
+    """Time a plan and report commands and peak memory.
+
+    Args:
+        name (str): benchmark name.
+        plan (Callable[[], Iterable[object]]): planner.
+
+    """
+    tracemalloc.start()
+    started: float = perf_counter()
+    commands: int = sum(1 for _ in plan())
+    elapsed: float = perf_counter() - started
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    sys.stdout.write(
+        f"{name:<32} commands={commands:<10} "
+        f"elapsed={elapsed:.3f}s peak={peak / 2**20:.1f}MiB\n",
+    )
+
+
+def main() -> None:
+    """Run benchmark."""
+    arguments: Namespace = parse_arguments()
+
+    run(
+        "dicts",
+        lambda: SyncService()
+        .plan(
+            source_hashes=dict(records(arguments.files, source=True)),
+            destination_hashes=dict(records(arguments.files, source=False)),
+            source="/source",
+            destination="/destination",
+        )
+        .commands,
+    )
+
+    with TemporaryDirectory() as directory:
+        run(
+            f"streaming, buffer {arguments.buffer_size}",
+            lambda: StreamingSyncAppService(
+                buffer_size=arguments.buffer_size,
+                directory=directory,
+            ).plan(
+                source_records=records(arguments.files, source=True),
+                destination_records=records(arguments.files, source=False),
+                source="/source",
+                destination="/destination",
+            ),
+        )
+
+
+if __name__ == "__main__":
+    main()
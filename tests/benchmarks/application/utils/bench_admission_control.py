@@ -0,0 +1,133 @@
+"""Admission control load test.
+
+Sends requests at a fixed rate to a pool of worker threads, as the server
+does, while most of them target one hot stock keeping unit whose
+allocations are serialized, as row locks serialize them in the database.
+The hot unit alone gets more requests than it can serve. Reports latency
+of the cold units, measured from each request's scheduled arrival, with no
+hot traffic, with hot traffic and no limiter, and with hot traffic behind
+the admission controller, which keeps cold p99 flat by rejecting the hot
+overflow.
+
+Run with
+``python -m tests.benchmarks.application.utils.bench_admission_control``.
+"""
+
+import sys
+from argparse import ArgumentParser, Namespace
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import AbstractContextManager, nullcontext
+from random import Random
+from time import perf_counter, sleep
+
+from src.application.utils.admission_control import (
+    AdmissionController,
+    AdmissionRejectedError,
+    AdmissionStatistics,
+)
+from src.application.utils.striped_lock import StripedLock
+from tests.utils.benchmark import report
+
+HOT: str = "HOT-SKU"
+
+
+def parse_arguments() -> Namespace:
+    """Parse command line arguments.
+
+    Returns:
+        Namespace: parsed arguments.
+
+    """
+    parser: ArgumentParser = ArgumentParser(description=__doc__)
+    parser.add_argument("--threads", type=int, default=16)
+    parser.add_argument("--rate", type=float, default=400)
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--hot-share", type=float, default=0.8)
+    parser.add_argument("--service-time", type=float, default=0.004)
+
+    return parser.parse_args()
+
+
+def run(
+    name: str,
+    hot_share: float,
+    admission_controller: AdmissionController | None,
+    arguments: Namespace,
+) -> None:
+    """Send requests at a fixed rate and report cold latencies.
+
+    Args:
+        name (str): benchmark name.
+        hot_share (float): share of requests for the hot unit.
+        admission_controller (AdmissionController | None): admission
+            controller, None to admit everything.
+        arguments (Namespace): parsed arguments.
+
+    """
+    random: Random = Random(0)  # noqa: S311
+    locks: StripedLock = StripedLock()
+    cold_latencies: list[float] = []
+    rejected: list[str] = []
+
+    def handle(stock_keeping_unit: str, arrival: float) -> None:
+        admission: AbstractContextManager[None] = (
+            nullcontext()
+            if admission_controller is None
+            else admission_controller.admit(stock_keeping_unit)
+        )
+
+        try:
+            with admission, locks.hold(stock_keeping_unit):
+                sleep(arguments.service_time)
+        except AdmissionRejectedError:
+            rejected.append(stock_keeping_unit)
+
+            return
+
+        if stock_keeping_unit != HOT:
+            cold_latencies.append(perf_counter() - arrival)
+
+    started: float = perf_counter()
+
+    with ThreadPoolExecutor(max_workers=arguments.threads) as pool:
+        for index in range(arguments.requests):
+            arrival: float = started + index / arguments.rate
+            sleep(max(arrival - perf_counter(), 0))
+            pool.submit(
+                handle,
+                HOT if random.random() < hot_share else f"COLD-{index}",
+                arrival,
+            )
+
+    report(name, cold_latencies, perf_counter() - started)
+
+    if admission_controller is not None:
+        statistics: AdmissionStatistics = admission_controller.statistics()
+        sys.stdout.write(
+            f"{'':<32} rejected={statistics.rejected:<8} "
+            f"timed_out={statistics.timed_out} "
+            f"max_queue_depth={statistics.max_queue_depth}\n",
+        )
+
+
+def main() -> None:
+    """Run benchmark."""
+    arguments: Namespace = parse_arguments()
+
+    run("cold, no hot traffic", 0, None, arguments)
+    run("cold, hot saturated", arguments.hot_share, None, arguments)
+    run(
+        "cold, hot saturated, limited",
+        arguments.hot_share,
+        AdmissionController(
+            max_in_flight=arguments.threads,
+            max_in_flight_per_key=2,
+            max_queue_per_key=4,
+            queue_timeout=0.05,
+        ),
+        arguments,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,193 @@
+"""Idempotency cache benchmark.
+
+Sends every allocation request several times from a thread pool, as
+clients retrying on timeouts do, either straight to the allocation service
+or through the idempotency cache, and reports request throughput and the
+cache hit rate. Without the cache every retry allocates again.
+
+Run with
+``python -m tests.benchmarks.application.utils.bench_idempotency_cache``
+and pass ``--database-uri`` to persist responses in a database instead of
+a temporary SQLite file.
+"""
+
+import sys
+from argparse import ArgumentParser, Namespace
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from pathlib import Path
+from random import Random
+from tempfile import TemporaryDirectory
+from time import perf_counter
+
+from sqlalchemy import Engine, create_engine
+from sqlalchemy.orm import sessionmaker
+
+from src.application.services.allocation import AllocationAppService
+from src.application.utils.idempotency_cache import (
+    IdempotencyCache,
+    IdempotencyStatistics,
+)
+from src.domain.aggregates.product import Product
+from src.domain.entities.batch import Batch
+from src.domain.value_objects.order_line import OrderLine
+from src.domain.value_objects.stored_response import StoredResponse
+from src.infrastructure.repositories.sql_repository.idempotency import (
+    SQLIdempotencyStore,
+)
+from src.infrastructure.repositories.sql_repository.in_memory import (
+    InMemoryStorage,
+)
+from src.infrastructure.repositories.sql_repository.postgresql import metadata
+from src.infrastructure.uow.allocation.in_memory_allocation import (
+    InMemoryAllocationUOW,
+)
+from tests.utils.benchmark import report
+from tests.utils.generate_random import random_order_id
+
+
+def parse_arguments() -> Namespace:
+    """Parse command line arguments.
+
+    Returns:
+        Namespace: parsed arguments.
+
+    """
+    parser: ArgumentParser = ArgumentParser(description=__doc__)
+    parser.add_argument("--database-uri", default=None)
+    parser.add_argument("--threads", type=int, default=16)
+    parser.add_argument("--requests", type=int, default=1000)
+    parser.add_argument("--retries", type=int, default=4)
+
+    return parser.parse_args()
+
+
+def make_storage(arguments: Namespace) -> InMemoryStorage:
+    """Make storage with enough stock for every retry.
+
+    Args:
+        arguments (Namespace): parsed arguments.
+
+    Returns:
+        InMemoryStorage: storage.
+
+    """
+    return InMemoryStorage(
+        [
+            Product(
+                stock_keeping_unit="RED-CHAIR",
+                batches=[
+                    Batch(
+                        reference="batch-001",
+                        stock_keeping_unit="RED-CHAIR",
+                        quantity=arguments.requests * arguments.retries,
+                        estimated_arrival_time=None,
+                    ),
+                ],
+            ),
+        ],
+    )
+
+
+def run(
+    name: str,
+    send: Callable[[OrderLine], object],
+    arguments: Namespace,
+) -> None:
+    """Send shuffled retries from a thread pool and report results.
+
+    Args:
+        name (str): benchmark name.
+        send (Callable[[OrderLine], object]): request handler.
+        arguments (Namespace): parsed arguments.
+
+    """
+    order_lines: list[OrderLine] = [
+        OrderLine(random_order_id(), "RED-CHAIR", 1)
+        for _ in range(arguments.requests)
+    ] * arguments.retries
+    Random(0).shuffle(order_lines)  # noqa: S311
+
+    def timed(order_line: OrderLine) -> float:
+        started: float = perf_counter()
+        send(order_line)
+
+        return perf_counter() - started
+
+    started: float = perf_counter()
+
+    with ThreadPoolExecutor(max_workers=arguments.threads) as pool:
+        latencies: list[float] = list(pool.map(timed, order_lines))
+
+    report(name, latencies, perf_counter() - started)
+
+
+def main() -> None:
+    """Run benchmark."""
+    arguments: Namespace = parse_arguments()
+    allocation_app_service: AllocationAppService = AllocationAppService()
+
+    with TemporaryDirectory() as directory:
+        engine: Engine = create_engine(
+            arguments.database_uri
+            or f"sqlite:///{Path(directory) / 'keys.db'}",
+        )
+        metadata.create_all(engine)
+
+        for name, cache in {
+            "uncached": None,
+            "memory": IdempotencyCache(),
+            "memory and store": IdempotencyCache(
+                store=SQLIdempotencyStore(
+                    session_factory=sessionmaker(engine)
+                ),
+            ),
+        }.items():
+            storage: InMemoryStorage = make_storage(arguments)
+            runs: list[OrderLine] = []
+
+            def allocate(
+                order_line: OrderLine,
+                storage: InMemoryStorage = storage,
+                runs: list[OrderLine] = runs,
+            ) -> StoredResponse:
+                runs.append(order_line)
+                batch_reference: str = allocation_app_service.allocate(
+                    order_id=order_line.order_id,
+                    stock_keeping_unit=order_line.stock_keeping_unit,
+                    quantity=order_line.quantity,
+                    unit_of_work=InMemoryAllocationUOW(storage),
+                )
+
+                return StoredResponse(201, batch_reference.encode())
+
+            def send(
+                order_line: OrderLine,
+                cache: IdempotencyCache | None = cache,
+                allocate: Callable[[OrderLine], StoredResponse] = allocate,
+            ) -> StoredResponse:
+                if cache is None:
+                    return allocate(order_line)
+
+                return cache.get_or_run(
+                    order_line.order_id,
+                    partial(allocate, order_line),
+                )[0]
+
+            run(name=name, send=send, arguments=arguments)
+
+            statistics: IdempotencyStatistics = (
+                IdempotencyStatistics()
+                if cache is None
+                else cache.statistics()
+            )
+
+            sys.stdout.write(
+                f"{'':<32} allocations={len(runs):<8} "
+                f"hit_rate={statistics.hit_rate:.2f}\n",
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,217 @@
+"""Sync plan executor benchmark.
+
+Plans the sync of a tree of files into a destination holding a renamed
+share of them and stale files, then runs the plan one command at a time,
+as ``SyncService.sync`` does, and with the plan executor, on the local
+file system and on one adding a fixed latency to every command, as a
+network file system does. Reports commands per second and command
+latencies.
+
+Run with ``python -m tests.benchmarks.application.utils.bench_plan_executor``
+and pass ``--root`` to build the trees on another file system.
+"""
+
+import os
+import shutil
+from argparse import ArgumentParser, Namespace
+from collections.abc import Callable
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from time import perf_counter, sleep
+
+from src.application.utils.plan_executor import CommandTiming, PlanExecutor
+from src.domain.interfaces.repositories.file_system import IFileSystem
+from src.domain.services.sync import SyncService, execute_command
+from src.domain.value_objects.sync_plan import SyncPlan
+from src.infrastructure.repositories.file_system.file_system_reader import (
+    FileSystemReader,
+)
+from src.infrastructure.repositories.file_system.local_file_system import (
+    LocalFileSystem,
+)
+from src.infrastructure.settings import settings
+from tests.utils.benchmark import report
+
+
+class SlowFileSystem(LocalFileSystem):
+    """Local file system waiting a fixed latency before every command."""
+
+    def __init__(self, latency: float) -> None:
+        """Create new instance.
+
+        Args:
+            latency (float): seconds waited before every command.
+
+        """
+        super().__init__()
+        self._latency: float = latency
+
+    def copy(self, src: Path, dest: Path) -> None:
+        """Copy file after the latency.
+
+        Args:
+            src (Path): source path.
+            dest (Path): destination path.
+
+        """
+        sleep(self._latency)
+        super().copy(src, dest)
+
+    def move(self, src: Path, dest: Path) -> None:
+        """Move file after the latency.
+
+        Args:
+            src (Path): source path.
+            dest (Path): destination path.
+
+        """
+        sleep(self._latency)
+        super().move(src, dest)
+
+    def delete(self, src: Path, dest: Path | None = None) -> None:
+        """Delete file after the latency.
+
+        Args:
+            src (Path): source path.
+            dest (Path | None, optional): destination path. Defaults to None.
+
+        """
+        sleep(self._latency)
+        super().delete(src, dest)
+
+
+def parse_arguments() -> Namespace:
+    """Parse command line arguments.
+
+    Returns:
+        Namespace: parsed arguments.
+
+    """
+    parser: ArgumentParser = ArgumentParser(description=__doc__)
+    parser.add_argument("--root", type=Path, default=Path.cwd())
+    parser.add_argument("--files", type=int, default=2000)
+    parser.add_argument("--size", type=int, default=64 * 1024)
+    parser.add_argument("--latency", type=float, default=0.002)
+    parser.add_argument("--workers", type=int, default=settings.sync_workers)
+
+    return parser.parse_args()
+
+
+def make_trees(source: Path, destination: Path, arguments: Namespace) -> None:
+    """Make source tree and a destination with renamed and stale files.
+
+    Args:
+        source (Path): source tree root.
+        destination (Path): destination tree root.
+        arguments (Namespace): parsed arguments.
+
+    """
+    shutil.rmtree(destination, ignore_errors=True)
+    source.mkdir(exist_ok=True)
+    destination.mkdir()
+
+    for index in range(arguments.files):
+        data: bytes = index.to_bytes(8) + os.urandom(arguments.size - 8)
+
+        if not (source / f"file-{index}").exists():
+            (source / f"file-{index}").write_bytes(data)
+
+        if index % 4 == 0:
+            (destination / f"renamed-{index}").write_bytes(
+                (source / f"file-{index}").read_bytes(),
+            )
+
+        elif index % 4 == 1:
+            (destination / f"stale-{index}").write_bytes(data[::-1])
+
+
+def run(
+    name: str,
+    execute: Callable[[SyncPlan, IFileSystem], list[float]],
+    file_system: IFileSystem,
+    directory: Path,
+    arguments: Namespace,
+) -> None:
+    """Plan and run a sync and report results.
+
+    Args:
+        name (str): benchmark name.
+        execute (Callable[[SyncPlan, IFileSystem], list[float]]): plan
+            runner returning command latencies.
+        file_system (IFileSystem): file system repository.
+        directory (Path): folder of the source and destination trees.
+        arguments (Namespace): parsed arguments.
+
+    """
+    source: Path = directory / "source"
+    destination: Path = directory / "destination"
+    make_trees(source, destination, arguments)
+    reader: FileSystemReader = FileSystemReader()
+    plan: SyncPlan = SyncService().plan(
+        source_hashes=reader.get_hashes(str(source)),
+        destination_hashes=reader.get_hashes(str(destination)),
+        source=str(source),
+        destination=str(destination),
+    )
+
+    started: float = perf_counter()
+    latencies: list[float] = execute(plan, file_system)
+    report(name, latencies, perf_counter() - started)
+
+
+def execute_serially(plan: SyncPlan, file_system: IFileSystem) -> list[float]:
+    """Run commands one at a time.
+
+    Args:
+        plan (SyncPlan): plan.
+        file_system (IFileSystem): file system repository.
+
+    Returns:
+        list[float]: command latencies.
+
+    """
+    latencies: list[float] = []
+
+    for command in plan.commands:
+        started: float = perf_counter()
+        execute_command(command, file_system)
+        latencies.append(perf_counter() - started)
+
+    return latencies
+
+
+def main() -> None:
+    """Run benchmark."""
+    arguments: Namespace = parse_arguments()
+    executor: PlanExecutor = PlanExecutor(workers=arguments.workers)
+
+    def execute_concurrently(
+        plan: SyncPlan,
+        file_system: IFileSystem,
+    ) -> list[float]:
+        timings: list[CommandTiming] = executor.execute(plan, file_system)
+
+        return [timing.elapsed for timing in timings]
+
+    with TemporaryDirectory(dir=arguments.root) as directory:
+        for file_system_name, file_system in {
+            "local": LocalFileSystem(),
+            f"{arguments.latency * 1000:g}ms latency": SlowFileSystem(
+                arguments.latency,
+            ),
+        }.items():
+            for execute_name, execute in {
+                "serial": execute_serially,
+                f"{arguments.workers} workers": execute_concurrently,
+            }.items():
+                run(
+                    name=f"{file_system_name} {execute_name}",
+                    execute=execute,
+                    file_system=file_system,
+                    directory=Path(directory),
+                    arguments=arguments,
+                )
+
+
+if __name__ == "__main__":
+    main()
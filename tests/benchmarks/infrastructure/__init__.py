@@ -0,0 +1 @@
+"""Infrastructure layer benchmarks."""
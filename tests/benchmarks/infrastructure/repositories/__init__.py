@@ -0,0 +1 @@
+"""Repositories benchmarks."""
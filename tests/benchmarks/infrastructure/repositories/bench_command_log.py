@@ -0,0 +1,127 @@
+"""Command log benchmark.
+
+Records a dry run of copies spread over many folders in a list of
+commands and in a command log, and reports memory per command traced by
+tracemalloc, then saves the log, loads it back and reads every command,
+reporting times and the file size.
+
+Run with
+``python -m tests.benchmarks.infrastructure.repositories.bench_command_log``
+and pass ``--commands`` to change the scale.
+"""
+
+import sys
+import tracemalloc
+from argparse import ArgumentParser, Namespace
+from collections.abc import Iterator
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from time import perf_counter
+
+from src.domain.value_objects.file_system_command import FileSystemCommand
+from src.domain.value_objects.file_system_command_action import (
+    FileSystemCommandAction,
+)
+from src.infrastructure.repositories.file_system.command_log import (
+    CommandLog,
+)
+
+MEBIBYTE: int = 1024 * 1024
+
+
+def parse_arguments() -> Namespace:
+    """Parse command line arguments.
+
+    Returns:
+        Namespace: parsed arguments.
+
+    """
+    parser: ArgumentParser = ArgumentParser(description=__doc__)
+    parser.add_argument("--commands", type=int, default=1_000_000)
+    parser.add_argument("--folders", type=int, default=1000)
+
+    return parser.parse_args()
+
+
+def commands(arguments: Namespace) -> Iterator[FileSystemCommand]:
+    """Make copies of files spread over folders.
+
+    Args:
+        arguments (Namespace): parsed arguments.
+
+    Yields:
+        Iterator[FileSystemCommand]: commands.
+
+    """
+    for index in range(arguments.commands):
+        folder: str = f"folder-{index % arguments.folders}"
+        yield FileSystemCommand(
+            FileSystemCommandAction.copy,
+            Path("/source") / folder / f"file-{index}",
+            Path("/destination") / folder / f"file-{index}",
+        )
+
+
+def measure(name: str, arguments: Namespace) -> CommandLog | None:
+    """Record commands in a list or a log and report memory and time.
+
+    Args:
+        name (str): "list" or "log".
+        arguments (Namespace): parsed arguments.
+
+    Returns:
+        CommandLog | None: log, None for the list.
+
+    """
+    tracemalloc.start()
+    started: float = perf_counter()
+    recorded: list[FileSystemCommand] | CommandLog = (
+        list(commands(arguments))
+        if name == "list"
+        else CommandLog(commands(arguments))
+    )
+    elapsed: float = perf_counter() - started
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    sys.stdout.write(
+        f"{name:<32} seconds={elapsed:<8.2f} "
+        f"bytes/command={size / arguments.commands:.1f}\n",
+    )
+
+    return recorded if isinstance(recorded, CommandLog) else None
+
+
+def main() -> None:
+    """Run benchmark."""
+    arguments: Namespace = parse_arguments()
+    measure("list", arguments)
+    log: CommandLog | None = measure("log", arguments)
+
+    if log is None:
+        return
+
+    with TemporaryDirectory() as directory:
+        path: Path = Path(directory) / "plan"
+        started: float = perf_counter()
+        log.save(path)
+        saved: float = perf_counter() - started
+
+        started = perf_counter()
+        loaded: CommandLog = CommandLog.load(path)
+        opened: float = perf_counter() - started
+
+        started = perf_counter()
+        read: int = sum(1 for _ in loaded)
+        iterated: float = perf_counter() - started
+        loaded.close()
+
+        sys.stdout.write(
+            f"{'save/load/read':<32} save={saved:.2f}s load={opened:.4f}s "
+            f"read={iterated:.2f}s commands={read} "
+            f"file={path.stat().st_size / MEBIBYTE:.1f}MiB\n",
+        )
+
+
+if __name__ == "__main__":
+    main()
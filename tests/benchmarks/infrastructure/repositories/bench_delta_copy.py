@@ -0,0 +1,135 @@
+"""Delta copy benchmark.
+
+Copies a large file over an older version of itself, edited in one
+contiguous region or in many scattered spots, with a full copy and with a
+delta copy, and reports seconds and mebibytes written. A delta copy reads
+both versions twice, to find changed blocks and to check the result, so it
+trades reads and time for writes.
+
+Run with ``python -m
+tests.benchmarks.infrastructure.repositories.bench_delta_copy``, pass
+``--size`` for the file size in mebibytes, ``--edit`` for the edited share
+in percent and ``--folder`` to pick the file system.
+"""
+
+import os
+import random
+import shutil
+import sys
+from argparse import ArgumentParser, Namespace
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from time import perf_counter
+
+from src.infrastructure.repositories.file_system.local_file_system import (
+    CopyStatistics,
+    LocalFileSystem,
+)
+
+MEBIBYTE: int = 1024 * 1024
+
+# Edit name: number of edited spots.
+EDITS: dict[str, int] = {
+    "contiguous": 1,
+    "scattered": 100,
+}
+
+
+def parse_arguments() -> Namespace:
+    """Parse command line arguments.
+
+    Returns:
+        Namespace: parsed arguments.
+
+    """
+    parser: ArgumentParser = ArgumentParser(description=__doc__)
+    parser.add_argument("--size", type=int, default=1024)
+    parser.add_argument("--edit", type=float, default=1)
+    parser.add_argument("--folder", type=Path, default=Path.cwd())
+    parser.add_argument("--seed", type=int, default=0)
+
+    return parser.parse_args()
+
+
+def make_versions(
+    folder: Path,
+    arguments: Namespace,
+    spots: int,
+) -> tuple[Path, Path]:
+    """Write an old version of a file and a new one with edited spots.
+
+    Args:
+        folder (Path): folder of both versions.
+        arguments (Namespace): parsed arguments.
+        spots (int): number of edited spots.
+
+    Returns:
+        tuple[Path, Path]: new and old version paths.
+
+    """
+    generator: random.Random = random.Random(arguments.seed)  # noqa: S311
+    new: Path = folder / "new"
+    old: Path = folder / "old"
+    size: int = arguments.size * MEBIBYTE
+    length: int = max(int(size * arguments.edit / 100 / spots), 1)
+
+    with old.open("wb") as file:
+        for _ in range(arguments.size):
+            file.write(os.urandom(MEBIBYTE))
+
+    shutil.copyfile(old, new)
+
+    with new.open("r+b") as file:
+        for _ in range(spots):
+            file.seek(generator.randrange(size - length))
+            file.write(os.urandom(length))
+
+    return new, old
+
+
+def run(name: str, file_system: LocalFileSystem, new: Path, old: Path) -> None:
+    """Copy new version over a copy of the old one and report results.
+
+    Args:
+        name (str): benchmark name.
+        file_system (LocalFileSystem): local file system.
+        new (Path): new version.
+        old (Path): old version.
+
+    """
+    destination: Path = old.with_name("destination")
+    shutil.copyfile(old, destination)
+    os.sync()
+
+    started: float = perf_counter()
+    file_system.copy(new, destination)
+    elapsed: float = perf_counter() - started
+    statistics: CopyStatistics = file_system.statistics()
+
+    sys.stdout.write(
+        f"{name:<32} seconds={elapsed:<8.2f} "
+        f"written={statistics.bytes_written / MEBIBYTE:.1f}MiB "
+        f"delta={statistics.delta_copies}\n",
+    )
+    destination.unlink()
+
+
+def main() -> None:
+    """Run benchmark."""
+    arguments: Namespace = parse_arguments()
+
+    with TemporaryDirectory(dir=arguments.folder) as directory:
+        for edit, spots in EDITS.items():
+            new, old = make_versions(Path(directory), arguments, spots)
+
+            for mode, delta in (("full", False), ("delta", True)):
+                run(
+                    name=f"{arguments.size}MiB {edit} {mode}",
+                    file_system=LocalFileSystem(delta=delta),
+                    new=new,
+                    old=old,
+                )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,148 @@
+"""File system reader benchmark.
+
+Builds a tree of many small files and reports scan and hash throughput of
+the file system reader with one and with several hashing threads, next to
+a sequential ``os.walk`` and ``read`` baseline.
+
+Run with ``python -m
+tests.benchmarks.infrastructure.repositories.bench_file_system_reader`` and
+pass ``--root`` to build the tree on another file system.
+"""
+
+import hashlib
+import os
+import sys
+from argparse import ArgumentParser, Namespace
+from collections.abc import Callable
+from pathlib import Path
+from random import Random
+from tempfile import TemporaryDirectory
+from time import perf_counter
+
+from src.infrastructure.repositories.file_system.file_system_reader import (
+    FileSystemReader,
+)
+from src.infrastructure.settings import settings
+
+MEBIBYTE: int = 1024 * 1024
+
+
+def parse_arguments() -> Namespace:
+    """Parse command line arguments.
+
+    Returns:
+        Namespace: parsed arguments.
+
+    """
+    parser: ArgumentParser = ArgumentParser(description=__doc__)
+    parser.add_argument("--root", type=Path, default=Path("/dev/shm"))  # noqa: S108
+    parser.add_argument("--files", type=int, default=100_000)
+    parser.add_argument("--files-per-folder", type=int, default=1000)
+    parser.add_argument("--max-size", type=int, default=16 * 1024)
+
+    return parser.parse_args()
+
+
+def make_tree(root: Path, arguments: Namespace) -> int:
+    """Make tree of files of random sizes.
+
+    Args:
+        root (Path): tree root.
+        arguments (Namespace): parsed arguments.
+
+    Returns:
+        int: total size.
+
+    """
+    random: Random = Random(0)  # noqa: S311
+    data: bytes = os.urandom(arguments.max_size)
+    total: int = 0
+
+    for index in range(arguments.files):
+        folder: Path = root / f"{index // arguments.files_per_folder:05}"
+
+        if not index % arguments.files_per_folder:
+            folder.mkdir()
+
+        size: int = random.randint(0, arguments.max_size)
+        (folder / f"file-{index}").write_bytes(data[:size])
+        total += size
+
+    return total
+
+
+def walk_and_read(root: str) -> dict[str, str]:
+    """Hash files sequentially, reading each one whole.
+
+    Args:
+        root (str): tree root.
+
+    Returns:
+        dict[str, str]: file name by content hash.
+
+    """
+    hashes: dict[str, str] = {}
+
+    for folder, _, names in os.walk(root):
+        for name in names:
+            path: str = os.path.join(folder, name)  # noqa: PTH118
+
+            with open(path, "rb") as file:  # noqa: PTH123
+                hashes.setdefault(
+                    hashlib.new(
+                        settings.reader_hash_algorithm, file.read()
+                    ).hexdigest(),
+                    os.path.relpath(path, root),
+                )
+
+    return hashes
+
+
+def run(
+    name: str,
+    read: Callable[[str], object],
+    root: str,
+    files: int,
+    size: int,
+) -> None:
+    """Time a pass over the tree and report throughput.
+
+    Args:
+        name (str): benchmark name.
+        read (Callable[[str], object]): tree reader.
+        root (str): tree root.
+        files (int): number of files.
+        size (int): total size.
+
+    """
+    started: float = perf_counter()
+    read(root)
+    elapsed: float = perf_counter() - started
+
+    sys.stdout.write(
+        f"{name:<32} elapsed={elapsed:<8.3f} "
+        f"files/s={files / elapsed:<12.1f} "
+        f"MiB/s={size / MEBIBYTE / elapsed:.1f}\n",
+    )
+
+
+def main() -> None:
+    """Run benchmark."""
+    arguments: Namespace = parse_arguments()
+
+    with TemporaryDirectory(dir=arguments.root) as directory:
+        size: int = make_tree(Path(directory), arguments)
+        reader: FileSystemReader = FileSystemReader()
+        readers: dict[str, Callable[[str], object]] = {
+            "scan": reader.scan,
+            "walk and read": walk_and_read,
+            "reader 1 thread": FileSystemReader(workers=1).get_hashes,
+            f"reader {settings.reader_workers} threads": reader.get_hashes,
+        }
+
+        for name, read in readers.items():
+            run(name, read, directory, arguments.files, size)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+"""File hash cache benchmark.
+
+Builds a tree of many small files and reports how long the file system
+reader takes to scan it, to hash it with an empty hash cache, to hash it
+again unchanged, and after a share of its files was modified.
+
+Run with ``python -m
+tests.benchmarks.infrastructure.repositories.bench_hash_cache`` and pass
+``--files`` to change the tree size.
+"""
+
+import os
+import sys
+from argparse import ArgumentParser, Namespace
+from collections.abc import Callable
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from time import perf_counter
+
+from src.infrastructure.repositories.file_system.file_system_reader import (
+    FileSystemReader,
+    ScannedFile,
+)
+from tests.benchmarks.infrastructure.repositories.bench_file_system_reader import (  # noqa: E501
+    make_tree,
+)
+
+
+def parse_arguments() -> Namespace:
+    """Parse command line arguments.
+
+    Returns:
+        Namespace: parsed arguments.
+
+    """
+    parser: ArgumentParser = ArgumentParser(description=__doc__)
+    parser.add_argument("--root", type=Path, default=Path("/dev/shm"))  # noqa: S108
+    parser.add_argument("--files", type=int, default=1_000_000)
+    parser.add_argument("--files-per-folder", type=int, default=1000)
+    parser.add_argument("--max-size", type=int, default=4 * 1024)
+    parser.add_argument("--modified", type=float, default=0.01)
+
+    return parser.parse_args()
+
+
+def run(name: str, read: Callable[[], object], files: int) -> None:
+    """Time a pass over the tree and report throughput.
+
+    Args:
+        name (str): benchmark name.
+        read (Callable[[], object]): tree reader.
+        files (int): number of files.
+
+    """
+    started: float = perf_counter()
+    read()
+    elapsed: float = perf_counter() - started
+
+    sys.stdout.write(
+        f"{name:<32} elapsed={elapsed:<8.3f} files/s={files / elapsed:.1f}\n",
+    )
+
+
+def main() -> None:
+    """Run benchmark."""
+    arguments: Namespace = parse_arguments()
+
+    with TemporaryDirectory(dir=arguments.root) as directory:
+        tree: Path = Path(directory) / "tree"
+        tree.mkdir()
+        make_tree(tree, arguments)
+        # The tree isn't written while it is read, nothing is racy.
+        reader: FileSystemReader = FileSystemReader(
+            cache_folder=str(Path(directory) / "cache"),
+            racy_window=0,
+        )
+        files: list[ScannedFile] = reader.scan(str(tree))
+
+        run("scan", lambda: reader.scan(str(tree)), len(files))
+        run(
+            "uncached",
+            lambda: FileSystemReader().get_hashes(str(tree)),
+            len(files),
+        )
+        run("empty cache", lambda: reader.get_hashes(str(tree)), len(files))
+        run("unchanged", lambda: reader.get_hashes(str(tree)), len(files))
+
+        for file in files[:: max(round(1 / arguments.modified), 1)]:
+            os.utime(file.path, ns=(file.mtime_ns + 1, file.mtime_ns + 1))
+
+        run(
+            f"{arguments.modified:.0%} modified",
+            lambda: reader.get_hashes(str(tree)),
+            len(files),
+        )
+
+
+if __name__ == "__main__":
+    main()
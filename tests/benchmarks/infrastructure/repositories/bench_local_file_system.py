@@ -0,0 +1,161 @@
+"""Local file system benchmark.
+
+Copies trees of small, medium, large and sparse files with the local file
+system, inside the kernel and with buffered reads and writes, and with
+``shutil.copy2`` for reference, on tmpfs and on disk, and reports files and
+mebibytes per second. Source files are read from the page cache, so the
+disk numbers measure writes.
+
+Run with ``python -m
+tests.benchmarks.infrastructure.repositories.bench_local_file_system`` and
+pass ``--disk`` to pick the folder on disk.
+"""
+
+import os
+import shutil
+import sys
+from argparse import ArgumentParser, Namespace
+from collections.abc import Callable
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from time import perf_counter
+
+from src.infrastructure.repositories.file_system.local_file_system import (
+    LocalFileSystem,
+)
+from tests.utils.benchmark import report
+
+KIBIBYTE: int = 1024
+MEBIBYTE: int = 1024 * KIBIBYTE
+
+# Tree name: files, size of each file, bytes of data in each file.
+TREES: dict[str, tuple[int, int, int]] = {
+    "small": (2000, 4 * KIBIBYTE, 4 * KIBIBYTE),
+    "medium": (200, MEBIBYTE, MEBIBYTE),
+    "large": (4, 64 * MEBIBYTE, 64 * MEBIBYTE),
+    "sparse": (4, 64 * MEBIBYTE, MEBIBYTE),
+}
+
+
+def parse_arguments() -> Namespace:
+    """Parse command line arguments.
+
+    Returns:
+        Namespace: parsed arguments.
+
+    """
+    parser: ArgumentParser = ArgumentParser(description=__doc__)
+    parser.add_argument("--tmpfs", type=Path, default=Path("/dev/shm"))  # noqa: S108
+    parser.add_argument("--disk", type=Path, default=Path.cwd())
+    parser.add_argument("--trees", nargs="+", default=list(TREES))
+
+    return parser.parse_args()
+
+
+def make_tree(root: Path, files: int, size: int, data: int) -> list[Path]:
+    """Make tree of files with data at their start and a hole after it.
+
+    Args:
+        root (Path): tree root.
+        files (int): number of files.
+        size (int): size of each file.
+        data (int): bytes of data in each file.
+
+    Returns:
+        list[Path]: file paths, relative to the root.
+
+    """
+    paths: list[Path] = [
+        Path(f"{index % 16:02}") / f"file-{index}" for index in range(files)
+    ]
+    content: bytes = os.urandom(data)
+
+    for path in paths:
+        (root / path).parent.mkdir(parents=True, exist_ok=True)
+
+        with (root / path).open("wb") as file:
+            file.write(content)
+            file.truncate(size)
+
+    return paths
+
+
+def run(
+    name: str,
+    copy: Callable[[Path, Path], object],
+    source: Path,
+    destination: Path,
+    paths: list[Path],
+) -> None:
+    """Copy every file of a tree and report results.
+
+    Args:
+        name (str): benchmark name.
+        copy (Callable[[Path, Path], object]): file copy function.
+        source (Path): source tree root.
+        destination (Path): destination tree root.
+        paths (list[Path]): file paths, relative to the roots.
+
+    """
+    shutil.rmtree(destination, ignore_errors=True)
+
+    for path in {path.parent for path in paths}:
+        (destination / path).mkdir(parents=True, exist_ok=True)
+
+    latencies: list[float] = []
+    started: float = perf_counter()
+
+    for path in paths:
+        copy_started: float = perf_counter()
+        copy(source / path, destination / path)
+        latencies.append(perf_counter() - copy_started)
+
+    elapsed: float = perf_counter() - started
+    size: int = sum((source / path).stat().st_size for path in paths)
+    allocated: int = sum(
+        (destination / path).stat().st_blocks * 512 for path in paths
+    )
+
+    report(name, latencies, elapsed)
+    sys.stdout.write(
+        f"{'':<32} MiB/s={size / MEBIBYTE / elapsed:<10.1f} "
+        f"allocated={allocated / MEBIBYTE:.1f}MiB\n",
+    )
+
+
+def main() -> None:
+    """Run benchmark."""
+    arguments: Namespace = parse_arguments()
+    copies: dict[str, Callable[[Path, Path], object]] = {
+        "zero copy": LocalFileSystem().copy,
+        "buffered": LocalFileSystem(zero_copy=False).copy,
+        "shutil.copy2": shutil.copy2,
+    }
+
+    for location, folder in (
+        ("tmpfs", arguments.tmpfs),
+        ("disk", arguments.disk),
+    ):
+        if not folder.is_dir():
+            sys.stdout.write(f"{location}: {folder} is missing, skipped\n")
+            continue
+
+        with TemporaryDirectory(dir=folder) as directory:
+            for tree in arguments.trees:
+                source: Path = Path(directory) / tree
+                paths: list[Path] = make_tree(source, *TREES[tree])
+
+                for copy_name, copy in copies.items():
+                    run(
+                        name=f"{location} {tree} {copy_name}",
+                        copy=copy,
+                        source=source,
+                        destination=Path(directory) / f"{tree}-copy",
+                        paths=paths,
+                    )
+
+                shutil.rmtree(source)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,136 @@
+"""Tiered file system reader benchmark.
+
+Builds a source tree of files of random sizes and a destination holding a
+share of them, then reads both with content hashes and with tiered
+fingerprints, for each hash algorithm, and reports wall time and bytes
+read. Files are read from the page cache, so wall time mostly measures
+hashing.
+
+Run with ``python -m
+tests.benchmarks.infrastructure.repositories.bench_tiered_reader`` and pass
+``--shared`` to change the share of files already in the destination.
+"""
+
+import os
+import shutil
+import sys
+from argparse import ArgumentParser, Namespace
+from pathlib import Path
+from random import Random
+from tempfile import TemporaryDirectory
+from time import perf_counter
+
+from src.infrastructure.repositories.file_system.file_system_reader import (
+    FileSystemReader,
+)
+from src.infrastructure.repositories.file_system.tiered_reader import (
+    TieredFileSystemReader,
+    TieredStatistics,
+)
+
+MEBIBYTE: int = 1024 * 1024
+
+
+def parse_arguments() -> Namespace:
+    """Parse command line arguments.
+
+    Returns:
+        Namespace: parsed arguments.
+
+    """
+    parser: ArgumentParser = ArgumentParser(description=__doc__)
+    parser.add_argument("--root", type=Path, default=Path("/dev/shm"))  # noqa: S108
+    parser.add_argument("--files", type=int, default=500)
+    parser.add_argument("--max-size", type=int, default=8 * MEBIBYTE)
+    parser.add_argument("--shared", type=float, nargs="+", default=[0, 0.9])
+    parser.add_argument(
+        "--algorithms",
+        nargs="+",
+        default=["blake2b", "sha1", "sha256"],
+    )
+
+    return parser.parse_args()
+
+
+def make_trees(
+    source: Path,
+    destination: Path,
+    shared: float,
+    arguments: Namespace,
+) -> None:
+    """Make source tree of log-uniform sizes and a partial copy of it.
+
+    Args:
+        source (Path): source tree root.
+        destination (Path): destination tree root.
+        shared (float): share of source files copied to the destination.
+        arguments (Namespace): parsed arguments.
+
+    """
+    random: Random = Random(0)  # noqa: S311
+    data: bytes = os.urandom(arguments.max_size)
+    source.mkdir()
+    destination.mkdir()
+
+    for index in range(arguments.files):
+        size: int = int(arguments.max_size ** random.random())
+        offset: int = random.randrange(arguments.max_size - size + 1)
+        (source / f"file-{index}").write_bytes(data[offset : offset + size])
+
+        if random.random() < shared:
+            shutil.copy(source / f"file-{index}", destination)
+
+
+def main() -> None:
+    """Run benchmark."""
+    arguments: Namespace = parse_arguments()
+
+    for shared in arguments.shared:
+        with TemporaryDirectory(dir=arguments.root) as directory:
+            source: Path = Path(directory) / "source"
+            destination: Path = Path(directory) / "destination"
+            make_trees(source, destination, shared, arguments)
+            folders: tuple[str, str] = (str(source), str(destination))
+            size: int = sum(
+                file.size
+                for folder in folders
+                for file in FileSystemReader().scan(folder)
+            )
+
+            for algorithm in arguments.algorithms:
+                started: float = perf_counter()
+                reader: FileSystemReader = FileSystemReader(
+                    algorithm=algorithm
+                )
+
+                for folder in folders:
+                    reader.get_hashes(folder)
+
+                sys.stdout.write(
+                    f"{f'{shared:.0%} shared full {algorithm}':<32} "
+                    f"elapsed={perf_counter() - started:<8.3f} "
+                    f"read={size / MEBIBYTE:.1f}MiB\n",
+                )
+
+                started = perf_counter()
+                tiered: TieredFileSystemReader = TieredFileSystemReader(
+                    folders=folders,
+                    algorithm=algorithm,
+                )
+
+                for folder in folders:
+                    tiered.get_hashes(folder)
+
+                statistics: TieredStatistics = tiered.statistics()
+                sys.stdout.write(
+                    f"{f'{shared:.0%} shared tiered {algorithm}':<32} "
+                    f"elapsed={perf_counter() - started:<8.3f} "
+                    f"read={statistics.bytes_read / MEBIBYTE:.1f}MiB "
+                    f"size={statistics.by_size} "
+                    f"partial={statistics.by_partial_hash} "
+                    f"full={statistics.by_full_hash}\n",
+                )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1 @@
+"""Units of work benchmarks."""
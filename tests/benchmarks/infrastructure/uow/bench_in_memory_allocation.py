@@ -0,0 +1,124 @@
+"""In-memory allocation unit of work benchmark.
+
+Measures get and allocate-commit latency against a large storage.
+
+Run with
+``python -m tests.benchmarks.infrastructure.uow.bench_in_memory_allocation``.
+"""
+
+import sys
+from argparse import ArgumentParser, Namespace
+from random import Random
+from time import perf_counter
+
+from src.domain.aggregates.product import Product
+from src.domain.entities.batch import Batch
+from src.domain.value_objects.order_line import OrderLine
+from src.infrastructure.repositories.sql_repository.in_memory import (
+    InMemoryStorage,
+)
+from src.infrastructure.uow.allocation.in_memory_allocation import (
+    InMemoryAllocationUOW,
+)
+from tests.utils.benchmark import report
+
+
+def parse_arguments() -> Namespace:
+    """Parse command line arguments.
+
+    Returns:
+        Namespace: parsed arguments.
+
+    """
+    parser: ArgumentParser = ArgumentParser(description=__doc__)
+    parser.add_argument("--products", type=int, default=1_000_000)
+    parser.add_argument("--operations", type=int, default=100_000)
+
+    return parser.parse_args()
+
+
+def make_product(index: int) -> Product:
+    """Make product with a single batch.
+
+    Args:
+        index (int): product index.
+
+    Returns:
+        Product: product aggregate.
+
+    """
+    stock_keeping_unit: str = f"SKU-{index}"
+
+    return Product(
+        stock_keeping_unit=stock_keeping_unit,
+        batches=[
+            Batch(
+                reference=f"batch-{index}",
+                stock_keeping_unit=stock_keeping_unit,
+                quantity=1_000_000,
+                estimated_arrival_time=None,
+            ),
+        ],
+    )
+
+
+def main() -> None:
+    """Run benchmark."""
+    arguments: Namespace = parse_arguments()
+    random: Random = Random(0)  # noqa: S311
+
+    started: float = perf_counter()
+    storage: InMemoryStorage = InMemoryStorage(
+        make_product(index) for index in range(arguments.products)
+    )
+    sys.stdout.write(
+        f"filled {len(storage)} products in {perf_counter() - started:.1f}s\n"
+    )
+
+    indexes: list[int] = [
+        random.randrange(arguments.products)
+        for _ in range(arguments.operations)
+    ]
+
+    latencies: list[float] = []
+    started = perf_counter()
+
+    for index in indexes:
+        operation_started: float = perf_counter()
+
+        with InMemoryAllocationUOW(storage) as unit_of_work:
+            unit_of_work.products.get(f"SKU-{index}")
+
+        latencies.append(perf_counter() - operation_started)
+
+    report("get", latencies, perf_counter() - started)
+
+    latencies = []
+    started = perf_counter()
+
+    for order, index in enumerate(indexes):
+        operation_started = perf_counter()
+
+        with InMemoryAllocationUOW(storage) as unit_of_work:
+            product: Product | None = unit_of_work.products.get(
+                f"SKU-{index}",
+            )
+
+            if product is not None:
+                product.allocate(
+                    OrderLine(
+                        order_id=f"order-{order}",
+                        stock_keeping_unit=product.stock_keeping_unit,
+                        quantity=1,
+                    )
+                )
+
+            unit_of_work.commit()
+
+        latencies.append(perf_counter() - operation_started)
+
+    report("allocate-commit", latencies, perf_counter() - started)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1 @@
+"""Controllers benchmarks."""
@@ -0,0 +1 @@
+"""Flask controllers benchmarks."""
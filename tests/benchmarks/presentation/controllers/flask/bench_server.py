@@ -0,0 +1,121 @@
+"""Pre-fork Flask server benchmark.
+
+Measures request throughput of a CPU-bound endpoint with a growing number of
+worker processes on one machine. Clients run in separate processes, so the
+server side is what limits throughput.
+
+Run with
+``python -m tests.benchmarks.presentation.controllers.flask.bench_server``.
+"""
+
+import logging
+from argparse import ArgumentParser, Namespace
+from concurrent.futures import ProcessPoolExecutor
+from hashlib import sha256
+from itertools import chain
+from time import perf_counter
+
+import requests
+from flask import Flask
+
+from src.presentation.controllers.flask.server import PreForkServer
+from tests.utils.benchmark import report
+
+app: Flask = Flask(__name__)
+
+
+@app.route("/work/<int:rounds>")
+def work(rounds: int) -> str:
+    """Hash repeatedly to simulate request handling.
+
+    Args:
+        rounds (int): number of hashing rounds.
+
+    Returns:
+        str: final digest.
+
+    """
+    digest: bytes = b""
+
+    for _ in range(rounds):
+        digest = sha256(digest).digest()
+
+    return digest.hex()
+
+
+def parse_arguments() -> Namespace:
+    """Parse command line arguments.
+
+    Returns:
+        Namespace: parsed arguments.
+
+    """
+    parser: ArgumentParser = ArgumentParser(description=__doc__)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4])
+    parser.add_argument("--clients", type=int, default=8)
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--rounds", type=int, default=20000)
+
+    return parser.parse_args()
+
+
+def client(url: str, requests_count: int) -> list[float]:
+    """Send sequential requests over a keep-alive session.
+
+    Args:
+        url (str): endpoint URL.
+        requests_count (int): number of requests to send.
+
+    Returns:
+        list[float]: per-request latencies in seconds.
+
+    """
+    latencies: list[float] = []
+
+    with requests.Session() as session:
+        for _ in range(requests_count):
+            start: float = perf_counter()
+            session.get(url, timeout=30).raise_for_status()
+            latencies.append(perf_counter() - start)
+
+    return latencies
+
+
+def main() -> None:
+    """Run benchmark."""
+    arguments: Namespace = parse_arguments()
+    per_client: int = arguments.requests // arguments.clients
+    logging.getLogger("werkzeug").setLevel(logging.WARNING)
+
+    for workers in arguments.workers:
+        server: PreForkServer = PreForkServer(
+            app=app,
+            port=0,
+            workers=workers,
+        )
+        server.start()
+
+        try:
+            host, port = server.address
+            url: str = f"http://{host}:{port}/work/{arguments.rounds}"
+
+            with ProcessPoolExecutor(arguments.clients) as executor:
+                start: float = perf_counter()
+                latencies: list[float] = list(
+                    chain.from_iterable(
+                        executor.map(
+                            client,
+                            [url] * arguments.clients,
+                            [per_client] * arguments.clients,
+                        )
+                    )
+                )
+                elapsed: float = perf_counter() - start
+
+            report(f"pre-fork workers={workers}", latencies, elapsed)
+        finally:
+            server.stop()
+
+
+if __name__ == "__main__":
+    main()
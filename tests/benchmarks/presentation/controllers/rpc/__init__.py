@@ -0,0 +1 @@
+"""RPC controllers benchmarks."""
@@ -0,0 +1,191 @@
+"""Allocation RPC server benchmark.
+
+Sends the same allocations to the Flask ``/allocate`` endpoint over
+keep-alive HTTP and to the RPC server over its Unix domain socket, one
+request at a time and pipelined, and reports throughput and latency. Both
+adapters run in this process against the same database, a temporary SQLite
+file unless ``--database-uri`` is passed, so the difference is framing and
+dispatch.
+
+Run with
+``python -m tests.benchmarks.presentation.controllers.rpc.bench_server``.
+"""
+
+import logging
+from argparse import ArgumentParser, Namespace
+from collections.abc import Callable
+from pathlib import Path
+from random import Random
+from tempfile import TemporaryDirectory
+from threading import Thread
+from time import perf_counter
+
+import requests
+
+from src.domain.value_objects.order_line import OrderLine
+from src.infrastructure.settings import settings
+from tests.utils.benchmark import report
+from tests.utils.generate_random import random_order_id
+
+
+def parse_arguments() -> Namespace:
+    """Parse command line arguments.
+
+    Returns:
+        Namespace: parsed arguments.
+
+    """
+    parser: ArgumentParser = ArgumentParser(description=__doc__)
+    parser.add_argument("--database-uri", default=None)
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--products", type=int, default=500)
+    parser.add_argument("--window", type=int, default=64)
+
+    return parser.parse_args()
+
+
+def make_order_lines(arguments: Namespace) -> list[OrderLine]:
+    """Make order lines spread over the products.
+
+    Args:
+        arguments (Namespace): parsed arguments.
+
+    Returns:
+        list[OrderLine]: order lines with unique order ids.
+
+    """
+    random: Random = Random(0)  # noqa: S311
+
+    return [
+        OrderLine(
+            random_order_id(),
+            f"SKU-{random.randrange(arguments.products)}",
+            1,
+        )
+        for _ in range(arguments.requests)
+    ]
+
+
+def run(
+    name: str,
+    send: Callable[[list[OrderLine]], object],
+    batch_size: int,
+    arguments: Namespace,
+) -> None:
+    """Send order lines in batches and report per-request results.
+
+    Args:
+        name (str): benchmark name.
+        send (Callable[[list[OrderLine]], object]): batch sender.
+        batch_size (int): order lines per batch, every one of them gets the
+            batch latency divided by its size.
+        arguments (Namespace): parsed arguments.
+
+    """
+    order_lines: list[OrderLine] = make_order_lines(arguments)
+    latencies: list[float] = []
+    started: float = perf_counter()
+
+    for start in range(0, len(order_lines), batch_size):
+        batch: list[OrderLine] = order_lines[start : start + batch_size]
+        batch_started: float = perf_counter()
+        send(batch)
+        latencies.extend(
+            [(perf_counter() - batch_started) / len(batch)] * len(batch),
+        )
+
+    report(name, latencies, perf_counter() - started)
+
+
+def main() -> None:
+    """Run benchmark."""
+    arguments: Namespace = parse_arguments()
+    logging.getLogger("werkzeug").setLevel(logging.WARNING)
+
+    with TemporaryDirectory() as directory:
+        # Engines are created on import from the settings.
+        settings.postgres_uri = (
+            arguments.database_uri
+            or f"sqlite:///{Path(directory) / 'allocation.db'}"
+        )
+
+        from werkzeug.serving import BaseWSGIServer, make_server
+
+        from src.application.services.add import AddAppService
+        from src.infrastructure.uow.allocation.postgresql_allocation import (
+            PostgresqlAllocationUOW,
+        )
+        from src.presentation.controllers.flask.controller import app
+        from src.presentation.controllers.rpc.client import (
+            AllocationRPCClient,
+        )
+        from src.presentation.controllers.rpc.server import (
+            AllocationRPCServer,
+        )
+
+        AddAppService().add_batches(
+            batches=[
+                (f"batch-{index}", f"SKU-{index}", 10**9, None)
+                for index in range(arguments.products)
+            ],
+            unit_of_work=PostgresqlAllocationUOW(),
+        )
+
+        http_server: BaseWSGIServer = make_server(
+            "127.0.0.1",
+            0,
+            app,
+            threaded=True,
+        )
+        rpc_server: AllocationRPCServer = AllocationRPCServer(
+            path=str(Path(directory) / "allocation.sock"),
+        )
+        threads: list[Thread] = [
+            Thread(target=http_server.serve_forever),
+            Thread(target=rpc_server.serve_forever),
+        ]
+
+        for thread in threads:
+            thread.start()
+
+        try:
+            url: str = f"http://127.0.0.1:{http_server.server_port}/allocate"
+
+            with requests.Session() as session:
+                run(
+                    "flask /allocate",
+                    lambda batch: session.post(
+                        url,
+                        json={
+                            "order_id": batch[0].order_id,
+                            "stock_keeping_unit": batch[0].stock_keeping_unit,
+                            "quantity": batch[0].quantity,
+                        },
+                        timeout=30,
+                    ).raise_for_status(),
+                    1,
+                    arguments,
+                )
+
+            with AllocationRPCClient(
+                str(rpc_server.path),
+                window=arguments.window,
+            ) as client:
+                run("rpc", client.allocate_many, 1, arguments)
+                run(
+                    f"rpc pipelined window={arguments.window}",
+                    client.allocate_many,
+                    arguments.window,
+                    arguments,
+                )
+        finally:
+            http_server.shutdown()
+            rpc_server.shutdown()
+            rpc_server.server_close()
+
+            for thread in threads:
+                thread.join()
+
+
+if __name__ == "__main__":
+    main()
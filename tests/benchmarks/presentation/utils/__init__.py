@@ -0,0 +1 @@
+"""Presentation utils benchmarks."""
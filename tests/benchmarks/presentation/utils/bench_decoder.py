@@ -0,0 +1,123 @@
+"""Request body decoder benchmark.
+
+Compares decoding an add batch request through ``request.json`` and a walk
+over the DTO annotations, as the DTOs used to, with the compiled decoder
+reading the raw request bytes.
+
+Run with ``python -m tests.benchmarks.presentation.utils.bench_decoder``.
+"""
+
+import json
+from argparse import ArgumentParser, Namespace
+from collections.abc import Callable
+from time import perf_counter
+from typing import Any
+
+from flask import Flask, request
+
+from src.presentation.dtos.flask.add_batch import AddBatchRequestBody
+from tests.utils.benchmark import report
+
+BODY: bytes = json.dumps(
+    {
+        "reference": "batch-001",
+        "stock_keeping_unit": "COMPLICATED-LAMP",
+        "quantity": 100,
+        "estimated_arrival_time": "2011-01-02",
+    }
+).encode()
+
+
+def parse_arguments() -> Namespace:
+    """Parse command line arguments.
+
+    Returns:
+        Namespace: parsed arguments.
+
+    """
+    parser: ArgumentParser = ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=100000)
+
+    return parser.parse_args()
+
+
+def decode_annotations() -> AddBatchRequestBody:
+    """Decode the current request the way DTOs used to.
+
+    Returns:
+        AddBatchRequestBody: request body.
+
+    """
+    body: Any = request.json
+
+    if not isinstance(body, dict):
+        msg: str = "Can't parse request body since it's not a dict."
+        raise TypeError(msg)
+
+    for (
+        variable_name,
+        expected_type,
+    ) in AddBatchRequestBody.__annotations__.items():
+        try:
+            variable_value: Any = body[variable_name]
+        except KeyError:
+            msg = f"Request must have {variable_name} field."
+            raise ValueError(msg) from KeyError
+
+        if not isinstance(variable_value, expected_type):
+            msg = f"{variable_name} must have {expected_type} type."
+
+    return AddBatchRequestBody(**body)
+
+
+def decode_compiled() -> AddBatchRequestBody:
+    """Decode the current request with the compiled decoder.
+
+    Returns:
+        AddBatchRequestBody: request body.
+
+    """
+    return AddBatchRequestBody.from_flask_request(request)
+
+
+def run(
+    name: str,
+    decode: Callable[[], AddBatchRequestBody],
+    app: Flask,
+    arguments: Namespace,
+) -> None:
+    """Decode requests and report per-request decode time.
+
+    Args:
+        name (str): benchmark name.
+        decode (Callable[[], AddBatchRequestBody]): decode function.
+        app (Flask): Flask application.
+        arguments (Namespace): parsed arguments.
+
+    """
+    latencies: list[float] = []
+
+    for _ in range(arguments.requests):
+        with app.test_request_context(
+            method="POST",
+            data=BODY,
+            content_type="application/json",
+        ):
+            started: float = perf_counter()
+            decode()
+            latencies.append(perf_counter() - started)
+
+    report(name, latencies, sum(latencies))
+
+
+def main() -> None:
+    """Run benchmark."""
+    arguments: Namespace = parse_arguments()
+    app: Flask = Flask(__name__)
+
+    run("request.json + annotations", decode_annotations, app, arguments)
+    run("compiled decoder", decode_compiled, app, arguments)
+
+
+if __name__ == "__main__":
+    main()
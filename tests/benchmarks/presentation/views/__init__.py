@@ -0,0 +1 @@
+"""Views benchmarks."""
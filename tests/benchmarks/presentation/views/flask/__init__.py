@@ -0,0 +1 @@
+"""Flask views benchmarks."""
@@ -0,0 +1,117 @@
+"""Flask view responses benchmark.
+
+Measures per-request CPU time of building and serializing the responses of
+the ``/allocate`` and ``/add_batch`` views, with ``jsonify`` as the views
+used to and with the response codecs they use now. The service call is left
+out, so the numbers isolate the encoding layer.
+
+Run with
+``python -m tests.benchmarks.presentation.views.flask.bench_responses``.
+"""
+
+from argparse import ArgumentParser, Namespace
+from collections.abc import Callable
+from time import perf_counter
+
+from flask import Flask, Response, jsonify
+
+from src.presentation.dtos.flask.add_batch import (
+    AddBatchResponseBody,
+    created_codec,
+)
+from src.presentation.dtos.flask.allocate import (
+    AllocateResponseBody,
+    batch_reference_codec,
+)
+from src.presentation.utils.encoder import FastJSONProvider, message_codec
+from src.presentation.utils.status_codes import StatusCode
+from tests.utils.benchmark import report
+
+
+def parse_arguments() -> Namespace:
+    """Parse command line arguments.
+
+    Returns:
+        Namespace: parsed arguments.
+
+    """
+    parser: ArgumentParser = ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=100000)
+
+    return parser.parse_args()
+
+
+def run(
+    name: str,
+    respond: Callable[[], tuple[Response, int]],
+    app: Flask,
+    arguments: Namespace,
+) -> None:
+    """Build and serialize responses and report per-request time.
+
+    Args:
+        name (str): benchmark name.
+        respond (Callable[[], tuple[Response, int]]): response factory.
+        app (Flask): Flask application.
+        arguments (Namespace): parsed arguments.
+
+    """
+    latencies: list[float] = []
+
+    with app.test_request_context():
+        for _ in range(arguments.requests):
+            started: float = perf_counter()
+            response, _ = respond()
+            response.get_data()
+            latencies.append(perf_counter() - started)
+
+    report(name, latencies, sum(latencies))
+
+
+def main() -> None:
+    """Run benchmark."""
+    arguments: Namespace = parse_arguments()
+    legacy_app: Flask = Flask(__name__)
+    app: Flask = Flask(__name__)
+    app.json = FastJSONProvider(app)
+
+    responses: dict[str, tuple[Callable[[], tuple[Response, int]], ...]] = {
+        "add_batch created": (
+            lambda: (jsonify({"status": "ok"}), StatusCode.created.value),
+            lambda: AddBatchResponseBody(
+                body=created_codec.body,
+                status_code=StatusCode.created,
+                codec=created_codec,
+            ).as_flask_response(),
+        ),
+        "allocate created": (
+            lambda: (
+                jsonify({"batch_reference": "batch-001"}),
+                StatusCode.created.value,
+            ),
+            lambda: AllocateResponseBody(
+                body={"batch_reference": "batch-001"},
+                status_code=StatusCode.created,
+                codec=batch_reference_codec,
+            ).as_flask_response(),
+        ),
+        "allocate bad request": (
+            lambda: (
+                jsonify({"message": "Invalid SKU: COMPLICATED-LAMP"}),
+                StatusCode.bad_request.value,
+            ),
+            lambda: AllocateResponseBody(
+                body={"message": "Invalid SKU: COMPLICATED-LAMP"},
+                status_code=StatusCode.bad_request,
+                codec=message_codec,
+            ).as_flask_response(),
+        ),
+    }
+
+    for name, (legacy, codec) in responses.items():
+        run(f"{name} jsonify", legacy, legacy_app, arguments)
+        run(f"{name} codec", codec, app, arguments)
+
+
+if __name__ == "__main__":
+    main()
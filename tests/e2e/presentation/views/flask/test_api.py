@@ -1,9 +1,10 @@
 """API Flask view end-to-end test."""
 
+import json
 from typing import Any
 
 import pytest
-from requests import Response, post
+from requests import Response, get, post
 
 from src.infrastructure.settings import settings
 from tests.utils.generate_random import (
@@ -134,3 +135,217 @@ def test_api_invalid_sku(
 
     assert response.status_code == expected_status_code
     assert response.json()["message"].startswith(expected_message)
+
+
+def test_api_allocate_batch() -> None:
+    """Test batch API returns per-line results in request order."""
+    batch_reference: str = random_batch_reference()
+    stock_keeping_unit: str = random_stock_keeping_unit()
+    unknown_stock_keeping_unit: str = random_stock_keeping_unit("unknown")
+
+    post_to_add_batch(
+        reference=batch_reference,
+        stock_keeping_unit=stock_keeping_unit,
+        quantity=10,
+        estimated_arrival_time=None,
+    )
+
+    payload: list[dict[str, Any]] = [
+        {
+            "order_id": random_order_id(),
+            "stock_keeping_unit": stock_keeping_unit,
+            "quantity": 4,
+        },
+        {
+            "order_id": random_order_id(),
+            "stock_keeping_unit": unknown_stock_keeping_unit,
+            "quantity": 1,
+        },
+        {
+            "order_id": random_order_id(),
+            "stock_keeping_unit": stock_keeping_unit,
+            "quantity": 7,
+        },
+    ]
+
+    response: Response = post(
+        url=f"{settings.api_url}/allocate/batch",
+        json=payload,
+        timeout=5,
+    )
+    results: list[dict[str, Any]] = response.json()["results"]
+
+    assert response.status_code == 200  # noqa: PLR2004
+    assert [result["order_id"] for result in results] == [
+        line["order_id"] for line in payload
+    ]
+    assert [result["status_code"] for result in results] == [201, 400, 400]
+    assert results[0]["batch_reference"] == batch_reference
+
+
+def test_api_add_batches() -> None:
+    """Test bulk add API reports a rejected batch without aborting others."""
+    stock_keeping_unit: str = random_stock_keeping_unit()
+    references: list[str] = [
+        random_batch_reference(str(index)) for index in range(3)
+    ]
+
+    response: Response = post(
+        url=f"{settings.api_url}/add_batch/batch",
+        json=[
+            {
+                "reference": references[0],
+                "stock_keeping_unit": stock_keeping_unit,
+                "quantity": 10,
+                "estimated_arrival_time": None,
+            },
+            {
+                "reference": references[1] + "x" * 300,
+                "stock_keeping_unit": stock_keeping_unit,
+                "quantity": 10,
+                "estimated_arrival_time": None,
+            },
+            {
+                "reference": references[2],
+                "stock_keeping_unit": stock_keeping_unit,
+                "quantity": 10,
+                "estimated_arrival_time": None,
+            },
+        ],
+        timeout=5,
+    )
+    results: list[dict[str, Any]] = response.json()["results"]
+
+    assert response.status_code == 200  # noqa: PLR2004
+    assert [result["status_code"] for result in results] == [201, 400, 201]
+
+
+def test_api_availability_not_modified() -> None:
+    """Test availability API answers a matching If-None-Match with 304."""
+    stock_keeping_unit: str = random_stock_keeping_unit()
+    url: str = f"{settings.api_url}/products/{stock_keeping_unit}/availability"
+
+    post_to_add_batch(
+        reference=random_batch_reference(),
+        stock_keeping_unit=stock_keeping_unit,
+        quantity=10,
+        estimated_arrival_time=None,
+    )
+
+    response: Response = get(url=url, timeout=5)
+    etag: str = response.headers["ETag"]
+
+    assert response.status_code == 200  # noqa: PLR2004
+    assert response.json()["available_quantity"] == 10  # noqa: PLR2004
+
+    response = get(url=url, headers={"If-None-Match": etag}, timeout=5)
+
+    assert response.status_code == 304  # noqa: PLR2004
+    assert response.headers["ETag"] == etag
+
+    post(
+        url=f"{settings.api_url}/allocate",
+        json={
+            "order_id": random_order_id(),
+            "stock_keeping_unit": stock_keeping_unit,
+            "quantity": 3,
+        },
+        timeout=5,
+    )
+    response = get(url=url, headers={"If-None-Match": etag}, timeout=5)
+
+    assert response.status_code == 200  # noqa: PLR2004
+    assert response.headers["ETag"] != etag
+    assert response.json()["available_quantity"] == 7  # noqa: PLR2004
+
+
+def test_api_availability_unknown_sku() -> None:
+    """Test availability API returns 404 on unknown SKU."""
+    response: Response = get(
+        url=(
+            f"{settings.api_url}/products/"
+            f"{random_stock_keeping_unit('unknown')}/availability"
+        ),
+        timeout=5,
+    )
+
+    assert response.status_code == 404  # noqa: PLR2004
+
+
+def test_api_allocate_replays_retry() -> None:
+    """Test a retried allocation is replayed and allocated once."""
+    stock_keeping_unit: str = random_stock_keeping_unit()
+    payload: dict[str, Any] = {
+        "order_id": random_order_id(),
+        "stock_keeping_unit": stock_keeping_unit,
+        "quantity": 3,
+    }
+
+    post_to_add_batch(
+        reference=random_batch_reference(),
+        stock_keeping_unit=stock_keeping_unit,
+        quantity=10,
+        estimated_arrival_time=None,
+    )
+
+    first: Response = post(
+        url=f"{settings.api_url}/allocate",
+        json=payload,
+        timeout=5,
+    )
+    retry: Response = post(
+        url=f"{settings.api_url}/allocate",
+        json=payload,
+        timeout=5,
+    )
+    availability: Response = get(
+        url=f"{settings.api_url}/products/{stock_keeping_unit}/availability",
+        timeout=5,
+    )
+
+    assert first.status_code == retry.status_code == 201  # noqa: PLR2004
+    assert retry.json() == first.json()
+    assert retry.headers["Idempotent-Replayed"] == "true"
+    assert availability.json()["available_quantity"] == 7  # noqa: PLR2004
+
+
+def test_api_allocations_export() -> None:
+    """Test allocations export API streams one JSON line per allocation."""
+    stock_keeping_unit: str = random_stock_keeping_unit()
+    batch_reference: str = random_batch_reference()
+    order_ids: list[str] = [random_order_id(str(index)) for index in range(3)]
+
+    post_to_add_batch(
+        reference=batch_reference,
+        stock_keeping_unit=stock_keeping_unit,
+        quantity=10,
+        estimated_arrival_time=None,
+    )
+
+    for order_id in order_ids:
+        post(
+            url=f"{settings.api_url}/allocate",
+            json={
+                "order_id": order_id,
+                "stock_keeping_unit": stock_keeping_unit,
+                "quantity": 1,
+            },
+            timeout=5,
+        )
+
+    response: Response = get(
+        url=f"{settings.api_url}/products/{stock_keeping_unit}/allocations",
+        stream=True,
+        timeout=5,
+    )
+
+    assert response.status_code == 200  # noqa: PLR2004
+    assert response.headers["Content-Type"] == "application/x-ndjson"
+    assert [json.loads(line) for line in response.iter_lines()] == [
+        {
+            "order_id": order_id,
+            "quantity": 1,
+            "batch_reference": batch_reference,
+        }
+        for order_id in order_ids
+    ]
@@ -1,8 +1,15 @@
 """Add application service tests."""
 
+from collections.abc import Callable
+
 import pytest
+from sqlalchemy import text
+from sqlalchemy.orm import Session
 
-from src.application.services.add import AddAppService
+from src.application.services.add import AddAppService, AddBatchResult
+from src.infrastructure.uow.allocation.postgresql_allocation import (
+    PostgresqlAllocationUOW,
+)
 from tests.mocks.infrastructure.uow.allocation import AllocationUOWMock
 
 
@@ -33,3 +40,30 @@ def test_add_batch(add_app_service: AddAppService) -> None:
     )
 
     assert unit_of_work.products.get("CRUNCHY-ARMCHAIR") is not None
+
+
+def test_add_batches_skips_rejected_batch(
+    add_app_service: AddAppService,
+    session_factory: Callable[[], Session],
+) -> None:
+    """Test a batch the database rejects doesn't abort the others.
+
+    Args:
+        add_app_service (AddAppService): add app service.
+        session_factory (Callable[[], Session]): session factory.
+
+    """
+    results: list[AddBatchResult] = add_app_service.add_batches(
+        batches=[
+            ("b1", "CRUNCHY-ARMCHAIR", 100, None),
+            ("b2", "CRUNCHY-ARMCHAIR", None, None),  # type: ignore[list-item]
+            ("b3", "RUSTY-SOAPDISH", 10, None),
+        ],
+        unit_of_work=PostgresqlAllocationUOW(session_factory=session_factory),
+    )
+
+    assert [result.reference for result in results] == ["b1", "b2", "b3"]
+    assert [result.error is None for result in results] == [True, False, True]
+    assert session_factory().execute(
+        text("SELECT reference FROM batches ORDER BY reference"),
+    ).all() == [("b1",), ("b3",)]
@@ -0,0 +1,129 @@
+"""Batch allocation application service tests."""
+
+import pytest
+
+from src.application.services.allocation import (
+    AllocationAppService,
+    LineResult,
+)
+from src.application.utils.striped_lock import StripedLock
+from src.domain.value_objects.order_line import OrderLine
+from tests.mocks.infrastructure.uow.allocation import (
+    CountingAllocationUOWMock,
+)
+
+
+@pytest.fixture
+def unit_of_work() -> CountingAllocationUOWMock:
+    """Create unit of work with two products.
+
+    Returns:
+        CountingAllocationUOWMock: unit of work.
+
+    """
+    return CountingAllocationUOWMock().add_products(
+        "BLUE-VASE",
+        "RED-CHAIR",
+    )
+
+
+def test_one_transaction_per_product(
+    unit_of_work: CountingAllocationUOWMock,
+) -> None:
+    """Test lines of a product share one unit of work and one commit.
+
+    Args:
+        unit_of_work (CountingAllocationUOWMock): unit of work.
+
+    """
+    order_lines: list[OrderLine] = [
+        OrderLine(
+            order_id=f"order-{index}",
+            stock_keeping_unit=("BLUE-VASE", "RED-CHAIR")[index % 2],
+            quantity=1,
+        )
+        for index in range(6)
+    ]
+
+    results: list[LineResult] = AllocationAppService().allocate_lines(
+        order_lines=order_lines,
+        unit_of_work=unit_of_work,
+    )
+
+    assert [result.order_line for result in results] == order_lines
+    assert [result.batch_reference for result in results] == [
+        f"batch-{order_line.stock_keeping_unit}" for order_line in order_lines
+    ]
+    assert unit_of_work.entered == 2  # noqa: PLR2004
+    assert unit_of_work.commits == 2  # noqa: PLR2004
+
+
+def test_reports_errors_per_line(
+    unit_of_work: CountingAllocationUOWMock,
+) -> None:
+    """Test failed lines don't affect the rest of the batch.
+
+    Args:
+        unit_of_work (CountingAllocationUOWMock): unit of work.
+
+    """
+    results: list[LineResult] = AllocationAppService().allocate_lines(
+        order_lines=[
+            OrderLine("too-big", "BLUE-VASE", 11),
+            OrderLine("fits", "BLUE-VASE", 10),
+            OrderLine("unknown", "GREEN-LAMP", 1),
+        ],
+        unit_of_work=unit_of_work,
+    )
+
+    assert [result.batch_reference for result in results] == [
+        None,
+        "batch-BLUE-VASE",
+        None,
+    ]
+    assert results[0].error == "Article BLUE-VASE is out of stock"
+    assert results[2].error == "Invalid SKU: GREEN-LAMP"
+    assert unit_of_work.commits == 1
+
+
+class LockCountingAllocationUOWMock(CountingAllocationUOWMock):
+    """Allocation unit of work mock counting locks held at commit."""
+
+    def __init__(self, locks: StripedLock) -> None:
+        """Create new instance.
+
+        Args:
+            locks (StripedLock): locks to inspect.
+
+        """
+        super().__init__()
+        self.locks: StripedLock = locks
+        self.held: list[int] = []
+
+    def commit(self) -> None:
+        """Commit changes."""
+        self.held.append(
+            sum(lock.locked() for lock in self.locks._locks),  # noqa: SLF001
+        )
+        super().commit()
+
+
+def test_holds_one_product_lock_at_a_time() -> None:
+    """Test only the lock of the product being committed is held."""
+    locks: StripedLock = StripedLock()
+    unit_of_work: LockCountingAllocationUOWMock = (
+        LockCountingAllocationUOWMock(locks).add_products(
+            "BLUE-VASE",
+            "RED-CHAIR",
+        )
+    )
+
+    AllocationAppService(locks=locks).allocate_lines(
+        order_lines=[
+            OrderLine("order-001", "BLUE-VASE", 1),
+            OrderLine("order-002", "RED-CHAIR", 1),
+        ],
+        unit_of_work=unit_of_work,
+    )
+
+    assert unit_of_work.held == [1, 1]
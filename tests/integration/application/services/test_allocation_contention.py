@@ -0,0 +1,118 @@
+"""Allocation application service contention tests."""
+
+from concurrent.futures import ThreadPoolExecutor
+from time import sleep
+
+from src.application.services.allocation import AllocationAppService
+from src.application.utils.striped_lock import StripedLock
+from src.domain.aggregates.product import Product
+from src.domain.entities.batch import Batch
+from src.domain.exceptions.out_of_stock import OutOfStockError
+from tests.mocks.infrastructure.uow.allocation import AllocationUOWMock
+
+HOT_STOCK_KEEPING_UNIT: str = "HOT-SNEAKERS"
+HOT_QUANTITY: int = 20
+COLD_STOCK_KEEPING_UNITS: tuple[str, ...] = tuple(
+    f"COLD-SOCKS-{index}" for index in range(8)
+)
+
+
+class SlowAllocationUOWMock(AllocationUOWMock):
+    """Allocation unit of work mock with a slow commit."""
+
+    def commit(self) -> None:
+        """Commit changes."""
+        sleep(0.001)
+        super().commit()
+
+
+def add_product(
+    unit_of_work: AllocationUOWMock,
+    stock_keeping_unit: str,
+    quantity: int,
+) -> None:
+    """Add product with a single batch.
+
+    Args:
+        unit_of_work (AllocationUOWMock): unit of work.
+        stock_keeping_unit (str): stock keeping unit.
+        quantity (int): batch quantity.
+
+    """
+    unit_of_work.products.add(
+        Product(
+            stock_keeping_unit=stock_keeping_unit,
+            batches=[
+                Batch(
+                    reference=f"batch-{stock_keeping_unit}",
+                    stock_keeping_unit=stock_keeping_unit,
+                    quantity=quantity,
+                    estimated_arrival_time=None,
+                ),
+            ],
+        )
+    )
+
+
+def test_mixed_hot_and_cold_traffic_does_not_oversell() -> None:
+    """Test concurrent allocations on a hot SKU never oversell it."""
+    unit_of_work: SlowAllocationUOWMock = SlowAllocationUOWMock()
+    add_product(unit_of_work, HOT_STOCK_KEEPING_UNIT, HOT_QUANTITY)
+
+    for stock_keeping_unit in COLD_STOCK_KEEPING_UNITS:
+        add_product(unit_of_work, stock_keeping_unit, 1000)
+
+    allocation_app_service: AllocationAppService = AllocationAppService(
+        locks=StripedLock(stripes=16),
+    )
+    requests: list[str] = [
+        HOT_STOCK_KEEPING_UNIT
+        if index % 2
+        else COLD_STOCK_KEEPING_UNITS[index % len(COLD_STOCK_KEEPING_UNITS)]
+        for index in range(200)
+    ]
+
+    def allocate(index: int) -> bool:
+        try:
+            allocation_app_service.allocate(
+                order_id=f"order-{index}",
+                stock_keeping_unit=requests[index],
+                quantity=1,
+                unit_of_work=unit_of_work,
+            )
+        except OutOfStockError:
+            return False
+
+        return True
+
+    with ThreadPoolExecutor(max_workers=16) as pool:
+        allocated: list[bool] = list(pool.map(allocate, range(len(requests))))
+
+    hot_allocated: int = sum(
+        is_allocated
+        for is_allocated, stock_keeping_unit in zip(
+            allocated,
+            requests,
+            strict=True,
+        )
+        if stock_keeping_unit == HOT_STOCK_KEEPING_UNIT
+    )
+    hot_product: Product | None = unit_of_work.products.get(
+        HOT_STOCK_KEEPING_UNIT,
+    )
+
+    assert hot_allocated == HOT_QUANTITY
+    assert hot_product is not None
+    assert hot_product.batches[0].available_quantity == 0
+    assert all(
+        is_allocated
+        for is_allocated, stock_keeping_unit in zip(
+            allocated,
+            requests,
+            strict=True,
+        )
+        if stock_keeping_unit != HOT_STOCK_KEEPING_UNIT
+    )
+    assert allocation_app_service.locks.statistics().acquisitions == len(
+        requests
+    )
@@ -0,0 +1,191 @@
+"""Whole order allocation application service tests."""
+
+from concurrent.futures import ThreadPoolExecutor, wait
+from random import Random
+from typing import TYPE_CHECKING
+
+import pytest
+
+from src.application.services.allocation import (
+    AllocationAppService,
+    InvalidSKUError,
+)
+from src.domain.aggregates.product import Product
+from src.domain.entities.batch import Batch
+from src.domain.exceptions.out_of_stock import OutOfStockError
+from src.domain.value_objects.order_line import OrderLine
+from src.infrastructure.repositories.sql_repository.in_memory import (
+    InMemoryStorage,
+)
+from src.infrastructure.uow.allocation.in_memory_allocation import (
+    InMemoryAllocationUOW,
+)
+
+if TYPE_CHECKING:
+    from concurrent.futures import Future
+
+STOCK_KEEPING_UNITS: tuple[str, ...] = tuple(
+    f"SKU-{index}" for index in range(6)
+)
+QUANTITY: int = 50
+
+
+@pytest.fixture
+def storage() -> InMemoryStorage:
+    """Create storage with one batch per product.
+
+    Returns:
+        InMemoryStorage: storage.
+
+    """
+    return InMemoryStorage(
+        Product(
+            stock_keeping_unit=stock_keeping_unit,
+            batches=[
+                Batch(
+                    reference=f"batch-{stock_keeping_unit}",
+                    stock_keeping_unit=stock_keeping_unit,
+                    quantity=QUANTITY,
+                    estimated_arrival_time=None,
+                ),
+            ],
+        )
+        for stock_keeping_unit in STOCK_KEEPING_UNITS
+    )
+
+
+def available_quantity(
+    storage: InMemoryStorage,
+    stock_keeping_unit: str,
+) -> int:
+    """Get available quantity of a committed product.
+
+    Args:
+        storage (InMemoryStorage): storage.
+        stock_keeping_unit (str): stock keeping unit.
+
+    Returns:
+        int: available quantity.
+
+    """
+    product, _ = storage.checkout(stock_keeping_unit)
+
+    assert product is not None
+
+    return product.batches[0].available_quantity
+
+
+def test_allocates_every_line(storage: InMemoryStorage) -> None:
+    """Test batch references are returned in order lines order.
+
+    Args:
+        storage (InMemoryStorage): storage.
+
+    """
+    batch_references: list[str] = AllocationAppService().allocate_order(
+        order_lines=[
+            OrderLine("order", "SKU-2", 1),
+            OrderLine("order", "SKU-0", 2),
+        ],
+        unit_of_work=InMemoryAllocationUOW(storage),
+    )
+
+    assert batch_references == ["batch-SKU-2", "batch-SKU-0"]
+    assert available_quantity(storage, "SKU-2") == QUANTITY - 1
+    assert available_quantity(storage, "SKU-0") == QUANTITY - 2
+
+
+@pytest.mark.parametrize(
+    argnames=("order_lines", "error"),
+    argvalues=[
+        (
+            [
+                OrderLine("order", "SKU-0", 1),
+                OrderLine("order", "SKU-1", QUANTITY + 1),
+            ],
+            OutOfStockError,
+        ),
+        (
+            [
+                OrderLine("order", "SKU-0", 1),
+                OrderLine("order", "UNKNOWN", 1),
+            ],
+            InvalidSKUError,
+        ),
+    ],
+)
+def test_rolls_back_whole_order(
+    storage: InMemoryStorage,
+    order_lines: list[OrderLine],
+    error: type[Exception],
+) -> None:
+    """Test a failed line leaves every product untouched.
+
+    Args:
+        storage (InMemoryStorage): storage.
+        order_lines (list[OrderLine]): order lines.
+        error (type[Exception]): expected error.
+
+    """
+    with pytest.raises(error):
+        AllocationAppService().allocate_order(
+            order_lines=order_lines,
+            unit_of_work=InMemoryAllocationUOW(storage),
+        )
+
+    assert available_quantity(storage, "SKU-0") == QUANTITY
+    assert available_quantity(storage, "SKU-1") == QUANTITY
+
+
+def test_overlapping_orders_do_not_deadlock(storage: InMemoryStorage) -> None:
+    """Test concurrent multi-SKU orders finish without overselling.
+
+    Args:
+        storage (InMemoryStorage): storage.
+
+    """
+    allocation_app_service: AllocationAppService = AllocationAppService()
+    random: Random = Random(0)  # noqa: S311
+    orders: list[list[OrderLine]] = [
+        [
+            OrderLine(f"order-{index}", stock_keeping_unit, 1)
+            for stock_keeping_unit in random.sample(STOCK_KEEPING_UNITS, k=3)
+        ]
+        for index in range(200)
+    ]
+
+    def allocate(order_lines: list[OrderLine]) -> bool:
+        try:
+            allocation_app_service.allocate_order(
+                order_lines=order_lines,
+                unit_of_work=InMemoryAllocationUOW(storage),
+            )
+        except OutOfStockError:
+            return False
+
+        return True
+
+    with ThreadPoolExecutor(max_workers=16) as pool:
+        futures: list[Future[bool]] = [
+            pool.submit(allocate, order) for order in orders
+        ]
+        _, not_done = wait(futures, timeout=10)
+
+        assert not not_done
+
+    allocated: list[list[OrderLine]] = [
+        order
+        for order, future in zip(orders, futures, strict=True)
+        if future.result()
+    ]
+
+    for stock_keeping_unit in STOCK_KEEPING_UNITS:
+        assert available_quantity(storage, stock_keeping_unit) == (
+            QUANTITY
+            - sum(
+                order_line.stock_keeping_unit == stock_keeping_unit
+                for order in allocated
+                for order_line in order
+            )
+        )
+        assert available_quantity(storage, stock_keeping_unit) >= 0
@@ -0,0 +1,133 @@
+"""Availability application service tests."""
+
+from collections.abc import Callable
+from datetime import date
+
+import pytest
+from sqlalchemy.orm import Session
+
+from src.application.services.add import AddAppService
+from src.application.services.allocation import (
+    AllocationAppService,
+    InvalidSKUError,
+)
+from src.application.services.availability import (
+    AvailabilityAppService,
+    BatchAvailability,
+    ProductAvailability,
+)
+from src.infrastructure.uow.allocation.postgresql_allocation import (
+    PostgresqlAllocationUOW,
+)
+
+
+@pytest.fixture
+def availability_app_service() -> AvailabilityAppService:
+    """Create availability app service.
+
+    Returns:
+        AvailabilityAppService: availability app service.
+
+    """
+    return AvailabilityAppService()
+
+
+def test_availability_per_batch_and_total(
+    availability_app_service: AvailabilityAppService,
+    session_factory: Callable[[], Session],
+) -> None:
+    """Test availability lists batches in allocation order with a total.
+
+    Args:
+        availability_app_service (AvailabilityAppService): service.
+        session_factory (Callable[[], Session]): session factory.
+
+    """
+    AddAppService().add_batches(
+        batches=[
+            ("later", "RED-CHAIR", 20, date(2011, 1, 2)),
+            ("earlier", "RED-CHAIR", 10, date(2011, 1, 1)),
+        ],
+        unit_of_work=PostgresqlAllocationUOW(session_factory),
+    )
+    AllocationAppService().allocate(
+        order_id="order",
+        stock_keeping_unit="RED-CHAIR",
+        quantity=4,
+        unit_of_work=PostgresqlAllocationUOW(session_factory),
+    )
+
+    availability: ProductAvailability = availability_app_service.availability(
+        stock_keeping_unit="RED-CHAIR",
+        unit_of_work=PostgresqlAllocationUOW(session_factory),
+    )
+
+    assert availability.batches == (
+        BatchAvailability("earlier", 6, date(2011, 1, 1)),
+        BatchAvailability("later", 20, date(2011, 1, 2)),
+    )
+    assert availability.available_quantity == 26  # noqa: PLR2004
+    assert availability.version_number == availability_app_service.version(
+        stock_keeping_unit="RED-CHAIR",
+        unit_of_work=PostgresqlAllocationUOW(session_factory),
+    )
+
+
+def test_version_changes_with_availability(
+    availability_app_service: AvailabilityAppService,
+    session_factory: Callable[[], Session],
+) -> None:
+    """Test adding a batch and allocating both bump the version number.
+
+    Args:
+        availability_app_service (AvailabilityAppService): service.
+        session_factory (Callable[[], Session]): session factory.
+
+    """
+
+    def version() -> int | None:
+        return availability_app_service.version(
+            stock_keeping_unit="RED-CHAIR",
+            unit_of_work=PostgresqlAllocationUOW(session_factory),
+        )
+
+    assert version() is None
+
+    AddAppService().add_batch(
+        batch=("b1", "RED-CHAIR", 10, None),
+        unit_of_work=PostgresqlAllocationUOW(session_factory),
+    )
+    added: int | None = version()
+
+    AddAppService().add_batch(
+        batch=("b2", "RED-CHAIR", 10, None),
+        unit_of_work=PostgresqlAllocationUOW(session_factory),
+    )
+    restocked: int | None = version()
+
+    AllocationAppService().allocate(
+        order_id="order",
+        stock_keeping_unit="RED-CHAIR",
+        quantity=1,
+        unit_of_work=PostgresqlAllocationUOW(session_factory),
+    )
+
+    assert len({added, restocked, version()}) == 3  # noqa: PLR2004
+
+
+def test_availability_of_unknown_sku(
+    availability_app_service: AvailabilityAppService,
+    session_factory: Callable[[], Session],
+) -> None:
+    """Test availability of an unknown product raises.
+
+    Args:
+        availability_app_service (AvailabilityAppService): service.
+        session_factory (Callable[[], Session]): session factory.
+
+    """
+    with pytest.raises(InvalidSKUError, match="UNKNOWN"):
+        availability_app_service.availability(
+            stock_keeping_unit="UNKNOWN",
+            unit_of_work=PostgresqlAllocationUOW(session_factory),
+        )
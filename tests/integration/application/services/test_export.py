@@ -0,0 +1,114 @@
+"""Export application service tests."""
+
+from collections.abc import Callable, Generator
+
+import pytest
+from sqlalchemy.orm import Session
+
+from src.application.services.add import AddAppService
+from src.application.services.allocation import (
+    AllocationAppService,
+    InvalidSKUError,
+)
+from src.application.services.export import ExportAppService
+from src.domain.value_objects.allocation import Allocation
+from src.domain.value_objects.order_line import OrderLine
+from src.infrastructure.uow.allocation.postgresql_allocation import (
+    PostgresqlAllocationUOW,
+)
+
+
+@pytest.fixture
+def stocked(session_factory: Callable[[], Session]) -> None:
+    """Add two products and allocate five order lines of one of them.
+
+    Args:
+        session_factory (Callable[[], Session]): session factory.
+
+    """
+    AddAppService().add_batches(
+        batches=[
+            ("b1", "RED-CHAIR", 4, None),
+            ("b2", "RED-CHAIR", 10, None),
+            ("b3", "BLUE-VASE", 10, None),
+        ],
+        unit_of_work=PostgresqlAllocationUOW(session_factory),
+    )
+    AllocationAppService().allocate_lines(
+        order_lines=[
+            OrderLine(f"order-{index}", "RED-CHAIR", 2) for index in range(5)
+        ]
+        + [OrderLine("other", "BLUE-VASE", 1)],
+        unit_of_work=PostgresqlAllocationUOW(session_factory),
+    )
+
+
+@pytest.mark.usefixtures("stocked")
+def test_export_streams_allocations_in_order(
+    session_factory: Callable[[], Session],
+) -> None:
+    """Test every allocation of the product is streamed in order.
+
+    Args:
+        session_factory (Callable[[], Session]): session factory.
+
+    """
+    allocations: list[Allocation] = list(
+        ExportAppService().allocations(
+            stock_keeping_unit="RED-CHAIR",
+            unit_of_work=PostgresqlAllocationUOW(session_factory),
+        ),
+    )
+
+    assert allocations == [
+        Allocation(
+            order_id=f"order-{index}",
+            stock_keeping_unit="RED-CHAIR",
+            quantity=2,
+            batch_reference="b1" if index < 2 else "b2",  # noqa: PLR2004
+        )
+        for index in range(5)
+    ]
+
+
+@pytest.mark.usefixtures("stocked")
+def test_export_of_product_without_allocations(
+    session_factory: Callable[[], Session],
+) -> None:
+    """Test a known product without allocations streams nothing.
+
+    Args:
+        session_factory (Callable[[], Session]): session factory.
+
+    """
+    AddAppService().add_batch(
+        batch=("b4", "GREEN-LAMP", 1, None),
+        unit_of_work=PostgresqlAllocationUOW(session_factory),
+    )
+
+    assert not list(
+        ExportAppService().allocations(
+            stock_keeping_unit="GREEN-LAMP",
+            unit_of_work=PostgresqlAllocationUOW(session_factory),
+        ),
+    )
+
+
+def test_export_of_unknown_sku(
+    session_factory: Callable[[], Session],
+) -> None:
+    """Test streaming an unknown product raises on first iteration.
+
+    Args:
+        session_factory (Callable[[], Session]): session factory.
+
+    """
+    allocations: Generator[Allocation, None, None] = (
+        ExportAppService().allocations(
+            stock_keeping_unit="UNKNOWN",
+            unit_of_work=PostgresqlAllocationUOW(session_factory),
+        )
+    )
+
+    with pytest.raises(InvalidSKUError, match="UNKNOWN"):
+        next(allocations)
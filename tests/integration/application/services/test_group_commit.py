@@ -0,0 +1,118 @@
+"""Group commit allocation application service tests."""
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from src.application.services.allocation import InvalidSKUError
+from src.application.services.group_commit import (
+    GroupCommitAllocationExecutor,
+)
+from src.domain.exceptions.out_of_stock import OutOfStockError
+from tests.mocks.infrastructure.uow.allocation import (
+    CountingAllocationUOWMock,
+)
+
+if TYPE_CHECKING:
+    from concurrent.futures import Future
+
+
+@pytest.fixture
+def unit_of_work() -> CountingAllocationUOWMock:
+    """Create unit of work with two products.
+
+    Returns:
+        CountingAllocationUOWMock: unit of work.
+
+    """
+    return CountingAllocationUOWMock().add_products(
+        "BLUE-VASE",
+        "RED-CHAIR",
+    )
+
+
+def test_coalesces_allocations_into_one_commit(
+    unit_of_work: CountingAllocationUOWMock,
+) -> None:
+    """Test allocations of one window are committed together.
+
+    Args:
+        unit_of_work (CountingAllocationUOWMock): unit of work.
+
+    """
+    executor: GroupCommitAllocationExecutor = GroupCommitAllocationExecutor(
+        unit_of_work_factory=lambda: unit_of_work,
+        window=1,
+        max_batch_size=3,
+    )
+
+    futures: list[Future[str]] = [
+        executor.submit("order-001", "BLUE-VASE", 4),
+        executor.submit("order-002", "RED-CHAIR", 4),
+        executor.submit("order-003", "BLUE-VASE", 4),
+    ]
+
+    with executor:
+        references: list[str] = [future.result() for future in futures]
+
+    assert references == [
+        "batch-BLUE-VASE",
+        "batch-RED-CHAIR",
+        "batch-BLUE-VASE",
+    ]
+    assert unit_of_work.commits == 1
+
+
+def test_reports_errors_per_caller(
+    unit_of_work: CountingAllocationUOWMock,
+) -> None:
+    """Test failed allocations don't affect the rest of the group.
+
+    Args:
+        unit_of_work (CountingAllocationUOWMock): unit of work.
+
+    """
+    executor: GroupCommitAllocationExecutor = GroupCommitAllocationExecutor(
+        unit_of_work_factory=lambda: unit_of_work,
+        window=1,
+        max_batch_size=3,
+    )
+
+    allocated: Future[str] = executor.submit("order-001", "BLUE-VASE", 8)
+    out_of_stock: Future[str] = executor.submit("order-002", "BLUE-VASE", 8)
+    invalid_sku: Future[str] = executor.submit("order-003", "NO-SKU", 1)
+
+    with executor:
+        assert allocated.result() == "batch-BLUE-VASE"
+
+        with pytest.raises(OutOfStockError):
+            out_of_stock.result()
+
+        with pytest.raises(InvalidSKUError, match="Invalid SKU: NO-SKU"):
+            invalid_sku.result()
+
+    assert unit_of_work.commits == 1
+
+
+def test_allocate_starts_worker(
+    unit_of_work: CountingAllocationUOWMock,
+) -> None:
+    """Test allocating without starting the executor doesn't block.
+
+    Args:
+        unit_of_work (CountingAllocationUOWMock): unit of work.
+
+    """
+    executor: GroupCommitAllocationExecutor = GroupCommitAllocationExecutor(
+        unit_of_work_factory=lambda: unit_of_work,
+        window=0,
+    )
+
+    try:
+        assert (
+            executor.allocate("order-001", "BLUE-VASE", 4) == "batch-BLUE-VASE"
+        )
+    finally:
+        executor.stop()
+
+    assert unit_of_work.commits == 1
@@ -0,0 +1,136 @@
+"""Tests for streaming sync application service."""
+
+from pathlib import Path
+from random import Random
+
+import pytest
+
+from src.application.services.streaming_sync import StreamingSyncAppService
+from src.domain.services.reader import Reader
+from src.domain.services.sync import SyncService
+from src.domain.value_objects.file_system_command import FileSystemCommand
+from src.domain.value_objects.file_system_command_action import (
+    FileSystemCommandAction,
+)
+from src.infrastructure.repositories.file_system.fake_file_system import (
+    FakeFileSystem,
+)
+
+
+def apply(
+    commands: list[FileSystemCommand],
+    source: dict[str, str],
+    destination: dict[str, str],
+) -> dict[str, str]:
+    """Run commands on folders held as hashes by file name.
+
+    Args:
+        commands (list[FileSystemCommand]): commands.
+        source (dict[str, str]): source hashes by file name.
+        destination (dict[str, str]): destination hashes by file name.
+
+    Returns:
+        dict[str, str]: destination hashes by file name after the commands.
+
+    """
+    files: dict[str, str] = dict(destination)
+
+    for command in commands:
+        name: str = command.source.name
+        target: str = (
+            "" if command.destination is None else (command.destination.name)
+        )
+
+        if command.command == FileSystemCommandAction.copy:
+            files[target] = source[name]
+
+        elif command.command == FileSystemCommandAction.move:
+            files[target] = files.pop(name)
+
+        else:
+            del files[name]
+
+    return files
+
+
+@pytest.mark.parametrize(
+    argnames=("source", "destination"),
+    argvalues=[
+        ({"sha1": "my-file"}, {}),
+        ({"sha1": "renamed-file"}, {"sha1": "original-file"}),
+    ],
+)
+def test_streaming_sync_matches_sync_service(
+    source: dict[str, str],
+    destination: dict[str, str],
+    tmp_path: Path,
+) -> None:
+    """Test streaming sync issues the sync service's commands.
+
+    Args:
+        source (dict[str, str]): source content.
+        destination (dict[str, str]): destination content.
+        tmp_path (Path): temporary folder.
+
+    """
+    reader: Reader = Reader(source=source, destination=destination)
+    expected: FakeFileSystem = FakeFileSystem()
+    actual: FakeFileSystem = FakeFileSystem()
+
+    SyncService().sync(reader, expected, "/source", "/destination")
+    StreamingSyncAppService(buffer_size=1, directory=str(tmp_path)).sync(
+        reader,
+        actual,
+        "/source",
+        "/destination",
+    )
+
+    assert actual.history() == expected.history()
+
+
+@pytest.mark.parametrize(argnames="seed", argvalues=range(20))
+def test_streaming_sync_reaches_sync_service_result(
+    seed: int,
+    tmp_path: Path,
+) -> None:
+    """Test streaming plan leaves the destination as the in memory one.
+
+    Args:
+        seed (int): random seed.
+        tmp_path (Path): temporary folder.
+
+    """
+    random: Random = Random(seed)  # noqa: S311
+    names: list[str] = [f"file-{index}" for index in range(12)]
+    source: dict[str, str] = {
+        f"sha{index}": name
+        for index, name in enumerate(random.sample(names, 8))
+    }
+    destination: dict[str, str] = {
+        f"sha{index + 4}": name
+        for index, name in enumerate(random.sample(names, 8))
+    }
+    expected_files: dict[str, str] = {
+        name: hash_value for hash_value, name in source.items()
+    }
+
+    streamed: list[FileSystemCommand] = list(
+        StreamingSyncAppService(buffer_size=3, directory=str(tmp_path)).plan(
+            source.items(),
+            destination.items(),
+            "/source",
+            "/destination",
+        )
+    )
+    planned: list[FileSystemCommand] = list(
+        SyncService()
+        .plan(source, destination, "/source", "/destination")
+        .commands
+    )
+    destination_files: dict[str, str] = {
+        name: hash_value for hash_value, name in destination.items()
+    }
+
+    assert apply(streamed, expected_files, destination_files) == expected_files
+    assert apply(planned, expected_files, destination_files) == expected_files
+    assert list(tmp_path.iterdir()) == []
@@ -0,0 +1,93 @@
+"""Idempotency cache retry storm tests."""
+
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from threading import Barrier
+
+from sqlalchemy import Engine, create_engine
+from sqlalchemy.orm import sessionmaker
+
+from src.application.services.allocation import AllocationAppService
+from src.application.utils.idempotency_cache import (
+    IdempotencyCache,
+    IdempotencyStatistics,
+)
+from src.domain.aggregates.product import Product
+from src.domain.entities.batch import Batch
+from src.domain.value_objects.stored_response import StoredResponse
+from src.infrastructure.repositories.sql_repository.idempotency import (
+    SQLIdempotencyStore,
+)
+from src.infrastructure.repositories.sql_repository.in_memory import (
+    InMemoryStorage,
+)
+from src.infrastructure.repositories.sql_repository.postgresql import metadata
+from src.infrastructure.uow.allocation.in_memory_allocation import (
+    InMemoryAllocationUOW,
+)
+
+RETRIES: int = 32
+
+
+def test_retry_storm_allocates_once(tmp_path: Path) -> None:
+    """Test concurrent retries of one request allocate once.
+
+    Args:
+        tmp_path (Path): temporary directory.
+
+    """
+    engine: Engine = create_engine(f"sqlite:///{tmp_path / 'keys.db'}")
+    metadata.create_all(engine)
+    cache: IdempotencyCache = IdempotencyCache(
+        store=SQLIdempotencyStore(session_factory=sessionmaker(engine)),
+    )
+    storage: InMemoryStorage = InMemoryStorage(
+        [
+            Product(
+                stock_keeping_unit="RED-CHAIR",
+                batches=[
+                    Batch(
+                        reference="batch-001",
+                        stock_keeping_unit="RED-CHAIR",
+                        quantity=100,
+                        estimated_arrival_time=None,
+                    ),
+                ],
+            ),
+        ],
+    )
+    allocation_app_service: AllocationAppService = AllocationAppService()
+    barrier: Barrier = Barrier(RETRIES)
+
+    def allocate() -> StoredResponse:
+        batch_reference: str = allocation_app_service.allocate(
+            order_id="order-001",
+            stock_keeping_unit="RED-CHAIR",
+            quantity=10,
+            unit_of_work=InMemoryAllocationUOW(storage),
+        )
+
+        return StoredResponse(status_code=201, body=batch_reference.encode())
+
+    def retry() -> tuple[StoredResponse, bool]:
+        barrier.wait()
+
+        return cache.get_or_run("order-001", allocate)
+
+    with ThreadPoolExecutor(max_workers=RETRIES) as pool:
+        results: list[tuple[StoredResponse, bool]] = list(
+            pool.map(lambda _: retry(), range(RETRIES)),
+        )
+
+    product, _ = storage.checkout("RED-CHAIR")
+
+    assert product is not None
+    assert product.batches[0].available_quantity == 90  # noqa: PLR2004
+    assert {response for response, _ in results} == {
+        StoredResponse(status_code=201, body=b"batch-001"),
+    }
+    assert sum(not replayed for _, replayed in results) == 1
+    assert cache.statistics() == IdempotencyStatistics(
+        memory_hits=RETRIES - 1,
+        misses=1,
+    )
@@ -0,0 +1,109 @@
+"""Tests for block delta."""
+
+import os
+import random
+
+import pytest
+
+from src.infrastructure.repositories.file_system.block_delta import (
+    DeltaOperation,
+    block_delta,
+    block_signatures,
+)
+
+BLOCK_SIZE: int = 256
+
+
+def delta(old: bytes, new: bytes) -> list[DeltaOperation]:
+    """Get writes turning old content into new content.
+
+    Args:
+        old (bytes): old content.
+        new (bytes): new content.
+
+    Returns:
+        list[DeltaOperation]: writes.
+
+    """
+    return list(
+        block_delta(new, block_signatures(old, BLOCK_SIZE), BLOCK_SIZE)
+    )
+
+
+def apply(old: bytes, new: bytes, operations: list[DeltaOperation]) -> bytes:
+    """Apply writes in order to a copy of the old content.
+
+    Args:
+        old (bytes): old content.
+        new (bytes): new content, literal data is read from.
+        operations (list[DeltaOperation]): writes.
+
+    Returns:
+        bytes: updated content, cut to the new size.
+
+    """
+    content: bytearray = bytearray(old)
+
+    for operation in operations:
+        end: int = operation.offset + operation.length
+        content[operation.offset : end] = (
+            new[operation.offset : end]
+            if operation.source is None
+            else content[
+                operation.source : operation.source + operation.length
+            ]
+        )
+
+    return bytes(content[: len(new)])
+
+
+def test_block_delta_writes_changed_block() -> None:
+    """Test an edit inside a block only writes that block."""
+    old: bytes = os.urandom(8 * BLOCK_SIZE)
+    new: bytes = old[:1000] + b"edit" + old[1004:]
+
+    assert delta(old, new) == [
+        DeltaOperation(3 * BLOCK_SIZE, BLOCK_SIZE),
+    ]
+
+
+def test_block_delta_reads_later_blocks() -> None:
+    """Test a block found later in the old file is read from there."""
+    old: bytes = os.urandom(4 * BLOCK_SIZE)
+    new: bytes = old[2 * BLOCK_SIZE : 3 * BLOCK_SIZE] + old[BLOCK_SIZE:]
+
+    assert delta(old, new) == [
+        DeltaOperation(0, BLOCK_SIZE, 2 * BLOCK_SIZE),
+    ]
+
+
+@pytest.mark.parametrize(argnames="seed", argvalues=range(20))
+def test_block_delta_rebuilds_new_content(seed: int) -> None:
+    """Test applying a delta in place gives the new content.
+
+    Args:
+        seed (int): random seed.
+
+    """
+    generator: random.Random = random.Random(seed)  # noqa: S311
+    old: bytes = generator.randbytes(generator.randrange(1, 16 * BLOCK_SIZE))
+    new: bytearray = bytearray(old)
+
+    for _ in range(3):
+        offset: int = generator.randrange(len(new) + 1)
+        length: int = generator.randrange(1, 2 * BLOCK_SIZE)
+        kind: int = generator.randrange(3)
+
+        if kind == 0:
+            new[offset:offset] = generator.randbytes(length)
+        elif kind == 1:
+            del new[offset : offset + length]
+        else:
+            new[offset : offset + length] = generator.randbytes(length)
+
+    operations: list[DeltaOperation] = delta(old, bytes(new))
+
+    assert [operation.offset for operation in operations] == sorted(
+        operation.offset for operation in operations
+    )
+    assert apply(old, bytes(new), operations) == new
@@ -0,0 +1,146 @@
+"""Tests for file system command log."""
+
+import tracemalloc
+from collections.abc import Callable
+from pathlib import Path
+
+import pytest
+
+from src.domain.value_objects.file_system_command import FileSystemCommand
+from src.domain.value_objects.file_system_command_action import (
+    FileSystemCommandAction,
+)
+from src.infrastructure.repositories.file_system.command_log import (
+    CommandLog,
+)
+
+COMMANDS: list[FileSystemCommand] = [
+    FileSystemCommand(
+        FileSystemCommandAction.copy,
+        Path("/source/folder/a"),
+        Path("/destination/folder/a"),
+    ),
+    FileSystemCommand(
+        FileSystemCommandAction.move,
+        Path("/destination/folder/b"),
+        Path("/destination/c"),
+    ),
+    FileSystemCommand(
+        FileSystemCommandAction.delete,
+        Path("/destination/not-utf-8-\udcff"),
+    ),
+    FileSystemCommand(FileSystemCommandAction.delete, Path("relative")),
+]
+
+
+def make_commands(count: int) -> list[FileSystemCommand]:
+    """Make copies of files spread over a hundred folders.
+
+    Args:
+        count (int): number of commands.
+
+    Returns:
+        list[FileSystemCommand]: commands.
+
+    """
+    return [
+        FileSystemCommand(
+            FileSystemCommandAction.copy,
+            Path("/source") / f"folder-{index % 100}" / f"file-{index}",
+            Path("/destination") / f"folder-{index % 100}" / f"file-{index}",
+        )
+        for index in range(count)
+    ]
+
+
+def traced_size(build: Callable[[], object]) -> int:
+    """Get bytes allocated by a build that are still held after it.
+
+    Args:
+        build (Callable[[], object]): build of the measured object.
+
+    Returns:
+        int: bytes held by the built object.
+
+    """
+    tracemalloc.start()
+
+    try:
+        before: int = tracemalloc.get_traced_memory()[0]
+        built: object = build()
+        size: int = tracemalloc.get_traced_memory()[0] - before
+        del built
+    finally:
+        tracemalloc.stop()
+
+    return size
+
+
+def test_command_log_reads_commands() -> None:
+    """Test a log reads back its commands, by index, slice and in order."""
+    log: CommandLog = CommandLog(COMMANDS)
+
+    assert len(log) == len(COMMANDS)
+    assert log == COMMANDS
+    assert list(log) == COMMANDS
+    assert log[-1] == COMMANDS[-1]
+    assert log[1:3] == COMMANDS[1:3]
+    assert log.index(COMMANDS[2]) == 2  # noqa: PLR2004
+
+    with pytest.raises(IndexError):
+        log[len(COMMANDS)]
+
+
+def test_command_log_saves_and_loads(tmp_path: Path) -> None:
+    """Test a saved log loads with the same commands and can grow.
+
+    Args:
+        tmp_path (Path): temporary folder.
+
+    """
+    CommandLog(COMMANDS[:3]).save(tmp_path / "plan")
+    loaded: CommandLog = CommandLog.load(tmp_path / "plan")
+
+    assert loaded == COMMANDS[:3]
+
+    loaded.save(tmp_path / "copy")
+
+    assert (tmp_path / "copy").read_bytes() == (tmp_path / "plan").read_bytes()
+
+    loaded.append(COMMANDS[3])
+
+    assert loaded == COMMANDS
+
+
+def test_command_log_rejects_other_files(tmp_path: Path) -> None:
+    """Test loading a file that isn't a command log raises.
+
+    Args:
+        tmp_path (Path): temporary folder.
+
+    """
+    (tmp_path / "plan").write_bytes(bytes(64))
+
+    with pytest.raises(ValueError, match="isn't a version 1 command log"):
+        CommandLog.load(tmp_path / "plan")
+
+
+def test_command_log_memory_per_command(
+    record_property: Callable[[str, object], None],
+) -> None:
+    """Test a log takes far less memory per command than a list.
+
+    Args:
+        record_property (Callable[[str, object], None]): test report
+            property recorder.
+
+    """
+    count: int = 5_000
+    before: float = traced_size(lambda: make_commands(count)) / count
+    after: float = (
+        traced_size(lambda: CommandLog(iter(make_commands(count)))) / count
+    )
+    record_property("bytes_per_command_before", round(before))
+    record_property("bytes_per_command_after", round(after))
+
+    assert after < before / 3
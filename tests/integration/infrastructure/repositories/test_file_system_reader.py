@@ -0,0 +1,193 @@
+"""Tests for file system reader."""
+
+import hashlib
+import os
+from pathlib import Path
+
+import pytest
+
+from src.infrastructure.repositories.file_system.file_system_reader import (
+    FileSystemReader,
+)
+
+
+@pytest.fixture
+def tree(tmp_path: Path) -> dict[str, bytes]:
+    """Create tree of files with nested folders, a link and an empty file.
+
+    Args:
+        tmp_path (Path): temporary folder.
+
+    Returns:
+        dict[str, bytes]: content by file name.
+
+    """
+    content: dict[str, bytes] = {
+        "top": b"top",
+        "empty": b"",
+        "a/nested": os.urandom(10_000),
+        "a/b/deep": os.urandom(100_000),
+    }
+
+    for name, data in content.items():
+        (tmp_path / name).parent.mkdir(parents=True, exist_ok=True)
+        (tmp_path / name).write_bytes(data)
+
+    (tmp_path / "link").symlink_to(tmp_path / "top")
+    (tmp_path / "a" / "linked").symlink_to(tmp_path / "a" / "b")
+
+    return content
+
+
+@pytest.mark.parametrize(
+    argnames=("chunk_size", "mmap_threshold"),
+    argvalues=[(1024 * 1024, 1024 * 1024), (7, 1024 * 1024), (7, 1)],
+)
+def test_reader_hashes_regular_files(
+    tmp_path: Path,
+    tree: dict[str, bytes],
+    chunk_size: int,
+    mmap_threshold: int,
+) -> None:
+    """Test reader hashes regular files of subfolders, not links.
+
+    Args:
+        tmp_path (Path): temporary folder.
+        tree (dict[str, bytes]): content by file name.
+        chunk_size (int): bytes read at once.
+        mmap_threshold (int): size from which files are mapped.
+
+    """
+    reader: FileSystemReader = FileSystemReader(
+        workers=2,
+        batch_size=1,
+        chunk_size=chunk_size,
+        mmap_threshold=mmap_threshold,
+    )
+
+    assert reader.get_hashes(str(tmp_path)) == {
+        hashlib.sha256(data).hexdigest(): name for name, data in tree.items()
+    }
+
+
+def test_reader_keeps_first_name_of_same_content(tmp_path: Path) -> None:
+    """Test reader keeps the first sorted name of files with same content.
+
+    Args:
+        tmp_path (Path): temporary folder.
+
+    """
+    for name in ("c", "a", "b"):
+        (tmp_path / name).write_bytes(b"same")
+
+    assert FileSystemReader().get_hashes(str(tmp_path)) == {
+        hashlib.sha256(b"same").hexdigest(): "a",
+    }
+
+
+def test_reader_names_every_file_of_same_content(tmp_path: Path) -> None:
+    """Test names include every file, not one per content.
+
+    Args:
+        tmp_path (Path): temporary folder.
+
+    """
+    for name in ("c", "a", "b"):
+        (tmp_path / name).write_bytes(b"same")
+
+    assert sorted(FileSystemReader().get_names(str(tmp_path))) == [
+        "a",
+        "b",
+        "c",
+    ]
+
+
+def test_reader_scan_sorts_files(
+    tmp_path: Path,
+    tree: dict[str, bytes],
+) -> None:
+    """Test scan finds files with their sizes, sorted by name.
+
+    Args:
+        tmp_path (Path): temporary folder.
+        tree (dict[str, bytes]): content by file name.
+
+    """
+    assert [
+        (file.name, file.size)
+        for file in FileSystemReader().scan(str(tmp_path))
+    ] == sorted((name, len(data)) for name, data in tree.items())
+
+
+def test_reader_rejects_unknown_algorithm() -> None:
+    """Test reader rejects an algorithm hashlib doesn't have."""
+    with pytest.raises(ValueError, match="Unknown hash algorithm"):
+        FileSystemReader(algorithm="unknown")
+
+
+def overwrite_keeping_stat(path: Path, data: bytes) -> None:
+    """Overwrite file with data of the same size, keeping its times.
+
+    Args:
+        path (Path): file path.
+        data (bytes): new content.
+
+    """
+    status: os.stat_result = path.stat()
+    path.write_bytes(data)
+    os.utime(path, ns=(status.st_atime_ns, status.st_mtime_ns))
+
+
+def test_reader_cache_skips_unchanged_files(tmp_path: Path) -> None:
+    """Test a cached file is not read again until its stat changes.
+
+    Args:
+        tmp_path (Path): temporary folder.
+
+    """
+    tree: Path = tmp_path / "tree"
+    tree.mkdir()
+    (tree / "file").write_bytes(b"old")
+    reader: FileSystemReader = FileSystemReader(
+        cache_folder=str(tmp_path / "cache"),
+        racy_window=0,
+    )
+    old: dict[str, str] = {hashlib.sha256(b"old").hexdigest(): "file"}
+
+    assert reader.get_hashes(str(tree)) == old
+
+    overwrite_keeping_stat(tree / "file", b"new")
+    (tree / "file").rename(tree / "renamed")
+
+    assert reader.get_hashes(str(tree)) == {
+        hashlib.sha256(b"old").hexdigest(): "renamed",
+    }
+
+    os.utime(tree / "renamed", ns=(0, 0))
+
+    assert reader.get_hashes(str(tree)) == {
+        hashlib.sha256(b"new").hexdigest(): "renamed",
+    }
+
+
+def test_reader_cache_ignores_racy_files(tmp_path: Path) -> None:
+    """Test a file modified just before the scan is not cached.
+
+    Args:
+        tmp_path (Path): temporary folder.
+
+    """
+    tree: Path = tmp_path / "tree"
+    tree.mkdir()
+    (tree / "file").write_bytes(b"old")
+    reader: FileSystemReader = FileSystemReader(
+        cache_folder=str(tmp_path / "cache"),
+        racy_window=60,
+    )
+    reader.get_hashes(str(tree))
+
+    overwrite_keeping_stat(tree / "file", b"new")
+
+    assert reader.get_hashes(str(tree)) == {
+        hashlib.sha256(b"new").hexdigest(): "file",
+    }
@@ -0,0 +1,31 @@
+"""Tests for file hash cache."""
+
+from contextlib import closing
+from pathlib import Path
+
+from src.infrastructure.repositories.file_system.hash_cache import HashCache
+
+
+def test_hash_cache_persists_updates(tmp_path: Path) -> None:
+    """Test digests are stored, replaced and removed across connections.
+
+    Args:
+        tmp_path (Path): temporary folder.
+
+    """
+    path: str = str(tmp_path / "hashes.sqlite")
+
+    with closing(HashCache(path)) as cache:
+        cache.update(
+            digests={
+                (1, 10): (3, 100, "aa" * 32),
+                (1, 11): (4, 200, "bb" * 32),
+            },
+            removed=[],
+        )
+
+    with closing(HashCache(path)) as cache:
+        cache.update(digests={(1, 10): (5, 300, "cc" * 32)}, removed=[(1, 11)])
+
+    with closing(HashCache(path)) as cache:
+        assert cache.digests() == {(1, 10): (5, 300, "cc" * 32)}
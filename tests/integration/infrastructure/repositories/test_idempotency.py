@@ -0,0 +1,207 @@
+"""Tests for SQL idempotency store."""
+
+import pytest
+from sqlalchemy import Engine
+from sqlalchemy.orm import sessionmaker
+
+from src.application.utils.idempotency_cache import (
+    IdempotencyCache,
+    IdempotencyConflictError,
+    IdempotencyStatistics,
+)
+from src.domain.value_objects.idempotency_record import IdempotencyRecord
+from src.domain.value_objects.stored_response import StoredResponse
+from src.infrastructure.repositories.sql_repository.idempotency import (
+    SQLIdempotencyStore,
+)
+
+CREATED: StoredResponse = StoredResponse(status_code=201, body=b"{}")
+OTHER: StoredResponse = StoredResponse(status_code=201, body=b"[]")
+
+
+@pytest.fixture
+def store(in_memory_db: Engine) -> SQLIdempotencyStore:
+    """Create store.
+
+    Args:
+        in_memory_db (Engine): in memory db engine.
+
+    Returns:
+        SQLIdempotencyStore: store.
+
+    """
+    return SQLIdempotencyStore(session_factory=sessionmaker(in_memory_db))
+
+
+def test_store_reserves_key_once(store: SQLIdempotencyStore) -> None:
+    """Test a reserved key is held until completed, then replayed.
+
+    Args:
+        store (SQLIdempotencyStore): store.
+
+    """
+    assert store.reserve("key", "first", now=0, expires_at=10) is None
+    assert store.reserve("key", "second", now=1, expires_at=11) == (
+        IdempotencyRecord(fingerprint="first")
+    )
+
+    store.complete("key", CREATED, expires_at=20)
+
+    assert store.reserve("key", "second", now=15, expires_at=25) == (
+        IdempotencyRecord(fingerprint="first", response=CREATED)
+    )
+    assert store.get("key", now=15) == IdempotencyRecord(
+        fingerprint="first",
+        response=CREATED,
+    )
+    assert store.get("unknown", now=15) is None
+
+
+def test_store_releases_pending_key_only(store: SQLIdempotencyStore) -> None:
+    """Test release drops a reservation but keeps completed responses.
+
+    Args:
+        store (SQLIdempotencyStore): store.
+
+    """
+    store.reserve("pending", "first", now=0, expires_at=10)
+    store.reserve("completed", "first", now=0, expires_at=10)
+    store.complete("completed", CREATED, expires_at=20)
+
+    store.release("pending")
+    store.release("completed")
+
+    assert store.reserve("pending", "second", now=1, expires_at=11) is None
+    assert store.get("completed", now=1) == IdempotencyRecord(
+        fingerprint="first",
+        response=CREATED,
+    )
+
+
+def test_store_ignores_and_replaces_expired(
+    store: SQLIdempotencyStore,
+) -> None:
+    """Test an expired record is not returned and can be replaced.
+
+    Args:
+        store (SQLIdempotencyStore): store.
+
+    """
+    store.reserve("key", "first", now=0, expires_at=10)
+    store.complete("key", CREATED, expires_at=10)
+
+    assert store.get("key", now=10) is None
+    assert store.reserve("key", "second", now=10, expires_at=20) is None
+
+    store.complete("key", OTHER, expires_at=20)
+
+    assert store.get("key", now=15) == IdempotencyRecord(
+        fingerprint="second",
+        response=OTHER,
+    )
+
+
+def test_store_accepts_long_keys(store: SQLIdempotencyStore) -> None:
+    """Test keys longer than the column are stored by digest.
+
+    Args:
+        store (SQLIdempotencyStore): store.
+
+    """
+    key: str = "k" * 1000
+    store.reserve(key, "first", now=0, expires_at=10)
+    store.complete(key, CREATED, expires_at=10)
+
+    assert store.get(key, now=5) == IdempotencyRecord(
+        fingerprint="first",
+        response=CREATED,
+    )
+
+
+def test_store_purges_expired(store: SQLIdempotencyStore) -> None:
+    """Test purge deletes expired records only.
+
+    Args:
+        store (SQLIdempotencyStore): store.
+
+    """
+    store.reserve("expired", "first", now=0, expires_at=10)
+    store.reserve("fresh", "first", now=0, expires_at=20)
+
+    assert store.purge(now=10) == 1
+    assert store.get("fresh", now=10) == IdempotencyRecord(
+        fingerprint="first",
+    )
+
+
+def test_cache_replays_from_store_after_restart(
+    store: SQLIdempotencyStore,
+) -> None:
+    """Test a new cache replays responses persisted by a previous one.
+
+    Args:
+        store (SQLIdempotencyStore): store.
+
+    """
+    IdempotencyCache(store=store).get_or_run("key", lambda: CREATED)
+    cache: IdempotencyCache = IdempotencyCache(store=store)
+
+    assert cache.get_or_run("key", lambda: OTHER) == (CREATED, True)
+    assert cache.get_or_run("key", lambda: OTHER) == (CREATED, True)
+    assert cache.statistics() == IdempotencyStatistics(
+        memory_hits=1,
+        store_hits=1,
+    )
+
+
+def test_cache_rejects_key_in_flight_in_another_process(
+    store: SQLIdempotencyStore,
+) -> None:
+    """Test a cache can't run a key another cache has reserved.
+
+    Args:
+        store (SQLIdempotencyStore): store.
+
+    """
+    cache: IdempotencyCache = IdempotencyCache(store=store)
+    runs: list[StoredResponse] = []
+
+    def run() -> StoredResponse:
+        with pytest.raises(IdempotencyConflictError):
+            IdempotencyCache(store=store).get_or_run("key", lambda: OTHER)
+
+        runs.append(CREATED)
+
+        return CREATED
+
+    assert cache.get_or_run("key", run) == (CREATED, False)
+    assert runs == [CREATED]
+    assert IdempotencyCache(store=store).get_or_run("key", lambda: OTHER) == (
+        CREATED,
+        True,
+    )
+
+
+def test_cache_releases_key_of_failed_request(
+    store: SQLIdempotencyStore,
+) -> None:
+    """Test a failed request lets another process run the key again.
+
+    Args:
+        store (SQLIdempotencyStore): store.
+
+    """
+
+    def fail() -> StoredResponse:
+        msg: str = "Database is down."
+        raise RuntimeError(msg)
+
+    with pytest.raises(RuntimeError, match="Database is down"):
+        IdempotencyCache(store=store).get_or_run("key", fail)
+
+    assert IdempotencyCache(store=store).get_or_run(
+        "key", lambda: CREATED
+    ) == (
+        CREATED,
+        False,
+    )
@@ -0,0 +1,491 @@
+"""Tests for local file system."""
+
+import errno
+import os
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import pytest
+
+from src.application.utils.plan_executor import PlanExecutor
+from src.domain.services.sync import SyncService
+from src.domain.value_objects.file_system_command import FileSystemCommand
+from src.domain.value_objects.file_system_command_action import (
+    FileSystemCommandAction,
+)
+from src.infrastructure.repositories.file_system.file_system_reader import (
+    FileSystemReader,
+)
+from src.infrastructure.repositories.file_system.local_file_system import (
+    CopyStatistics,
+    LocalFileSystem,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+MEBIBYTE: int = 1024 * 1024
+
+
+def write_sparse(path: Path) -> bytes:
+    """Write file with data at both ends and a hole in between.
+
+    Args:
+        path (Path): file path.
+
+    Returns:
+        bytes: file content.
+
+    """
+    with path.open("wb") as file:
+        file.write(b"head")
+        file.seek(16 * MEBIBYTE)
+        file.write(b"tail")
+
+    return path.read_bytes()
+
+
+@pytest.mark.parametrize(argnames="zero_copy", argvalues=[True, False])
+def test_copy_keeps_content_and_stat(
+    tmp_path: Path, *, zero_copy: bool
+) -> None:
+    """Test a copy has the content, mode and times of its source.
+
+    Args:
+        tmp_path (Path): temporary folder.
+        zero_copy (bool): whether to copy inside the kernel.
+
+    """
+    source: Path = tmp_path / "source" / "file"
+    destination: Path = tmp_path / "destination" / "nested" / "file"
+    content: bytes = os.urandom(3 * MEBIBYTE + 7)
+    source.parent.mkdir()
+    source.write_bytes(content)
+    source.chmod(0o640)
+    os.utime(source, ns=(1_000_000_000, 2_000_000_000))
+
+    LocalFileSystem(buffer_size=4096, zero_copy=zero_copy).copy(
+        source, destination
+    )
+
+    assert destination.read_bytes() == content
+    assert destination.stat().st_mode == source.stat().st_mode
+    assert destination.stat().st_mtime_ns == 2_000_000_000  # noqa: PLR2004
+    assert [path.name for path in destination.parent.iterdir()] == ["file"]
+
+
+@pytest.mark.parametrize(argnames="zero_copy", argvalues=[True, False])
+def test_copy_keeps_holes(tmp_path: Path, *, zero_copy: bool) -> None:
+    """Test a sparse file is copied without allocating its hole.
+
+    Args:
+        tmp_path (Path): temporary folder.
+        zero_copy (bool): whether to copy inside the kernel.
+
+    """
+    source: Path = tmp_path / "source"
+    destination: Path = tmp_path / "destination"
+    content: bytes = write_sparse(source)
+
+    if source.stat().st_blocks * 512 >= len(content):
+        pytest.skip("File system doesn't support sparse files.")
+
+    LocalFileSystem(zero_copy=zero_copy).copy(source, destination)
+
+    assert destination.read_bytes() == content
+    assert destination.stat().st_blocks * 512 < MEBIBYTE
+
+
+def test_copy_falls_back_to_buffered(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test a copy the kernel can't do is done with buffered reads.
+
+    Args:
+        tmp_path (Path): temporary folder.
+        monkeypatch (pytest.MonkeyPatch): monkeypatch.
+
+    """
+
+    def unsupported(*_: object) -> int:
+        raise OSError(errno.EXDEV, os.strerror(errno.EXDEV))
+
+    monkeypatch.setattr(os, "copy_file_range", unsupported)
+    monkeypatch.setattr(os, "sendfile", unsupported)
+    source: Path = tmp_path / "source"
+    destination: Path = tmp_path / "destination"
+    content: bytes = os.urandom(MEBIBYTE + 1)
+    source.write_bytes(content)
+
+    LocalFileSystem(buffer_size=4096).copy(source, destination)
+
+    assert destination.read_bytes() == content
+
+
+def test_copy_failure_keeps_destination(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test a failed copy leaves the old destination and no partial file.
+
+    Args:
+        tmp_path (Path): temporary folder.
+        monkeypatch (pytest.MonkeyPatch): monkeypatch.
+
+    """
+
+    def failing(*_: object) -> int:
+        raise OSError(errno.EIO, os.strerror(errno.EIO))
+
+    monkeypatch.setattr(os, "copy_file_range", failing)
+    source: Path = tmp_path / "source"
+    destination: Path = tmp_path / "destination"
+    source.write_bytes(b"new")
+    destination.write_bytes(b"old")
+
+    with pytest.raises(OSError, match="Input/output error"):
+        LocalFileSystem().copy(source, destination)
+
+    assert destination.read_bytes() == b"old"
+    assert sorted(path.name for path in tmp_path.iterdir()) == [
+        "destination",
+        "source",
+    ]
+
+
+def test_move_renames_or_copies_across_devices(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test move renames a file, or copies and deletes it across devices.
+
+    Args:
+        tmp_path (Path): temporary folder.
+        monkeypatch (pytest.MonkeyPatch): monkeypatch.
+
+    """
+    file_system: LocalFileSystem = LocalFileSystem()
+    source: Path = tmp_path / "source"
+    destination: Path = tmp_path / "folder" / "destination"
+    source.write_bytes(b"content")
+    inode: int = source.stat().st_ino
+
+    file_system.move(source, destination)
+
+    assert not source.exists()
+    assert destination.stat().st_ino == inode
+
+    replace: Callable[[Path, Path], Path] = Path.replace
+
+    def cross_device(path: Path, target: Path) -> Path:
+        if path == destination:
+            raise OSError(errno.EXDEV, os.strerror(errno.EXDEV))
+
+        return replace(path, target)
+
+    monkeypatch.setattr(Path, "replace", cross_device)
+    file_system.move(destination, source)
+
+    assert not destination.exists()
+    assert source.read_bytes() == b"content"
+
+
+def test_sync_with_local_file_system(tmp_path: Path) -> None:
+    """Test sync service applies copy, move and delete to real folders.
+
+    Args:
+        tmp_path (Path): temporary folder.
+
+    """
+    source: Path = tmp_path / "source"
+    destination: Path = tmp_path / "destination"
+    source.mkdir()
+    destination.mkdir()
+    (source / "new").write_bytes(b"new")
+    (source / "renamed").write_bytes(b"moved")
+    (destination / "old").write_bytes(b"moved")
+    (destination / "stale").write_bytes(b"stale")
+    file_system: LocalFileSystem = LocalFileSystem()
+
+    SyncService().sync(
+        reader=FileSystemReader(),
+        file_system=file_system,
+        source=str(source),
+        destination=str(destination),
+    )
+
+    assert {
+        path.name: path.read_bytes() for path in destination.iterdir()
+    } == {"new": b"new", "renamed": b"moved"}
+    assert file_system.history() == [
+        FileSystemCommand(
+            FileSystemCommandAction.copy, source / "new", destination / "new"
+        ),
+        FileSystemCommand(
+            FileSystemCommandAction.move,
+            destination / "old",
+            destination / "renamed",
+        ),
+        FileSystemCommand(
+            FileSystemCommandAction.delete, destination / "stale"
+        ),
+    ]
+
+
+def test_plan_executor_with_local_file_system(tmp_path: Path) -> None:
+    """Test executor swaps files and replaces a deleted name concurrently.
+
+    Args:
+        tmp_path (Path): temporary folder.
+
+    """
+    source: Path = tmp_path / "source"
+    destination: Path = tmp_path / "destination"
+    source.mkdir()
+    destination.mkdir()
+    content: dict[str, bytes] = {
+        "a": b"first",
+        "b": b"second",
+        "c": b"third",
+    }
+
+    for name, data in content.items():
+        (source / name).write_bytes(data)
+
+    (destination / "a").write_bytes(b"second")
+    (destination / "b").write_bytes(b"first")
+    (destination / "c").write_bytes(b"stale")
+    reader: FileSystemReader = FileSystemReader()
+
+    PlanExecutor(workers=4).execute(
+        SyncService().plan(
+            source_hashes=reader.get_hashes(str(source)),
+            destination_hashes=reader.get_hashes(str(destination)),
+            source=str(source),
+            destination=str(destination),
+        ),
+        LocalFileSystem(),
+    )
+
+    assert {
+        path.name: path.read_bytes() for path in destination.iterdir()
+    } == content
+
+
+def test_delta_copy_writes_changed_blocks(tmp_path: Path) -> None:
+    """Test a copy over an old version rewrites only changed blocks.
+
+    Args:
+        tmp_path (Path): temporary folder.
+
+    """
+    source: Path = tmp_path / "source"
+    destination: Path = tmp_path / "destination"
+    content: bytes = os.urandom(4 * MEBIBYTE)
+    destination.write_bytes(content)
+    source.write_bytes(content[:MEBIBYTE] + b"edit" + content[MEBIBYTE + 4 :])
+    os.utime(source, ns=(1_000_000_000, 2_000_000_000))
+    inode: int = destination.stat().st_ino
+    file_system: LocalFileSystem = LocalFileSystem(
+        delta=True, delta_block_size=64 * 1024, delta_threshold=MEBIBYTE
+    )
+
+    file_system.copy(source, destination)
+
+    assert destination.read_bytes() == source.read_bytes()
+    assert destination.stat().st_ino == inode
+    assert destination.stat().st_mtime_ns == 2_000_000_000  # noqa: PLR2004
+    assert file_system.statistics() == CopyStatistics(
+        copies=1, delta_copies=1, bytes_written=64 * 1024
+    )
+
+
+@pytest.mark.parametrize(
+    argnames="shifted",
+    argvalues=[True, False],
+    ids=["shifted", "hard-linked"],
+)
+def test_delta_copy_falls_back_to_full_copy(
+    tmp_path: Path, *, shifted: bool
+) -> None:
+    """Test shifted data or a hard linked destination is copied in full.
+
+    Args:
+        tmp_path (Path): temporary folder.
+        shifted (bool): whether data is shifted, or else the destination
+            has another link.
+
+    """
+    source: Path = tmp_path / "source"
+    destination: Path = tmp_path / "destination"
+    content: bytes = os.urandom(2 * MEBIBYTE)
+    destination.write_bytes(content)
+
+    if shifted:
+        source.write_bytes(b"inserted" + content)
+    else:
+        source.write_bytes(b"edit" + content[4:])
+        (tmp_path / "link").hardlink_to(destination)
+
+    file_system: LocalFileSystem = LocalFileSystem(
+        delta=True, delta_block_size=64 * 1024, delta_threshold=MEBIBYTE
+    )
+
+    file_system.copy(source, destination)
+
+    assert destination.read_bytes() == source.read_bytes()
+    assert file_system.statistics() == CopyStatistics(
+        copies=1, delta_copies=0, bytes_written=source.stat().st_size
+    )
+
+    if not shifted:
+        assert (tmp_path / "link").read_bytes() == content
+
+
+@pytest.mark.parametrize(
+    argnames=("old", "new"),
+    argvalues=[(b"", b"content"), (b"content", b"")],
+    ids=["empty-destination", "empty-source"],
+)
+def test_delta_copy_skips_empty_files(
+    tmp_path: Path, old: bytes, new: bytes
+) -> None:
+    """Test empty files are copied in full even without a threshold.
+
+    Args:
+        tmp_path (Path): temporary folder.
+        old (bytes): destination content.
+        new (bytes): source content.
+
+    """
+    source: Path = tmp_path / "source"
+    destination: Path = tmp_path / "destination"
+    destination.write_bytes(old)
+    source.write_bytes(new)
+    file_system: LocalFileSystem = LocalFileSystem(
+        delta=True, delta_block_size=4, delta_threshold=0
+    )
+
+    file_system.copy(source, destination)
+
+    assert destination.read_bytes() == new
+    assert file_system.statistics() == CopyStatistics(
+        copies=1, delta_copies=0, bytes_written=len(new)
+    )
+
+
+def test_sync_moves_copies_and_deletes_folders(tmp_path: Path) -> None:
+    """Test sync renames, copies and deletes whole real folders.
+
+    Args:
+        tmp_path (Path): temporary folder.
+
+    """
+    source: Path = tmp_path / "source"
+    destination: Path = tmp_path / "destination"
+
+    for index in range(20):
+        for root, folder in (
+            (source, "renamed"),
+            (destination, "original"),
+            (source, "added"),
+            (destination, "stale"),
+        ):
+            path: Path = root / folder / f"sub-{index % 3}" / f"file-{index}"
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(f"{folder}-{index}".replace("original", "renamed"))
+
+    file_system: LocalFileSystem = LocalFileSystem()
+
+    SyncService().sync(
+        reader=FileSystemReader(),
+        file_system=file_system,
+        source=str(source),
+        destination=str(destination),
+    )
+
+    assert {
+        path.relative_to(destination): path.read_bytes()
+        for path in destination.rglob("*")
+        if path.is_file()
+    } == {
+        path.relative_to(source): path.read_bytes()
+        for path in source.rglob("*")
+        if path.is_file()
+    }
+    assert sorted(path.name for path in destination.iterdir()) == [
+        "added",
+        "renamed",
+    ]
+    assert len(file_system.history()) == 3  # noqa: PLR2004
+
+
+@pytest.mark.parametrize(
+    argnames=("source_files", "destination_files"),
+    argvalues=[
+        (
+            {"a/__init__.py": "", "e/mod.py": "module"},
+            {"a/__init__.py": "", "e/__init__.py": "", "old/mod.py": "module"},
+        ),
+        (
+            {"keep/b": "C2", "old/b": "C2"},
+            {"keep/b": "C2", "old/a": "C1", "old/b": "C2"},
+        ),
+    ],
+    ids=["empty files", "duplicate files"],
+)
+def test_sync_keeps_files_hidden_by_duplicates(
+    tmp_path: Path,
+    source_files: dict[str, str],
+    destination_files: dict[str, str],
+) -> None:
+    """Test folders holding files of a same content aren't collapsed.
+
+    Args:
+        tmp_path (Path): temporary folder.
+        source_files (dict[str, str]): source content by name.
+        destination_files (dict[str, str]): destination content by name.
+
+    """
+    source: Path = tmp_path / "source"
+    destination: Path = tmp_path / "destination"
+
+    for root, files in (
+        (source, source_files),
+        (destination, destination_files),
+    ):
+        for name, content in files.items():
+            (root / name).parent.mkdir(parents=True, exist_ok=True)
+            (root / name).write_text(content)
+
+    SyncService().sync(
+        reader=FileSystemReader(),
+        file_system=LocalFileSystem(),
+        source=str(source),
+        destination=str(destination),
+    )
+
+    for name, content in source_files.items():
+        assert (destination / name).read_text() == content
+
+
+def test_delete_folder_keeps_entries_readers_skip(tmp_path: Path) -> None:
+    """Test a folder delete removes regular files and emptied folders only.
+
+    Args:
+        tmp_path (Path): temporary folder.
+
+    """
+    folder: Path = tmp_path / "folder"
+    (folder / "files").mkdir(parents=True)
+    (folder / "links").mkdir()
+    (folder / "files" / "file").write_text("file")
+    (folder / "links" / "file").write_text("file")
+    (folder / "links" / "link").symlink_to(tmp_path)
+
+    LocalFileSystem().delete(folder)
+
+    assert sorted(
+        str(path.relative_to(folder)) for path in folder.rglob("*")
+    ) == ["links", "links/link"]
@@ -111,3 +111,53 @@ def test_repository_can_get_batch(
 
     if isinstance(retrieved, Product):
         assert retrieved.stock_keeping_unit == stock_keeping_unit
+
+
+def test_repository_can_get_many_products_in_order(session: Session) -> None:
+    """Test sql alchemy repository gets products sorted by SKU.
+
+    Args:
+        session (Session): sql alchemy orm session.
+
+    """
+    repository: PostgreSQLRepository = PostgreSQLRepository(session)
+
+    for stock_keeping_unit in ("RED-CHAIR", "BLUE-VASE", "GREEN-LAMP"):
+        repository.add(
+            product=Product(
+                stock_keeping_unit=stock_keeping_unit,
+                batches=[],
+            ),
+        )
+
+    session.commit()
+
+    retrieved: list[Product] = repository.get_many(
+        ["RED-CHAIR", "UNKNOWN", "BLUE-VASE", "RED-CHAIR"],
+    )
+
+    assert [product.stock_keeping_unit for product in retrieved] == [
+        "BLUE-VASE",
+        "RED-CHAIR",
+    ]
+
+
+def test_repository_can_get_version(session: Session) -> None:
+    """Test sql alchemy repository gets version number of a product.
+
+    Args:
+        session (Session): sql alchemy orm session.
+
+    """
+    repository: PostgreSQLRepository = PostgreSQLRepository(session)
+    repository.add(
+        product=Product(
+            stock_keeping_unit="RED-CHAIR",
+            batches=[],
+            version_number=7,
+        ),
+    )
+    session.commit()
+
+    assert repository.get_version("RED-CHAIR") == 7  # noqa: PLR2004
+    assert repository.get_version("UNKNOWN") is None
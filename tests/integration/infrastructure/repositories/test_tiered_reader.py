@@ -0,0 +1,133 @@
+"""Tests for tiered file system reader."""
+
+import os
+from pathlib import Path
+
+import pytest
+
+from src.domain.services.sync import SyncService
+from src.domain.value_objects.sync_plan import SyncPlan
+from src.infrastructure.repositories.file_system.file_system_reader import (
+    FileSystemReader,
+)
+from src.infrastructure.repositories.file_system.tiered_reader import (
+    TieredFileSystemReader,
+    TieredStatistics,
+)
+
+PARTIAL_SIZE: int = 16
+
+
+@pytest.fixture
+def folders(tmp_path: Path) -> tuple[str, str]:
+    """Create source and destination folders needing every tier.
+
+    Args:
+        tmp_path (Path): temporary folder.
+
+    Returns:
+        tuple[str, str]: source and destination folders.
+
+    """
+    edge: bytes = os.urandom(PARTIAL_SIZE)
+    content: dict[str, bytes] = {
+        "unique-size": os.urandom(1000),
+        "small": b"small",
+        "same-edges-1": edge + b"middle-1" + edge,
+        "same-edges-2": edge + b"middle-2" + edge,
+        "same-size": os.urandom(2 * PARTIAL_SIZE + 8),
+        "renamed": os.urandom(5000),
+        "unchanged": os.urandom(3000),
+    }
+    source: Path = tmp_path / "source"
+    destination: Path = tmp_path / "destination"
+    source.mkdir()
+    destination.mkdir()
+
+    for name, data in content.items():
+        (source / name).write_bytes(data)
+
+    (destination / "small").write_bytes(b"SMALL")
+    (destination / "same-edges-1").write_bytes(content["same-edges-1"])
+    (destination / "old-name").write_bytes(content["renamed"])
+    (destination / "unchanged").write_bytes(content["unchanged"])
+    (destination / "stale").write_bytes(os.urandom(7000))
+
+    return str(source), str(destination)
+
+
+def plan(
+    reader: FileSystemReader | TieredFileSystemReader,
+    source: str,
+    destination: str,
+) -> SyncPlan:
+    """Plan sync of folders with a reader.
+
+    Args:
+        reader (FileSystemReader | TieredFileSystemReader): reader.
+        source (str): source folder.
+        destination (str): destination folder.
+
+    Returns:
+        SyncPlan: plan.
+
+    """
+    return SyncService().plan(
+        source_hashes=reader.get_hashes(source),
+        destination_hashes=reader.get_hashes(destination),
+        source=source,
+        destination=destination,
+    )
+
+
+@pytest.mark.parametrize(
+    argnames="algorithm",
+    argvalues=["blake2b", "sha1", "sha256"],
+)
+def test_tiered_reader_plans_as_full_hashes(
+    folders: tuple[str, str],
+    algorithm: str,
+) -> None:
+    """Test tiered fingerprints plan the commands content hashes do.
+
+    Args:
+        folders (tuple[str, str]): source and destination folders.
+        algorithm (str): hashlib algorithm.
+
+    """
+    source, destination = folders
+    tiered: TieredFileSystemReader = TieredFileSystemReader(
+        folders=folders,
+        algorithm=algorithm,
+        partial_size=PARTIAL_SIZE,
+    )
+
+    assert plan(tiered, source, destination) == plan(
+        FileSystemReader(algorithm=algorithm), source, destination
+    )
+    # Sizes tell the unique size and stale files apart, partial hashes
+    # the small files and the random one of the same size, full hashes the
+    # files with the same edges and the renamed and unchanged ones.
+    assert tiered.statistics() == TieredStatistics(
+        files=12,
+        by_size=2,
+        by_partial_hash=3,
+        by_full_hash=7,
+        bytes_read=2 * 5
+        + 8 * 2 * PARTIAL_SIZE
+        + 3 * (2 * PARTIAL_SIZE + 8)
+        + 2 * (5000 + 3000),
+    )
+
+
+def test_tiered_reader_rejects_unknown_folder(
+    folders: tuple[str, str],
+) -> None:
+    """Test tiered reader only reads the folders it was given.
+
+    Args:
+        folders (tuple[str, str]): source and destination folders.
+
+    """
+    with pytest.raises(ValueError, match="isn't read"):
+        TieredFileSystemReader(folders=folders[:1]).get_hashes(folders[1])
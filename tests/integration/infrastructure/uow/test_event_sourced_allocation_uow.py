@@ -0,0 +1,328 @@
+"""Test event-sourced allocation unit of work."""
+
+from datetime import date
+from pathlib import Path
+
+import pytest
+
+from src.domain.aggregates.product import Product
+from src.domain.entities.batch import Batch
+from src.domain.value_objects.order_line import OrderLine
+from src.infrastructure.repositories.sql_repository.event_codec import (
+    EventDecodeError,
+    apply_events,
+    encode_changes,
+    encode_product,
+)
+from src.infrastructure.repositories.sql_repository.event_sourced import (
+    LOG_FILE_NAME,
+    SNAPSHOT_FILE_NAME,
+    EventSourcedStorage,
+)
+from src.infrastructure.uow.allocation.event_sourced_allocation import (
+    EventSourcedAllocationUOW,
+)
+
+STOCK_KEEPING_UNIT: str = "VINTAGE-LAMP"
+
+
+def add_batch(storage: EventSourcedStorage, reference: str) -> None:
+    """Add batch of 100 units, creating the product if needed.
+
+    Args:
+        storage (EventSourcedStorage): storage.
+        reference (str): batch reference.
+
+    """
+    with EventSourcedAllocationUOW(storage) as unit_of_work:
+        product: Product | None = unit_of_work.products.get(
+            STOCK_KEEPING_UNIT,
+        )
+
+        if product is None:
+            product = Product(
+                stock_keeping_unit=STOCK_KEEPING_UNIT, batches=[]
+            )
+            unit_of_work.products.add(product)
+
+        product.add_batch(
+            Batch(
+                reference=reference,
+                stock_keeping_unit=STOCK_KEEPING_UNIT,
+                quantity=100,
+                estimated_arrival_time=date(2011, 1, 1),
+            )
+        )
+        unit_of_work.commit()
+
+
+def allocate(storage: EventSourcedStorage, order_id: str) -> None:
+    """Allocate ten units.
+
+    Args:
+        storage (EventSourcedStorage): storage.
+        order_id (str): order id.
+
+    """
+    with EventSourcedAllocationUOW(storage) as unit_of_work:
+        product: Product | None = unit_of_work.products.get(
+            STOCK_KEEPING_UNIT,
+        )
+
+        assert product is not None
+
+        product.allocate(
+            OrderLine(
+                order_id=order_id,
+                stock_keeping_unit=STOCK_KEEPING_UNIT,
+                quantity=10,
+            )
+        )
+        unit_of_work.commit()
+
+
+def load(storage: EventSourcedStorage) -> Product:
+    """Load committed product.
+
+    Args:
+        storage (EventSourcedStorage): storage.
+
+    Returns:
+        Product: product aggregate.
+
+    """
+    with EventSourcedAllocationUOW(storage) as unit_of_work:
+        product: Product | None = unit_of_work.products.get(
+            STOCK_KEEPING_UNIT,
+        )
+
+    assert product is not None
+
+    return product
+
+
+@pytest.mark.parametrize(argnames="snapshot_every", argvalues=[0, 1, 2])
+def test_rebuilds_products_on_start(
+    tmp_path: Path,
+    snapshot_every: int,
+) -> None:
+    """Test products are rebuilt from the snapshot and the log tail.
+
+    Args:
+        tmp_path (Path): temporary directory.
+        snapshot_every (int): commits between snapshots.
+
+    """
+    storage: EventSourcedStorage = EventSourcedStorage(
+        tmp_path,
+        snapshot_every=snapshot_every,
+    )
+    add_batch(storage, "batch-001")
+    allocate(storage, "order-001")
+    allocate(storage, "order-002")
+    storage.close()
+
+    restored: EventSourcedStorage = EventSourcedStorage(tmp_path)
+    product: Product = load(restored)
+    restored.close()
+
+    assert (tmp_path / SNAPSHOT_FILE_NAME).exists() is bool(snapshot_every)
+    assert product.version_number == 3  # noqa: PLR2004
+    assert product.batches[0].estimated_arrival_time == date(2011, 1, 1)
+    assert product.batches[0].available_quantity == 80  # noqa: PLR2004
+
+
+def test_recovers_after_crash_mid_write(tmp_path: Path) -> None:
+    """Test a torn last frame is discarded and the log stays writable.
+
+    Args:
+        tmp_path (Path): temporary directory.
+
+    """
+    storage: EventSourcedStorage = EventSourcedStorage(
+        tmp_path,
+        snapshot_every=0,
+    )
+    add_batch(storage, "batch-001")
+    allocate(storage, "order-001")
+    storage.close()
+
+    # Simulate a crash that persisted the header of the last frame but not
+    # the end of its payload.
+    log_path: Path = tmp_path / LOG_FILE_NAME
+    log: bytes = log_path.read_bytes()
+    last_frame_end: int = len(log.rstrip(b"\x00"))
+
+    with log_path.open("r+b") as log_file:
+        log_file.seek(last_frame_end - 4)
+        log_file.write(bytes(4))
+
+    restored: EventSourcedStorage = EventSourcedStorage(tmp_path)
+
+    assert load(restored).batches[0].available_quantity == 100  # noqa: PLR2004
+
+    allocate(restored, "order-002")
+    restored.close()
+
+    reopened: EventSourcedStorage = EventSourcedStorage(tmp_path)
+    product: Product = load(reopened)
+    reopened.close()
+
+    assert product.batches[0].available_quantity == 90  # noqa: PLR2004
+    assert {line.order_id for line in product.batches[0].allocations} == {
+        "order-002",
+    }
+
+
+def test_ignores_corrupted_snapshot(tmp_path: Path) -> None:
+    """Test a corrupted snapshot falls back to replaying the whole log.
+
+    Args:
+        tmp_path (Path): temporary directory.
+
+    """
+    storage: EventSourcedStorage = EventSourcedStorage(
+        tmp_path,
+        snapshot_every=1,
+    )
+    add_batch(storage, "batch-001")
+    allocate(storage, "order-001")
+    storage.close()
+
+    snapshot_path: Path = tmp_path / SNAPSHOT_FILE_NAME
+    snapshot_path.write_bytes(snapshot_path.read_bytes()[:-1])
+
+    restored: EventSourcedStorage = EventSourcedStorage(tmp_path)
+
+    assert load(restored).batches[0].available_quantity == 90  # noqa: PLR2004
+
+    restored.close()
+
+
+def test_grows_log_file(tmp_path: Path) -> None:
+    """Test the log grows past its preallocated size.
+
+    Args:
+        tmp_path (Path): temporary directory.
+
+    """
+    storage: EventSourcedStorage = EventSourcedStorage(tmp_path, sync=False)
+    add_batch(storage, "batch-000")
+
+    initial_size: int = (tmp_path / LOG_FILE_NAME).stat().st_size
+    reference_length: int = 4096
+
+    for index in range(initial_size // reference_length + 1):
+        add_batch(storage, f"{index:0{reference_length}}")
+
+    storage.close()
+
+    restored: EventSourcedStorage = EventSourcedStorage(tmp_path)
+    product: Product = load(restored)
+    restored.close()
+
+    assert (tmp_path / LOG_FILE_NAME).stat().st_size > initial_size
+    assert len(product.batches) == initial_size // reference_length + 2
+
+
+def test_recovers_capacity_reused_in_one_commit(tmp_path: Path) -> None:
+    """Test a deallocation and an allocation using its units replay.
+
+    Args:
+        tmp_path (Path): temporary directory.
+
+    """
+    storage: EventSourcedStorage = EventSourcedStorage(
+        tmp_path,
+        snapshot_every=0,
+    )
+    add_batch(storage, "batch-001")
+
+    with EventSourcedAllocationUOW(storage) as unit_of_work:
+        product: Product | None = unit_of_work.products.get(
+            STOCK_KEEPING_UNIT,
+        )
+
+        assert product is not None
+
+        product.allocate(OrderLine("order-001", STOCK_KEEPING_UNIT, 100))
+        unit_of_work.commit()
+
+    with EventSourcedAllocationUOW(storage) as unit_of_work:
+        product = unit_of_work.products.get(STOCK_KEEPING_UNIT)
+
+        assert product is not None
+
+        product.batches[0].deallocate(
+            OrderLine("order-001", STOCK_KEEPING_UNIT, 100),
+        )
+        product.allocate(OrderLine("order-002", STOCK_KEEPING_UNIT, 100))
+        unit_of_work.commit()
+
+    storage.close()
+
+    restored: EventSourcedStorage = EventSourcedStorage(tmp_path)
+    allocations: frozenset[OrderLine] = load(restored).batches[0].allocations
+    restored.close()
+
+    assert {line.order_id for line in allocations} == {"order-002"}
+
+
+def test_replays_batches_sharing_a_reference(tmp_path: Path) -> None:
+    """Test allocations are replayed to the right batch of a reference.
+
+    Args:
+        tmp_path (Path): temporary directory.
+
+    """
+    storage: EventSourcedStorage = EventSourcedStorage(
+        tmp_path,
+        snapshot_every=0,
+    )
+    add_batch(storage, "batch-001")
+    add_batch(storage, "batch-001")
+
+    with EventSourcedAllocationUOW(storage) as unit_of_work:
+        product: Product | None = unit_of_work.products.get(
+            STOCK_KEEPING_UNIT,
+        )
+
+        assert product is not None
+
+        product.batches[1].allocate(
+            OrderLine("order-001", STOCK_KEEPING_UNIT, 10),
+        )
+        product.version_number += 1
+        unit_of_work.commit()
+
+    storage.close()
+
+    restored: EventSourcedStorage = EventSourcedStorage(tmp_path)
+    product = load(restored)
+    restored.close()
+
+    assert [batch.available_quantity for batch in product.batches] == [
+        100,
+        90,
+    ]
+
+
+def test_rejects_events_that_do_not_apply() -> None:
+    """Test replaying an allocation the batch can't hold raises."""
+    product: Product = Product(
+        stock_keeping_unit=STOCK_KEEPING_UNIT,
+        batches=[
+            Batch(
+                reference="batch-001",
+                stock_keeping_unit=STOCK_KEEPING_UNIT,
+                quantity=10,
+                estimated_arrival_time=None,
+            ),
+        ],
+    )
+    events: bytes = encode_product(product)
+    product.allocate(OrderLine("order-001", STOCK_KEEPING_UNIT, 10))
+    allocated: bytes = encode_changes(None, product)[len(events) :]
+
+    with pytest.raises(EventDecodeError, match="allocated event"):
+        apply_events(events + allocated + allocated, {})
@@ -0,0 +1,243 @@
+"""Test in-memory allocation unit of work."""
+
+import pytest
+
+from src.domain.aggregates.product import Product
+from src.domain.entities.batch import Batch
+from src.domain.value_objects.order_line import OrderLine
+from src.infrastructure.repositories.sql_repository.in_memory import (
+    InMemoryStorage,
+    StaleProductError,
+)
+from src.infrastructure.uow.allocation.in_memory_allocation import (
+    InMemoryAllocationUOW,
+)
+
+STOCK_KEEPING_UNIT: str = "GENERIC-SOFA"
+
+
+@pytest.fixture
+def storage() -> InMemoryStorage:
+    """Create storage with one product.
+
+    Returns:
+        InMemoryStorage: in-memory storage.
+
+    """
+    return InMemoryStorage(
+        products=[
+            Product(
+                stock_keeping_unit=STOCK_KEEPING_UNIT,
+                batches=[
+                    Batch(
+                        reference="batch-001",
+                        stock_keeping_unit=STOCK_KEEPING_UNIT,
+                        quantity=100,
+                        estimated_arrival_time=None,
+                    ),
+                ],
+            ),
+        ],
+    )
+
+
+def allocate(unit_of_work: InMemoryAllocationUOW, order_id: str) -> None:
+    """Allocate ten units of the product.
+
+    Args:
+        unit_of_work (InMemoryAllocationUOW): entered unit of work.
+        order_id (str): order id.
+
+    """
+    product: Product | None = unit_of_work.products.get(STOCK_KEEPING_UNIT)
+
+    assert product is not None
+
+    product.allocate(
+        OrderLine(
+            order_id=order_id,
+            stock_keeping_unit=STOCK_KEEPING_UNIT,
+            quantity=10,
+        )
+    )
+
+
+def available_quantity(storage: InMemoryStorage) -> int:
+    """Get committed available quantity of the product.
+
+    Args:
+        storage (InMemoryStorage): in-memory storage.
+
+    Returns:
+        int: available quantity.
+
+    """
+    with InMemoryAllocationUOW(storage) as unit_of_work:
+        product: Product | None = unit_of_work.products.get(
+            STOCK_KEEPING_UNIT,
+        )
+
+        assert product is not None
+
+        return product.batches[0].available_quantity
+
+
+def test_commit_persists_changes(storage: InMemoryStorage) -> None:
+    """Test committed changes are visible to later units of work.
+
+    Args:
+        storage (InMemoryStorage): in-memory storage.
+
+    """
+    with InMemoryAllocationUOW(storage) as unit_of_work:
+        allocate(unit_of_work, "order-001")
+        unit_of_work.commit()
+
+    assert available_quantity(storage) == 90  # noqa: PLR2004
+
+
+def test_rolls_back_uncommitted_work_by_default(
+    storage: InMemoryStorage,
+) -> None:
+    """Test changes are dropped when leaving the context without commit.
+
+    Args:
+        storage (InMemoryStorage): in-memory storage.
+
+    """
+    with InMemoryAllocationUOW(storage) as unit_of_work:
+        allocate(unit_of_work, "order-001")
+
+    assert available_quantity(storage) == 100  # noqa: PLR2004
+
+
+def test_rollback_restores_committed_state(storage: InMemoryStorage) -> None:
+    """Test rollback restores the last committed state.
+
+    Args:
+        storage (InMemoryStorage): in-memory storage.
+
+    """
+    with InMemoryAllocationUOW(storage) as unit_of_work:
+        allocate(unit_of_work, "order-001")
+        unit_of_work.commit()
+
+        allocate(unit_of_work, "order-002")
+        unit_of_work.rollback()
+
+        product: Product | None = unit_of_work.products.get(
+            STOCK_KEEPING_UNIT,
+        )
+
+        assert product is not None
+        assert product.batches[0].available_quantity == 90  # noqa: PLR2004
+
+
+def test_rejects_commit_on_stale_product(storage: InMemoryStorage) -> None:
+    """Test the second of two concurrent commits of one product fails.
+
+    Args:
+        storage (InMemoryStorage): in-memory storage.
+
+    """
+    first: InMemoryAllocationUOW = InMemoryAllocationUOW(storage)
+    second: InMemoryAllocationUOW = InMemoryAllocationUOW(storage)
+
+    with first, second:
+        allocate(first, "order-001")
+        allocate(second, "order-002")
+        first.commit()
+
+        with pytest.raises(StaleProductError, match=STOCK_KEEPING_UNIT):
+            second.commit()
+
+    assert available_quantity(storage) == 90  # noqa: PLR2004
+
+
+def test_requires_context(storage: InMemoryStorage) -> None:
+    """Test products are only available inside the context.
+
+    Args:
+        storage (InMemoryStorage): in-memory storage.
+
+    """
+    with pytest.raises(ValueError, match="First, you should enter"):
+        InMemoryAllocationUOW(storage).products.get(STOCK_KEEPING_UNIT)
+
+
+def test_savepoint_rolls_back_only_its_block(storage: InMemoryStorage) -> None:
+    """Test a failed savepoint keeps changes made before it.
+
+    Args:
+        storage (InMemoryStorage): in-memory storage.
+
+    """
+    with InMemoryAllocationUOW(storage) as unit_of_work:
+        allocate(unit_of_work, "order-001")
+        product: Product | None = unit_of_work.products.get(
+            STOCK_KEEPING_UNIT,
+        )
+
+        def allocate_and_fail() -> None:
+            with unit_of_work.savepoint():
+                allocate(unit_of_work, "order-002")
+                raise RuntimeError
+
+        with pytest.raises(RuntimeError):
+            allocate_and_fail()
+
+        assert product is not None
+        assert product.batches[0].available_quantity == 90  # noqa: PLR2004
+
+        unit_of_work.commit()
+
+    assert available_quantity(storage) == 90  # noqa: PLR2004
+
+
+def test_commits_only_changed_products(storage: InMemoryStorage) -> None:
+    """Test a product only read isn't committed, nor found stale.
+
+    Args:
+        storage (InMemoryStorage): in-memory storage.
+
+    """
+    reader: InMemoryAllocationUOW = InMemoryAllocationUOW(storage)
+    writer: InMemoryAllocationUOW = InMemoryAllocationUOW(storage)
+
+    with reader, writer:
+        reader.products.get(STOCK_KEEPING_UNIT)
+        allocate(writer, "order-001")
+        writer.commit()
+        reader.commit()
+
+    assert storage.revision(STOCK_KEEPING_UNIT) == 2  # noqa: PLR2004
+    assert available_quantity(storage) == 90  # noqa: PLR2004
+
+
+def test_savepoint_of_one_product_drops_products_loaded_inside(
+    storage: InMemoryStorage,
+) -> None:
+    """Test a failed savepoint of a product restores it alone.
+
+    Args:
+        storage (InMemoryStorage): in-memory storage.
+
+    """
+    with InMemoryAllocationUOW(storage) as unit_of_work:
+
+        def add_and_fail() -> None:
+            with unit_of_work.savepoint(STOCK_KEEPING_UNIT):
+                allocate(unit_of_work, "order-001")
+                unit_of_work.products.add(
+                    Product(stock_keeping_unit="NEW-LAMP", batches=[]),
+                )
+                raise RuntimeError
+
+        with pytest.raises(RuntimeError):
+            add_and_fail()
+
+        unit_of_work.commit()
+
+    assert available_quantity(storage) == 100  # noqa: PLR2004
+    assert storage.revision("NEW-LAMP") == 0
+    assert storage.revision(STOCK_KEEPING_UNIT) == 1
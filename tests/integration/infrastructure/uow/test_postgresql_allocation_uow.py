@@ -10,6 +10,7 @@ from sqlalchemy.orm import Session
 
 from src.domain.aggregates.product import Product
 from src.domain.entities.batch import Batch
+from src.domain.exceptions.persistence import PersistenceError
 from src.domain.value_objects.order_line import OrderLine
 from src.infrastructure.uow.allocation.postgresql_allocation import (
     PostgresqlAllocationUOW,
@@ -369,3 +370,37 @@ def test_rolls_back_on_error(
     )
 
     assert rows == []
+
+
+def test_savepoint_rolls_back_only_rejected_changes(
+    session_factory: Callable[[], Session],
+) -> None:
+    """Test a rejected savepoint keeps the rest of the transaction.
+
+    Args:
+        session_factory (Callable[[], Session]): session factory.
+
+    """
+    unit_of_work: PostgresqlAllocationUOW = PostgresqlAllocationUOW(
+        session_factory=session_factory,
+    )
+
+    with unit_of_work:
+        with unit_of_work.savepoint():
+            unit_of_work.products.add(Product("GOOD-LAMP", batches=[]))
+
+        with pytest.raises(PersistenceError), unit_of_work.savepoint():
+            unit_of_work.products.add(
+                Product(
+                    "BAD-LAMP",
+                    batches=[Batch("batch-001", "BAD-LAMP", None, None)],  # type: ignore[arg-type]
+                )
+            )
+
+        unit_of_work.commit()
+
+    session: Session = session_factory()
+
+    assert session.execute(
+        text("SELECT stock_keeping_unit FROM products"),
+    ).all() == [("GOOD-LAMP",)]
@@ -0,0 +1,168 @@
+"""Test replicated allocation unit of work."""
+
+from pathlib import Path
+
+import pytest
+from sqlalchemy import Engine, create_engine, text
+from sqlalchemy.orm import sessionmaker
+
+from src.domain.aggregates.product import Product
+from src.infrastructure.repositories.sql_repository.postgresql import metadata
+from src.infrastructure.uow.allocation.replicated_allocation import (
+    ReplicaRouter,
+    ReplicatedAllocationUOW,
+)
+
+PRIMARY: str = "primary"
+REPLICAS: tuple[str, ...] = ("replica-0", "replica-1")
+
+
+def make_database(path: Path, marker: str) -> sessionmaker:
+    """Make SQLite database holding a product named after the database.
+
+    Args:
+        path (Path): database file path.
+        marker (str): stock keeping unit of the product.
+
+    Returns:
+        sessionmaker: session factory.
+
+    """
+    engine: Engine = create_engine(f"sqlite:///{path}")
+    metadata.create_all(engine)
+
+    with engine.begin() as connection:
+        connection.execute(
+            statement=text(
+                "INSERT INTO products (stock_keeping_unit, version_number) "
+                "VALUES (:stock_keeping_unit, 0)"
+            ),
+            parameters={"stock_keeping_unit": marker},
+        )
+
+    return sessionmaker(bind=engine)
+
+
+def make_router(
+    tmp_path: Path, read_your_writes_window: float
+) -> ReplicaRouter:
+    """Make router over SQLite files standing in for PostgreSQL servers.
+
+    Args:
+        tmp_path (Path): temporary directory.
+        read_your_writes_window (float): read your writes window.
+
+    Returns:
+        ReplicaRouter: router.
+
+    """
+    return ReplicaRouter(
+        primary=make_database(tmp_path / f"{PRIMARY}.sqlite", PRIMARY),
+        replicas=[
+            make_database(tmp_path / f"{replica}.sqlite", replica)
+            for replica in REPLICAS
+        ],
+        read_your_writes_window=read_your_writes_window,
+    )
+
+
+def served_by(unit_of_work: ReplicatedAllocationUOW) -> str:
+    """Get name of the database serving an entered unit of work.
+
+    Args:
+        unit_of_work (ReplicatedAllocationUOW): entered unit of work.
+
+    Returns:
+        str: database name.
+
+    """
+    return next(
+        name
+        for name in (PRIMARY, *REPLICAS)
+        if unit_of_work.products.get(name) is not None
+    )
+
+
+def read(router: ReplicaRouter) -> str:
+    """Get name of the database serving a read-only unit of work.
+
+    Args:
+        router (ReplicaRouter): router.
+
+    Returns:
+        str: database name.
+
+    """
+    with ReplicatedAllocationUOW(router, read_only=True) as unit_of_work:
+        return served_by(unit_of_work)
+
+
+@pytest.mark.usefixtures("sqlalchemy_mapping")
+def test_routes_reads_to_replicas_round_robin(tmp_path: Path) -> None:
+    """Test read-only units of work cycle through the replicas.
+
+    Args:
+        tmp_path (Path): temporary directory.
+
+    """
+    router: ReplicaRouter = make_router(tmp_path, read_your_writes_window=0)
+
+    assert [read(router) for _ in range(4)] == [*REPLICAS, *REPLICAS]
+
+    with ReplicatedAllocationUOW(router) as unit_of_work:
+        assert served_by(unit_of_work) == PRIMARY
+
+
+@pytest.mark.usefixtures("sqlalchemy_mapping")
+def test_pins_reads_of_the_writer_to_primary_after_commit(
+    tmp_path: Path,
+) -> None:
+    """Test the writer's reads go to the primary within the window.
+
+    Args:
+        tmp_path (Path): temporary directory.
+
+    """
+    router: ReplicaRouter = make_router(tmp_path, read_your_writes_window=60)
+
+    assert read(router) == REPLICAS[0]
+
+    with ReplicatedAllocationUOW(router, caller="writer") as unit_of_work:
+        unit_of_work.products.add(
+            Product(stock_keeping_unit="NEW-PRODUCT", batches=[]),
+        )
+        unit_of_work.commit()
+
+    with ReplicatedAllocationUOW(
+        router,
+        read_only=True,
+        caller="writer",
+    ) as unit_of_work:
+        assert served_by(unit_of_work) == PRIMARY
+        assert unit_of_work.products.get("NEW-PRODUCT") is not None
+
+    with ReplicatedAllocationUOW(
+        router,
+        read_only=True,
+        caller="reader",
+    ) as unit_of_work:
+        assert served_by(unit_of_work) == REPLICAS[1]
+
+    assert read(router) == REPLICAS[0]
+
+
+@pytest.mark.usefixtures("sqlalchemy_mapping")
+def test_read_only_unit_of_work_cannot_commit(tmp_path: Path) -> None:
+    """Test read-only units of work refuse to commit.
+
+    Args:
+        tmp_path (Path): temporary directory.
+
+    """
+    router: ReplicaRouter = make_router(tmp_path, read_your_writes_window=0)
+
+    with (
+        ReplicatedAllocationUOW(router, read_only=True) as unit_of_work,
+        pytest.raises(ValueError, match="can't commit"),
+    ):
+        unit_of_work.commit()
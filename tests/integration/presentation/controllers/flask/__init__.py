@@ -0,0 +1 @@
+"""Tests for Flask controllers."""
@@ -0,0 +1,179 @@
+"""Tests for pre-fork Flask server."""
+
+import os
+import signal
+from collections.abc import Iterator
+from time import monotonic
+from typing import TYPE_CHECKING
+
+import pytest
+import requests
+from flask import Flask
+
+from src.infrastructure.settings import settings
+from src.presentation.controllers.flask.server import PreForkServer
+from src.presentation.views.flask.availability import availability_blueprint
+from src.presentation.views.flask.export import export_blueprint
+
+if TYPE_CHECKING:
+    from werkzeug.routing import MapAdapter
+
+app: Flask = Flask(__name__)
+warm_up_pids: list[int] = []
+
+
+@app.route("/warm-up")
+def warm_up() -> str:
+    """Record process warmed up.
+
+    Returns:
+        str: empty body.
+
+    """
+    warm_up_pids.append(os.getpid())
+
+    return ""
+
+
+@app.route("/pid")
+def pid() -> str:
+    """Get worker process id.
+
+    Returns:
+        str: process id.
+
+    """
+    return str(os.getpid())
+
+
+@pytest.fixture
+def server() -> Iterator[PreForkServer]:
+    """Start pre-fork server with two workers on a free port.
+
+    Yields:
+        PreForkServer: running server.
+
+    """
+    server: PreForkServer = PreForkServer(
+        app=app,
+        port=0,
+        workers=2,
+        warm_up_paths=["/warm-up"],
+    )
+    server.start()
+
+    yield server
+
+    server.stop()
+
+
+def test_serves_requests_from_worker_processes(server: PreForkServer) -> None:
+    """Test requests are handled by worker processes.
+
+    Args:
+        server (PreForkServer): running server.
+
+    """
+    host, port = server.address
+
+    with requests.Session() as session:
+        pids: set[int] = {
+            int(session.get(f"http://{host}:{port}/pid", timeout=5).text)
+            for _ in range(10)
+        }
+
+    assert len(server.workers) == 2  # noqa: PLR2004
+    assert pids <= server.workers
+    assert os.getpid() not in pids
+
+
+def test_reports_worker_rss(server: PreForkServer) -> None:
+    """Test resident set size is reported for every worker.
+
+    Args:
+        server (PreForkServer): running server.
+
+    """
+    sizes: dict[int, int] = server.rss()
+
+    assert set(sizes) == server.workers
+    assert all(size > 0 for size in sizes.values())
+
+
+def test_restarts_dead_worker(server: PreForkServer) -> None:
+    """Test supervisor replaces a worker that died.
+
+    Args:
+        server (PreForkServer): running server.
+
+    """
+    dead: int = min(server.workers)
+    os.kill(dead, signal.SIGKILL)
+    deadline: float = monotonic() + 5
+
+    while dead in server.workers and monotonic() < deadline:
+        server._reap()  # noqa: SLF001
+
+    assert dead not in server.workers
+    assert len(server.workers) == 2  # noqa: PLR2004
+
+
+def test_warms_up_before_forking(server: PreForkServer) -> None:
+    """Test warm-up requests are served by the parent before forking.
+
+    Args:
+        server (PreForkServer): running server.
+
+    """
+    assert len(server.workers) == 2  # noqa: PLR2004
+    assert warm_up_pids[-1] == os.getpid()
+
+
+def test_crashed_worker_exits_with_error(
+    server: PreForkServer,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test a worker whose loop raises exits with a non-zero status.
+
+    Args:
+        server (PreForkServer): running server.
+        monkeypatch (pytest.MonkeyPatch): monkeypatch.
+
+    """
+
+    def crash() -> None:
+        raise RuntimeError
+
+    monkeypatch.setattr(server, "_work", crash)
+    workers: frozenset[int] = server.workers
+    server._spawn()  # noqa: SLF001
+    (crashed,) = server.workers - workers
+    _, status = os.waitpid(crashed, 0)
+    server._pids.discard(crashed)  # noqa: SLF001
+
+    assert os.waitstatus_to_exitcode(status) == 1
+
+
+def test_warm_up_skips_paths_matching_no_route(
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Test a warm-up path without a route is reported, not requested.
+
+    Args:
+        caplog (pytest.LogCaptureFixture): log capture.
+
+    """
+    PreForkServer(app=app, warm_up_paths=["/missing"])._warm_up()  # noqa: SLF001
+
+    assert "Warm-up path /missing matches no route" in caplog.text
+
+
+def test_default_warm_up_paths_are_routed() -> None:
+    """Test default warm-up paths reach views of the application."""
+    routed: Flask = Flask(__name__)
+    routed.register_blueprint(availability_blueprint)
+    routed.register_blueprint(export_blueprint)
+    routes: MapAdapter = routed.url_map.bind("localhost")
+
+    for path in settings.server_warm_up_paths:
+        routes.match(path, method="GET")
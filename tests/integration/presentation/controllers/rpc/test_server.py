@@ -0,0 +1,256 @@
+"""Tests for allocation RPC server."""
+
+import socket
+import struct
+from collections.abc import Iterator
+from pathlib import Path
+from threading import Thread
+
+import pytest
+
+from src.domain.aggregates.product import Product
+from src.domain.entities.batch import Batch
+from src.domain.value_objects.order_line import OrderLine
+from src.infrastructure.repositories.sql_repository.in_memory import (
+    InMemoryStorage,
+)
+from src.infrastructure.uow.allocation.in_memory_allocation import (
+    InMemoryAllocationUOW,
+)
+from src.presentation.controllers.rpc.client import AllocationRPCClient
+from src.presentation.controllers.rpc.server import AllocationRPCServer
+from src.presentation.dtos.rpc.allocate import (
+    LENGTH,
+    AllocateResponseFrame,
+)
+
+QUANTITY: int = 100
+
+
+@pytest.fixture
+def server(tmp_path: Path) -> Iterator[AllocationRPCServer]:
+    """Start RPC server over an in-memory storage.
+
+    Args:
+        tmp_path (Path): temporary directory.
+
+    Yields:
+        AllocationRPCServer: running server.
+
+    """
+    storage: InMemoryStorage = InMemoryStorage(
+        [
+            Product(
+                stock_keeping_unit="RED-CHAIR",
+                batches=[
+                    Batch(
+                        reference="batch-001",
+                        stock_keeping_unit="RED-CHAIR",
+                        quantity=QUANTITY,
+                        estimated_arrival_time=None,
+                    ),
+                ],
+            ),
+        ],
+    )
+    server: AllocationRPCServer = AllocationRPCServer(
+        path=str(tmp_path / "allocation.sock"),
+        unit_of_work_factory=lambda: InMemoryAllocationUOW(storage),
+        max_frame_size=1024,
+    )
+    thread: Thread = Thread(target=server.serve_forever)
+    thread.start()
+
+    yield server
+
+    server.shutdown()
+    server.server_close()
+    thread.join()
+
+
+def test_allocates(server: AllocationRPCServer) -> None:
+    """Test allocation returns batch reference or error message.
+
+    Args:
+        server (AllocationRPCServer): running server.
+
+    """
+    with AllocationRPCClient(str(server.path)) as client:
+        created: AllocateResponseFrame = client.allocate(
+            "order-001",
+            "RED-CHAIR",
+            1,
+        )
+        out_of_stock: AllocateResponseFrame = client.allocate(
+            "order-002",
+            "RED-CHAIR",
+            QUANTITY,
+        )
+        invalid: AllocateResponseFrame = client.allocate(
+            "order-003",
+            "UNKNOWN",
+            1,
+        )
+
+    assert (created.status_code, created.text) == (201, "batch-001")
+    assert out_of_stock.status_code == 400  # noqa: PLR2004
+    assert "out of stock" in out_of_stock.text
+    assert (invalid.status_code, invalid.text) == (400, "Invalid SKU: UNKNOWN")
+
+
+def test_pipelined_responses_keep_request_order(
+    server: AllocationRPCServer,
+) -> None:
+    """Test pipelined requests are answered in order.
+
+    Args:
+        server (AllocationRPCServer): running server.
+
+    """
+    order_lines: list[OrderLine] = [
+        OrderLine(f"order-{index}", "RED-CHAIR", 1)
+        for index in range(QUANTITY + 1)
+    ]
+
+    with AllocationRPCClient(str(server.path), window=16) as client:
+        responses: list[AllocateResponseFrame] = client.allocate_many(
+            order_lines,
+        )
+
+    assert [response.request_id for response in responses] == list(
+        range(1, QUANTITY + 2),
+    )
+    assert [response.status_code for response in responses] == [201] * (
+        QUANTITY
+    ) + [400]
+
+
+def test_malformed_payload_gets_bad_request(
+    server: AllocationRPCServer,
+) -> None:
+    """Test a payload not matching its header is rejected, not fatal.
+
+    Args:
+        server (AllocationRPCServer): running server.
+
+    """
+    with socket.socket(socket.AF_UNIX) as connection:
+        connection.connect(str(server.path))
+        # Header announces two 5 bytes strings that never come.
+        payload: bytes = struct.pack("!IHHi", 7, 5, 5, 1)
+        connection.sendall(LENGTH.pack(len(payload)) + payload)
+        response: bytes = connection.recv(1024)
+
+    frame: AllocateResponseFrame = AllocateResponseFrame.decode(
+        response[LENGTH.size :],
+    )
+
+    assert (frame.request_id, frame.status_code) == (7, 400)
+
+
+def test_oversized_frame_closes_connection(
+    server: AllocationRPCServer,
+) -> None:
+    """Test a frame over the maximum size closes the connection.
+
+    Args:
+        server (AllocationRPCServer): running server.
+
+    """
+    with socket.socket(socket.AF_UNIX) as connection:
+        connection.connect(str(server.path))
+        connection.sendall(LENGTH.pack(2048))
+
+        assert connection.recv(1024) == b""
+
+
+def test_unexpected_error_keeps_connection(tmp_path: Path) -> None:
+    """Test an unexpected error is answered and later frames still served.
+
+    Args:
+        tmp_path (Path): temporary directory.
+
+    """
+    storage: InMemoryStorage = InMemoryStorage(
+        [
+            Product(
+                stock_keeping_unit="RED-CHAIR",
+                batches=[
+                    Batch(
+                        reference="batch-001",
+                        stock_keeping_unit="RED-CHAIR",
+                        quantity=QUANTITY,
+                        estimated_arrival_time=None,
+                    ),
+                ],
+            ),
+        ],
+    )
+    failures: list[str] = ["Database is down."]
+
+    def unit_of_work_factory() -> InMemoryAllocationUOW:
+        if failures:
+            raise RuntimeError(failures.pop())
+
+        return InMemoryAllocationUOW(storage)
+
+    server: AllocationRPCServer = AllocationRPCServer(
+        path=str(tmp_path / "allocation.sock"),
+        unit_of_work_factory=unit_of_work_factory,
+    )
+    thread: Thread = Thread(target=server.serve_forever)
+    thread.start()
+
+    try:
+        with AllocationRPCClient(str(server.path)) as client:
+            failed: AllocateResponseFrame = client.allocate(
+                "order-001",
+                "RED-CHAIR",
+                1,
+            )
+            created: AllocateResponseFrame = client.allocate(
+                "order-001",
+                "RED-CHAIR",
+                1,
+            )
+    finally:
+        server.shutdown()
+        server.server_close()
+        thread.join()
+
+    assert failed.status_code == 500  # noqa: PLR2004
+    assert (created.status_code, created.text) == (201, "batch-001")
+
+
+def test_error_echoing_long_sku_keeps_connection(tmp_path: Path) -> None:
+    """Test an error text longer than 64 KiB is sent whole.
+
+    Args:
+        tmp_path (Path): temporary directory.
+
+    """
+    stock_keeping_unit: str = "X" * 65_530
+    server: AllocationRPCServer = AllocationRPCServer(
+        path=str(tmp_path / "allocation.sock"),
+        unit_of_work_factory=lambda: InMemoryAllocationUOW(
+            InMemoryStorage([]),
+        ),
+        max_frame_size=128 * 1024,
+    )
+    thread: Thread = Thread(target=server.serve_forever)
+    thread.start()
+
+    try:
+        with AllocationRPCClient(str(server.path)) as client:
+            responses: list[AllocateResponseFrame] = [
+                client.allocate("order-001", stock_keeping_unit, 1)
+                for _ in range(2)
+            ]
+    finally:
+        server.shutdown()
+        server.server_close()
+        thread.join()
+
+    assert [
+        (response.status_code, response.text) for response in responses
+    ] == [(400, f"Invalid SKU: {stock_keeping_unit}")] * 2
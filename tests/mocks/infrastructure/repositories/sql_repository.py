@@ -1,6 +1,9 @@
 """SQL repository mock."""
 
+from collections.abc import Iterable, Iterator
+
 from src.domain.aggregates.product import Product
+from src.domain.value_objects.allocation import Allocation
 
 
 class SQLRepositoryMock:
@@ -13,7 +16,9 @@ class SQLRepositoryMock:
             products (list[Batch]): initial data.
 
         """
-        self._products = set(products)
+        self._products: dict[str, Product] = {
+            product.stock_keeping_unit: product for product in products
+        }
 
     def get(self, stock_keeping_unit: str) -> Product | None:
         """Get product aggregate from repository by reference.
@@ -25,18 +30,64 @@ class SQLRepositoryMock:
             Product: product aggregate
 
         """
-        product: Product | None = None
+        return self._products.get(stock_keeping_unit)
+
+    def get_version(self, stock_keeping_unit: str) -> int | None:
+        """Get version number of a product.
+
+        Args:
+            stock_keeping_unit (str): stock keeping unit.
+
+        Returns:
+            int | None: version number, None for unknown products.
+
+        """
+        product: Product | None = self._products.get(stock_keeping_unit)
+
+        return None if product is None else product.version_number
+
+    def get_many(self, stock_keeping_units: Iterable[str]) -> list[Product]:
+        """Get product aggregates in stock keeping unit order.
+
+        Args:
+            stock_keeping_units (Iterable[str]): stock keeping units.
+
+        Returns:
+            list[Product]: found product aggregates, sorted by stock keeping
+                unit.
+
+        """
+        return [
+            self._products[stock_keeping_unit]
+            for stock_keeping_unit in sorted(set(stock_keeping_units))
+            if stock_keeping_unit in self._products
+        ]
+
+    def iter_allocations(
+        self, stock_keeping_unit: str
+    ) -> Iterator[Allocation]:
+        """Iterate over allocations of a product.
+
+        Args:
+            stock_keeping_unit (str): stock keeping unit.
+
+        Yields:
+            Iterator[Allocation]: allocations, batch by batch.
+
+        """
+        product: Product | None = self._products.get(stock_keeping_unit)
 
-        try:
-            product = next(
-                product
-                for product in self._products
-                if product.stock_keeping_unit == stock_keeping_unit
-            )
-        except StopIteration:
-            product = None
+        if product is None:
+            return
 
-        return product
+        for batch in product.batches:
+            for order_line in batch.allocations:
+                yield Allocation(
+                    order_id=order_line.order_id,
+                    stock_keeping_unit=order_line.stock_keeping_unit,
+                    quantity=order_line.quantity,
+                    batch_reference=batch.reference,
+                )
 
     def add(self, product: Product) -> None:
         """Add product aggregate to repository.
@@ -45,4 +96,4 @@ class SQLRepositoryMock:
             product (Product): product aggregate.
 
         """
-        self._products.add(product)
+        self._products[product.stock_keeping_unit] = product
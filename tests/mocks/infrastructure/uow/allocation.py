@@ -1,8 +1,12 @@
 """Allocation unit of work mock."""
 
+from collections.abc import Iterator
+from contextlib import contextmanager
 from types import TracebackType
 from typing import Self
 
+from src.domain.aggregates.product import Product
+from src.domain.entities.batch import Batch
 from src.domain.interfaces.repositories.sql_repository import SQLRepository
 from tests.mocks.infrastructure.repositories.sql_repository import (
     SQLRepositoryMock,
@@ -34,6 +38,23 @@ class AllocationUOWMock:
     def rollback(self) -> None:
         """Rollback changes."""
 
+    @contextmanager
+    def savepoint(
+        self,
+        stock_keeping_unit: str | None = None,  # noqa: ARG002
+    ) -> Iterator[None]:
+        """Open nested scope, changes are not undone.
+
+        Args:
+            stock_keeping_unit (str | None, optional): product the block
+                changes. Defaults to None.
+
+        Yields:
+            Iterator[None]: nothing.
+
+        """
+        yield
+
     def close(self) -> None:
         """Close connection."""
 
@@ -57,3 +78,57 @@ class AllocationUOWMock:
         """
         self.rollback()
         self.close()
+
+
+class CountingAllocationUOWMock(AllocationUOWMock):
+    """Allocation unit of work mock counting entries and commits."""
+
+    def __init__(self) -> None:
+        """Create new instance."""
+        super().__init__()
+        self.entered: int = 0
+        self.commits: int = 0
+
+    def add_products(
+        self,
+        *stock_keeping_units: str,
+        quantity: int = 10,
+    ) -> Self:
+        """Add products with one batch each.
+
+        Args:
+            *stock_keeping_units (str): stock keeping units.
+            quantity (int, optional): quantity of each batch, referenced
+                batch-<stock keeping unit>. Defaults to 10.
+
+        Returns:
+            Self: unit of work.
+
+        """
+        for stock_keeping_unit in stock_keeping_units:
+            self.products.add(
+                Product(
+                    stock_keeping_unit=stock_keeping_unit,
+                    batches=[
+                        Batch(
+                            reference=f"batch-{stock_keeping_unit}",
+                            stock_keeping_unit=stock_keeping_unit,
+                            quantity=quantity,
+                            estimated_arrival_time=None,
+                        ),
+                    ],
+                ),
+            )
+
+        return self
+
+    def commit(self) -> None:
+        """Commit changes."""
+        super().commit()
+        self.commits += 1
+
+    def __enter__(self) -> Self:
+        """Enter dunder method."""
+        self.entered += 1
+
+        return super().__enter__()
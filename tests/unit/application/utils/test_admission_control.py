@@ -0,0 +1,131 @@
+"""Test admission control util."""
+
+from contextlib import ExitStack
+from threading import Event, Thread
+from time import sleep
+
+import pytest
+
+from src.application.utils.admission_control import (
+    AdmissionController,
+    AdmissionRejectedError,
+    AdmissionStatistics,
+)
+
+
+@pytest.mark.parametrize(
+    argnames=("max_in_flight", "max_in_flight_per_key", "max_queue"),
+    argvalues=[(0, 1, 0), (1, 0, 0), (1, 1, -1)],
+)
+def test_admission_controller_rejects_invalid_limits(
+    max_in_flight: int,
+    max_in_flight_per_key: int,
+    max_queue: int,
+) -> None:
+    """Test admission controller validates its limits.
+
+    Args:
+        max_in_flight (int): requests in flight.
+        max_in_flight_per_key (int): requests in flight per key.
+        max_queue (int): waiting requests.
+
+    """
+    with pytest.raises(ValueError, match="must"):
+        AdmissionController(
+            max_in_flight=max_in_flight,
+            max_in_flight_per_key=max_in_flight_per_key,
+            max_queue=max_queue,
+        )
+
+
+def test_admission_controller_rejects_over_full_queue() -> None:
+    """Test a request over the per key cap with no queue room is rejected."""
+    admission_controller: AdmissionController = AdmissionController(
+        max_in_flight=4,
+        max_in_flight_per_key=2,
+        max_queue_per_key=0,
+        retry_after=3,
+    )
+
+    with ExitStack() as stack:
+        stack.enter_context(admission_controller.admit("HOT"))
+        stack.enter_context(admission_controller.admit("HOT"))
+
+        with (
+            pytest.raises(AdmissionRejectedError) as error,
+            admission_controller.admit("HOT"),
+        ):
+            pass
+
+        with admission_controller.admit("COLD"):
+            pass
+
+    assert error.value.retry_after == 3  # noqa: PLR2004
+    assert admission_controller.statistics() == AdmissionStatistics(
+        admitted=3,
+        rejected=1,
+        timed_out=0,
+        in_flight=0,
+        queue_depth=0,
+        max_queue_depth=0,
+    )
+
+
+def test_admission_controller_enforces_global_cap() -> None:
+    """Test the global cap applies across keys."""
+    admission_controller: AdmissionController = AdmissionController(
+        max_in_flight=1,
+        max_queue=0,
+    )
+
+    with (
+        admission_controller.admit("FIRST"),
+        pytest.raises(AdmissionRejectedError),
+        admission_controller.admit("SECOND"),
+    ):
+        pass
+
+
+def test_admission_controller_times_out_queued_request() -> None:
+    """Test a queued request is rejected after the queue timeout."""
+    admission_controller: AdmissionController = AdmissionController(
+        max_in_flight_per_key=1,
+        queue_timeout=0.01,
+    )
+
+    with (
+        admission_controller.admit("HOT"),
+        pytest.raises(AdmissionRejectedError, match="timed out"),
+        admission_controller.admit("HOT"),
+    ):
+        pass
+
+    assert admission_controller.statistics().timed_out == 1
+
+
+def test_admission_controller_admits_queued_request_on_release() -> None:
+    """Test a queued request runs once a slot is released."""
+    admission_controller: AdmissionController = AdmissionController(
+        max_in_flight_per_key=1,
+        queue_timeout=5,
+    )
+    admitted: Event = Event()
+
+    def wait() -> None:
+        with admission_controller.admit("HOT"):
+            admitted.set()
+
+    with admission_controller.admit("HOT"):
+        thread: Thread = Thread(target=wait)
+        thread.start()
+
+        while admission_controller.queue_depth("HOT") == 0:
+            sleep(0.001)
+
+        assert admission_controller.queue_depth() == 1
+        assert not admitted.is_set()
+
+    thread.join()
+
+    assert admitted.is_set()
+    assert admission_controller.statistics().max_queue_depth == 1
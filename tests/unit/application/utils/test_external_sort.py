@@ -0,0 +1,47 @@
+"""Test external sort util."""
+
+from pathlib import Path
+from random import Random
+
+from src.application.utils.external_sort import ExternalSort, Record
+
+
+def test_external_sort_merges_spilled_runs(tmp_path: Path) -> None:
+    """Test records spilled to runs come back sorted and runs are removed.
+
+    Args:
+        tmp_path (Path): temporary folder.
+
+    """
+    random: Random = Random(0)  # noqa: S311
+    records: list[Record] = [
+        (f"{random.randrange(100):02}", f"name-{index}")
+        for index in range(250)
+    ]
+
+    with ExternalSort(buffer_size=16, directory=str(tmp_path)) as sort:
+        sort.extend(records)
+
+        assert sort.spilled_runs == 250 // 16
+        assert list(sort.sorted()) == sorted(records)
+
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_external_sort_keeps_special_characters(tmp_path: Path) -> None:
+    """Test names with separators and escapes survive a spill.
+
+    Args:
+        tmp_path (Path): temporary folder.
+
+    """
+    records: list[Record] = [
+        ("b", "tab\tand\nnewline"),
+        ("a", "back\\slash\\n"),
+        ("c", "undecodable \udcff"),
+    ]
+
+    with ExternalSort(buffer_size=1, directory=str(tmp_path)) as sort:
+        sort.extend(records)
+
+        assert list(sort.sorted()) == sorted(records)
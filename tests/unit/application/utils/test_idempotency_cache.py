@@ -0,0 +1,114 @@
+"""Test idempotency cache util."""
+
+import pytest
+
+from src.application.utils.idempotency_cache import (
+    IdempotencyCache,
+    IdempotencyKeyReusedError,
+    IdempotencyStatistics,
+)
+from src.domain.value_objects.stored_response import StoredResponse
+
+CREATED: StoredResponse = StoredResponse(status_code=201, body=b"{}")
+BAD_REQUEST: StoredResponse = StoredResponse(status_code=400, body=b"{}")
+
+
+class Clock:
+    """Manually advanced clock."""
+
+    def __init__(self) -> None:
+        """Create new instance."""
+        self.now: float = 0
+
+    def __call__(self) -> float:
+        """Get current time.
+
+        Returns:
+            float: current time.
+
+        """
+        return self.now
+
+
+def test_idempotency_cache_rejects_non_positive_capacity() -> None:
+    """Test idempotency cache requires room for one response."""
+    with pytest.raises(ValueError, match="Capacity must be positive"):
+        IdempotencyCache(capacity=0)
+
+
+def test_idempotency_cache_replays_successful_response() -> None:
+    """Test a successful response is replayed without running again."""
+    cache: IdempotencyCache = IdempotencyCache()
+    runs: list[StoredResponse] = []
+
+    def run() -> StoredResponse:
+        runs.append(CREATED)
+
+        return CREATED
+
+    assert cache.get_or_run("key", run) == (CREATED, False)
+    assert cache.get_or_run("key", run) == (CREATED, True)
+    assert len(runs) == 1
+    assert cache.statistics() == IdempotencyStatistics(
+        memory_hits=1,
+        misses=1,
+    )
+
+
+def test_idempotency_cache_runs_failed_request_again() -> None:
+    """Test a failed response is not kept."""
+    cache: IdempotencyCache = IdempotencyCache()
+
+    assert cache.get_or_run("key", lambda: BAD_REQUEST) == (BAD_REQUEST, False)
+    assert cache.get_or_run("key", lambda: CREATED) == (CREATED, False)
+
+
+def test_idempotency_cache_rejects_reused_key() -> None:
+    """Test a key is only replayed to the request that stored it."""
+    cache: IdempotencyCache = IdempotencyCache()
+    cache.get_or_run("key", lambda: CREATED, fingerprint="first")
+
+    assert cache.get_or_run("key", lambda: CREATED, fingerprint="first")[1]
+
+    with pytest.raises(IdempotencyKeyReusedError, match="another request"):
+        cache.get_or_run("key", lambda: CREATED, fingerprint="second")
+
+
+def test_idempotency_cache_expires_responses() -> None:
+    """Test a response is replayed for the ttl only."""
+    clock: Clock = Clock()
+    cache: IdempotencyCache = IdempotencyCache(ttl=10, clock=clock)
+    cache.get_or_run("key", lambda: CREATED)
+
+    clock.now = 9
+
+    assert cache.get_or_run("key", lambda: BAD_REQUEST)[1]
+
+    clock.now = 10
+
+    assert not cache.get_or_run("key", lambda: BAD_REQUEST)[1]
+
+
+def test_idempotency_cache_evicts_least_recently_used() -> None:
+    """Test memory holds at most capacity responses."""
+    cache: IdempotencyCache = IdempotencyCache(capacity=2)
+    cache.get_or_run("first", lambda: CREATED)
+    cache.get_or_run("second", lambda: CREATED)
+    cache.get_or_run("first", lambda: CREATED)
+    cache.get_or_run("third", lambda: CREATED)
+
+    assert cache.get_or_run("first", lambda: BAD_REQUEST)[1]
+    assert not cache.get_or_run("second", lambda: BAD_REQUEST)[1]
+
+
+def test_idempotency_statistics_hit_rate() -> None:
+    """Test hit rate counts memory and store hits."""
+    statistics: IdempotencyStatistics = IdempotencyStatistics(
+        memory_hits=2,
+        store_hits=1,
+        misses=1,
+    )
+
+    assert statistics.hits == 3  # noqa: PLR2004
+    assert statistics.hit_rate == 0.75  # noqa: PLR2004
+    assert IdempotencyStatistics().hit_rate == 0
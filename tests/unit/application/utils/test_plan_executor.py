@@ -0,0 +1,126 @@
+"""Test sync plan executor util."""
+
+from pathlib import Path
+from threading import Barrier
+from typing import TYPE_CHECKING
+
+import pytest
+
+from src.application.utils.plan_executor import CommandTiming, PlanExecutor
+from src.domain.services.sync import SyncService
+from src.domain.value_objects.sync_plan import SyncPlan
+from src.infrastructure.repositories.file_system.fake_file_system import (
+    FakeFileSystem,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from src.domain.value_objects.file_system_command import (
+        FileSystemCommand,
+    )
+
+
+class BlockingFileSystem(FakeFileSystem):
+    """Fake file system whose copies wait for each other."""
+
+    def __init__(self, parties: int) -> None:
+        """Create new instance.
+
+        Args:
+            parties (int): copies that must run at once.
+
+        """
+        super().__init__()
+        self._barrier: Barrier = Barrier(parties, timeout=5)
+
+    def copy(self, src: Path, dest: Path) -> None:
+        """Copy file once the other copies started.
+
+        Args:
+            src (Path): source path.
+            dest (Path): destination path.
+
+        """
+        self._barrier.wait()
+        super().copy(src, dest)
+
+    def move(self, src: Path, dest: Path) -> None:
+        """Move file, fail on a broken one.
+
+        Args:
+            src (Path): source path.
+            dest (Path): destination path.
+
+        Raises:
+            OSError: if the source is named broken.
+
+        """
+        if src.name == "broken":
+            msg: str = "Broken file."
+            raise OSError(msg)
+
+        super().move(src, dest)
+
+
+@pytest.fixture
+def plan() -> SyncPlan:
+    """Plan two copies and a chain of moves waiting for each other.
+
+    Returns:
+        SyncPlan: plan.
+
+    """
+    return SyncService().plan(
+        source_hashes={"sha1": "a", "sha2": "b", "sha3": "c", "sha4": "d"},
+        destination_hashes={"sha1": "b", "sha2": "c"},
+        source="/source",
+        destination="/destination",
+    )
+
+
+def test_plan_executor_runs_independent_commands_concurrently(
+    plan: SyncPlan,
+) -> None:
+    """Test copies run at once and moves in dependency order.
+
+    Args:
+        plan (SyncPlan): plan.
+
+    """
+    file_system: BlockingFileSystem = BlockingFileSystem(parties=2)
+
+    timings: list[CommandTiming] = PlanExecutor(workers=4).execute(
+        plan,
+        file_system,
+    )
+    history: Sequence[FileSystemCommand] = file_system.history()
+
+    assert [timing.command for timing in timings] == list(plan.commands)
+    assert sorted(history, key=str) == sorted(plan.commands, key=str)
+
+    for index, dependencies in enumerate(plan.dependencies):
+        for dependency in dependencies:
+            assert history.index(plan.commands[dependency]) < history.index(
+                plan.commands[index]
+            )
+            assert (
+                timings[dependency].started + timings[dependency].elapsed
+                <= timings[index].started
+            )
+
+
+def test_plan_executor_stops_on_error() -> None:
+    """Test a failed move raises and the copy waiting for it doesn't run."""
+    plan: SyncPlan = SyncService().plan(
+        source_hashes={"sha1": "a", "sha2": "broken"},
+        destination_hashes={"sha1": "broken"},
+        source="/source",
+        destination="/destination",
+    )
+    file_system: BlockingFileSystem = BlockingFileSystem(parties=1)
+
+    with pytest.raises(OSError, match="Broken file"):
+        PlanExecutor(workers=2).execute(plan, file_system)
+
+    assert file_system.history() == []
@@ -0,0 +1,98 @@
+"""Test striped lock util."""
+
+from threading import Thread
+from time import sleep
+
+import pytest
+
+from src.application.utils.striped_lock import LockStatistics, StripedLock
+
+
+@pytest.mark.parametrize(
+    argnames="stripes",
+    argvalues=[0, -1],
+)
+def test_striped_lock_rejects_non_positive_stripes(stripes: int) -> None:
+    """Test striped lock requires at least one stripe.
+
+    Args:
+        stripes (int): number of stripes.
+
+    """
+    with pytest.raises(ValueError, match="Stripes must be positive"):
+        StripedLock(stripes=stripes)
+
+
+@pytest.mark.parametrize(
+    argnames="key",
+    argvalues=["BLUE-VASE", "RED-CHAIR"],
+)
+def test_striped_lock_stripe_is_stable(key: str) -> None:
+    """Test the same key always maps onto the same stripe.
+
+    Args:
+        key (str): key.
+
+    """
+    stripes: int = 16
+
+    assert StripedLock(stripes).stripe(key) == StripedLock(stripes).stripe(key)
+    assert 0 <= StripedLock(stripes).stripe(key) < stripes
+
+
+def test_striped_lock_serializes_same_key() -> None:
+    """Test holders of the same key wait for each other."""
+    striped_lock: StripedLock = StripedLock(stripes=4)
+    hold_time: float = 0.05
+
+    def hold() -> None:
+        with striped_lock.hold("BLUE-VASE"):
+            sleep(hold_time)
+
+    threads: list[Thread] = [Thread(target=hold) for _ in range(2)]
+
+    for thread in threads:
+        thread.start()
+
+    for thread in threads:
+        thread.join()
+
+    statistics: LockStatistics = striped_lock.statistics()
+
+    assert statistics.acquisitions == len(threads)
+    assert statistics.max_hold >= hold_time
+    assert statistics.max_wait >= hold_time / 2
+
+
+def test_striped_lock_hold_many_acquires_each_stripe_once() -> None:
+    """Test keys sharing a stripe don't make holders lock it twice."""
+    striped_lock: StripedLock = StripedLock(stripes=1)
+
+    with striped_lock.hold_many(["BLUE-VASE", "RED-CHAIR", "BLUE-VASE"]):
+        pass
+
+    assert striped_lock.statistics().acquisitions == 1
+
+
+def test_striped_lock_hold_many_does_not_deadlock() -> None:
+    """Test holders of overlapping keys in opposite orders finish."""
+    striped_lock: StripedLock = StripedLock(stripes=64)
+    keys: list[str] = [f"SKU-{index}" for index in range(8)]
+
+    def hold(ordered_keys: list[str]) -> None:
+        for _ in range(200):
+            with striped_lock.hold_many(ordered_keys):
+                pass
+
+    threads: list[Thread] = [
+        Thread(target=hold, args=(keys,), daemon=True),
+        Thread(target=hold, args=(keys[::-1],), daemon=True),
+    ]
+
+    for thread in threads:
+        thread.start()
+
+    for thread in threads:
+        thread.join(timeout=5)
+
+    assert not any(thread.is_alive() for thread in threads)
@@ -1,6 +1,7 @@
 """Test sync domain service."""
 
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 import pytest
 
@@ -15,6 +16,9 @@ from src.infrastructure.repositories.file_system.fake_file_system import (
     FakeFileSystem,
 )
 
+if TYPE_CHECKING:
+    from src.domain.value_objects.sync_plan import SyncPlan
+
 
 @pytest.fixture
 def sync_service() -> SyncService:
@@ -136,3 +140,252 @@ def test_sync_service_sync_when_renamed(
             destination=Path("/destination/renamed-file"),
         )
     ]
+
+
+def test_sync_service_plan_waits_for_freed_names(
+    sync_service: SyncService,
+) -> None:
+    """Test writes of a name wait for the move or delete freeing it.
+
+    Args:
+        sync_service (SyncService): sync service.
+
+    """
+    plan: SyncPlan = sync_service.plan(
+        source_hashes={"sha1": "a", "sha2": "b", "sha3": "c"},
+        destination_hashes={"sha1": "b", "sha2": "c", "sha4": "a"},
+        source="/source",
+        destination="/destination",
+    )
+
+    assert plan.commands == (
+        FileSystemCommand(
+            command=FileSystemCommandAction.delete,
+            source=Path("/destination/a"),
+        ),
+        FileSystemCommand(
+            command=FileSystemCommandAction.move,
+            source=Path("/destination/b"),
+            destination=Path("/destination/a"),
+        ),
+        FileSystemCommand(
+            command=FileSystemCommandAction.move,
+            source=Path("/destination/c"),
+            destination=Path("/destination/b"),
+        ),
+        FileSystemCommand(
+            command=FileSystemCommandAction.copy,
+            source=Path("/source/c"),
+            destination=Path("/destination/c"),
+        ),
+    )
+    assert plan.dependencies == ((), (0,), (1,), (2,))
+
+
+def test_sync_service_plan_swaps_through_free_name(
+    sync_service: SyncService,
+) -> None:
+    """Test moves swapping names go through a temporary name.
+
+    Args:
+        sync_service (SyncService): sync service.
+
+    """
+    plan: SyncPlan = sync_service.plan(
+        source_hashes={"sha1": "a", "sha2": "b"},
+        destination_hashes={"sha1": "b", "sha2": "a", "sha3": "a.sync-0"},
+        source="/source",
+        destination="/destination",
+    )
+
+    assert plan.commands == (
+        FileSystemCommand(
+            command=FileSystemCommandAction.move,
+            source=Path("/destination/b"),
+            destination=Path("/destination/a.sync-1"),
+        ),
+        FileSystemCommand(
+            command=FileSystemCommandAction.move,
+            source=Path("/destination/a"),
+            destination=Path("/destination/b"),
+        ),
+        FileSystemCommand(
+            command=FileSystemCommandAction.delete,
+            source=Path("/destination/a.sync-0"),
+        ),
+        FileSystemCommand(
+            command=FileSystemCommandAction.move,
+            source=Path("/destination/a.sync-1"),
+            destination=Path("/destination/a"),
+        ),
+    )
+    assert plan.dependencies == ((), (0,), (), (1,))
+
+
+def test_sync_service_plan_copies_over_changed_file(
+    sync_service: SyncService,
+) -> None:
+    """Test a file changed in place is copied over, not deleted first.
+
+    Args:
+        sync_service (SyncService): sync service.
+
+    """
+    plan: SyncPlan = sync_service.plan(
+        source_hashes={"sha2": "a"},
+        destination_hashes={"sha1": "a"},
+        source="/source",
+        destination="/destination",
+    )
+
+    assert plan.commands == (
+        FileSystemCommand(
+            command=FileSystemCommandAction.copy,
+            source=Path("/source/a"),
+            destination=Path("/destination/a"),
+        ),
+    )
+    assert plan.dependencies == ((),)
+
+
+def subtree(folder: str, files: int, hashes: str = "sha") -> dict[str, str]:
+    """Make hashes of files spread over two subfolders of a folder.
+
+    Args:
+        folder (str): folder name.
+        files (int): number of files.
+        hashes (str, optional): hash prefix. Defaults to "sha".
+
+    Returns:
+        dict[str, str]: file names by hash.
+
+    """
+    return {
+        f"{hashes}{index}": f"{folder}/sub-{index % 2}/file-{index}"
+        for index in range(files)
+    }
+
+
+@pytest.mark.parametrize(
+    argnames=("source", "destination", "expected_operations"),
+    argvalues=[
+        (subtree("new", 1000), subtree("old", 1000), 1),
+        (
+            subtree("new", 1000) | {"kept": "old/kept"},
+            subtree("old", 1000) | {"kept": "old/kept"},
+            2,
+        ),
+        (
+            subtree("new", 1000) | {"sha0": "elsewhere/file-0"},
+            subtree("old", 1000),
+            500 + 1,
+        ),
+        (subtree("kept", 10) | subtree("added", 1000, "new"), {}, 2),
+        ({}, subtree("stale", 1000), 1),
+    ],
+    ids=[
+        "renamed",
+        "partly renamed",
+        "file moved out",
+        "added",
+        "deleted",
+    ],
+)
+def test_sync_service_sync_collapses_folders(
+    source: dict[str, str],
+    destination: dict[str, str],
+    expected_operations: int,
+    sync_service: SyncService,
+    file_system: IFileSystem,
+) -> None:
+    """Test whole folders are moved, copied or deleted at once.
+
+    Args:
+        source (dict[str, str]): source content.
+        destination (dict[str, str]): destination content.
+        expected_operations (int): operations issued.
+        sync_service (SyncService): sync service.
+        file_system (IFileSystem): file system repository.
+
+    """
+    sync_service.sync(
+        reader=Reader(source=source, destination=destination),
+        file_system=file_system,
+        source="/source",
+        destination="/destination",
+    )
+
+    assert len(file_system.history()) == expected_operations
+
+
+def test_sync_service_plan_writes_into_folder_after_it_moved(
+    sync_service: SyncService,
+) -> None:
+    """Test a file written into a renamed folder waits for the rename.
+
+    Args:
+        sync_service (SyncService): sync service.
+
+    """
+    plan: SyncPlan = sync_service.plan(
+        source_hashes={"sha1": "new/a", "sha2": "new/b", "sha3": "old/c"},
+        destination_hashes={"sha1": "old/a", "sha2": "old/b"},
+        source="/source",
+        destination="/destination",
+        source_names=["new/a", "new/b", "old/c"],
+        destination_names=["old/a", "old/b"],
+    )
+
+    assert plan.commands == (
+        FileSystemCommand(
+            command=FileSystemCommandAction.move,
+            source=Path("/destination/old"),
+            destination=Path("/destination/new"),
+        ),
+        FileSystemCommand(
+            command=FileSystemCommandAction.copy,
+            source=Path("/source/old/c"),
+            destination=Path("/destination/old/c"),
+        ),
+    )
+    assert plan.dependencies == ((), (0,))
+
+
+@pytest.mark.parametrize(
+    argnames=("names", "expected"),
+    argvalues=[
+        (None, ("old/a", "old/b")),
+        (["old/a", "old/b", "old/duplicate"], ("old/a", "old/b")),
+        (["old/a", "old/b"], ("old",)),
+    ],
+    ids=["unlisted", "duplicate left out", "listed"],
+)
+def test_sync_service_plan_collapses_only_listed_folders(
+    names: list[str] | None,
+    expected: tuple[str, ...],
+    sync_service: SyncService,
+) -> None:
+    """Test a folder is deleted at once only if every file in it is.
+
+    Args:
+        names (list[str] | None): names of every destination file.
+        expected (tuple[str, ...]): deleted names.
+        sync_service (SyncService): sync service.
+
+    """
+    plan: SyncPlan = sync_service.plan(
+        source_hashes={},
+        destination_hashes={"sha1": "old/a", "sha2": "old/b"},
+        source="/source",
+        destination="/destination",
+        source_names=None if names is None else [],
+        destination_names=names,
+    )
+
+    assert (
+        tuple(
+            str(command.source.relative_to("/destination"))
+            for command in plan.commands
+        )
+        == expected
+    )
@@ -0,0 +1 @@
+"""Tests for flask dtos."""
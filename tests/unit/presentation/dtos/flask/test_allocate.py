@@ -0,0 +1,29 @@
+"""Test flask allocate dtos."""
+
+from src.presentation.dtos.flask.allocate import AllocateResponseBody
+from src.presentation.utils.encoder import message_codec
+from src.presentation.utils.status_codes import StatusCode
+
+
+def test_allocate_response_body_sets_retry_after() -> None:
+    """Test Retry-After is sent in seconds."""
+    response, status_code = AllocateResponseBody(
+        body={"message": "Busy."},
+        status_code=StatusCode.service_unavailable,
+        codec=message_codec,
+        retry_after=3,
+    ).as_flask_response()
+
+    assert status_code == StatusCode.service_unavailable
+    assert response.headers["Retry-After"] == "3"
+
+
+def test_allocate_response_body_omits_retry_after() -> None:
+    """Test Retry-After is only sent when given."""
+    response, _ = AllocateResponseBody(
+        body={"message": "Created."},
+        status_code=StatusCode.created,
+        codec=message_codec,
+    ).as_flask_response()
+
+    assert "Retry-After" not in response.headers
@@ -0,0 +1,83 @@
+"""Test request body decoder util."""
+
+from dataclasses import dataclass
+from datetime import date
+
+import pytest
+
+from src.presentation.utils.decoder import DecodeError, Decoder
+
+
+@dataclass(frozen=True, slots=True)
+class LineBody:
+    """Line body."""
+
+    order_id: str
+    quantity: int
+
+
+@dataclass(frozen=True, slots=True)
+class OrderBody:
+    """Order body."""
+
+    lines: tuple[LineBody, ...]
+    delivery: date | None
+
+
+def test_decodes_nested_dataclasses() -> None:
+    """Test nested objects, arrays and ISO dates are decoded."""
+    order: OrderBody = Decoder(OrderBody).decode(
+        b'{"lines": [{"order_id": "o1", "quantity": 2}],'
+        b' "delivery": "2011-01-02"}',
+    )
+
+    assert order == OrderBody(
+        lines=(LineBody(order_id="o1", quantity=2),),
+        delivery=date(2011, 1, 2),
+    )
+
+
+@pytest.mark.parametrize(
+    argnames=("data", "message"),
+    argvalues=[
+        (b"{", "body is not valid JSON"),
+        (b"[]", "body must be object, got array."),
+        (b'{"lines": []}', "body must have delivery field(s)."),
+        (
+            b'{"lines": [], "delivery": null, "note": ""}',
+            "body has unexpected note field(s).",
+        ),
+        (
+            b'{"lines": [{"order_id": "o1", "quantity": "2"}],'
+            b' "delivery": null}',
+            "body.lines[0].quantity must be integer, got string.",
+        ),
+        (
+            b'{"lines": [{"order_id": "o1", "quantity": true}],'
+            b' "delivery": null}',
+            "body.lines[0].quantity must be integer, got boolean.",
+        ),
+        (
+            b'{"lines": [], "delivery": "2011-13-01"}',
+            "body.delivery must be an ISO 8601 date, got '2011-13-01'.",
+        ),
+    ],
+)
+def test_rejects_bad_payloads(data: bytes, message: str) -> None:
+    """Test bad payloads are rejected with the path of the bad value.
+
+    Args:
+        data (bytes): raw request body.
+        message (str): expected error message start.
+
+    """
+    with pytest.raises(DecodeError) as error:
+        Decoder(OrderBody).decode(data)
+
+    assert str(error.value).startswith(message)
+
+
+def test_rejects_unsupported_types() -> None:
+    """Test compiling a decoder for an unsupported type fails early."""
+    with pytest.raises(TypeError, match="Can't compile decoder"):
+        Decoder(dict[str, int])
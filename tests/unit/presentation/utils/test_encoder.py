@@ -0,0 +1,63 @@
+"""Test response body encoder util."""
+
+import json
+
+import pytest
+from flask import Flask, jsonify
+
+from src.presentation.utils.encoder import (
+    FastJSONProvider,
+    StaticCodec,
+    TemplateCodec,
+    json_codec,
+)
+
+
+@pytest.mark.parametrize(
+    argnames="batch_reference",
+    argvalues=["batch-001", 'quote " and \\ backslash', "ünïcode\n"],
+)
+def test_template_codec_escapes_values(batch_reference: str) -> None:
+    """Test template values are encoded as JSON strings.
+
+    Args:
+        batch_reference (str): batch reference.
+
+    """
+    body: dict[str, str] = {"batch_reference": batch_reference}
+
+    assert json.loads(TemplateCodec("batch_reference").encode(body)) == body
+
+
+def test_template_codec_keeps_key_order() -> None:
+    """Test template keys are encoded in template order."""
+    encoded: bytes = TemplateCodec("b", "a").encode({"a": 1, "b": None})
+
+    assert encoded == b'{"b":null,"a":1}'
+
+
+def test_static_codec_encodes_once() -> None:
+    """Test static codec returns the same pre-encoded bytes."""
+    codec: StaticCodec = StaticCodec({"status": "ok"})
+
+    assert codec.encode(codec.body) is codec.encode(codec.body)
+    assert json.loads(codec.encode(codec.body)) == {"status": "ok"}
+
+
+def test_json_codec_encodes_any_body() -> None:
+    """Test fallback codec encodes nested bodies compactly."""
+    body: dict[str, list[dict[str, int]]] = {"results": [{"status": 201}]}
+
+    assert json_codec.encode(body) == b'{"results":[{"status":201}]}'
+
+
+def test_fast_json_provider_serves_jsonify() -> None:
+    """Test Flask responses are encoded by the fast provider."""
+    app: Flask = Flask(__name__)
+    app.json = FastJSONProvider(app)
+
+    with app.app_context():
+        assert json.loads(jsonify(b=1, a=2).get_data()) == {
+            "a": 2,
+            "b": 1,
+        }
@@ -0,0 +1,44 @@
+"""Benchmark utility module."""
+
+import sys
+from collections.abc import Sequence
+
+
+def percentile(values: Sequence[float], rank: float) -> float:
+    """Get percentile using the nearest-rank method.
+
+    Args:
+        values (Sequence[float]): measured values.
+        rank (float): percentile rank, from 0 to 100.
+
+    Returns:
+        float: percentile value, 0 if there are no values.
+
+    """
+    if not values:
+        return 0
+
+    ordered: list[float] = sorted(values)
+    index: int = max(round(rank / 100 * len(ordered)) - 1, 0)
+
+    return ordered[min(index, len(ordered) - 1)]
+
+
+def report(name: str, latencies: Sequence[float], elapsed: float) -> None:
+    """Write throughput and latency summary to stdout.
+
+    Args:
+        name (str): benchmark name.
+        latencies (Sequence[float]): per-operation latencies in seconds.
+        elapsed (float): wall time of the whole run in seconds.
+
+    """
+    throughput: float = len(latencies) / elapsed if elapsed else 0
+
+    sys.stdout.write(
+        f"{name:<32} "
+        f"ops={len(latencies):<8} "
+        f"ops/s={throughput:<12.1f} "
+        f"p50={percentile(latencies, 50) * 1000:.3f}ms "
+        f"p99={percentile(latencies, 99) * 1000:.3f}ms\n"
+    )